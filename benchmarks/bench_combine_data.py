@@ -0,0 +1,64 @@
+"""Compare wall time of combining scraped data for every eligible game in a season, serial vs worker processes.
+
+Uses the database and scraped data of the configured app (DOTENV_FILE / CONFIG_FILE / DATABASE_URL), so the
+season must already be scraped. By default nothing is written (write_json=False, update_db=False) so the
+benchmark can be repeated; pass --save to include writing the JSON files and status records in the timing.
+
+Usage: python -m benchmarks.bench_combine_data --year 2019 [--workers N] [--games N] [--save]
+"""
+
+import os
+
+import click
+
+from benchmarks.util import print_comparison, timer
+from vigorish.app import Vigorish
+from vigorish.tasks.combine_scraped_data import CombineScrapedDataTask
+from vigorish.tasks.combine_scraped_data_parallel import CombineScrapedDataParallelTask
+
+
+def get_eligible_game_ids(app, year):
+    audit_report = app.audit_report.get(year, {})
+    report_keys = ["scraped", "successful", "failed", "pfx_error", "invalid_pfx"]
+    return sorted(game_id for key in report_keys for game_id in audit_report.get(key, []))
+
+
+def combine_serial(app, game_ids, save):
+    combine_data = CombineScrapedDataTask(app)
+    for bbref_game_id in game_ids:
+        combine_data.execute(bbref_game_id, write_json=save, update_db=save)
+        app.db_session.rollback()
+
+
+def combine_parallel(app, game_ids, save, workers):
+    combine_data = CombineScrapedDataParallelTask(app, max_workers=workers)
+    try:
+        for _ in combine_data.combine_games(game_ids, write_json=save, update_db=save):
+            pass
+    finally:
+        combine_data.shutdown()
+
+
+@click.command()
+@click.option("--year", type=int, required=True, help="Season to combine.")
+@click.option("--workers", default=os.cpu_count(), show_default=True, help="Number of worker processes.")
+@click.option("--games", type=int, default=None, help="Only combine the first N eligible games.")
+@click.option("--save", is_flag=True, help="Write combined data JSON files and update status records.")
+def main(year, workers, games, save):
+    app = Vigorish()
+    game_ids = get_eligible_game_ids(app, year)[:games]
+    if not game_ids:
+        raise click.ClickException(f"No scraped games are eligible to be combined for MLB {year}.")
+    results = {}
+    with timer(results, "serial"):
+        combine_serial(app, game_ids, save)
+    with timer(results, "parallel"):
+        combine_parallel(app, game_ids, save, workers)
+    print(f"MLB {year}: {len(game_ids):,} games")
+    for mode, elapsed in results.items():
+        print(f"  {mode:<8} {elapsed:8.3f}s  {len(game_ids) / elapsed:7.1f} games/sec")
+    print_comparison(f"combine {len(game_ids)} games ({workers} workers)", results["serial"], results["parallel"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare disk footprint and random-read latency of scraped HTML stored as one file per page vs HtmlArchive.
+
+Copies the HTML files from a folder (by default, the 2019 brooks_pitch_logs test data) into a temporary folder,
+repeating them until --pages files exist, then packs the same pages into an archive. Disk footprint is measured
+in allocated blocks, so the per-file overhead of many small files is included.
+
+Usage: python -m benchmarks.bench_html_archive [--folder PATH] [--pages N] [--reads N]
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+import click
+
+from benchmarks.util import timer
+from vigorish.data.html_archive import HtmlArchive
+from vigorish.util.sys_helpers import file_size_str
+
+TESTS_FOLDER = Path(__file__).parent.parent.joinpath("tests")
+DEFAULT_FOLDER = TESTS_FOLDER.joinpath("html_storage", "2019", "brooks_pitch_logs")
+
+
+def create_html_files(src_folder, dest_folder, pages):
+    src_files = sorted(Path(src_folder).glob("*.html"))
+    if not src_files:
+        raise click.ClickException(f"No HTML files found in {src_folder}")
+    html_files = []
+    for num in range(pages):
+        src_file = src_files[num % len(src_files)]
+        html_file = dest_folder.joinpath(f"{src_file.stem}_{num:06d}.html")
+        html_file.write_bytes(src_file.read_bytes())
+        html_files.append(html_file)
+    return html_files
+
+
+def disk_usage(files):
+    return sum(f.stat().st_blocks * 512 for f in files)
+
+
+def read_latency(read_page, url_ids):
+    latency = []
+    for url_id in url_ids:
+        start = perf_counter()
+        read_page(url_id)
+        latency.append(perf_counter() - start)
+    return latency
+
+
+def print_latency(title, latency):
+    latency_us = sorted(x * 1e6 for x in latency)
+    p99 = latency_us[int(len(latency_us) * 0.99) - 1]
+    print(f"  {title:<12} median: {median(latency_us):8.1f}us  p99: {p99:8.1f}us  ({len(latency_us):,} reads)")
+
+
+@click.command()
+@click.option("--folder", type=click.Path(exists=True), default=str(DEFAULT_FOLDER), help="Folder of HTML files.")
+@click.option("--pages", default=5000, show_default=True, help="Number of pages to store.")
+@click.option("--reads", default=2000, show_default=True, help="Number of random reads to time.")
+def main(folder, pages, reads):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files_folder = Path(temp_dir).joinpath("files")
+        archive_folder = Path(temp_dir).joinpath("archive")
+        files_folder.mkdir()
+        html_files = create_html_files(folder, files_folder, pages)
+        results = {}
+        archive = HtmlArchive(archive_folder)
+        with timer(results, "pack"):
+            archive.import_html_files(html_files)
+        archive_files = list(archive_folder.iterdir())
+
+        html_file_map = {f.stem: f for f in html_files}
+        url_ids = random.Random(42).choices(sorted(html_file_map), k=reads)
+        file_latency = read_latency(lambda url_id: html_file_map[url_id].read_text(), url_ids)
+        archive_latency = read_latency(HtmlArchive(archive_folder).read, url_ids)
+
+        print(f"{pages:,} pages (packed in {results['pack']:.2f}s)")
+        print(f"  {'files':<12} {file_size_str(disk_usage(html_files)):>10} on disk in {len(html_files):,} files")
+        print(f"  {'archive':<12} {file_size_str(disk_usage(archive_files)):>10} on disk in {len(archive_files)} files")
+        print_latency("files", file_latency)
+        print_latency("archive", archive_latency)
+
+
+if __name__ == "__main__":
+    main()
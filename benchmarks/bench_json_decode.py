@@ -0,0 +1,117 @@
+"""Compare the time to encode and decode a season of parsed and combined game data with each JSON serializer.
+
+The baseline is the previous implementation: stdlib json with indent=2 for writing, json.loads for reading,
+dateutil's generic parser for date fields and dacite.from_dict for each pitch in a pitchfx log. Every parsed JSON
+file and combined data file for the season in the tests folder is decoded into the same objects that
+FileHelper.decode_json and JsonStorage return.
+
+Usage: python -m benchmarks.bench_json_decode [--year YEAR] [--rounds N]
+"""
+
+import json
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import click
+from dacite import from_dict
+from dateutil import parser
+
+from benchmarks.util import print_comparison, timer
+from vigorish.data.json_decoder import (
+    decode_bbref_boxscore,
+    decode_bbref_games_for_date,
+    decode_brooks_games_for_date,
+    decode_brooks_pitch_logs_for_game,
+    decode_brooks_pitchfx_log,
+)
+from vigorish.scrape.brooks_pitchfx.models.pitchfx import BrooksPitchFxData
+from vigorish.util.json_serializer import get_serializer, parse_date_str
+from vigorish.util.sys_helpers import file_size_str
+
+JSON_FOLDER = Path(__file__).parent.parent.joinpath("tests", "json_storage")
+DECODERS = {
+    "bbref_games_for_date": decode_bbref_games_for_date,
+    "brooks_games_for_date": decode_brooks_games_for_date,
+    "bbref_boxscores": decode_bbref_boxscore,
+    "brooks_pitch_logs": decode_brooks_pitch_logs_for_game,
+    "brooks_pitchfx": decode_brooks_pitchfx_log,
+    "combined_data": None,
+}
+DATE_FIELDS = ["game_date_str", "game_date_time_str", "game_start_time_str", "time_pitch_thrown_str"]
+DATE_STR_REGEX = re.compile(rf'"(?:{"|".join(DATE_FIELDS)})":\s*"([^"]+)"')
+
+
+def read_season_files(year):
+    season_files = []
+    for data_set, decode_func in DECODERS.items():
+        for json_file in sorted(JSON_FOLDER.joinpath(str(year), data_set).glob("*.json")):
+            if not json_file.stem.endswith("_PATCH_LIST"):
+                season_files.append((decode_func, json_file.read_bytes()))
+    return season_files
+
+
+def decode_pitchfx_data_dacite(json_dict):
+    json_dict.pop("__brooks_pitchfx_data__")
+    return from_dict(data_class=BrooksPitchFxData, data=json_dict)
+
+
+def decode_all(season_files, loads):
+    for decode_func, contents in season_files:
+        json_dict = loads(contents)
+        if decode_func:
+            decode_func(json_dict)
+
+
+@click.command()
+@click.option("--year", default=2019, show_default=True, help="Season of test data to decode.")
+@click.option("--rounds", default=5, show_default=True, help="Number of times to decode every file.")
+def main(year, rounds):
+    season_files = read_season_files(year)
+    if not season_files:
+        raise click.ClickException(f"No JSON files found for {year} in {JSON_FOLDER}")
+    decoded = [json.loads(contents) for _, contents in season_files]
+    date_strs = [m for _, contents in season_files for m in DATE_STR_REGEX.findall(contents.decode("utf-8"))]
+    baseline_size = sum(len(json.dumps(d, indent=2)) for d in decoded)
+    print(f"{len(season_files)} files, {file_size_str(baseline_size)} with indent=2, {len(date_strs):,} date fields")
+
+    results = {}
+    with timer(results, "baseline_dates"):
+        for date_str in date_strs:
+            parser.parse(date_str)
+    with timer(results, "dates"):
+        for date_str in date_strs:
+            parse_date_str(date_str)
+    print_comparison("parse date fields", results["baseline_dates"], results["dates"])
+
+    with timer(results, "baseline_encode"):
+        for _ in range(rounds):
+            for json_dict in decoded:
+                json.dumps(json_dict, indent=2)
+    with patch("vigorish.data.json_decoder.parse_date_str", parser.parse), patch(
+        "vigorish.data.json_decoder.decode_brooks_pitchfx_data", decode_pitchfx_data_dacite
+    ), timer(results, "baseline_decode"):
+        for _ in range(rounds):
+            decode_all(season_files, json.loads)
+
+    for name in ["json", "orjson"]:
+        serializer = get_serializer(name)
+        if serializer.name != name:
+            print(f"{name} is not installed, skipping")
+            continue
+        compact_files = [(func, serializer.dumps(d).encode("utf-8")) for (func, _), d in zip(season_files, decoded)]
+        with timer(results, f"{name}_encode"):
+            for _ in range(rounds):
+                for json_dict in decoded:
+                    serializer.dumps(json_dict)
+        with timer(results, f"{name}_decode"):
+            for _ in range(rounds):
+                decode_all(compact_files, serializer.loads)
+        compact_size = sum(len(contents) for _, contents in compact_files)
+        print(f"\n{name}: {file_size_str(compact_size)} compact")
+        print_comparison(f"encode ({name})", results["baseline_encode"], results[f"{name}_encode"])
+        print_comparison(f"decode ({name})", results["baseline_decode"], results[f"{name}_decode"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Compare the number of queries and the time needed to build league-wide team stats and standings for a season.
+
+The baseline is the previous implementation: one query per team (plus a deepcopy of the results) for each
+*_for_all_teams method of BatStatsMetricsFactory and PitchStatsMetricsFactory, and one query per team (each with a
+lookup of the most recent scraped date) for ScrapedData.get_season_standings. The candidate fetches the bat stats,
+pitch stats or game results for the season once and partitions them by team.
+
+A temporary SQLite database (the configured database is not modified) is populated with the base tables and a
+synthetic season of --games games with box score stats for both teams.
+
+Usage: python -m benchmarks.bench_league_stats [--year YEAR] [--games N] [--csv-folder PATH]
+"""
+
+import random
+from contextlib import contextmanager
+from copy import deepcopy
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import click
+from sqlalchemy import event, Float, Integer
+
+import vigorish.database as db
+from benchmarks.bench_restore_database import create_temp_app
+from benchmarks.util import print_comparison, timer
+from vigorish.constants import TEAM_ID_MAP
+from vigorish.data.metrics.bat_stats import BatStatsMetrics, BatStatsMetricsFactory
+from vigorish.data.metrics.pitch_stats import PitchStatsMetrics, PitchStatsMetricsFactory
+from vigorish.data.scraped_data import ScrapedData
+from vigorish.enums import DefensePosition
+
+BATTERS_PER_GAME = 13
+PITCHERS_PER_GAME = 4
+
+
+def create_synthetic_season(app, year, game_count, seed=42):
+    rng = random.Random(seed)
+    season = db.Season.find_by_year(app.db_session, year)
+    date_ids = sorted(date_status.id for date_status in season.dates)
+    teams = [team for team in db.Team.get_all_teams_for_season(app.db_session, year) if team.team_id_br in TEAM_ID_MAP]
+    games, bat_stats, pitch_stats = [], [], []
+    for game_num in range(game_count):
+        (away_team, home_team) = rng.sample(teams, 2)
+        date_id = rng.choice(date_ids)
+        games.append(
+            {
+                "bbref_game_id": f"BENCH{game_num:05d}",
+                "bb_game_id": f"gid_bench_{game_num:05d}",
+                "away_team_id_br": away_team.team_id_br,
+                "home_team_id_br": home_team.team_id_br,
+                "away_team_runs_scored": rng.randint(0, 10),
+                "home_team_runs_scored": rng.randint(0, 10),
+                "scraped_bbref_boxscore": 1,
+                "scrape_status_date_id": date_id,
+                "season_id": season.id,
+            }
+        )
+        for (team, opponent) in [(away_team, home_team), (home_team, away_team)]:
+            game_ids = {"date_id": date_id, "season_id": season.id, "bbref_game_id": f"BENCH{game_num:05d}"}
+            team_ids = {
+                "player_team_id": team.id,
+                "player_team_id_bbref": team.team_id_br,
+                "opponent_team_id": opponent.id,
+                "opponent_team_id_bbref": opponent.team_id_br,
+            }
+            for bat_order in range(1, BATTERS_PER_GAME + 1):
+                stats = create_random_stats(rng, db.BatStats)
+                stats.update(game_ids, **team_ids, is_starter=int(bat_order <= 9), bat_order=min(bat_order, 9))
+                stats["def_position"] = str(int(rng.choice(list(DefensePosition)[1:10])))
+                bat_stats.append(stats)
+            for pitcher_num in range(PITCHERS_PER_GAME):
+                stats = create_random_stats(rng, db.PitchStats)
+                stats.update(game_ids, **team_ids, is_sp=int(pitcher_num == 0), is_rp=int(pitcher_num > 0))
+                pitch_stats.append(stats)
+    app.db_engine.execute(db.GameScrapeStatus.__table__.insert(), games)
+    app.db_engine.execute(db.BatStats.__table__.insert(), bat_stats)
+    app.db_engine.execute(db.PitchStats.__table__.insert(), pitch_stats)
+
+
+def create_random_stats(rng, stats_model):
+    return {
+        column.name: rng.randint(0, 4)
+        for column in stats_model.__table__.columns
+        if isinstance(column.type, (Integer, Float)) and not column.primary_key and not column.foreign_keys
+    }
+
+
+@contextmanager
+def count_queries(db_engine, results, key):
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+        results[key] = len(queries)
+
+
+def get_stats_for_team(db_session, stats_model, team_id, **filters):
+    return db_session.query(stats_model).filter(stats_model.player_team_id == team_id).filter_by(**filters).all()
+
+
+def baseline_team_stats(db_session, year):
+    team_id_map = {
+        s.year: db.Team.get_team_id_map_for_year(db_session, s.year) for s in db.Season.get_all_regular_seasons(db_session)
+    }
+    bat_stats_splits = [{}, {"is_starter": 1}, {"is_starter": 0}, {}, {}]
+    for filters in bat_stats_splits:
+        for team_id in TEAM_ID_MAP:
+            bat_stats = get_stats_for_team(db_session, db.BatStats, team_id_map[year][team_id], **filters)
+            BatStatsMetrics(bat_stats=deepcopy(bat_stats), year=year, team_id_bbref=team_id)
+    for filters in [{}, {"is_sp": 1}, {"is_rp": 1}]:
+        for team_id in TEAM_ID_MAP:
+            pitch_stats = get_stats_for_team(db_session, db.PitchStats, team_id_map[year][team_id], **filters)
+            PitchStatsMetrics(pitch_stats=deepcopy(pitch_stats), year=year, team_id_bbref=team_id)
+
+
+def candidate_team_stats(db_session, year):
+    bat_stats = BatStatsMetricsFactory(db_session)
+    bat_stats.for_all_teams(year)
+    bat_stats.for_starters_for_all_teams(year)
+    bat_stats.for_bench_for_all_teams(year)
+    bat_stats.for_lineup_spots_for_all_teams([1, 2], year)
+    bat_stats.for_def_positions_for_all_teams([DefensePosition.CATCHER], year)
+    pitch_stats = PitchStatsMetricsFactory(db_session)
+    pitch_stats.for_all_teams(year)
+    pitch_stats.for_sp_for_all_teams(year)
+    pitch_stats.for_rp_for_all_teams(year)
+
+
+def baseline_standings(scraped_data, year):
+    for team in db.Team.get_all_teams_for_season(scraped_data.db_session, year):
+        all_games = db.GameScrapeStatus.get_all_games_for_team(scraped_data.db_session, team.team_id_br, year)
+        away_games = [g for g in all_games if g.away_team_id_br == team.team_id_br]
+        home_games = [g for g in all_games if g.home_team_id_br == team.team_id_br]
+        scraped_data._get_away_game_results(away_games)
+        scraped_data._get_home_game_results(home_games)
+
+
+@click.command()
+@click.option("--year", default=2019, show_default=True, help="Season to populate with synthetic games.")
+@click.option("--games", default=2430, show_default=True, help="Number of synthetic games in the season.")
+@click.option("--csv-folder", type=click.Path(exists=True, path_type=Path), help="CSV folder for the base tables.")
+def main(year, games, csv_folder):
+    with TemporaryDirectory() as temp_folder:
+        app = create_temp_app(temp_folder)
+        result = app.initialize_database(csv_folder=csv_folder)
+        if result.failure:
+            raise click.ClickException(result.error)
+        create_synthetic_season(app, year, games)
+        scraped_data = ScrapedData(app.db_engine, app.db_session, app.config)
+        (times, queries) = ({}, {})
+        with timer(times, "baseline_stats"), count_queries(app.db_engine, queries, "baseline_stats"):
+            baseline_team_stats(app.db_session, year)
+        app.db_session.expunge_all()
+        with timer(times, "candidate_stats"), count_queries(app.db_engine, queries, "candidate_stats"):
+            candidate_team_stats(app.db_session, year)
+        app.db_session.expunge_all()
+        with timer(times, "baseline_standings"), count_queries(app.db_engine, queries, "baseline_standings"):
+            baseline_standings(scraped_data, year)
+        app.db_session.expunge_all()
+        with timer(times, "candidate_standings"), count_queries(app.db_engine, queries, "candidate_standings"):
+            scraped_data.get_season_standings(year)
+        app.db_session.close()
+    print(f"Synthetic {year} season: {games:,} games, {len(TEAM_ID_MAP)} teams")
+    for name, title in [("stats", "team bat/pitch stats (8 splits)"), ("standings", "season standings")]:
+        print_comparison(title, times[f"baseline_{name}"], times[f"candidate_{name}"])
+        print(f"{'':<40} queries:  {queries[f'baseline_{name}']:>8}  candidate: {queries[f'candidate_{name}']:>8}")
+
+
+if __name__ == "__main__":
+    main()
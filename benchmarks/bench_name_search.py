@@ -0,0 +1,107 @@
+"""Compare cold and warm latency of player name searches.
+
+The baseline is the previous implementation of PlayerNameSearch: every pitch_stats and bat_stats row is loaded as an
+ORM object to collect the distinct MLB ids, PlayerId.find_by_mlb_id is called once per id, and each search passes
+the resulting {mlb_id: name} dict to rapidfuzz. The candidate builds the index with a single SELECT DISTINCT join,
+saves it next to the database and searches a prebuilt array of normalized names.
+
+Cold latency is the time of the first search made by a new instance (for the candidate, both with and without a
+saved index file). Warm latency is the time of --queries searches made by the same instance.
+
+A temporary SQLite database is populated with --players synthetic players, each with --apps rows split between
+pitch_stats and bat_stats.
+
+Usage: python -m benchmarks.bench_name_search [--players N] [--apps N] [--queries N]
+"""
+
+import random
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import click
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+from benchmarks.util import print_comparison, timer
+from vigorish.data.name_search import get_player_name_index_filepath, PlayerNameSearch
+from vigorish.util.string_helpers import fuzzy_match
+
+SYLLABLES = ["an", "bel", "car", "do", "el", "fer", "gar", "ja", "ko", "lo", "mi", "ne", "ra", "san", "to", "vi", "ye"]
+
+
+def create_synthetic_players(db_session, player_count, apps_per_player, seed=42):
+    rng = random.Random(seed)
+    player_ids, pitch_stats, bat_stats = [], [], []
+    for mlb_id in range(100000, 100000 + player_count):
+        first = "".join(rng.choices(SYLLABLES, k=rng.randint(1, 2))).capitalize()
+        last = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+        player_ids.append({"mlb_id": mlb_id, "mlb_name": f"{first} {last}"})
+        stats = pitch_stats if rng.random() < 0.45 else bat_stats
+        stats.extend({"player_id_mlb": mlb_id, "bbref_game_id": f"BENCH{app:03d}"} for app in range(apps_per_player))
+    db_session.execute(db.PlayerId.__table__.insert(), player_ids)
+    db_session.execute(db.PitchStats.__table__.insert(), pitch_stats)
+    db_session.execute(db.BatStats.__table__.insert(), bat_stats)
+    db_session.commit()
+    return [player["mlb_name"] for player in player_ids]
+
+
+class BaselinePlayerNameSearch:
+    def __init__(self, db_session):
+        self.db_session = db_session
+        self.player_id_name_map = None
+
+    def fuzzy_match(self, query, score_cutoff=80):
+        if self.player_id_name_map is None:
+            pitcher_ids = {ps.player_id_mlb for ps in self.db_session.query(db.PitchStats).all()}
+            batter_ids = {bs.player_id_mlb for bs in self.db_session.query(db.BatStats).all()}
+            self.player_id_name_map = {
+                mlb_id: db.PlayerId.find_by_mlb_id(self.db_session, mlb_id).mlb_name
+                for mlb_id in pitcher_ids | batter_ids
+            }
+        return fuzzy_match(query, self.player_id_name_map, score_cutoff=score_cutoff)
+
+
+def misspell(rng, name):
+    position = rng.randrange(len(name))
+    return f"{name[:position]}{name[position + 1:]}".lower()
+
+
+def time_searches(times, key, name_search, queries):
+    with timer(times, f"{key}_cold"):
+        name_search.fuzzy_match(queries[0])
+    with timer(times, f"{key}_warm"):
+        for query in queries[1:]:
+            name_search.fuzzy_match(query)
+
+
+@click.command()
+@click.option("--players", default=10000, show_default=True, help="Number of synthetic players.")
+@click.option("--apps", default=30, show_default=True, help="Number of stats rows for each player.")
+@click.option("--queries", default=20, show_default=True, help="Number of searches made by each instance.")
+def main(players, apps, queries):
+    rng = random.Random(7)
+    times = {}
+    with TemporaryDirectory() as temp_folder:
+        db_engine = create_engine(f"sqlite:///{Path(temp_folder).joinpath('vig_bench.db')}")
+        tables = [db.PlayerId.__table__, db.PitchStats.__table__, db.BatStats.__table__]
+        db.Base.metadata.create_all(db_engine, tables=tables)
+        db_session = Session(bind=db_engine)
+        player_names = create_synthetic_players(db_session, players, apps)
+        search_queries = [misspell(rng, name) for name in rng.choices(player_names, k=queries + 1)]
+
+        time_searches(times, "baseline", BaselinePlayerNameSearch(db_session), search_queries)
+        db_session.expunge_all()
+        index_filepath = get_player_name_index_filepath(db_engine)
+        time_searches(times, "unsaved", PlayerNameSearch(db_session, index_filepath), search_queries)
+        time_searches(times, "saved", PlayerNameSearch(db_session, index_filepath), search_queries)
+        index_size = index_filepath.stat().st_size
+        db_session.close()
+    print(f"{players:,} players, {players * apps:,} stats rows, index file: {index_size / 1024:,.0f} KB")
+    print_comparison("cold search (no saved index)", times["baseline_cold"], times["unsaved_cold"])
+    print_comparison("cold search (saved index)", times["baseline_cold"], times["saved_cold"])
+    print_comparison(f"warm searches (x{queries})", times["baseline_warm"], times["saved_warm"])
+
+
+if __name__ == "__main__":
+    main()
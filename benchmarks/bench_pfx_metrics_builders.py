@@ -0,0 +1,99 @@
+"""Measure build time and peak RSS of PitchFxPitchingMetrics for a full-career pitcher.
+
+Each mode runs in a fresh interpreter so that ru_maxrss reflects only that mode:
+  orm      load every pitch as a db.PitchFx instance and split the lists in Python
+  columns  load the pitches into a shared PitchFxColumns store, bucket them once with PitchFxGroups
+  sql      count and sum each bucket in the database with one GROUP BY query (PitchFxAggregateGroups)
+
+Usage: python -m benchmarks.bench_pfx_metrics_builders [--pitches N]
+"""
+
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import click
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import vigorish.database as db
+from benchmarks.util import CAREER_PITCH_COUNT, create_synthetic_pfx_dicts
+from vigorish.data.metrics.pitchfx import (
+    PitchFxAggregateGroups,
+    PitchFxColumns,
+    PitchFxGroups,
+    PitchFxPitchingMetrics,
+)
+
+PITCHER_ID = 1
+
+
+def create_benchmark_db(db_path: Path, pitch_count: int) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    db.PitchFx.__table__.create(engine)
+    pfx = create_synthetic_pfx_dicts(pitch_count)
+    for pitch in pfx:
+        pitch["pitcher_id"] = PITCHER_ID
+    engine.execute(db.PitchFx.__table__.insert(), pfx)
+
+
+def build_with_orm_rows(db_session) -> None:
+    pfx = db_session.query(db.PitchFx).filter_by(pitcher_id=PITCHER_ID).all()
+    PitchFxPitchingMetrics(pfx, PITCHER_ID, "R", remove_outliers=True).as_dict()
+    for season_id in sorted({p.season_id for p in pfx}):
+        pfx_for_season = [p for p in pfx if p.season_id == season_id]
+        PitchFxPitchingMetrics(pfx_for_season, PITCHER_ID, "R", remove_outliers=True).as_dict()
+
+
+def build_with_columns(db_session) -> None:
+    build_from_groups(PitchFxGroups(PitchFxColumns.from_db(db_session, db.PitchFx.pitcher_id == PITCHER_ID)))
+
+
+def build_with_sql_aggregates(db_session) -> None:
+    build_from_groups(PitchFxAggregateGroups.from_db(db_session, db.PitchFx.pitcher_id == PITCHER_ID))
+
+
+def build_from_groups(pfx: PitchFxGroups) -> None:
+    PitchFxPitchingMetrics(pfx, PITCHER_ID, "R", remove_outliers=True).as_dict()
+    for season_id in pfx.season_ids:
+        pfx_for_season = pfx.filter(season_id=season_id)
+        PitchFxPitchingMetrics(pfx_for_season, PITCHER_ID, "R", remove_outliers=True).as_dict()
+
+
+BUILD_MODES = {"orm": build_with_orm_rows, "columns": build_with_columns, "sql": build_with_sql_aggregates}
+
+
+@click.group(invoke_without_command=True)
+@click.option("--pitches", default=CAREER_PITCH_COUNT, show_default=True, help="Number of pitches thrown by pitcher.")
+@click.pass_context
+def main(ctx, pitches):
+    if ctx.invoked_subcommand:
+        return
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir).joinpath("bench.db")
+        create_benchmark_db(db_path, pitches)
+        print(f"Full-career pitcher ({pitches:,} pitches, career + by-year splits)")
+        for mode in BUILD_MODES:
+            subprocess.run([sys.executable, "-m", __spec__.name, "run", mode, str(db_path)], check=True)
+
+
+@main.command()
+@click.argument("mode", type=click.Choice(list(BUILD_MODES)))
+@click.argument("db_path")
+def run(mode, db_path):
+    db_session = sessionmaker(bind=create_engine(f"sqlite:///{db_path}"))()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = perf_counter()
+    BUILD_MODES[mode](db_session)
+    elapsed = perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"  {mode:<8} build time: {elapsed:7.3f}s  peak RSS: {peak_rss / 1024:7.1f} MB (+{(peak_rss - rss_before) / 1024:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
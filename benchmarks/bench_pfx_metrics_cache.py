@@ -0,0 +1,94 @@
+"""Compare the time to build career and by-year PitchFx metrics for the pitchers in a game, viewed repeatedly.
+
+Viewing a game calls PitchFxMetricsFactory.for_pitcher_career_and_by_year for each pitcher that appeared in it.
+The baseline is the previous behavior, where nothing is shared between PlayerData instances, so the metrics are
+rebuilt for every view (use_cache=False). The candidate uses the process-wide PitchFxMetricsCache: the first view
+builds the metrics and every later view is a cache hit. The disk tier is measured with a new cache (as if the
+process had been restarted) that reads the metrics pickled by the first cache.
+
+A temporary SQLite database is populated with --pitchers pitchers, each with --pitches synthetic pitches spread
+over five seasons.
+
+Usage: python -m benchmarks.bench_pfx_metrics_cache [--pitchers N] [--pitches N] [--views N]
+"""
+
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+import click
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+from benchmarks.util import create_synthetic_pfx_dicts, print_comparison, timer
+from vigorish.data.metrics.pitchfx import PitchFxMetricsCache, PitchFxMetricsFactory
+
+FIRST_MLB_ID = 500000
+
+
+def create_benchmark_db(db_engine, pitcher_count, pitch_count):
+    tables = [db.Season.__table__, db.PlayerId.__table__, db.PitchFx.__table__]
+    db.Base.metadata.create_all(db_engine, tables=tables)
+    seasons = [
+        {"id": sid, "year": 2014 + sid, "start_date": datetime(2014 + sid, 4, 1), "end_date": datetime(2014 + sid, 10, 1)}
+        for sid in range(1, 6)
+    ]
+    db_engine.execute(db.Season.__table__.insert(), seasons)
+    player_ids = [{"mlb_id": FIRST_MLB_ID + num, "db_player_id": num} for num in range(1, pitcher_count + 1)]
+    db_engine.execute(db.PlayerId.__table__.insert(), player_ids)
+    for num in range(1, pitcher_count + 1):
+        pfx = create_synthetic_pfx_dicts(pitch_count, seed=num)
+        for pitch in pfx:
+            pitch["pitcher_id"] = num
+        db_engine.execute(db.PitchFx.__table__.insert(), pfx)
+
+
+def view_game(factory, pitcher_count):
+    for num in range(1, pitcher_count + 1):
+        (pfx_metrics_for_career, pfx_metrics_by_year) = factory.for_pitcher_career_and_by_year(FIRST_MLB_ID + num, "R")
+        pfx_metrics_for_career.as_dict()
+
+
+def view_game_repeatedly(factory, pitcher_count, views):
+    for _ in range(views):
+        view_game(factory, pitcher_count)
+
+
+@click.command()
+@click.option("--pitchers", default=10, show_default=True, help="Number of pitchers in the game.")
+@click.option("--pitches", default=10000, show_default=True, help="Number of career pitches for each pitcher.")
+@click.option("--views", default=10, show_default=True, help="Number of times the game is viewed.")
+def main(pitchers, pitches, views):
+    times = {}
+    with TemporaryDirectory() as temp_folder:
+        db_engine = create_engine(f"sqlite:///{Path(temp_folder).joinpath('vig_bench.db')}")
+        create_benchmark_db(db_engine, pitchers, pitches)
+        app = SimpleNamespace(db_engine=db_engine, db_session=Session(bind=db_engine))
+        cache_folder = Path(temp_folder).joinpath("pfx_metrics_cache")
+
+        with timer(times, "baseline"):
+            view_game_repeatedly(PitchFxMetricsFactory(app, use_cache=False), pitchers, views)
+        factory = PitchFxMetricsFactory(app)
+        factory.cache = PitchFxMetricsCache(disk_folder=cache_folder)
+        with timer(times, "memory"):
+            view_game_repeatedly(factory, pitchers, views)
+        memory_stats = factory.cache.stats
+        factory.cache = PitchFxMetricsCache(disk_folder=cache_folder)
+        with timer(times, "disk"):
+            view_game_repeatedly(factory, pitchers, views)
+        disk_stats = factory.cache.stats
+        app.db_session.close()
+    print(f"{pitchers} pitchers x {pitches:,} pitches, game viewed {views} times")
+    print_comparison("memory cache (first view builds)", times["baseline"], times["memory"])
+    print_comparison("disk cache (new process)", times["baseline"], times["disk"])
+    for (title, stats) in [("memory", memory_stats), ("disk", disk_stats)]:
+        print(
+            f"{title:<6} hits: {stats['hits']:>4}  disk hits: {stats['disk_hits']:>4}  misses: {stats['misses']:>4}  "
+            f"hit rate: {stats['hit_rate']:.1%}  size: {stats['size'] / 1024 / 1024:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare PitchFxMetrics (generator per property) with PitchFxArrayMetrics (vectorized reductions).
+
+Usage: python -m benchmarks.bench_pfx_metrics_engine [--career N] [--team-season N]
+"""
+
+import click
+
+from benchmarks.util import (
+    CAREER_PITCH_COUNT,
+    create_synthetic_pfx,
+    print_comparison,
+    TEAM_SEASON_PITCH_COUNT,
+    timer,
+)
+from vigorish.data.metrics.pitchfx import PitchFxArrayMetrics, PitchFxColumns, PitchFxMetrics
+
+
+def run_benchmark(label: str, pitch_count: int) -> None:
+    pfx = create_synthetic_pfx(pitch_count)
+    results = {}
+    with timer(results, "baseline"):
+        baseline = PitchFxMetrics(pfx).as_dict()
+    with timer(results, "load_columns"):
+        pfx_columns = PitchFxColumns.from_pfx(pfx)
+    with timer(results, "candidate"):
+        candidate = PitchFxArrayMetrics(pfx_columns).as_dict()
+    if baseline != candidate:
+        mismatched = [k for k in baseline if baseline[k] != candidate.get(k)]
+        raise click.ClickException(f"Results do not match for {label}: {mismatched}")
+    print_comparison(f"{label} ({pitch_count:,} pitches)", results["baseline"], results["candidate"])
+    print(f"{'':<40} (one-time column load from ORM rows: {results['load_columns']:.3f}s)")
+
+
+@click.command()
+@click.option("--career", default=CAREER_PITCH_COUNT, show_default=True, help="Pitch count for career-sized data.")
+@click.option(
+    "--team-season", default=TEAM_SEASON_PITCH_COUNT, show_default=True, help="Pitch count for a team season."
+)
+def main(career, team_season):
+    run_benchmark("Career", career)
+    run_benchmark("Team season", team_season)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compare the time to restore the database from a backup zip file with the bulk load and the original path.
+
+Both restores are performed on a temporary SQLite database (the configured database is not modified), using the
+backup zip file given by --zip-file or the most recent backup in DB_BACKUP_FOLDER_PATH. Only the time spent loading
+the backup tables is measured, not the time needed to create and populate the base tables. To benchmark a large
+pitchfx table with a small backup (e.g., the one created by the test suite in tests/backup), --pitchfx-copies N
+writes a temporary copy of the zip file with every pitchfx row repeated N times.
+
+Usage: python -m benchmarks.bench_restore_database [--zip-file PATH] [--csv-folder PATH] [--pitchfx-copies N]
+"""
+
+import csv
+import io
+import os
+from collections import defaultdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import click
+
+from benchmarks.util import print_comparison
+from vigorish.app import Vigorish
+from vigorish.config.dotenv_file import DotEnvFile
+from vigorish.tasks.restore_database import RestoreDatabaseTask
+
+
+def create_temp_app(temp_folder):
+    config_file = os.environ.get("CONFIG_FILE") or DotEnvFile().env_var_dict["CONFIG_FILE"]
+    dotenv_file = Path(temp_folder).joinpath(".env")
+    db_file = Path(temp_folder).joinpath("vig_bench.db")
+    dotenv_file.write_text(f"CONFIG_FILE={config_file}\nDATABASE_URL=sqlite:///{db_file}\n")
+    return Vigorish(dotenv_file)
+
+
+def copy_zip_with_more_pitchfx(zip_file, temp_folder, copies):
+    new_zip_file = Path(temp_folder).joinpath(zip_file.name)
+    with ZipFile(zip_file) as src, ZipFile(new_zip_file, "w", ZIP_DEFLATED) as dest:
+        for name in src.namelist():
+            if not name.endswith("/pitchfx.csv"):
+                dest.writestr(name, src.read(name))
+                continue
+            with src.open(name) as csv_file, dest.open(name, "w", force_zip64=True) as new_csv_file:
+                rows = list(csv.reader(io.TextIOWrapper(csv_file, encoding="utf-8", newline="")))
+                new_csv_text = io.TextIOWrapper(new_csv_file, encoding="utf-8", newline="")
+                writer = csv.writer(new_csv_text, lineterminator="\n")
+                writer.writerow(rows[0])
+                next_id = 1
+                for _ in range(copies):
+                    for row in rows[1:]:
+                        writer.writerow([next_id, *row[1:]])
+                        next_id += 1
+                new_csv_text.flush()
+                new_csv_text.detach()
+    return new_zip_file
+
+
+def time_restore(app, zip_file, csv_folder, bulk_load):
+    restore_db = RestoreDatabaseTask(app)
+    times = defaultdict(float)
+
+    def restore_database_start():
+        times["start"] = perf_counter()
+
+    def restore_table_start(table):
+        times["table_start"] = perf_counter()
+
+    def restore_table_complete(table):
+        times[table.__name__] = perf_counter() - times["table_start"]
+
+    def restore_database_complete():
+        times["total"] = perf_counter() - times["start"]
+
+    restore_db.events.restore_database_start += restore_database_start
+    restore_db.events.restore_table_start += restore_table_start
+    restore_db.events.restore_table_complete += restore_table_complete
+    restore_db.events.restore_database_complete += restore_database_complete
+    result = restore_db.execute(zip_file=zip_file, csv_folder=csv_folder, bulk_load=bulk_load)
+    if result.failure:
+        raise click.ClickException(result.error)
+    return times
+
+
+@click.command()
+@click.option("--zip-file", type=click.Path(exists=True, path_type=Path), help="Backup zip file to restore.")
+@click.option("--csv-folder", type=click.Path(exists=True, path_type=Path), help="CSV folder for the base tables.")
+@click.option("--pitchfx-copies", default=1, show_default=True, help="Repeat every pitchfx row N times.")
+def main(zip_file, csv_folder, pitchfx_copies):
+    with TemporaryDirectory() as temp_folder:
+        app = create_temp_app(temp_folder)
+        if not zip_file:
+            result = RestoreDatabaseTask(app).get_most_recent_backup()
+            if result.failure:
+                raise click.ClickException(result.error)
+            zip_file = result.value
+        if pitchfx_copies > 1:
+            zip_file = copy_zip_with_more_pitchfx(zip_file, temp_folder, pitchfx_copies)
+        baseline = time_restore(app, zip_file, csv_folder, bulk_load=False)
+        candidate = time_restore(app, zip_file, csv_folder, bulk_load=True)
+        app.db_session.close()
+    for table in [name for name in baseline if name not in ["start", "table_start", "total"]]:
+        print_comparison(f"restore {table}", baseline[table], candidate[table])
+    print_comparison("restore all tables", baseline["total"], candidate["total"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Shared helpers for the benchmark scripts in this folder."""
+
+import random
+from contextlib import contextmanager
+from time import perf_counter
+
+import vigorish.database as db
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PFX_BOOL_COLUMNS, PFX_FLOAT_COLUMNS
+from vigorish.enums import PitchType
+
+CAREER_PITCH_COUNT = 50000
+TEAM_SEASON_PITCH_COUNT = 24000
+PITCH_TYPES = ["FF", "SL", "CH", "CU", "SI", "FC"]
+
+
+def create_synthetic_pfx(count: int, seed: int = 42) -> list[db.PitchFx]:
+    """Create transient PitchFx instances with randomized values for all columns used by PitchFxMetrics."""
+    return [db.PitchFx(**pitch) for pitch in create_synthetic_pfx_dicts(count, seed)]
+
+
+def create_synthetic_pfx_dicts(count: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    pfx = []
+    for _ in range(count):
+        pitch_type = rng.choice(PITCH_TYPES)
+        pitch = {name: int(rng.random() < 0.3) for name in PFX_BOOL_COLUMNS}
+        pitch.update({name: round(rng.uniform(-10.0, 100.0), 2) for name in PFX_FLOAT_COLUMNS})
+        pitch["launch_speed"] = round(rng.uniform(60.0, 115.0), 1) if pitch["is_in_play"] else None
+        pitch["mlbam_pitch_name"] = pitch_type
+        pitch["pitch_type_int"] = int(PitchType.from_abbrev(pitch_type))
+        pitch["p_throws"] = rng.choice("RL")
+        pitch["stand"] = rng.choice("RL")
+        pitch["season_id"] = rng.randint(1, 5)
+        pitch["is_invalid_ibb"] = 0
+        pitch["is_out_of_sequence"] = 0
+        pfx.append(pitch)
+    return pfx
+
+
+@contextmanager
+def timer(results: dict, key: str):
+    start = perf_counter()
+    yield
+    results[key] = perf_counter() - start
+
+
+def print_comparison(title: str, baseline: float, candidate: float) -> None:
+    speedup = baseline / candidate if candidate else float("inf")
+    print(f"{title:<40} baseline: {baseline:8.3f}s  candidate: {candidate:8.3f}s  speedup: {speedup:6.1f}x")
@@ -40,6 +40,7 @@ INSTALL_REQUIRES = [
     "halo",
     "lxml",
     "naked",
+    "numpy",
     "py-getch",
     "pyfiglet",
     "python-dateutil",
@@ -54,6 +55,7 @@ INSTALL_REQUIRES = [
     "urllib3",
     "w3lib",
 ]
+EXTRAS_REQUIRE = {"orjson": ["orjson"]}
 
 exec(open(str(APP_ROOT / "src/vigorish/version.py")).read())
 setup(
@@ -75,6 +77,7 @@ setup(
     python_requires=">=3.6",
     classifiers=CLASSIFIERS,
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     entry_points="""
         [console_scripts]
         vig=vigorish.cli.vig:cli
@@ -17,6 +17,8 @@ from vigorish.config.project_paths import CSV_FOLDER, JSON_FOLDER, SQLITE_DEV_UR
 from vigorish.data.game_data import GameData
 from vigorish.data.scraped_data import ScrapedData
 from vigorish.enums import DataSet
+from vigorish.setup.migrate_schema import migrate_schema
+from vigorish.status.update_status_rollups import track_status_rollups
 from vigorish.types import AuditReport
 from vigorish.util.result import Result
 
@@ -75,6 +77,10 @@ class Vigorish:
         self.config = ConfigFile()
         self.db_engine = db_engine or self._create_db_engine()
         self.db_session = db_session or self._create_db_session()
+        track_status_rollups(self.db_session)
+        result = migrate_schema(self.db_session)
+        if result.failure:
+            raise ValueError(f"Failed to migrate database schema: {result.error}")
         self.scraped_data = ScrapedData(self.db_engine, self.db_session, self.config)
 
     def get_total_number_of_rows(self, db_table: Table) -> int:
@@ -34,7 +34,7 @@ class AddToDatabase(MenuItem):
 
     def launch_no_prompts(self, year):
         self.subscribe_to_events()
-        result = self.add_to_db.execute(year)
+        result = self.add_to_db.execute(year, bulk_insert=True)
         self.spinner.stop()
         self.unsubscribe_from_events()
         if result.failure:
@@ -52,7 +52,7 @@ class AddToDatabase(MenuItem):
                 return Result.Ok()
             year = result.value
         self.subscribe_to_events()
-        result = self.add_to_db.execute(year)
+        result = self.add_to_db.execute(year, bulk_insert=True)
         self.spinner.stop()
         self.unsubscribe_from_events()
         if result.failure:
@@ -94,15 +94,18 @@ class AddToDatabase(MenuItem):
     def add_data_to_db_start(self, year, game_ids):
         subprocess.run(["clear"])
         self.game_ids = game_ids
-        self.spinner.text = self.get_progress_text(0, year, game_ids[0])
+        self.spinner.text = self.get_progress_text(0, year, game_ids[0], 0.0)
         self.spinner.start()
 
-    def add_data_to_db_progress(self, num_complete, year, game_id):
-        self.spinner.text = self.get_progress_text(num_complete, year, game_id)
+    def add_data_to_db_progress(self, num_complete, year, game_id, pfx_per_sec):
+        self.spinner.text = self.get_progress_text(num_complete, year, game_id, pfx_per_sec)
 
-    def get_progress_text(self, num_complete, year, game_id):
+    def get_progress_text(self, num_complete, year, game_id, pfx_per_sec):
         percent = num_complete / float(self.total_games)
-        return f"Adding combined game data for MLB {year} to database... (Game ID: {game_id}) {percent:.0%}..."
+        return (
+            f"Adding combined game data for MLB {year} to database... (Game ID: {game_id}) {percent:.0%} "
+            f"({pfx_per_sec:,.0f} pitches/sec)..."
+        )
 
     def subscribe_to_events(self):
         self.add_to_db.events.add_data_to_db_start += self.add_data_to_db_start
@@ -66,8 +66,15 @@ class BackupDatabase(MenuItem):
     def backup_table_progress(self, percent):
         self.spinner.text = self.get_spinner_text(percent)
 
-    def create_zip_file_start(self):
-        self.spinner.text = "Compressing CSV files and adding to ZIP archive..."
+    def backup_table_complete(self, table_count, table, table_stats):
+        self.spinner.stop_and_persist(
+            self.spinner.frame(),
+            (
+                f"Exported {table.__name__} ({table_stats['rows']:,} rows, "
+                f"{table_stats['rows_per_sec']:,.0f} rows/sec)"
+            ),
+        )
+        self.spinner.start()
 
     def get_spinner_text(self, percent):
         return (
@@ -83,13 +90,13 @@ class BackupDatabase(MenuItem):
         self.backup_db.events.backup_database_start += self.backup_database_start
         self.backup_db.events.backup_table_start += self.backup_table_start
         self.backup_db.events.backup_table_progress += self.backup_table_progress
-        self.backup_db.events.create_zip_file_start += self.create_zip_file_start
+        self.backup_db.events.backup_table_complete += self.backup_table_complete
 
     def unsubscribe_from_events(self):
         self.backup_db.events.backup_database_start -= self.backup_database_start
         self.backup_db.events.backup_table_start -= self.backup_table_start
         self.backup_db.events.backup_table_progress -= self.backup_table_progress
-        self.backup_db.events.create_zip_file_start -= self.create_zip_file_start
+        self.backup_db.events.backup_table_complete -= self.backup_table_complete
 
     def get_task_description_pages(self):
         return [
@@ -102,8 +109,8 @@ class BackupDatabase(MenuItem):
                 "* scrape_status_game",
                 "* scrape_status_pitch_app\n",
                 (
-                    "After exporting each table as a CSV file, the files are added to a zip "
-                    "archive. Then, the zip file is compressed and the CSV files are removed."
+                    "All tables are read at the same time, and each table is written as a CSV "
+                    "file directly into a compressed zip archive."
                 ),
             ],
             [
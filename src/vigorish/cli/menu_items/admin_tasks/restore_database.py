@@ -109,6 +109,9 @@ class RestoreDatabase(MenuItem):
 
     def restore_database_start(self):
         subprocess.run(["clear"])
+        print_heading("Restore Database from Backup", fg="bright_yellow")
+        if not self.backup_start_time:
+            self.backup_start_time = datetime.now()
         self.spinner = Halo(spinner=get_random_dots_spinner(), color=get_random_cli_color())
         self.spinner.start()
 
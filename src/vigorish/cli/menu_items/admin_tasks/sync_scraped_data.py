@@ -61,7 +61,6 @@ class SyncScrapedData(MenuItem):
         result = self.get_sync_parameters()
         if result.failure:
             return Result.Ok(False)
-        self.get_all_s3_objects()
         for file_type, data_sets in self.sync_tasks.items():
             for data_set in data_sets:
                 result = self.find_out_of_sync_files(file_type, data_set)
@@ -119,14 +118,6 @@ class SyncScrapedData(MenuItem):
         }
         return user_options_prompt(choices, prompt)
 
-    def get_all_s3_objects(self):
-        subprocess.run(["clear"])
-        spinner = Halo(spinner=get_random_dots_spinner(), color=get_random_cli_color())
-        spinner.text = "Retrieving details of all objects stored in S3..."
-        spinner.start()
-        self.s3_sync.get_all_s3_objects()
-        spinner.stop()
-
     def find_out_of_sync_files(self, file_type, data_set):
         self.task_number += 1
         self.report_sync_results()
@@ -235,14 +226,22 @@ class SyncScrapedData(MenuItem):
         self.spinner = Halo(spinner=get_random_dots_spinner(), color=get_random_cli_color())
         self.spinner.start()
         self.s3_sync.events.sync_files_progress += self.update_sync_progress
-        self.s3_sync.sync_files(self.sync_direction, missing_files, outdated_files, file_type, data_set, self.year)
+        result = self.s3_sync.sync_files(
+            self.sync_direction, missing_files, outdated_files, file_type, data_set, self.year
+        )
         self.s3_sync.events.sync_files_progress -= self.update_sync_progress
         self.spinner.stop()
+        if result.failure:
+            print_message(result.error, fg="bright_red", bold=True)
+            pause(message="Press any key to continue...")
+            return
+        sync_stats = result.value
         src_folder = "S3 bucket" if self.sync_direction == SyncDirection.DOWN_TO_LOCAL else "local folder"
         dest_folder = "local folder" if self.sync_direction == SyncDirection.DOWN_TO_LOCAL else "S3 bucket"
         message = (
             f"All changes have been applied, MLB {self.year} {data_set} {file_type} files in {src_folder} "
-            f"have been synced to {dest_folder}!"
+            f"have been synced to {dest_folder}! ({sync_stats['files_per_sec']:.1f} files/sec, "
+            f"{file_size_str(sync_stats['bytes_per_sec'])}/sec)"
         )
         print_message(message, fg="bright_green", bold=True)
         pause(message="Press any key to continue...")
@@ -21,6 +21,10 @@ from vigorish.cli.menu_item import MenuItem
 from vigorish.constants import EMOJIS, MENU_NUMBERS
 from vigorish.enums import AuditError, ScrapeCondition
 from vigorish.tasks.combine_scraped_data import CombineScrapedDataTask
+from vigorish.tasks.combine_scraped_data_parallel import (
+    CombineScrapedDataParallelTask,
+    get_combine_data_worker_count,
+)
 from vigorish.util.dt_format_strings import DATE_MONTH_NAME
 from vigorish.util.list_helpers import flatten_list2d
 from vigorish.util.result import Result
@@ -44,6 +48,9 @@ class CombineScrapedData(MenuItem):
     def __init__(self, app):
         super().__init__(app)
         self.combine_data = CombineScrapedDataTask(app)
+        self.combine_data_parallel = None
+        if get_combine_data_worker_count() > 1:
+            self.combine_data_parallel = CombineScrapedDataParallelTask(app)
         self._season = None
         self._date_game_id_map = {}
         self.pbar_manager = enlighten.get_manager()
@@ -344,12 +351,8 @@ class CombineScrapedData(MenuItem):
         return self.total_dates - self.date_progress_bar.count
 
     def combine_selected_games(self, game_date, game_ids):
-        for bbref_game_id in game_ids:
+        for bbref_game_id, result in self.combine_games(game_date, game_ids):
             fail_results = []
-            self.current_game_id = bbref_game_id
-            self.update_progress_bars(game_date)
-            # LOGGER.info(f"Begin combining scraped data for game: {bbref_game_id}")
-            result = self.combine_data.execute(bbref_game_id)
             if not result["gather_scraped_data_success"]:
                 LOGGER.info(f"Unable to combine data for game: {bbref_game_id}")
                 LOGGER.info(f"An error occurred gathering scraped data for game: {bbref_game_id}")
@@ -380,6 +383,18 @@ class CombineScrapedData(MenuItem):
                 # LOGGER.info(f"Successfully combined scraped data for game: {bbref_game_id}")
         return Result.Ok()
 
+    def combine_games(self, game_date, game_ids):
+        if self.combine_data_parallel:
+            for bbref_game_id, result in self.combine_data_parallel.combine_games(game_ids):
+                self.current_game_id = bbref_game_id
+                self.update_progress_bars(game_date)
+                yield (bbref_game_id, result)
+            return
+        for bbref_game_id in game_ids:
+            self.current_game_id = bbref_game_id
+            self.update_progress_bars(game_date)
+            yield (bbref_game_id, self.combine_data.execute(bbref_game_id))
+
     def update_progress_bars(self, game_date):
         date_str = game_date.strftime(DATE_MONTH_NAME)
         self.status_bar.update(
@@ -405,6 +420,8 @@ class CombineScrapedData(MenuItem):
         self.date_progress_bar.close()
         self.game_progress_bar_success.close()
         self.pbar_manager.stop()
+        if self.combine_data_parallel:
+            self.combine_data_parallel.shutdown()
 
     def display_results(self):
         subprocess.run(["clear"])
@@ -17,7 +17,9 @@ from vigorish.status.report_status import (
     report_season_status,
     report_status_single_date,
 )
-from vigorish.tasks import SyncDataNoPromptsTask
+from vigorish.status.update_status_rollups import rebuild_status_rollups
+from vigorish.tasks import RebuildPitchStatsToDateTask, SyncDataNoPromptsTask
+from vigorish.tasks.reparse_scraped_html import REPARSE_DATA_SETS, ReparseScrapedHtmlTask
 from vigorish.util.datetime_util import current_year, today_str
 from vigorish.util.result import Result
 from vigorish.util.string_helpers import flatten_list2d
@@ -237,6 +239,28 @@ def status_season(app, year, verbosity):
     return exit_app(app, result)
 
 
+@status.command("rebuild", context_settings={"help_option_names": ["-h", "--help"]})
+@click.pass_obj
+def status_rebuild(app):
+    """Recalculate the season, date and game status totals from the scrape status tables."""
+    result = rebuild_status_rollups(app.db_session)
+    if result.failure:
+        return exit_app(app, result)
+    rollup_counts = [f"{rollup_model.__tablename__}: {count:,} rows" for rollup_model, count in result.value.items()]
+    return exit_app(app, result, "\n".join(["Rebuilt status totals:"] + rollup_counts))
+
+
+@status.command("rebuild-pitch-stats", context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument("year", type=MlbSeason(), required=False)
+@click.pass_obj
+def status_rebuild_pitch_stats(app, year):
+    """Recalculate the running season totals for each pitcher (all seasons if YEAR is not provided)."""
+    result = RebuildPitchStatsToDateTask(app).execute(year)
+    if result.failure:
+        return exit_app(app, result)
+    return exit_app(app, result, f"Rebuilt pitcher season totals: {result.value:,} rows")
+
+
 @cli.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.pass_obj
 def sync(app):
@@ -308,6 +332,36 @@ def sync_down_to_local(app, year, file_type, data_set):
     return exit_app(app, result)
 
 
+@cli.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument("year", type=MlbSeason(), default=current_year)
+@click.option(
+    "--data-set",
+    type=DataSetName(),
+    multiple=True,
+    default=[str(DataSet.ALL)],
+    show_default=True,
+    help="Data set(s) to parse (BBREF_BOXSCORES and/or BROOKS_PITCHFX), multiple values can be provided.",
+)
+@click.option("--workers", type=int, default=None, help="Number of worker processes (default: number of CPUs).")
+@click.pass_obj
+def reparse(app, year, data_set, workers):
+    """Parse all cached HTML for a season again, using multiple processes."""
+    data_sets_int = sum(int(ds) for ds in flatten_list2d(data_set))
+    data_sets = [ds for ds in REPARSE_DATA_SETS if ds & data_sets_int]
+    result = ReparseScrapedHtmlTask(app, max_workers=workers).execute(year, data_sets)
+    if result.failure:
+        return exit_app(app, result)
+    report = []
+    for ds, reparse_results in result.value.items():
+        report.append(
+            f"{ds}: {reparse_results['parsed']}/{reparse_results['total_pages']} pages parsed in "
+            f"{reparse_results['elapsed']:.1f}s ({reparse_results['pages_per_sec']:.1f} pages/sec)"
+        )
+        report.extend(f"  {url_id}: {error}" for url_id, error in reparse_results["errors"].items())
+        report.extend(f"  {url_id}: HTML not found" for url_id in reparse_results["missing_html"])
+    return exit_app(app, result, "\n".join(report))
+
+
 def exit_app(app, result, message=None):
     app.db_session.close()
     subprocess.run(["clear"])
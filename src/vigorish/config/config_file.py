@@ -104,7 +104,7 @@ class ConfigFile:
         html_storage_settings = [self.get_current_setting("HTML_STORAGE", data_set) for data_set in data_sets]
         json_storage_settings = [self.get_current_setting("JSON_STORAGE", data_set) for data_set in data_sets]
         html_local_storage = all(
-            html_storage in [HtmlStorageOption.NONE, HtmlStorageOption.LOCAL_FOLDER]
+            html_storage in [HtmlStorageOption.NONE, HtmlStorageOption.LOCAL_FOLDER, HtmlStorageOption.LOCAL_ARCHIVE]
             for html_storage in html_storage_settings
         )
 
@@ -376,7 +376,8 @@ class ConfigFile:
                 "DESCRIPTION": (
                     "By default, HTML is NOT saved after it has been parsed. However, you "
                     "can choose to save scraped HTML in a local folder, S3 bucket, or "
-                    "both."
+                    "both. LOCAL_ARCHIVE saves the HTML for each season and data set in a few "
+                    "compressed archive files in the local folder instead of one file per page."
                 ),
                 "SAME_SETTING_FOR_ALL_DATA_SETS": True,
             },
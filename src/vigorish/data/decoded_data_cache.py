@@ -0,0 +1,99 @@
+"""Bounded LRU cache of scraped data objects decoded from local JSON files."""
+import pickle
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+
+from vigorish.util.dt_format_strings import DATE_ONLY
+from vigorish.util.numeric_helpers import ONE_MB
+
+MAX_CACHE_SIZE = 64 * ONE_MB
+
+
+class DecodedDataCache:
+    """Keep recently decoded scraped data in memory, evicting the least recently used items past max_size bytes.
+
+    Items are keyed by (file_type, data_set, url_id, mtime), so an item is never returned after the JSON file it was
+    decoded from has been modified. Each item is stored as a pickled snapshot and a new copy is unpickled for each
+    hit, because patch lists and the combine process modify the objects they are given. Unpickling is several times
+    faster than reading and decoding the JSON file, and the size of the snapshot is the size charged to the cache.
+
+    A url_id that is a date is stored as a DATE_ONLY string, the same format as the url_id of a date patch list.
+    """
+
+    def __init__(self, max_size=MAX_CACHE_SIZE):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.mtimes = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "items": len(self.items),
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+    def get(self, file_type, data_set, url_id, mtime):
+        key = (file_type, data_set, get_cache_url_id(url_id), mtime)
+        with self.lock:
+            snapshot = self.items.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(snapshot)
+
+    def put(self, file_type, data_set, url_id, mtime, data):
+        try:
+            snapshot = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        if len(snapshot) > self.max_size:
+            return False
+        url_id = get_cache_url_id(url_id)
+        with self.lock:
+            if (file_type, data_set, url_id) in self.mtimes:
+                self._remove((file_type, data_set, url_id, self.mtimes[(file_type, data_set, url_id)]))
+            self.items[(file_type, data_set, url_id, mtime)] = snapshot
+            self.mtimes[(file_type, data_set, url_id)] = mtime
+            self.size += len(snapshot)
+            while self.size > self.max_size:
+                self._remove(next(iter(self.items)))
+                self.evictions += 1
+        return True
+
+    def invalidate(self, file_type, data_set, url_id):
+        """Remove the item decoded from the file for file_type, data_set and url_id (if it is cached)."""
+        key = (file_type, data_set, get_cache_url_id(url_id))
+        with self.lock:
+            if key in self.mtimes:
+                self._remove((*key, self.mtimes[key]))
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.mtimes.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        self.size -= len(self.items.pop(key))
+        del self.mtimes[key[:3]]
+
+
+def get_cache_url_id(url_id):
+    return url_id.strftime(DATE_ONLY) if isinstance(url_id, date) else url_id
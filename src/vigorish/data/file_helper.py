@@ -1,11 +1,11 @@
 """Functions for reading and writing files."""
-import json
 import os
 from pathlib import Path
 
 import boto3
 import botocore
 
+from vigorish.data.file_index import FileIndex
 from vigorish.data.json_decoder import (
     decode_bbref_boxscore,
     decode_bbref_boxscore_patch_list,
@@ -18,6 +18,7 @@ from vigorish.data.json_decoder import (
     decode_brooks_pitchfx_patch_list,
 )
 from vigorish.enums import DataSet, LocalFileTask, S3FileTask, VigFile
+from vigorish.util import json_serializer
 from vigorish.util.dt_format_strings import DATE_ONLY, DATE_ONLY_TABLE_ID
 from vigorish.util.exceptions import S3BucketException
 from vigorish.util.numeric_helpers import ONE_KB
@@ -31,9 +32,10 @@ class FileHelper:
         self.s3_resource = None
         try:  # pragma: no cover
             if os.environ.get("ENV") != "TEST":
-                self.s3_resource = boto3.resource("s3")
+                self.s3_resource = boto3.resource("s3", endpoint_url=os.environ.get("S3_ENDPOINT_URL") or None)
         except (boto3.exceptions.ResourceNotExistsError, ValueError):  # pragma: no cover
             self.s3_resource = None
+        self.file_indexes = {}
 
     @property
     def local_folderpath_dict(self):
@@ -142,6 +144,10 @@ class FileHelper:
         storage_setting = self.file_storage_dict[file_type][data_set]
         return "LOCAL_FOLDER" in storage_setting.name or "BOTH" in storage_setting.name
 
+    def check_file_stored_archive(self, file_type, data_set):
+        storage_setting = self.file_storage_dict[file_type][data_set]
+        return "LOCAL_ARCHIVE" in storage_setting.name
+
     def check_file_stored_s3(self, file_type, data_set):  # pragma: no cover
         storage_setting = self.file_storage_dict[file_type][data_set]
         return "S3_BUCKET" in storage_setting.name or "BOTH" in storage_setting.name
@@ -154,6 +160,10 @@ class FileHelper:
         s3_bucket = self.get_s3_bucket()
         return list(s3_bucket.objects.all()) if s3_bucket else []
 
+    def get_s3_objects_in_folder(self, s3_folder):  # pragma: no cover
+        s3_bucket = self.get_s3_bucket()
+        return list(s3_bucket.objects.filter(Prefix=f"{s3_folder.rstrip('/')}/")) if s3_bucket else []
+
     def perform_local_file_task(
         self,
         task,
@@ -337,18 +347,34 @@ class FileHelper:
     def get_file_name_combined_game_data(self, bbref_game_id):
         return f"{bbref_game_id}_COMBINED_DATA.json"
 
+    def get_file_index(self, folderpath):
+        folderpath = Path(folderpath).resolve()
+        if folderpath not in self.file_indexes:
+            self.file_indexes[folderpath] = FileIndex(folderpath)
+        return self.file_indexes[folderpath]
+
+    def get_local_file_names(self, file_type, data_set, year, min_size=0):
+        """Names of the files in the local folder for file_type, data_set and year, read from the folder's index."""
+        folderpath = self.get_local_folderpath(file_type, data_set, year=year)
+        return self.get_file_index(folderpath).get_names(min_size)
+
     def read_local_file(self, filepath):
         return Result.Ok(filepath) if filepath.exists() else Result.Fail(f"File not found: {filepath.resolve()}.")
 
     def write_to_file(self, file_type, data, filepath):
         """Write object in json format to file."""
-        if file_type in [VigFile.PARSED_JSON, VigFile.PATCH_LIST]:
+        if file_type == VigFile.PARSED_JSON:
+            data = json_serializer.dumps(data.as_dict())
+        if file_type == VigFile.PATCH_LIST:
             data = data.as_json()
         if file_type == VigFile.COMBINED_GAME_DATA:
-            data = json.dumps(data, indent=2, sort_keys=False)
+            data = json_serializer.dumps(data)
         try:
+            file_index = self.get_file_index(filepath.parent)
+            file_index.refresh()
             filepath.parent.mkdir(parents=True, exist_ok=True)
             filepath.write_text(data)
+            file_index.add(filepath)
             return Result.Ok(filepath)
         except Exception as e:
             error = f"Error: {repr(e)}"
@@ -356,16 +382,19 @@ class FileHelper:
 
     def delete_file(self, filepath):
         if filepath.exists() and filepath.is_file():
+            file_index = self.get_file_index(filepath.parent)
+            file_index.refresh()
             filepath.unlink()
+            file_index.remove(filepath)
         return Result.Ok()
 
     def decode_json(self, file_type, data_set, filepath):
         delete_file = not self.check_file_stored_local(VigFile.PARSED_JSON, data_set)
         try:
-            contents = filepath.read_text()
+            contents = filepath.read_bytes()
             if delete_file and os.environ.get("ENV") != "TEST":
-                filepath.unlink()
-            return self.json_decoder_dict[file_type][data_set](json.loads(contents))
+                self.delete_file(filepath)
+            return self.json_decoder_dict[file_type][data_set](json_serializer.loads(contents))
         except Exception as e:
             error = f"Error: {repr(e)}"
             return Result.Fail(error)
@@ -379,7 +408,7 @@ class FileHelper:
         try:
             self.get_s3_bucket().upload_file(str(filepath), s3_key)
             if delete_file:
-                filepath.unlink()
+                self.delete_file(filepath)
             return Result.Ok() if delete_file else Result.Ok(filepath)
         except botocore.exceptions.ClientError as ex:
             error_code = ex.response["Error"]["Code"]
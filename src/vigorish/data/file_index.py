@@ -0,0 +1,139 @@
+"""Record the name, size and modified time of each file in a local folder of scraped data."""
+import os
+from pathlib import Path
+from threading import RLock
+
+FILE_INDEX_NAME = ".file_index"
+MAX_STALE_LINES = 1000
+
+
+class FileIndex:
+    """Name, size and modified time of each file in a local folder, read without listing the folder.
+
+    The index is an append-only, tab-separated file stored in the folder it describes:
+
+        name  size  mtime
+
+    FileHelper appends a line each time it writes a file, and a line with size -1 each time it deletes a file. The
+    last line for a file name wins. A line with an empty name records the modified time of the folder (in ns) after
+    the change, since adding or removing a file changes the modified time of the folder that contains it.
+
+    Files added or removed any other way (e.g., downloaded from S3 or copied by hand) change the modified time of
+    the folder without updating the index. When this is detected, the index is rebuilt from a single scan of the
+    folder, so the index can be used in place of globbing the folder or checking each file. A file modified in place
+    by another program does not change the modified time of the folder, so its size and mtime are not updated until
+    it is written by FileHelper or the index is rebuilt.
+    """
+
+    def __init__(self, folderpath):
+        self.folderpath = Path(folderpath)
+        self.filepath = self.folderpath.joinpath(FILE_INDEX_NAME)
+        self.files = {}
+        self.folder_mtime = None
+        self.index_offset = 0
+        self.index_inode = None
+        self.line_count = 0
+        self.lock = RLock()
+
+    def __contains__(self, name):
+        return name in self.get_files()
+
+    @property
+    def names(self):
+        return sorted(self.get_files())
+
+    def get_files(self):
+        """Return a dict mapping the name of each file in the folder to a (size, mtime) tuple."""
+        with self.lock:
+            self.refresh()
+            return dict(self.files)
+
+    def get_names(self, min_size=0):
+        return {name for (name, (size, _)) in self.get_files().items() if size > min_size}
+
+    def refresh(self):
+        """Read changes made by other processes, rebuilding the index if the folder was changed without it."""
+        with self.lock:
+            if not self.folderpath.is_dir():
+                self.files = {}
+                self.folder_mtime = None
+                return
+            self.read_index()
+            if self.folder_mtime != self.folderpath.stat().st_mtime_ns:
+                self.rebuild()
+
+    def read_index(self):
+        """Read any lines appended to the index file since it was last read (all lines if it was replaced)."""
+        if not self.filepath.exists():
+            self.reset_index(None)
+            return
+        index_stat = self.filepath.stat()
+        if index_stat.st_ino != self.index_inode or index_stat.st_size < self.index_offset:
+            self.reset_index(index_stat.st_ino)
+        if index_stat.st_size == self.index_offset:
+            return
+        with open(self.filepath, "rb") as index_file:
+            index_file.seek(self.index_offset)
+            for line in index_file:
+                if not line.endswith(b"\n"):
+                    break
+                self.index_offset += len(line)
+                self.line_count += 1
+                (name, size, mtime) = line.decode("utf-8").rstrip("\n").split("\t")
+                if not name:
+                    self.folder_mtime = int(mtime)
+                elif int(size) < 0:
+                    self.files.pop(name, None)
+                else:
+                    self.files[name] = (int(size), float(mtime))
+
+    def reset_index(self, index_inode):
+        self.files = {}
+        self.folder_mtime = None
+        self.index_offset = 0
+        self.index_inode = index_inode
+        self.line_count = 0
+
+    def rebuild(self):
+        files = {}
+        with os.scandir(self.folderpath) as folder:
+            for entry in folder:
+                if entry.is_file() and not entry.name.startswith("."):
+                    file_stat = entry.stat()
+                    files[entry.name] = (file_stat.st_size, file_stat.st_mtime)
+        temp_filepath = self.filepath.with_name(f"{FILE_INDEX_NAME}.tmp")
+        temp_filepath.write_bytes(b"".join(get_index_line(name, *files[name]) for name in sorted(files)))
+        os.replace(temp_filepath, self.filepath)
+        self.append_to_index([get_index_line("", 0, self.folderpath.stat().st_mtime_ns)])
+        self.read_index()
+
+    def add(self, filepath):
+        """Record a file that was just written to the folder. Call refresh() before the file is written."""
+        with self.lock:
+            if self.folder_mtime is None:
+                self.refresh()
+                return
+            file_stat = Path(filepath).stat()
+            self.append_change(get_index_line(Path(filepath).name, file_stat.st_size, file_stat.st_mtime))
+
+    def remove(self, filepath):
+        """Record a file that was just deleted from the folder. Call refresh() before the file is deleted."""
+        with self.lock:
+            if self.folder_mtime is None:
+                self.refresh()
+                return
+            self.append_change(get_index_line(Path(filepath).name, -1, 0))
+
+    def append_change(self, index_line):
+        self.append_to_index([index_line, get_index_line("", 0, self.folderpath.stat().st_mtime_ns)])
+        self.read_index()
+        if self.line_count > 2 * len(self.files) + MAX_STALE_LINES:
+            self.rebuild()
+
+    def append_to_index(self, index_lines):
+        with open(self.filepath, "ab") as index_file:
+            index_file.write(b"".join(index_lines))
+
+
+def get_index_line(name, size, mtime):
+    return f"{name}\t{size}\t{mtime!r}\n".encode("utf-8")
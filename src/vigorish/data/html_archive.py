@@ -0,0 +1,194 @@
+"""Store the scraped HTML for a season and data set in compressed, append-only segment files."""
+import gzip
+import os
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+
+from vigorish.util.numeric_helpers import ONE_MB
+
+INDEX_FILE_NAME = "html_archive.idx"
+SEGMENT_FILE_PREFIX = "html_archive_"
+SEGMENT_FILE_SUFFIX = ".gz"
+MAX_SEGMENT_SIZE = 64 * ONE_MB
+COMPRESS_LEVEL = 6
+
+
+class HtmlArchive:
+    """Pack the HTML for a season and data set into a small number of files instead of one file per page.
+
+    Each page is compressed as a separate gzip member and appended to the active segment file
+    (html_archive_0001.gz, html_archive_0002.gz, ...). A new segment is started when the active segment reaches
+    max_segment_size. Since a segment is a series of complete gzip members, `gzip -dc` will print every page it
+    contains. The location of each page is appended to the index file as a tab-separated line:
+
+        url_id  segment  offset  length
+
+    The last line for a url_id wins, so saving a page again appends a new copy and deleting a page appends a line
+    with length -1. The space used by pages that were replaced or deleted is reclaimed by compact().
+
+    The index is read into memory when the archive is opened. If a url_id is not found, any lines appended by
+    another process since the index was last read are loaded before giving up.
+    """
+
+    def __init__(self, folderpath, max_segment_size=MAX_SEGMENT_SIZE):
+        self.folderpath = Path(folderpath)
+        self.index_filepath = self.folderpath.joinpath(INDEX_FILE_NAME)
+        self.max_segment_size = max_segment_size
+        self.index = {}
+        self.index_offset = 0
+        self.active_segment = None
+        self._extract_folderpath = None
+        self.refresh_index()
+
+    def __contains__(self, url_id):
+        return url_id in self.index or (self.refresh_index() and url_id in self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def url_ids(self):
+        self.refresh_index()
+        return sorted(self.index)
+
+    @property
+    def segment_numbers(self):
+        return sorted(
+            int(segment.name[len(SEGMENT_FILE_PREFIX) : -len(SEGMENT_FILE_SUFFIX)])
+            for segment in self.folderpath.glob(f"{SEGMENT_FILE_PREFIX}*{SEGMENT_FILE_SUFFIX}")
+        )
+
+    @property
+    def disk_usage(self):
+        segment_files = [self.get_segment_filepath(segment) for segment in self.segment_numbers]
+        index_size = self.index_filepath.stat().st_size if self.index_filepath.exists() else 0
+        return index_size + sum(segment_file.stat().st_size for segment_file in segment_files)
+
+    @property
+    def extract_folderpath(self):
+        """Temporary folder where pages are written when a file path is required (removed when the archive is)."""
+        if not self._extract_folderpath:
+            self._extract_folderpath = Path(tempfile.mkdtemp(prefix="vig_html_archive_"))
+            weakref.finalize(self, shutil.rmtree, self._extract_folderpath, True)
+        return self._extract_folderpath
+
+    def get_segment_filepath(self, segment):
+        return self.folderpath.joinpath(f"{SEGMENT_FILE_PREFIX}{segment:04d}{SEGMENT_FILE_SUFFIX}")
+
+    def refresh_index(self):
+        """Read any lines appended to the index file since it was last read, returns True if any were found."""
+        if not self.index_filepath.exists() or self.index_filepath.stat().st_size == self.index_offset:
+            return False
+        with open(self.index_filepath, "rb") as index_file:
+            index_file.seek(self.index_offset)
+            for line in index_file:
+                if not line.endswith(b"\n"):
+                    break
+                self.index_offset += len(line)
+                (url_id, segment, offset, length) = line.decode("utf-8").rstrip("\n").split("\t")
+                if int(length) < 0:
+                    self.index.pop(url_id, None)
+                else:
+                    self.index[url_id] = (int(segment), int(offset), int(length))
+        return True
+
+    def read(self, url_id):
+        data = self.read_compressed(url_id)
+        return gzip.decompress(data).decode("utf-8") if data is not None else None
+
+    def read_compressed(self, url_id):
+        if url_id not in self:
+            return None
+        (segment, offset, length) = self.index[url_id]
+        with open(self.get_segment_filepath(segment), "rb") as segment_file:
+            segment_file.seek(offset)
+            return segment_file.read(length)
+
+    def extract(self, url_id, filename):
+        html = self.read(url_id)
+        if html is None:
+            return None
+        filepath = self.extract_folderpath.joinpath(filename)
+        filepath.write_text(html)
+        return filepath
+
+    def write(self, url_id, html):
+        data = gzip.compress(html.encode("utf-8"), compresslevel=COMPRESS_LEVEL, mtime=0)
+        segment = self.get_active_segment(len(data))
+        offset = self.append_to_segment(segment, data)
+        self.append_to_index(url_id, segment, offset, len(data))
+        return self.get_segment_filepath(segment)
+
+    def delete(self, url_id):
+        if url_id not in self:
+            return False
+        self.append_to_index(url_id, 0, 0, -1)
+        return True
+
+    def get_active_segment(self, size):
+        if not self.active_segment:
+            segments = self.segment_numbers
+            self.active_segment = segments[-1] if segments else 1
+        segment_filepath = self.get_segment_filepath(self.active_segment)
+        segment_size = segment_filepath.stat().st_size if segment_filepath.exists() else 0
+        if segment_size and segment_size + size > self.max_segment_size:
+            self.active_segment += 1
+        return self.active_segment
+
+    def append_to_segment(self, segment, data):
+        self.folderpath.mkdir(parents=True, exist_ok=True)
+        with open(self.get_segment_filepath(segment), "ab") as segment_file:
+            offset = segment_file.tell()
+            segment_file.write(data)
+        return offset
+
+    def append_to_index(self, url_id, segment, offset, length):
+        with open(self.index_filepath, "ab") as index_file:
+            index_file.write(get_index_line(url_id, segment, offset, length))
+        self.refresh_index()
+
+    def import_html_files(self, filepaths, delete_files=False):
+        """Add existing HTML files to the archive, using the file name (without extension) as the url_id."""
+        count = 0
+        for filepath in map(Path, filepaths):
+            self.write(filepath.stem, filepath.read_text())
+            if delete_files:
+                filepath.unlink()
+            count += 1
+        return count
+
+    def compact(self):
+        """Copy the pages that are in the index to new segment files and remove the old segment files.
+
+        This must not be run while another process is reading from or writing to the archive. Returns the number
+        of bytes that were reclaimed.
+        """
+        self.refresh_index()
+        size_before = self.disk_usage
+        old_segments = self.segment_numbers
+        segment = old_segments[-1] + 1 if old_segments else 1
+        segment_size = 0
+        index_lines = []
+        for url_id in sorted(self.index):
+            data = self.read_compressed(url_id)
+            if segment_size and segment_size + len(data) > self.max_segment_size:
+                segment += 1
+            offset = self.append_to_segment(segment, data)
+            segment_size = offset + len(data)
+            index_lines.append(get_index_line(url_id, segment, offset, len(data)))
+        temp_filepath = self.index_filepath.with_suffix(".tmp")
+        temp_filepath.write_bytes(b"".join(index_lines))
+        os.replace(temp_filepath, self.index_filepath)
+        for old_segment in old_segments:
+            self.get_segment_filepath(old_segment).unlink()
+        self.active_segment = segment
+        self.index = {}
+        self.index_offset = 0
+        self.refresh_index()
+        return size_before - self.disk_usage
+
+
+def get_index_line(url_id, segment, offset, length):
+    return f"{url_id}\t{segment}\t{offset}\t{length}\n".encode("utf-8")
@@ -1,4 +1,7 @@
 """Functions for reading and writing files."""
+from pathlib import Path
+
+from vigorish.data.html_archive import HtmlArchive
 from vigorish.enums import DataSet, LocalFileTask, S3FileTask, VigFile
 from vigorish.util.result import Result
 from vigorish.util.string_helpers import validate_bbref_game_id, validate_pitch_app_id
@@ -10,6 +13,7 @@ class HtmlStorage:
     def __init__(self, config, file_helper):
         self.config = config
         self.file_helper = file_helper
+        self.archives = {}
 
     def save_html(self, data_set, url_id, html):
         local_filepath = None
@@ -20,6 +24,10 @@ class HtmlStorage:
             result_local = self.save_html_local(data_set, url_id, html)
             if result_local.success:
                 local_filepath = result_local.value
+        if self.html_stored_archive(data_set):
+            result_local = self.save_html_archive(data_set, url_id, html)
+            if result_local.success:
+                local_filepath = result_local.value
         if self.html_stored_s3(data_set):  # pragma: no cover
             result_s3 = self.save_html_s3(data_set, url_id, html)
             if result_s3.success:
@@ -42,6 +50,57 @@ class HtmlStorage:
         }
         return save_html_local_dict[data_set](url_id, html)
 
+    def html_stored_archive(self, data_set):
+        return self.file_helper.check_file_stored_archive(VigFile.SCRAPED_HTML, data_set)
+
+    def get_html_archive(self, data_set, game_date=None, year=None):
+        folderpath = self.file_helper.get_local_folderpath(VigFile.SCRAPED_HTML, data_set, game_date, year)
+        if folderpath not in self.archives:
+            self.archives[folderpath] = HtmlArchive(folderpath)
+        return self.archives[folderpath]
+
+    def get_archive_key(self, data_set, url_id):
+        result = get_game_date_from_url_id(data_set, url_id)
+        if result.failure:
+            return result
+        game_date = result.value
+        filename = self.file_helper.filename_dict[VigFile.SCRAPED_HTML][data_set](url_id)
+        return Result.Ok((self.get_html_archive(data_set, game_date), Path(filename).stem, filename))
+
+    def save_html_archive(self, data_set, url_id, html):
+        result = self.get_archive_key(data_set, url_id)
+        if result.failure:
+            return result
+        (archive, archive_key, _) = result.value
+        try:
+            return Result.Ok(archive.write(archive_key, html))
+        except Exception as e:
+            return Result.Fail(f"Error: {repr(e)}")
+
+    def get_html_archive_file(self, data_set, url_id):
+        result = self.get_archive_key(data_set, url_id)
+        if result.failure:
+            return result
+        (archive, archive_key, filename) = result.value
+        filepath = archive.extract(archive_key, filename)
+        return Result.Ok(filepath) if filepath else Result.Fail(f"{filename} not found in {archive.folderpath}")
+
+    def delete_html_archive(self, data_set, url_id):
+        result = self.get_archive_key(data_set, url_id)
+        if result.failure:
+            return result
+        (archive, archive_key, _) = result.value
+        archive.delete(archive_key)
+        return Result.Ok()
+
+    def get_cached_html_folderpath(self, data_set, game_date):
+        if self.html_stored_archive(data_set):
+            return str(self.get_html_archive(data_set, game_date).extract_folderpath)
+        return self.file_helper.get_local_folderpath(VigFile.SCRAPED_HTML, data_set, game_date)
+
+    def get_archived_url_ids(self, data_set, year):
+        return self.get_html_archive(data_set, year=year).url_ids
+
     def html_stored_s3(self, data_set):  # pragma: no cover
         return self.file_helper.check_file_stored_s3(VigFile.SCRAPED_HTML, data_set)
 
@@ -60,6 +119,10 @@ class HtmlStorage:
             result_local = self.get_html_local(data_set, url_id)
             if result_local.success:
                 return result_local.value
+        if self.html_stored_archive(data_set):
+            result_archive = self.get_html_archive_file(data_set, url_id)
+            if result_archive.success:
+                return result_archive.value
         if self.html_stored_s3(data_set):  # pragma: no cover
             result_s3 = self.get_html_s3(data_set, url_id)
             if result_s3.success:
@@ -91,6 +154,8 @@ class HtmlStorage:
         result_s3 = Result.Ok()
         if self.html_stored_local(data_set):
             result_local = self.delete_html_local(data_set, url_id)
+        if self.html_stored_archive(data_set):
+            result_local = self.delete_html_archive(data_set, url_id)
         if self.html_stored_s3(data_set):  # pragma: no cover
             result_s3 = self.delete_html_s3(data_set, url_id)
         return Result.Combine([result_local, result_s3])
@@ -478,3 +543,13 @@ class HtmlStorage:
             game_date=game_dict["game_date"],
             pitch_app_id=pitch_app_id,
         )
+
+
+def get_game_date_from_url_id(data_set, url_id):
+    if data_set in [DataSet.BROOKS_GAMES_FOR_DATE, DataSet.BBREF_GAMES_FOR_DATE]:
+        return Result.Ok(url_id)
+    validate_url_id = validate_bbref_game_id if data_set == DataSet.BBREF_BOXSCORES else validate_pitch_app_id
+    result = validate_url_id(url_id)
+    if result.failure:
+        return result
+    return Result.Ok(result.value["game_date"])
@@ -1,6 +1,7 @@
 """Decode json dicts of scraped data to custom objects."""
+from dataclasses import fields
+
 from dacite import from_dict
-from dateutil import parser
 
 from vigorish.patch.bbref_boxscores import BBRefBoxscorePatchList, PatchBBRefBoxscorePitchSequence
 from vigorish.patch.bbref_games_for_date import (
@@ -38,13 +39,16 @@ from vigorish.scrape.brooks_pitch_logs.models.pitch_log import BrooksPitchLog
 from vigorish.scrape.brooks_pitch_logs.models.pitch_logs_for_game import BrooksPitchLogsForGame
 from vigorish.scrape.brooks_pitchfx.models.pitchfx import BrooksPitchFxData
 from vigorish.scrape.brooks_pitchfx.models.pitchfx_log import BrooksPitchFxLog
+from vigorish.util.json_serializer import parse_date_str
 from vigorish.util.result import Result
 
+PITCHFX_DATA_FIELDS = {f.name for f in fields(BrooksPitchFxData) if f.init}
+
 
 def decode_bbref_games_for_date(json_dict):
     """Convert json dictionary to BbrefGamesForDate object."""
     json_dict.pop("__bbref_games_for_date__")
-    json_dict["game_date"] = parser.parse(json_dict["game_date_str"])
+    json_dict["game_date"] = parse_date_str(json_dict["game_date_str"])
     games_dict_list = json_dict.pop("games")
     games_for_date = BBRefGamesForDate(**json_dict)
     games_for_date.games = [decode_bbref_game_info(g) for g in games_dict_list]
@@ -60,7 +64,7 @@ def decode_bbref_game_info(json_dict):
 def decode_brooks_games_for_date(json_dict):
     """Convert json dictionary to BrooksGamesForDate object."""
     json_dict.pop("__brooks_games_for_date__")
-    json_dict["game_date"] = parser.parse(json_dict["game_date_str"])
+    json_dict["game_date"] = parse_date_str(json_dict["game_date_str"])
     games_dict_list = json_dict.pop("games")
     games_for_date = BrooksGamesForDate(**json_dict)
     games_for_date.games = [decode_brooks_game_info(g) for g in games_dict_list]
@@ -165,8 +169,10 @@ def decode_brooks_pitchfx_log(json_dict):
 
 
 def decode_brooks_pitchfx_data(json_dict):
+    # dacite.from_dict type-checks and copies every field, which accounts for nearly all of the time spent decoding
+    # a pitchfx log. All fields are scalar values, so the dataclass is constructed directly.
     json_dict.pop("__brooks_pitchfx_data__")
-    return from_dict(data_class=BrooksPitchFxData, data=json_dict)
+    return BrooksPitchFxData(**{k: v for k, v in json_dict.items() if k in PITCHFX_DATA_FIELDS})
 
 
 def decode_bbref_games_for_date_patch_list(json_dict):
@@ -1,7 +1,7 @@
 """Functions for reading and writing files."""
-import json
-
+from vigorish.data.decoded_data_cache import DecodedDataCache
 from vigorish.enums import DataSet, LocalFileTask, S3FileTask, VigFile
+from vigorish.util import json_serializer
 from vigorish.util.dt_format_strings import HTTP_TIME
 from vigorish.util.result import Result
 from vigorish.util.string_helpers import (
@@ -18,8 +18,23 @@ class JsonStorage:
     def __init__(self, config, file_helper):
         self.config = config
         self.file_helper = file_helper
+        self.cache = DecodedDataCache()
+
+    def decode_local_file_cached(self, file_type, data_set, url_id, get_local_file, decode_local_file):
+        result = get_local_file(url_id)
+        if result.failure:
+            return result
+        mtime = result.value.stat().st_mtime_ns
+        data = self.cache.get(file_type, data_set, url_id, mtime)
+        if data is not None:
+            return Result.Ok(data)
+        result = decode_local_file(url_id)
+        if result.success:
+            self.cache.put(file_type, data_set, url_id, mtime, result.value)
+        return result
 
     def save_json(self, data_set, parsed_data):
+        self.cache.invalidate(VigFile.PARSED_JSON, data_set, get_parsed_data_url_id(data_set, parsed_data))
         local_filepath = None
         s3_object_key = None
         result_local = Result.Ok()
@@ -176,6 +191,7 @@ class JsonStorage:
         )
 
     def save_patch_list(self, data_set, patch_list):
+        self.cache.invalidate(VigFile.PATCH_LIST, data_set, patch_list.url_id)
         local_filepath = None
         s3_object_key = None
         result_local = Result.Ok()
@@ -298,6 +314,7 @@ class JsonStorage:
         )
 
     def save_combined_game_data(self, combined_data):
+        self.cache.invalidate(VigFile.COMBINED_GAME_DATA, DataSet.ALL, combined_data["bbref_game_id"])
         local_filepath = None
         s3_object_key = None
         result_local = Result.Ok()
@@ -345,7 +362,13 @@ class JsonStorage:
 
     def get_combined_game_data(self, bbref_game_id):
         if self.json_stored_local_folder(VigFile.COMBINED_GAME_DATA, DataSet.ALL):
-            result = self.decode_combined_game_data_local_file(bbref_game_id)
+            result = self.decode_local_file_cached(
+                VigFile.COMBINED_GAME_DATA,
+                DataSet.ALL,
+                bbref_game_id,
+                self.get_combined_game_data_local_file,
+                self.decode_combined_game_data_local_file,
+            )
             if result.success:
                 return result.value
         if self.json_stored_s3(VigFile.COMBINED_GAME_DATA, DataSet.ALL):  # pragma: no cover
@@ -360,7 +383,7 @@ class JsonStorage:
             return result
         filepath = result.value
         try:
-            json_dict = json.loads(filepath.read_text())
+            json_dict = json_serializer.loads(filepath.read_bytes())
             json_dict["last_modified"] = get_last_mod_time_utc(filepath).strftime(HTTP_TIME)
             return Result.Ok(json_dict)
         except Exception as e:
@@ -386,7 +409,7 @@ class JsonStorage:
             return result
         filepath = result.value
         try:
-            json_dict = json.loads(filepath.read_text())
+            json_dict = json_serializer.loads(filepath.read_bytes())
             json_dict["last_modified"] = get_last_mod_time_utc(filepath).strftime(HTTP_TIME)
             return Result.Ok(json_dict)
         except Exception as e:
@@ -425,7 +448,20 @@ class JsonStorage:
             DataSet.BBREF_GAMES_FOR_DATE: self.decode_json_bbref_games_for_date_local_file,
             DataSet.BBREF_BOXSCORES: self.decode_json_bbref_boxscore_local_file,
         }
-        return get_scraped_data_local_dict[data_set](url_id)
+        get_local_file_dict = {
+            DataSet.BROOKS_GAMES_FOR_DATE: self.get_json_brooks_games_for_date_local_file,
+            DataSet.BROOKS_PITCH_LOGS: self.get_json_brooks_pitch_logs_for_game_local_file,
+            DataSet.BROOKS_PITCHFX: self.get_json_brooks_pitchfx_local_file,
+            DataSet.BBREF_GAMES_FOR_DATE: self.get_json_bbref_games_for_date_local_file,
+            DataSet.BBREF_BOXSCORES: self.get_json_bbref_boxscore_local_file,
+        }
+        return self.decode_local_file_cached(
+            VigFile.PARSED_JSON,
+            data_set,
+            url_id,
+            get_local_file_dict[data_set],
+            get_scraped_data_local_dict[data_set],
+        )
 
     def decode_json_brooks_games_for_date_local_file(self, game_date):
         result = self.get_json_brooks_games_for_date_local_file(game_date)
@@ -715,8 +751,21 @@ class JsonStorage:
             DataSet.BBREF_GAMES_FOR_DATE: self.decode_bbref_games_for_date_patch_list_local_file,
             DataSet.BBREF_BOXSCORES: self.decode_bbref_boxscore_patch_list_local_file,
         }
-        get_patch_list_for_data_set = get_patch_list_local_dict.get(data_set)
-        return get_patch_list_for_data_set(url_id) if get_patch_list_for_data_set else Result.Ok({})
+        get_local_file_dict = {
+            DataSet.BROOKS_GAMES_FOR_DATE: self.get_brooks_games_for_date_patch_list_local_file,
+            DataSet.BROOKS_PITCHFX: self.get_brooks_pitchfx_patch_list_local_file,
+            DataSet.BBREF_GAMES_FOR_DATE: self.get_bbref_games_for_date_patch_list_local_file,
+            DataSet.BBREF_BOXSCORES: self.get_bbref_boxscore_patch_list_local_file,
+        }
+        if data_set not in get_patch_list_local_dict:
+            return Result.Ok({})
+        return self.decode_local_file_cached(
+            VigFile.PATCH_LIST,
+            data_set,
+            url_id,
+            get_local_file_dict[data_set],
+            get_patch_list_local_dict[data_set],
+        )
 
     def decode_brooks_games_for_date_patch_list_local_file(self, game_date):
         result = self.get_brooks_games_for_date_patch_list_local_file(game_date)
@@ -1060,3 +1109,14 @@ class JsonStorage:
             pitch_app_id=new_pitch_app_id,
         )
         return self.file_helper.rename_s3_object(old_key, new_key)
+
+
+def get_parsed_data_url_id(data_set, parsed_data):
+    url_id_attr = {
+        DataSet.BROOKS_GAMES_FOR_DATE: "game_date",
+        DataSet.BROOKS_PITCH_LOGS: "bb_game_id",
+        DataSet.BROOKS_PITCHFX: "pitch_app_id",
+        DataSet.BBREF_GAMES_FOR_DATE: "game_date",
+        DataSet.BBREF_BOXSCORES: "bbref_game_id",
+    }
+    return getattr(parsed_data, url_id_attr[data_set])
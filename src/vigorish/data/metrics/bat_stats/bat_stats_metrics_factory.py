@@ -1,5 +1,4 @@
-from copy import deepcopy
-from functools import cached_property
+from sqlalchemy.engine import Row
 
 import vigorish.database as db
 from vigorish.constants import TEAM_ID_MAP
@@ -14,13 +13,7 @@ class BatStatsMetricsFactory:
         self.db_session = db_session
         self.player_cache: dict[int, PlayerBatStatsMetrics] = {}
         self.team_cache: dict[int, TeamBatStatsMetrics] = {}
-
-    @cached_property
-    def team_id_map(self):
-        return {
-            s.year: db.Team.get_team_id_map_for_year(self.db_session, s.year)
-            for s in db.Season.get_all_regular_seasons(self.db_session)
-        }
+        self.league_cache: dict[int, dict[str, list[Row]]] = {}
 
     def for_player(self, mlb_id: int) -> PlayerBatStatsMetrics:
         if mlb_id not in self.player_cache:
@@ -33,66 +26,65 @@ class BatStatsMetricsFactory:
         return self.team_cache[team_id_bbref]
 
     def for_all_teams(self, year: int) -> list[BatStatsMetrics]:
-        return [
-            BatStatsMetrics(
-                bat_stats=deepcopy(self._get_bat_stats_for_team(team_id, year)),
-                year=year,
-                team_id_bbref=team_id,
-                player_team_id_bbref=team_id,
-            )
-            for team_id in list(TEAM_ID_MAP.keys())
-        ]
+        return self._get_bat_stats_metrics_for_all_teams(year)
 
     def for_starters_for_all_teams(self, year: int) -> list[BatStatsMetrics]:
-        return [
-            BatStatsMetrics(
-                bat_stats=deepcopy(self._get_bat_stats_for_starters_for_team(team_id, year)),
-                year=year,
-                team_id_bbref=team_id,
-                player_team_id_bbref=team_id,
-                is_starter=True,
-            )
-            for team_id in list(TEAM_ID_MAP.keys())
-        ]
+        return self._get_bat_stats_metrics_for_all_teams(year, lambda bs: bs.is_starter == 1, is_starter=True)
 
     def for_bench_for_all_teams(self, year: int) -> list[BatStatsMetrics]:
-        return [
-            BatStatsMetrics(
-                bat_stats=deepcopy(self._get_bat_stats_for_bench_for_team(team_id, year)),
-                year=year,
-                team_id_bbref=team_id,
-                player_team_id_bbref=team_id,
-                is_starter=False,
-            )
-            for team_id in list(TEAM_ID_MAP.keys())
-        ]
+        return self._get_bat_stats_metrics_for_all_teams(year, lambda bs: bs.is_starter == 0, is_starter=False)
 
     def for_lineup_spots_for_all_teams(self, bat_order_list: list[int], year: int) -> list[BatStatsMetrics]:
-        return [
-            BatStatsMetrics(
-                bat_stats=deepcopy(self._get_bat_stats_for_lineup_spots_for_team(bat_order_list, team_id, year)),
-                year=year,
-                team_id_bbref=team_id,
-                player_team_id_bbref=team_id,
-            )
-            for team_id in list(TEAM_ID_MAP.keys())
-        ]
+        return self._get_bat_stats_metrics_for_all_teams(year, lambda bs: bs.bat_order in bat_order_list)
 
     def for_def_positions_for_all_teams(
         self,
         def_position_list: list[DefensePosition],
         year: int,
     ) -> list[BatStatsMetrics]:
+        def_positions = _convert_def_position_list_to_str_list(def_position_list)
+        return self._get_bat_stats_metrics_for_all_teams(year, lambda bs: bs.def_position in def_positions)
+
+    def _get_bat_stats_metrics_for_all_teams(self, year: int, include=None, **kwargs) -> list[BatStatsMetrics]:
         return [
             BatStatsMetrics(
-                bat_stats=deepcopy(self._get_bat_stats_for_def_positions_for_team(def_position_list, team_id, year)),
+                bat_stats=list(filter(include, bat_stats)) if include else list(bat_stats),
                 year=year,
                 team_id_bbref=team_id,
                 player_team_id_bbref=team_id,
+                **kwargs,
             )
-            for team_id in list(TEAM_ID_MAP.keys())
+            for team_id, bat_stats in self._get_bat_stats_by_team_for_season(year).items()
         ]
 
+    def invalidate_league_cache(self, year: int = None) -> None:
+        """Remove the cached bat_stats for year (every season if year is None), e.g. after importing data."""
+        if year is None:
+            self.league_cache.clear()
+        else:
+            self.league_cache.pop(year, None)
+
+    def _get_bat_stats_by_team_for_season(self, year: int) -> dict[str, list[Row]]:
+        """Fetch the bat_stats columns of every team for a season with one query and partition them by team.
+
+        The rows are cached for each season. They are plain rows rather than ORM objects, so they are not tied to
+        the session (and are not refreshed after each commit). AddToDatabaseTask and RestoreDatabaseTask call
+        invalidate_league_cache() after the bat_stats table has changed.
+        """
+        if year not in self.league_cache:
+            query = (
+                self.db_session.query(db.Team.team_id_br, *db.BatStats.__table__.columns)
+                .join(db.Team, db.BatStats.player_team_id == db.Team.id)
+                .filter(db.Team.year == year)
+                .filter(db.Team.team_id_br.in_(TEAM_ID_MAP))
+                .order_by(db.BatStats.id)
+            )
+            bat_stats_by_team = {team_id: [] for team_id in TEAM_ID_MAP}
+            for row in query:
+                bat_stats_by_team[row.team_id_br].append(row)
+            self.league_cache[year] = bat_stats_by_team
+        return self.league_cache[year]
+
     def _get_bat_stats_metrics_set_for_team(self, team_id_bbref) -> TeamBatStatsMetrics:
         return TeamBatStatsMetrics(
             self.db_session, self._get_bat_stats_for_team_franchise(team_id_bbref), team_id_bbref
@@ -108,53 +100,6 @@ class BatStatsMetricsFactory:
     def _get_bat_stats_for_team_franchise(self, team_id_bbref: str) -> list[db.BatStats]:
         return self.db_session.query(db.BatStats).filter(db.BatStats.player_team_id_bbref == team_id_bbref).all()
 
-    def _get_bat_stats_for_team(self, team_id_bbref: str, year: int) -> list[db.BatStats]:
-        return (
-            self.db_session.query(db.BatStats)
-            .filter(db.BatStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .all()
-        )
-
-    def _get_bat_stats_for_starters_for_team(self, team_id_bbref: str, year: int) -> list[db.BatStats]:
-        return (
-            self.db_session.query(db.BatStats)
-            .filter(db.BatStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .filter(db.BatStats.is_starter == 1)
-            .all()
-        )
-
-    def _get_bat_stats_for_bench_for_team(self, team_id_bbref: str, year: int) -> list[db.BatStats]:
-        return (
-            self.db_session.query(db.BatStats)
-            .filter(db.BatStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .filter(db.BatStats.is_starter == 0)
-            .all()
-        )
-
-    def _get_bat_stats_for_lineup_spots_for_team(
-        self, bat_order_list: list[int], team_id_bbref: str, year: int
-    ) -> list[db.BatStats]:
-        team_bat_stats = (
-            self.db_session.query(db.BatStats)
-            .filter(db.BatStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .all()
-        )
-        return [bat_stats for bat_stats in team_bat_stats if bat_stats.bat_order in bat_order_list]
-
-    def _get_bat_stats_for_def_positions_for_team(
-        self, def_position_list: list[DefensePosition], team_id_bbref: str, year: int
-    ) -> list[db.BatStats]:
-        team_bat_stats = (
-            self.db_session.query(db.BatStats)
-            .filter(db.BatStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .all()
-        )
-        return [
-            bat_stats
-            for bat_stats in team_bat_stats
-            if bat_stats.def_position in _convert_def_position_list_to_str_list(def_position_list)
-        ]
-
 
 def _convert_def_position_list_to_str_list(def_positions: list[DefensePosition]) -> list[str]:
     return [str(int(def_pos)) for def_pos in def_positions]
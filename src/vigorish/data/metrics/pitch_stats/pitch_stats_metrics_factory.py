@@ -1,5 +1,4 @@
-from copy import deepcopy
-from functools import cached_property
+from sqlalchemy.engine import Row
 
 import vigorish.database as db
 from vigorish.constants import TEAM_ID_MAP
@@ -13,13 +12,7 @@ class PitchStatsMetricsFactory:
         self.db_session = db_session
         self.player_cache: dict[int, PlayerPitchStatsMetrics] = {}
         self.team_cache: dict[int, TeamPitchStatsMetrics] = {}
-
-    @cached_property
-    def team_id_map(self):
-        return {
-            s.year: db.Team.get_team_id_map_for_year(self.db_session, s.year)
-            for s in db.Season.get_all_regular_seasons(self.db_session)
-        }
+        self.league_cache: dict[int, dict[str, list[Row]]] = {}
 
     def for_pitcher(self, mlb_id: int) -> PlayerPitchStatsMetrics:
         if mlb_id not in self.player_cache:
@@ -32,40 +25,54 @@ class PitchStatsMetricsFactory:
         return self.team_cache[team_id_bbref]
 
     def for_all_teams(self, year: int) -> list[PitchStatsMetrics]:
-        return [
-            PitchStatsMetrics(
-                pitch_stats=deepcopy(self._get_pitch_stats_for_team(team_id, year)),
-                year=year,
-                team_id_bbref=team_id,
-                player_team_id_bbref=team_id,
-            )
-            for team_id in list(TEAM_ID_MAP.keys())
-        ]
+        return self._get_pitch_stats_metrics_for_all_teams(year)
 
     def for_sp_for_all_teams(self, year: int) -> list[PitchStatsMetrics]:
-        return [
-            PitchStatsMetrics(
-                pitch_stats=deepcopy(self._get_pitch_stats_for_sp_for_team(team_id, year)),
-                year=year,
-                team_id_bbref=team_id,
-                player_team_id_bbref=team_id,
-                role="SP",
-            )
-            for team_id in list(TEAM_ID_MAP.keys())
-        ]
+        return self._get_pitch_stats_metrics_for_all_teams(year, lambda ps: ps.is_sp == 1, role="SP")
 
     def for_rp_for_all_teams(self, year: int) -> list[PitchStatsMetrics]:
+        return self._get_pitch_stats_metrics_for_all_teams(year, lambda ps: ps.is_rp == 1, role="RP")
+
+    def _get_pitch_stats_metrics_for_all_teams(self, year: int, include=None, **kwargs) -> list[PitchStatsMetrics]:
         return [
             PitchStatsMetrics(
-                pitch_stats=deepcopy(self._get_pitch_stats_for_rp_for_team(team_id, year)),
+                pitch_stats=list(filter(include, pitch_stats)) if include else list(pitch_stats),
                 year=year,
                 team_id_bbref=team_id,
                 player_team_id_bbref=team_id,
-                role="RP",
+                **kwargs,
             )
-            for team_id in list(TEAM_ID_MAP.keys())
+            for team_id, pitch_stats in self._get_pitch_stats_by_team_for_season(year).items()
         ]
 
+    def invalidate_league_cache(self, year: int = None) -> None:
+        """Remove the cached pitch_stats for year (every season if year is None), e.g. after importing data."""
+        if year is None:
+            self.league_cache.clear()
+        else:
+            self.league_cache.pop(year, None)
+
+    def _get_pitch_stats_by_team_for_season(self, year: int) -> dict[str, list[Row]]:
+        """Fetch the pitch_stats columns of every team for a season with one query and partition them by team.
+
+        The rows are cached for each season. They are plain rows rather than ORM objects, so they are not tied to
+        the session (and are not refreshed after each commit). AddToDatabaseTask and RestoreDatabaseTask call
+        invalidate_league_cache() after the pitch_stats table has changed.
+        """
+        if year not in self.league_cache:
+            query = (
+                self.db_session.query(db.Team.team_id_br, *db.PitchStats.__table__.columns)
+                .join(db.Team, db.PitchStats.player_team_id == db.Team.id)
+                .filter(db.Team.year == year)
+                .filter(db.Team.team_id_br.in_(TEAM_ID_MAP))
+                .order_by(db.PitchStats.id)
+            )
+            pitch_stats_by_team = {team_id: [] for team_id in TEAM_ID_MAP}
+            for row in query:
+                pitch_stats_by_team[row.team_id_br].append(row)
+            self.league_cache[year] = pitch_stats_by_team
+        return self.league_cache[year]
+
     def _get_pitch_stats_metrics_set_for_team(self, team_id_bbref) -> TeamPitchStatsMetrics:
         return TeamPitchStatsMetrics(
             self.db_session, self._get_pitch_stats_for_team_franchise(team_id_bbref), team_id_bbref
@@ -80,26 +87,3 @@ class PitchStatsMetricsFactory:
 
     def _get_pitch_stats_for_team_franchise(self, team_id_bbref: str) -> list[db.PitchStats]:
         return self.db_session.query(db.PitchStats).filter(db.PitchStats.player_team_id_bbref == team_id_bbref).all()
-
-    def _get_pitch_stats_for_team(self, team_id_bbref: str, year: int) -> list[db.PitchStats]:
-        return (
-            self.db_session.query(db.PitchStats)
-            .filter(db.PitchStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .all()
-        )
-
-    def _get_pitch_stats_for_sp_for_team(self, team_id_bbref: str, year: int) -> list[db.PitchStats]:
-        return (
-            self.db_session.query(db.PitchStats)
-            .filter(db.PitchStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .filter(db.PitchStats.is_sp == 1)
-            .all()
-        )
-
-    def _get_pitch_stats_for_rp_for_team(self, team_id_bbref: str, year: int) -> list[db.PitchStats]:
-        return (
-            self.db_session.query(db.PitchStats)
-            .filter(db.PitchStats.player_team_id == self.team_id_map[year][team_id_bbref])
-            .filter(db.PitchStats.is_rp == 1)
-            .all()
-        )
@@ -1,9 +1,18 @@
 # flake8: noqa
+from vigorish.data.metrics.pitchfx.pitchfx_aggregate_metrics import PitchFxAggregateMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_array_metrics import PitchFxArrayMetrics
 from vigorish.data.metrics.pitchfx.pitchfx_batting_metrics import PitchFxBattingMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_groups import PitchFxAggregateGroups, PitchFxGroups
 from vigorish.data.metrics.pitchfx.pitchfx_metrics import PitchFxMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_metrics_cache import (
+    get_pfx_metrics_cache,
+    PitchFxMetricsCache,
+)
 from vigorish.data.metrics.pitchfx.pitchfx_metrics_factory import PitchFxMetricsFactory
 from vigorish.data.metrics.pitchfx.pitchfx_metrics_set import (
     PfxMetricsSetBuilder,
     PitchFxMetricsSet,
 )
 from vigorish.data.metrics.pitchfx.pitchfx_pitching_metrics import PitchFxPitchingMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_totals import PitchFxTotals
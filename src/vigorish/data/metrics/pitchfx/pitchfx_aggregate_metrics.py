@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+from vigorish.data.metrics.pitchfx.pitchfx_metrics import PitchFxMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_totals import PitchFxTotals
+
+
+class PitchFxAggregateMetrics(PitchFxMetrics):
+    """PitchFxMetrics calculated from PitchFxTotals aggregated by the database rather than from individual pitches."""
+
+    pfx: PitchFxTotals
+
+    @cached_property
+    def pitch_type_int(self):
+        return sum(self.pfx.pitch_types)
+
+    @cached_property
+    def total_pitches(self) -> int:
+        return len(self.pfx)
+
+    @cached_property
+    def total_inside_strike_zone(self) -> int:
+        return int(self.pfx["total_inside_strike_zone"])
+
+    @cached_property
+    def total_outside_strike_zone(self) -> int:
+        return int(self.pfx["total_outside_strike_zone"])
+
+    @cached_property
+    def total_called_strikes(self) -> int:
+        return int(self.pfx["total_called_strikes"])
+
+    @cached_property
+    def total_swinging_strikes(self) -> int:
+        return int(self.pfx["total_swinging_strikes"])
+
+    @cached_property
+    def total_swings(self) -> int:
+        return int(self.pfx["total_swings"])
+
+    @cached_property
+    def total_swings_inside_zone(self) -> int:
+        return int(self.pfx["total_swings_inside_zone"])
+
+    @cached_property
+    def total_swings_outside_zone(self) -> int:
+        return int(self.pfx["total_swings_outside_zone"])
+
+    @cached_property
+    def total_bad_whiffs(self) -> int:
+        return int(self.pfx["total_bad_whiffs"])
+
+    @cached_property
+    def total_swings_made_contact(self) -> int:
+        return int(self.pfx["total_swings_made_contact"])
+
+    @cached_property
+    def total_contact_inside_zone(self) -> int:
+        return int(self.pfx["total_contact_inside_zone"])
+
+    @cached_property
+    def total_contact_outside_zone(self) -> int:
+        return int(self.pfx["total_contact_outside_zone"])
+
+    @cached_property
+    def total_balls_in_play(self) -> int:
+        return int(self.pfx["total_balls_in_play"])
+
+    @cached_property
+    def total_ground_balls(self) -> int:
+        return int(self.pfx["total_ground_balls"])
+
+    @cached_property
+    def total_line_drives(self) -> int:
+        return int(self.pfx["total_line_drives"])
+
+    @cached_property
+    def total_fly_balls(self) -> int:
+        return int(self.pfx["total_fly_balls"])
+
+    @cached_property
+    def total_popups(self) -> int:
+        return int(self.pfx["total_popups"])
+
+    @cached_property
+    def total_pa(self) -> int:
+        return int(self.pfx["total_pa"])
+
+    @cached_property
+    def total_hits(self) -> int:
+        return int(self.pfx["total_hits"])
+
+    @cached_property
+    def total_outs(self) -> int:
+        return int(self.pfx["total_outs"])
+
+    @cached_property
+    def total_k(self) -> int:
+        return int(self.pfx["total_k"])
+
+    @cached_property
+    def total_bb(self) -> int:
+        return int(self.pfx["total_bb"])
+
+    @cached_property
+    def total_hbp(self) -> int:
+        return int(self.pfx["total_hbp"])
+
+    @cached_property
+    def total_sac_hit(self) -> int:
+        return int(self.pfx["total_sac_hit"])
+
+    @cached_property
+    def total_sac_fly(self) -> int:
+        return int(self.pfx["total_sac_fly"])
+
+    @cached_property
+    def total_errors(self) -> int:
+        return int(self.pfx["total_errors"])
+
+    @cached_property
+    def total_singles(self) -> int:
+        return int(self.pfx["total_singles"])
+
+    @cached_property
+    def total_doubles(self) -> int:
+        return int(self.pfx["total_doubles"])
+
+    @cached_property
+    def total_triples(self) -> int:
+        return int(self.pfx["total_triples"])
+
+    @cached_property
+    def total_homeruns(self) -> int:
+        return int(self.pfx["total_homeruns"])
+
+    @cached_property
+    def total_ibb(self) -> int:
+        return int(self.pfx["total_ibb"])
+
+    @cached_property
+    def total_hard_hits(self) -> int:
+        return int(self.pfx["total_hard_hits"])
+
+    @cached_property
+    def total_medium_hits(self) -> int:
+        return int(self.pfx["total_medium_hits"])
+
+    @cached_property
+    def total_soft_hits(self) -> int:
+        return int(self.pfx["total_soft_hits"])
+
+    @cached_property
+    def total_barrels(self) -> int:
+        return int(self.pfx["total_barrels"])
+
+    @cached_property
+    def avg_speed(self) -> float:
+        return _avg(self.pfx, "start_speed", ndigits=1)
+
+    @cached_property
+    def avg_pfx_x(self) -> float:
+        return _avg(self.pfx, "pfx_x", ndigits=2)
+
+    @cached_property
+    def avg_pfx_z(self) -> float:
+        return _avg(self.pfx, "pfx_z", ndigits=2)
+
+    @cached_property
+    def avg_px(self) -> float:
+        return _avg(self.pfx, "px", ndigits=2)
+
+    @cached_property
+    def avg_pz(self) -> float:
+        return _avg(self.pfx, "pz", ndigits=2)
+
+    @cached_property
+    def avg_plate_time(self) -> float:
+        return _avg(self.pfx, "plate_time", ndigits=3)
+
+    @cached_property
+    def avg_extension(self) -> float:
+        return _avg(self.pfx, "extension", ndigits=2)
+
+    @cached_property
+    def avg_break_angle(self) -> float:
+        return _avg(self.pfx, "break_angle", ndigits=1)
+
+    @cached_property
+    def avg_break_length(self) -> float:
+        return _avg(self.pfx, "break_length", ndigits=1)
+
+    @cached_property
+    def avg_break_y(self) -> float:
+        return _avg(self.pfx, "break_y", ndigits=1)
+
+    @cached_property
+    def avg_spin_rate(self) -> float:
+        return _avg(self.pfx, "spin_rate", ndigits=0)
+
+    @cached_property
+    def avg_spin_direction(self) -> float:
+        return _avg(self.pfx, "spin_direction", ndigits=0)
+
+    @cached_property
+    def avg_launch_speed(self) -> float:
+        return _avg_nonzero(self.pfx, "launch_speed", ndigits=1)
+
+    @cached_property
+    def max_launch_speed(self) -> float:
+        return float(self.pfx["max_launch_speed"] or 0.0)
+
+    @cached_property
+    def avg_launch_angle(self) -> float:
+        return _avg_nonzero(self.pfx, "launch_angle", ndigits=1)
+
+    @cached_property
+    def avg_hit_distance(self) -> float:
+        return _avg_nonzero(self.pfx, "total_distance", ndigits=1)
+
+
+def _avg(pfx: PitchFxTotals, name: str, ndigits: int) -> float:
+    avg = float(pfx[f"sum_{name}"]) / float(len(pfx)) if len(pfx) else 0.0
+    return round(avg, ndigits=ndigits)
+
+
+def _avg_nonzero(pfx: PitchFxTotals, name: str, ndigits: int) -> float:
+    count = pfx[f"count_{name}"]
+    avg = float(pfx[f"sum_{name}"]) / count if count else 0.0
+    return round(avg, ndigits=ndigits)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from functools import cached_property
+
+import numpy as np
+
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_metrics import PitchFxMetrics
+
+
+class PitchFxArrayMetrics(PitchFxMetrics):
+    """PitchFxMetrics calculated with vectorized reductions over a PitchFxColumns instance."""
+
+    pfx: PitchFxColumns
+
+    @cached_property
+    def pitch_type_int(self):
+        return int(np.unique(self.pfx["pitch_type_int"]).sum())
+
+    @cached_property
+    def total_pitches(self) -> int:
+        return len(self.pfx)
+
+    @cached_property
+    def total_inside_strike_zone(self) -> int:
+        return _count(self.pfx, "inside_strike_zone")
+
+    @cached_property
+    def total_outside_strike_zone(self) -> int:
+        return _count(self.pfx, "outside_strike_zone")
+
+    @cached_property
+    def total_called_strikes(self) -> int:
+        return _count(self.pfx, "called_strike")
+
+    @cached_property
+    def total_swinging_strikes(self) -> int:
+        return _count(self.pfx, "swinging_strike")
+
+    @cached_property
+    def total_swings(self) -> int:
+        return _count(self.pfx, "batter_did_swing")
+
+    @cached_property
+    def total_swings_inside_zone(self) -> int:
+        return _count(self.pfx, "swing_inside_zone")
+
+    @cached_property
+    def total_swings_outside_zone(self) -> int:
+        return _count(self.pfx, "swing_outside_zone")
+
+    @cached_property
+    def total_bad_whiffs(self):
+        return int(np.count_nonzero(self.pfx["swing_outside_zone"] & self.pfx["swinging_strike"]))
+
+    @cached_property
+    def total_swings_made_contact(self) -> int:
+        return _count(self.pfx, "batter_made_contact")
+
+    @cached_property
+    def total_contact_inside_zone(self) -> int:
+        return _count(self.pfx, "contact_inside_zone")
+
+    @cached_property
+    def total_contact_outside_zone(self) -> int:
+        return _count(self.pfx, "contact_outside_zone")
+
+    @cached_property
+    def total_balls_in_play(self) -> int:
+        return _count(self.pfx, "is_in_play")
+
+    @cached_property
+    def total_ground_balls(self) -> int:
+        return _count(self.pfx, "is_ground_ball")
+
+    @cached_property
+    def total_line_drives(self) -> int:
+        return _count(self.pfx, "is_line_drive")
+
+    @cached_property
+    def total_fly_balls(self) -> int:
+        return _count(self.pfx, "is_fly_ball")
+
+    @cached_property
+    def total_popups(self) -> int:
+        return _count(self.pfx, "is_popup")
+
+    @cached_property
+    def total_pa(self) -> int:
+        return _count(self.pfx, "is_final_pitch_of_ab")
+
+    @cached_property
+    def total_hits(self) -> int:
+        return _count(self.pfx, "ab_result_hit")
+
+    @cached_property
+    def total_outs(self) -> int:
+        return _count(self.pfx, "ab_result_out")
+
+    @cached_property
+    def total_k(self) -> int:
+        return _count(self.pfx, "ab_result_k")
+
+    @cached_property
+    def total_bb(self) -> int:
+        return _count(self.pfx, "ab_result_bb")
+
+    @cached_property
+    def total_hbp(self) -> int:
+        return _count(self.pfx, "ab_result_hbp")
+
+    @cached_property
+    def total_sac_hit(self) -> int:
+        return _count(self.pfx, "ab_result_sac_hit")
+
+    @cached_property
+    def total_sac_fly(self) -> int:
+        return _count(self.pfx, "ab_result_sac_fly")
+
+    @cached_property
+    def total_errors(self) -> int:
+        return _count(self.pfx, "ab_result_error")
+
+    @cached_property
+    def total_singles(self) -> int:
+        return _count(self.pfx, "ab_result_single")
+
+    @cached_property
+    def total_doubles(self) -> int:
+        return _count(self.pfx, "ab_result_double")
+
+    @cached_property
+    def total_triples(self) -> int:
+        return _count(self.pfx, "ab_result_triple")
+
+    @cached_property
+    def total_homeruns(self) -> int:
+        return _count(self.pfx, "ab_result_homerun")
+
+    @cached_property
+    def total_ibb(self) -> int:
+        return _count(self.pfx, "ab_result_ibb")
+
+    @cached_property
+    def total_hard_hits(self) -> int:
+        return _count(self.pfx, "is_hard_hit")
+
+    @cached_property
+    def total_medium_hits(self) -> int:
+        return _count(self.pfx, "is_medium_hit")
+
+    @cached_property
+    def total_soft_hits(self) -> int:
+        return _count(self.pfx, "is_soft_hit")
+
+    @cached_property
+    def total_barrels(self) -> int:
+        return _count(self.pfx, "is_barreled")
+
+    @cached_property
+    def avg_speed(self) -> float:
+        return _avg(self.pfx, "start_speed", ndigits=1)
+
+    @cached_property
+    def avg_pfx_x(self) -> float:
+        return _avg(self.pfx, "pfx_x", ndigits=2)
+
+    @cached_property
+    def avg_pfx_z(self) -> float:
+        return _avg(self.pfx, "pfx_z", ndigits=2)
+
+    @cached_property
+    def avg_px(self) -> float:
+        return _avg(self.pfx, "px", ndigits=2)
+
+    @cached_property
+    def avg_pz(self) -> float:
+        return _avg(self.pfx, "pz", ndigits=2)
+
+    @cached_property
+    def avg_plate_time(self) -> float:
+        return _avg(self.pfx, "plate_time", ndigits=3)
+
+    @cached_property
+    def avg_extension(self) -> float:
+        return _avg(self.pfx, "extension", ndigits=2)
+
+    @cached_property
+    def avg_break_angle(self) -> float:
+        return _avg(self.pfx, "break_angle", ndigits=1)
+
+    @cached_property
+    def avg_break_length(self) -> float:
+        return _avg(self.pfx, "break_length", ndigits=1)
+
+    @cached_property
+    def avg_break_y(self) -> float:
+        return _avg(self.pfx, "break_y", ndigits=1)
+
+    @cached_property
+    def avg_spin_rate(self) -> float:
+        return _avg(self.pfx, "spin_rate", ndigits=0)
+
+    @cached_property
+    def avg_spin_direction(self) -> float:
+        return _avg(self.pfx, "spin_direction", ndigits=0)
+
+    @cached_property
+    def avg_launch_speed(self) -> float:
+        return _avg_nonzero(self.pfx, "launch_speed", ndigits=1)
+
+    @cached_property
+    def max_launch_speed(self) -> float:
+        launch_speed = self.pfx["launch_speed"]
+        has_launch_speed = launch_speed[launch_speed != 0]
+        return float(has_launch_speed.max()) if len(has_launch_speed) else 0.0
+
+    @cached_property
+    def avg_launch_angle(self) -> float:
+        return _avg_nonzero(self.pfx, "launch_angle", ndigits=1)
+
+    @cached_property
+    def avg_hit_distance(self) -> float:
+        return _avg_nonzero(self.pfx, "total_distance", ndigits=1)
+
+
+def _count(pfx: PitchFxColumns, name: str) -> int:
+    return int(np.count_nonzero(pfx[name]))
+
+
+def _avg(pfx: PitchFxColumns, name: str, ndigits: int) -> float:
+    avg = float(pfx[name].sum()) / float(len(pfx)) if len(pfx) else 0.0
+    return round(avg, ndigits=ndigits)
+
+
+def _avg_nonzero(pfx: PitchFxColumns, name: str, ndigits: int) -> float:
+    column = pfx[name]
+    values = column[column != 0]
+    avg = float(values.sum()) / len(values) if len(values) else 0.0
+    return round(avg, ndigits=ndigits)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from copy import deepcopy
-
 import vigorish.database as db
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_groups import PitchFxGroups
 from vigorish.data.metrics.pitchfx.pitchfx_metrics_set import (
     PfxMetricsSetBuilder,
     PitchFxMetricsSet,
@@ -18,34 +18,35 @@ class PitchFxBattingMetrics:
     as_lhb_vs_rhp: PitchFxMetricsSet
     as_lhb_vs_lhp: PitchFxMetricsSet
 
-    def __init__(self, pfx: list[db.PitchFx], mlb_id: int, remove_outliers: bool = False):
+    def __init__(
+        self, pfx: list[db.PitchFx] | PitchFxColumns | PitchFxGroups, mlb_id: int, remove_outliers: bool = False
+    ):
+        pfx = PitchFxGroups.from_pfx(pfx)
         pfx_metrics_builder = PfxMetricsSetBuilder()
-        pfx_vs_rhp = list(filter(lambda x: x.p_throws == "R", pfx))
-        pfx_vs_lhp = list(filter(lambda x: x.p_throws == "L", pfx))
-        pfx_as_rhb_vs_rhp = list(filter(lambda x: (x.p_throws == "R" and x.stand == "R"), pfx))
-        pfx_as_rhb_vs_lhp = list(filter(lambda x: (x.p_throws == "L" and x.stand == "R"), pfx))
-        pfx_as_lhb_vs_rhp = list(filter(lambda x: (x.p_throws == "R" and x.stand == "L"), pfx))
-        pfx_as_lhb_vs_lhp = list(filter(lambda x: (x.p_throws == "L" and x.stand == "L"), pfx))
-        self.vs_all = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx), mlb_id=mlb_id, remove_outliers=remove_outliers
-        )
+        pfx_vs_rhp = pfx.filter(p_throws="R")
+        pfx_vs_lhp = pfx.filter(p_throws="L")
+        pfx_as_rhb_vs_rhp = pfx.filter(p_throws="R", stand="R")
+        pfx_as_rhb_vs_lhp = pfx.filter(p_throws="L", stand="R")
+        pfx_as_lhb_vs_rhp = pfx.filter(p_throws="R", stand="L")
+        pfx_as_lhb_vs_lhp = pfx.filter(p_throws="L", stand="L")
+        self.vs_all = pfx_metrics_builder.create_pfx_metrics_set(pfx, mlb_id=mlb_id, remove_outliers=remove_outliers)
         self.vs_rhp = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_vs_rhp), mlb_id=mlb_id, p_throws="R", remove_outliers=remove_outliers
+            pfx_vs_rhp, mlb_id=mlb_id, p_throws="R", remove_outliers=remove_outliers
         )
         self.vs_lhp = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_vs_lhp), mlb_id=mlb_id, p_throws="L", remove_outliers=remove_outliers
+            pfx_vs_lhp, mlb_id=mlb_id, p_throws="L", remove_outliers=remove_outliers
         )
         self.as_rhb_vs_rhp = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_as_rhb_vs_rhp), mlb_id=mlb_id, p_throws="R", bat_stand="R", remove_outliers=remove_outliers
+            pfx_as_rhb_vs_rhp, mlb_id=mlb_id, p_throws="R", bat_stand="R", remove_outliers=remove_outliers
         )
         self.as_rhb_vs_lhp = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_as_rhb_vs_lhp), mlb_id=mlb_id, p_throws="L", bat_stand="R", remove_outliers=remove_outliers
+            pfx_as_rhb_vs_lhp, mlb_id=mlb_id, p_throws="L", bat_stand="R", remove_outliers=remove_outliers
         )
         self.as_lhb_vs_rhp = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_as_lhb_vs_rhp), mlb_id=mlb_id, p_throws="R", bat_stand="L", remove_outliers=remove_outliers
+            pfx_as_lhb_vs_rhp, mlb_id=mlb_id, p_throws="R", bat_stand="L", remove_outliers=remove_outliers
         )
         self.as_lhb_vs_lhp = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_as_lhb_vs_lhp), mlb_id=mlb_id, p_throws="L", bat_stand="L", remove_outliers=remove_outliers
+            pfx_as_lhb_vs_lhp, mlb_id=mlb_id, p_throws="L", bat_stand="L", remove_outliers=remove_outliers
         )
 
     def as_dict(self):
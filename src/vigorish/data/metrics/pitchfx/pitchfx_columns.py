@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+
+PFX_BOOL_COLUMNS = [
+    "inside_strike_zone",
+    "outside_strike_zone",
+    "called_strike",
+    "swinging_strike",
+    "batter_did_swing",
+    "swing_inside_zone",
+    "swing_outside_zone",
+    "batter_made_contact",
+    "contact_inside_zone",
+    "contact_outside_zone",
+    "is_in_play",
+    "is_ground_ball",
+    "is_line_drive",
+    "is_fly_ball",
+    "is_popup",
+    "is_hard_hit",
+    "is_medium_hit",
+    "is_soft_hit",
+    "is_barreled",
+    "is_final_pitch_of_ab",
+    "ab_result_out",
+    "ab_result_hit",
+    "ab_result_single",
+    "ab_result_double",
+    "ab_result_triple",
+    "ab_result_homerun",
+    "ab_result_bb",
+    "ab_result_ibb",
+    "ab_result_k",
+    "ab_result_hbp",
+    "ab_result_error",
+    "ab_result_sac_hit",
+    "ab_result_sac_fly",
+    "is_invalid_ibb",
+    "is_out_of_sequence",
+]
+
+PFX_FLOAT_COLUMNS = [
+    "start_speed",
+    "pfx_x",
+    "pfx_z",
+    "px",
+    "pz",
+    "plate_time",
+    "extension",
+    "break_angle",
+    "break_length",
+    "break_y",
+    "spin_rate",
+    "spin_direction",
+    "launch_speed",
+    "launch_angle",
+    "total_distance",
+]
+
+PFX_INT_COLUMNS = ["pitch_type_int", "season_id"]
+
+PFX_STR_COLUMNS = ["p_throws", "stand"]
+
+PFX_COLUMN_NAMES = PFX_BOOL_COLUMNS + PFX_FLOAT_COLUMNS + PFX_INT_COLUMNS + PFX_STR_COLUMNS
+
+
+class PitchFxColumns:
+    """Read-only column store holding the PitchFx columns needed to calculate PitchFxMetrics.
+
+    Subsets created with take() share the arrays of the parent store and only keep an index array
+    of the rows they contain, so splitting a career's worth of pitches by stance, pitch type or
+    season does not copy any columns. Reading a column from a subset gathers its rows into a new
+    array each time it is called (reading from the parent store returns the shared array), so
+    callers should read each column of a subset once and reuse the result.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray], index: np.ndarray = None) -> None:
+        self.columns = columns
+        self.index = index
+
+    def __len__(self) -> int:
+        return len(self.index) if self.index is not None else len(self.columns["pitch_type_int"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return the values of column name for the rows in this view (a copy if this view is a subset)."""
+        return self.columns[name][self.index] if self.index is not None else self.columns[name]
+
+    @classmethod
+    def from_pfx(cls, pfx: list[db.PitchFx]) -> PitchFxColumns:
+        return cls.from_rows([tuple(getattr(p, name) for name in PFX_COLUMN_NAMES) for p in pfx])
+
+    @classmethod
+    def from_db(cls, db_session: Session, *criteria) -> PitchFxColumns:
+        columns = [getattr(db.PitchFx, name) for name in PFX_COLUMN_NAMES]
+        return cls.from_rows(db_session.query(*columns).filter(*criteria).all())
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> PitchFxColumns:
+        values = dict(zip(PFX_COLUMN_NAMES, zip(*rows))) if rows else {name: () for name in PFX_COLUMN_NAMES}
+        columns = {}
+        for name in PFX_BOOL_COLUMNS:
+            columns[name] = np.array(values[name], dtype=bool)
+        for name in PFX_FLOAT_COLUMNS:
+            columns[name] = np.nan_to_num(np.array(values[name], dtype=np.float64))
+        for name in PFX_INT_COLUMNS:
+            columns[name] = np.array([val or 0 for val in values[name]], dtype=np.int64)
+        for name in PFX_STR_COLUMNS:
+            columns[name] = np.array([val or "" for val in values[name]], dtype=object)
+        for col in columns.values():
+            col.flags.writeable = False
+        return cls(columns)
+
+    def take(self, selector: np.ndarray) -> PitchFxColumns:
+        """Return a view of the rows matching selector (a boolean mask or positions relative to this view)."""
+        index = self.index if self.index is not None else np.arange(len(self))
+        return PitchFxColumns(self.columns, index[selector])
+
+    def group_by(self, *keys: np.ndarray) -> dict[tuple, np.ndarray]:
+        """Bucket the rows of this view by the distinct combinations of keys with a single stable sort.
+
+        Returns a dict mapping each combination of key values to the positions (relative to this view) of the
+        rows in that bucket, listed in their original order.
+        """
+        if not len(self):
+            return {}
+        uniques, codes = zip(*(np.unique(key, return_inverse=True) for key in keys))
+        group_codes = np.ravel_multi_index([code.ravel() for code in codes], [len(unique) for unique in uniques])
+        order = np.argsort(group_codes, kind="stable")
+        sorted_codes = group_codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        groups = {}
+        for start, end in zip(starts, ends):
+            first = order[start]
+            group_key = tuple(_to_python(unique[code[first]]) for unique, code in zip(uniques, codes))
+            groups[group_key] = order[start:end]
+        return groups
+
+
+def _to_python(value):
+    return value.item() if isinstance(value, np.generic) else value
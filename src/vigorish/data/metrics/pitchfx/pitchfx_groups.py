@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+from vigorish.data.metrics.pitchfx.pitchfx_aggregate_metrics import PitchFxAggregateMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_array_metrics import PitchFxArrayMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_totals import (
+    PFX_AGGREGATE_COLUMNS,
+    PFX_GROUP_COLUMNS,
+    PitchFxTotals,
+)
+
+PFX_GROUP_KEYS = ("season_id", "p_throws", "stand", "pitch_type_int", "is_valid")
+
+
+class PitchFxGroups:
+    """Pitches bucketed by season, pitcher hand, batter stance, pitch type and validity in a single pass.
+
+    Every split needed by PitchFxPitchingMetrics and PitchFxBattingMetrics (by year, vs RHB/LHB, by pitch
+    type) is produced by merging buckets, rather than rescanning all pitches once per split.
+    """
+
+    metrics_class = PitchFxArrayMetrics
+
+    def __init__(self, pfx: PitchFxColumns, groups: dict[tuple, np.ndarray] = None) -> None:
+        self.pfx = pfx
+        if groups is None:
+            is_valid = ~(pfx["is_invalid_ibb"] | pfx["is_out_of_sequence"])
+            groups = pfx.group_by(pfx["season_id"], pfx["p_throws"], pfx["stand"], pfx["pitch_type_int"], is_valid)
+        self.groups = groups
+
+    @classmethod
+    def from_pfx(cls, pfx: list[db.PitchFx] | PitchFxColumns | PitchFxGroups) -> PitchFxGroups:
+        if isinstance(pfx, PitchFxGroups):
+            return pfx
+        return cls(pfx if isinstance(pfx, PitchFxColumns) else PitchFxColumns.from_pfx(pfx))
+
+    @property
+    def total_pitches(self) -> int:
+        return sum(len(positions) for positions in self.groups.values())
+
+    @property
+    def season_ids(self) -> list[int]:
+        return sorted({dict(zip(PFX_GROUP_KEYS, key))["season_id"] for key in self.groups})
+
+    def filter(self, **criteria) -> PitchFxGroups:
+        """Return the buckets matching all criteria (e.g., season_id=3, stand="R") without copying any data."""
+        groups = {
+            key: positions
+            for key, positions in self.groups.items()
+            if all(dict(zip(PFX_GROUP_KEYS, key))[name] == value for name, value in criteria.items())
+        }
+        return self.__class__(self.pfx, groups)
+
+    def valid_pitches_by_pitch_type(self) -> dict[int, PitchFxColumns]:
+        positions_by_pitch_type = defaultdict(list)
+        for key, positions in self.groups.items():
+            group = dict(zip(PFX_GROUP_KEYS, key))
+            if group["is_valid"]:
+                positions_by_pitch_type[group["pitch_type_int"]].append(positions)
+        return {
+            pitch_type_int: self._merge(positions_list)
+            for pitch_type_int, positions_list in positions_by_pitch_type.items()
+        }
+
+    def valid_pitches(self, exclude_pitch_types: list[int] = None) -> PitchFxColumns:
+        exclude_pitch_types = exclude_pitch_types or []
+        positions_list = []
+        for key, positions in self.groups.items():
+            group = dict(zip(PFX_GROUP_KEYS, key))
+            if group["is_valid"] and group["pitch_type_int"] not in exclude_pitch_types:
+                positions_list.append(positions)
+        return self._merge(positions_list)
+
+    def _merge(self, positions_list: list[np.ndarray]) -> PitchFxColumns:
+        positions = np.sort(np.concatenate(positions_list)) if positions_list else np.array([], dtype=np.intp)
+        return self.pfx.take(positions)
+
+
+class PitchFxAggregateGroups(PitchFxGroups):
+    """The same buckets as PitchFxGroups, but counted and summed by the database with one GROUP BY query.
+
+    Each bucket holds a PitchFxTotals instead of row positions, so building every split for a team-season
+    or a pitcher's career never loads individual pitches into memory.
+    """
+
+    metrics_class = PitchFxAggregateMetrics
+
+    @classmethod
+    def from_db(cls, db_session: Session, *criteria) -> PitchFxAggregateGroups:
+        query = (
+            db_session.query(*PFX_GROUP_COLUMNS, *PFX_AGGREGATE_COLUMNS)
+            .filter(*criteria)
+            .group_by(*[col.name for col in PFX_GROUP_COLUMNS])
+        )
+        groups = {}
+        for row in query.all():
+            row = dict(row._mapping)
+            key = tuple(row[name] for name in PFX_GROUP_KEYS)
+            groups[key] = PitchFxTotals.from_row(row)
+        return cls(None, groups)
+
+    def _merge(self, totals_list: list[PitchFxTotals]) -> PitchFxTotals:
+        return PitchFxTotals.merge(totals_list)
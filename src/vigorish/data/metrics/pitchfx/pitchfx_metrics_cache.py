@@ -0,0 +1,229 @@
+"""Process-wide LRU cache of PitchFx metrics, with an optional tier of pickled metrics stored on disk."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+import numpy as np
+
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.util.numeric_helpers import ONE_MB
+
+DEFAULT_CACHE_SIZE_MB = 256
+
+_pfx_metrics_cache = None
+
+
+def get_pfx_metrics_cache_size() -> int:
+    cache_size_mb = os.environ.get("PFX_METRICS_CACHE_MB", "")
+    return (int(cache_size_mb) if cache_size_mb.isdigit() else DEFAULT_CACHE_SIZE_MB) * ONE_MB
+
+
+def get_pfx_metrics_cache_folder() -> Path | None:
+    cache_folder = os.environ.get("PFX_METRICS_CACHE_FOLDER", "")
+    return Path(cache_folder) if cache_folder else None
+
+
+def get_pfx_metrics_cache() -> PitchFxMetricsCache:
+    """Return the cache shared by every PitchFxMetricsFactory in this process (created on first use)."""
+    global _pfx_metrics_cache
+    if _pfx_metrics_cache is None:
+        _pfx_metrics_cache = PitchFxMetricsCache(get_pfx_metrics_cache_size(), get_pfx_metrics_cache_folder())
+    return _pfx_metrics_cache
+
+
+class PitchFxMetricsCache:
+    """Keep recently created PitchFx metrics in memory, evicting the least recently used items past max_size bytes.
+
+    Items are keyed by (database url, entity, split, seasons, remove_outliers), and each item records the player
+    (mlb_id) and seasons (years) that it was calculated from. A player's career and by-year metrics depend on every
+    season (years is None), and team metrics depend only on the season (mlb_id is None). AddToDatabaseTask calls
+    invalidate() with the players and seasons of the PitchFx data it imports, which removes every item that
+    depends on them.
+
+    The metrics objects are shared by every caller and must be treated as read-only. The size charged to the cache
+    for each item is the size of the arrays and values it holds (see get_item_size).
+
+    Each item is stored with the data version of the database when it was created (the largest pitchfx.id), and
+    is only returned while the data version still matches, so cached metrics are never used after PitchFx data has
+    been added to or removed from the database. If disk_folder is provided, each item is also pickled to a file in
+    that folder along with the data version. When an item is not found in memory, the file is used if the data
+    version still matches, so metrics survive restarting the process.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE_MB * ONE_MB, disk_folder: Path | None = None) -> None:
+        self.max_size = max_size
+        self.disk_folder = Path(disk_folder) if disk_folder else None
+        self.items = OrderedDict()
+        self.data_versions = {}
+        self.sizes = {}
+        self.dependencies = {}
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "items": len(self.items),
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+    def get_or_create(
+        self,
+        key: tuple,
+        create_metrics: Callable[[], Any],
+        mlb_id: int | None,
+        years: frozenset[int] | None,
+        get_data_version: Callable[[], Any],
+    ) -> Any:
+        """Return the metrics cached for key, calling create_metrics() to create them if they are not cached."""
+        data_version = get_data_version()
+        with self.lock:
+            if key in self.items and self.data_versions[key] == data_version:
+                self.items.move_to_end(key)
+                self.hits += 1
+                return self.items[key]
+            self.remove(key)
+        metrics = self.read_from_disk(key, data_version)
+        if metrics is not None:
+            with self.lock:
+                self.disk_hits += 1
+        else:
+            with self.lock:
+                self.misses += 1
+            metrics = create_metrics()
+            if metrics is None:
+                return None
+        self.put(key, metrics, mlb_id, years, data_version)
+        return metrics
+
+    def put(
+        self, key: tuple, metrics: Any, mlb_id: int | None, years: frozenset[int] | None, data_version: Any = None
+    ) -> None:
+        if self.disk_folder and data_version is not None:
+            self.write_to_disk(key, data_version, metrics)
+        item_size = get_item_size(metrics)
+        if item_size > self.max_size:
+            return
+        with self.lock:
+            self.remove(key)
+            self.items[key] = metrics
+            self.data_versions[key] = data_version
+            self.sizes[key] = item_size
+            self.dependencies[key] = (mlb_id, years)
+            self.size += item_size
+            while self.size > self.max_size:
+                self.remove(next(iter(self.items)))
+                self.evictions += 1
+
+    def invalidate(self, db_url: str, mlb_ids: set[int] | None = None, years: set[int] | None = None) -> int:
+        """Remove the items for db_url that depend on any of mlb_ids or years (all items for db_url if both are None)."""
+        mlb_ids = set(mlb_ids or [])
+        years = set(years or [])
+        with self.lock:
+            invalid_keys = [
+                key
+                for key, (mlb_id, item_years) in self.dependencies.items()
+                if key[0] == db_url and is_invalid(mlb_id, item_years, mlb_ids, years)
+            ]
+            for key in invalid_keys:
+                self.remove(key)
+            self.invalidations += len(invalid_keys)
+        return len(invalid_keys)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+            self.data_versions.clear()
+            self.sizes.clear()
+            self.dependencies.clear()
+            self.size = 0
+
+    def remove(self, key: tuple) -> None:
+        if key in self.items:
+            del self.items[key]
+            del self.data_versions[key]
+            del self.dependencies[key]
+            self.size -= self.sizes.pop(key)
+
+    def get_disk_filepath(self, key: tuple) -> Path:
+        return self.disk_folder.joinpath(f"{hashlib.sha1(repr(key).encode()).hexdigest()}.pkl")
+
+    def read_from_disk(self, key: tuple, data_version: Any) -> Any:
+        if not self.disk_folder or data_version is None:
+            return None
+        filepath = self.get_disk_filepath(key)
+        if not filepath.exists():
+            return None
+        try:
+            (file_key, file_data_version, snapshot) = pickle.loads(filepath.read_bytes())
+            if file_key != key or file_data_version != data_version:
+                return None
+            return pickle.loads(snapshot)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError):
+            return None
+
+    def write_to_disk(self, key: tuple, data_version: Any, metrics: Any) -> None:
+        try:
+            snapshot = pickle.dumps(metrics, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self.disk_folder.mkdir(parents=True, exist_ok=True)
+        filepath = self.get_disk_filepath(key)
+        temp_file = filepath.with_suffix(".tmp")
+        temp_file.write_bytes(pickle.dumps((key, data_version, snapshot), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(temp_file, filepath)
+
+
+def get_item_size(item: Any, seen: set[int] = None) -> int:
+    """Return the number of bytes held by item, counting each object it references once.
+
+    A PitchFxColumns is charged only for its index array. The column arrays belong to the store loaded from the
+    database and are shared by every subset taken from it, so they are not counted.
+    """
+    seen = seen if seen is not None else set()
+    if id(item) in seen:
+        return 0
+    seen.add(id(item))
+    if isinstance(item, PitchFxColumns):
+        return item.index.nbytes if item.index is not None else 0
+    if isinstance(item, np.ndarray):
+        return item.nbytes
+    if isinstance(item, dict):
+        return sum(get_item_size(key, seen) + get_item_size(value, seen) for key, value in item.items())
+    if isinstance(item, (list, tuple, set, frozenset)):
+        return sum(get_item_size(value, seen) for value in item)
+    if hasattr(item, "__dict__") and not isinstance(item, (type, Enum)):
+        return get_item_size(vars(item), seen)
+    return sys.getsizeof(item)
+
+
+def is_invalid(mlb_id: int | None, item_years: frozenset[int] | None, mlb_ids: set[int], years: set[int]) -> bool:
+    if not mlb_ids and not years:
+        return True
+    if mlb_id is None:
+        return bool(item_years & years)
+    return mlb_id in mlb_ids and (item_years is None or not years or bool(item_years & years))
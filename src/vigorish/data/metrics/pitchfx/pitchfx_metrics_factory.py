@@ -1,16 +1,52 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from functools import wraps
+from inspect import signature
+
+from sqlalchemy import func
 
 import vigorish.database as db
 from vigorish.data.metrics.pitchfx.pitchfx_batting_metrics import PitchFxBattingMetrics
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_groups import PitchFxAggregateGroups, PitchFxGroups
+from vigorish.data.metrics.pitchfx.pitchfx_metrics_cache import get_pfx_metrics_cache
 from vigorish.data.metrics.pitchfx.pitchfx_pitching_metrics import PitchFxPitchingMetrics
 
 
+def cached_metrics(method):
+    """Return the metrics from the process-wide cache, keyed by the method name and the values of its arguments.
+
+    The cached metrics depend on the player identified by the mlb_id (or pitch_app_id) argument, and on the season
+    identified by the year argument. If there is no year argument, the metrics depend on every season.
+    """
+    method_signature = signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return method(self, *args, **kwargs)
+        bound_args = method_signature.bind(self, *args, **kwargs)
+        bound_args.apply_defaults()
+        arguments = dict(list(bound_args.arguments.items())[1:])
+        key = (self.db_url, method.__name__, tuple(arguments.items()), self.aggregate_in_db)
+        mlb_id = arguments.get("mlb_id")
+        if "pitch_app_id" in arguments:
+            mlb_id = int(arguments["pitch_app_id"].rsplit("_", 1)[-1])
+        years = frozenset([arguments["year"]]) if "year" in arguments else None
+        return self.cache.get_or_create(
+            key, lambda: method(self, *args, **kwargs), mlb_id, years, self._get_pfx_data_version
+        )
+
+    return wrapper
+
+
 class PitchFxMetricsFactory:
-    def __init__(self, app):
+    def __init__(self, app, aggregate_in_db: bool = False, use_cache: bool = True):
         self.app = app
         self.db_session = app.db_session
+        self.db_url = str(app.db_engine.url)
+        self.aggregate_in_db = aggregate_in_db
+        self.cache = get_pfx_metrics_cache() if use_cache else None
 
     def for_pitcher_game(
         self, mlb_id: int, bbref_game_id: str, p_throws: str, remove_outliers: bool = False
@@ -18,13 +54,15 @@ class PitchFxMetricsFactory:
         pitch_app_id = f"{bbref_game_id}_{mlb_id}"
         return self.for_pitch_app(pitch_app_id, p_throws, remove_outliers)
 
+    @cached_metrics
     def for_pitch_app(self, pitch_app_id: str, p_throws: str, remove_outliers: bool = False) -> PitchFxPitchingMetrics:
         pitch_app = db.PitchAppScrapeStatus.find_by_pitch_app_id(self.db_session, pitch_app_id)
         if not pitch_app:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(pitch_app_db_id=pitch_app.id).all()
+        pfx = self._get_pfx(db.PitchFx.pitch_app_db_id == pitch_app.id)
         return PitchFxPitchingMetrics(pfx, pitch_app.pitcher_id_mlb, p_throws, remove_outliers)
 
+    @cached_metrics
     def for_pitcher_season(
         self, mlb_id: int, year: int, p_throws: str, remove_outliers: bool = True
     ) -> PitchFxPitchingMetrics:
@@ -34,38 +72,50 @@ class PitchFxMetricsFactory:
         season = db.Season.find_by_year(self.db_session, year)
         if not season:
             return None
-        pfx = (
-            self.db_session.query(db.PitchFx)
-            .filter_by(pitcher_id=pitcher.db_player_id)
-            .filter_by(season_id=season.id)
-            .all()
-        )
+        pfx = self._get_pfx(db.PitchFx.pitcher_id == pitcher.db_player_id, db.PitchFx.season_id == season.id)
         return PitchFxPitchingMetrics(pfx, mlb_id, p_throws, remove_outliers)
 
+    @cached_metrics
     def for_pitcher_career(self, mlb_id: int, p_throws: str, remove_outliers: bool = True) -> PitchFxPitchingMetrics:
         pitcher = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         if not pitcher:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(pitcher_id=pitcher.db_player_id).all()
+        pfx = self._get_pfx(db.PitchFx.pitcher_id == pitcher.db_player_id)
         return PitchFxPitchingMetrics(pfx, mlb_id, p_throws, remove_outliers)
 
+    @cached_metrics
     def for_pitcher_by_year(
         self, mlb_id: int, p_throws: str, remove_outliers: bool = True
     ) -> dict[int, PitchFxPitchingMetrics]:
         pitcher = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         if not pitcher:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(pitcher_id=pitcher.db_player_id).all()
-        season_ids = list({p.season_id for p in pfx})
+        pfx = self._get_pfx(db.PitchFx.pitcher_id == pitcher.db_player_id)
+        return self._get_pitching_metrics_by_year(pfx, mlb_id, p_throws, remove_outliers)
+
+    @cached_metrics
+    def for_pitcher_career_and_by_year(
+        self, mlb_id: int, p_throws: str, remove_outliers: bool = True
+    ) -> tuple[PitchFxPitchingMetrics, dict[int, PitchFxPitchingMetrics]]:
+        pitcher = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
+        if not pitcher:
+            return (None, None)
+        pfx = self._get_pfx(db.PitchFx.pitcher_id == pitcher.db_player_id)
+        pfx_metrics_for_career = PitchFxPitchingMetrics(pfx, mlb_id, p_throws, remove_outliers)
+        pfx_metrics_by_year = self._get_pitching_metrics_by_year(pfx, mlb_id, p_throws, remove_outliers)
+        return (pfx_metrics_for_career, pfx_metrics_by_year)
+
+    def _get_pitching_metrics_by_year(
+        self, pfx: PitchFxGroups, mlb_id: int, p_throws: str, remove_outliers: bool
+    ) -> dict[int, PitchFxPitchingMetrics]:
         pfx_metrics_by_year = {}
-        for sid in sorted(season_ids):
+        for sid in pfx.season_ids:
             season = self.db_session.query(db.Season).get(sid)
-            pfx_for_season = [p for p in pfx if p.season_id == sid]
-            pfx_metrics_by_year[season.year] = PitchFxPitchingMetrics(
-                deepcopy(pfx_for_season), mlb_id, p_throws, remove_outliers
-            )
+            pfx_for_season = pfx.filter(season_id=sid)
+            pfx_metrics_by_year[season.year] = PitchFxPitchingMetrics(pfx_for_season, mlb_id, p_throws, remove_outliers)
         return pfx_metrics_by_year
 
+    @cached_metrics
     def for_batter_game(self, mlb_id: int, bbref_game_id: str, remove_outliers: bool = False) -> PitchFxBattingMetrics:
         game_status = db.GameScrapeStatus.find_by_bbref_game_id(self.db_session, bbref_game_id)
         if not game_status:
@@ -73,14 +123,10 @@ class PitchFxMetricsFactory:
         batter = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         if not batter:
             return None
-        pfx = (
-            self.db_session.query(db.PitchFx)
-            .filter_by(game_status_id=game_status.id)
-            .filter_by(batter_id=batter.db_player_id)
-            .all()
-        )
+        pfx = self._get_pfx(db.PitchFx.game_status_id == game_status.id, db.PitchFx.batter_id == batter.db_player_id)
         return PitchFxBattingMetrics(pfx, mlb_id, remove_outliers)
 
+    @cached_metrics
     def for_batter_season(self, mlb_id: int, year: int, remove_outliers: bool = False) -> PitchFxBattingMetrics:
         season = db.Season.find_by_year(self.db_session, year)
         if not season:
@@ -88,44 +134,50 @@ class PitchFxMetricsFactory:
         batter = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         if not batter:
             return None
-        pfx = (
-            self.db_session.query(db.PitchFx)
-            .filter_by(batter_id=batter.db_player_id)
-            .filter_by(season_id=season.id)
-            .all()
-        )
+        pfx = self._get_pfx(db.PitchFx.batter_id == batter.db_player_id, db.PitchFx.season_id == season.id)
         return PitchFxBattingMetrics(pfx, mlb_id, remove_outliers)
 
+    @cached_metrics
     def for_batter_career(self, mlb_id: int, remove_outliers: bool = False) -> PitchFxBattingMetrics:
         batter = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         if not batter:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(batter_id=batter.db_player_id).all()
+        pfx = self._get_pfx(db.PitchFx.batter_id == batter.db_player_id)
         return PitchFxBattingMetrics(pfx, mlb_id, remove_outliers)
 
+    @cached_metrics
     def for_batter_by_year(self, mlb_id: int, remove_outliers: bool = False) -> dict[int, PitchFxBattingMetrics]:
         batter = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         if not batter:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(batter_id=batter.db_player_id).all()
-        season_ids = list({p.season_id for p in pfx})
+        pfx = self._get_pfx(db.PitchFx.batter_id == batter.db_player_id)
         pfx_metrics_by_year = {}
-        for sid in season_ids:
+        for sid in pfx.season_ids:
             season = self.db_session.query(db.Season).get(sid)
-            pfx_for_season = [p for p in pfx if p.season_id == sid]
+            pfx_for_season = pfx.filter(season_id=sid)
             pfx_metrics_by_year[season.year] = PitchFxBattingMetrics(pfx_for_season, mlb_id, remove_outliers)
         return pfx_metrics_by_year
 
+    @cached_metrics
     def for_team_pitching(self, team_id_br: str, year: int, remove_outliers: bool = True) -> PitchFxPitchingMetrics:
         team = db.Team.find_by_team_id_and_year(self.db_session, team_id_br, year)
         if not team:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(team_pitching_id=team.id).all()
-        return PitchFxPitchingMetrics(pfx, mlb_id=None, remove_outliers=remove_outliers)
+        pfx = self._get_pfx(db.PitchFx.team_pitching_id == team.id)
+        return PitchFxPitchingMetrics(pfx, mlb_id=None, p_throws=None, remove_outliers=remove_outliers)
 
+    @cached_metrics
     def for_team_batting(self, team_id_br: str, year: int, remove_outliers: bool = False) -> PitchFxPitchingMetrics:
         team = db.Team.find_by_team_id_and_year(self.db_session, team_id_br, year)
         if not team:
             return None
-        pfx = self.db_session.query(db.PitchFx).filter_by(team_batting_id=team.id).all()
+        pfx = self._get_pfx(db.PitchFx.team_batting_id == team.id)
         return PitchFxBattingMetrics(pfx, mlb_id=None, remove_outliers=remove_outliers)
+
+    def _get_pfx(self, *criteria) -> PitchFxGroups:
+        if self.aggregate_in_db:
+            return PitchFxAggregateGroups.from_db(self.db_session, *criteria)
+        return PitchFxGroups(PitchFxColumns.from_db(self.db_session, *criteria))
+
+    def _get_pfx_data_version(self) -> int:
+        return self.db_session.query(func.max(db.PitchFx.id)).scalar()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 import vigorish.database as db
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_groups import PitchFxGroups
 from vigorish.data.metrics.pitchfx.pitchfx_metrics import PitchFxMetrics
 from vigorish.enums import PitchType
 
@@ -78,36 +79,34 @@ class PitchFxMetricsSet:
 class PfxMetricsSetBuilder:
     def create_pfx_metrics_set(
         self,
-        pfx: list[db.PitchFx],
+        pfx: list[db.PitchFx] | PitchFxColumns | PitchFxGroups,
         mlb_id: int = None,
         p_throws: str = None,
         bat_stand: str = None,
         remove_outliers: bool = False,
     ) -> PitchFxMetricsSet:
-        self.pfx = pfx
-        self.total_pfx = len(pfx)
+        self.pfx_groups = PitchFxGroups.from_pfx(pfx)
+        self.total_pfx = self.pfx_groups.total_pitches
         self.mlb_id = mlb_id
         self.p_throws = p_throws
         self.bat_stand = bat_stand
         self.remove_outliers = remove_outliers
 
-        self._remove_invalid_data()
-        (valid_pfx_metrics, outlier_pitch_types) = self._create_pfx_metrics_for_each_pitch_type()
+        valid_pfx_metrics, outlier_pitch_types = self._create_pfx_metrics_for_each_pitch_type()
         return self._create_pfx_metrics_set(valid_pfx_metrics, outlier_pitch_types)
 
-    def _remove_invalid_data(self) -> None:
-        self.pfx = list(filter(lambda x: not (x.is_invalid_ibb or x.is_out_of_sequence), self.pfx))
-
-    def _create_pfx_metrics_for_each_pitch_type(self) -> tuple[list[PitchFxMetrics], list[str]]:
-        all_pitch_types = PitchType(sum({p.pitch_type_int for p in self.pfx}))
+    def _create_pfx_metrics_for_each_pitch_type(self) -> tuple[list[PitchFxMetrics], list[int]]:
+        pfx_by_pitch_type = self.pfx_groups.valid_pitches_by_pitch_type()
+        total_valid_pfx = sum(len(pfx) for pfx in pfx_by_pitch_type.values())
+        all_pitch_types = PitchType(sum(pfx_by_pitch_type.keys()))
         valid_pfx_metrics, outlier_pitch_types = [], []
         for pitch_type in all_pitch_types:
-            pfx_for_pitch_type = [p for p in self.pfx if p.mlbam_pitch_name == str(pitch_type)]
-            percent = round(len(pfx_for_pitch_type) / float(len(self.pfx)), 3)
+            pfx_for_pitch_type = pfx_by_pitch_type[int(pitch_type)]
+            percent = round(len(pfx_for_pitch_type) / float(total_valid_pfx), 3)
             if self.remove_outliers and percent < 0.01:
-                outlier_pitch_types.append(str(pitch_type))
+                outlier_pitch_types.append(int(pitch_type))
                 continue
-            pfx_metrics = PitchFxMetrics(deepcopy(pfx_for_pitch_type), self.mlb_id, self.p_throws, self.bat_stand)
+            pfx_metrics = self.pfx_groups.metrics_class(pfx_for_pitch_type, self.mlb_id, self.p_throws, self.bat_stand)
             valid_pfx_metrics.append(pfx_metrics)
         valid_pfx_metrics = self._sort_by_percent_thrown(valid_pfx_metrics)
         return (valid_pfx_metrics, outlier_pitch_types)
@@ -119,13 +118,13 @@ class PfxMetricsSetBuilder:
         return sorted(pitch_type_metrics, key=lambda x: x.percent, reverse=True)
 
     def _create_pfx_metrics_set(
-        self, valid_pfx_metrics: list[PitchFxMetrics], outlier_pitch_types: list[str]
+        self, valid_pfx_metrics: list[PitchFxMetrics], outlier_pitch_types: list[int]
     ) -> PitchFxMetricsSet:
-        self.pfx = list(filter(lambda x: x.mlbam_pitch_name not in outlier_pitch_types, self.pfx))
+        self.pfx = self.pfx_groups.valid_pitches(exclude_pitch_types=outlier_pitch_types)
         total_pfx_removed = self.total_pfx - len(self.pfx)
 
         metrics_by_pitch_type = {str(m.pitch_type): m for m in valid_pfx_metrics}
-        metrics_combined = PitchFxMetrics(deepcopy(self.pfx), self.mlb_id, self.p_throws, self.bat_stand)
+        metrics_combined = self.pfx_groups.metrics_class(self.pfx, self.mlb_id, self.p_throws, self.bat_stand)
         metrics_combined.percent = 1
         return PitchFxMetricsSet(
             pitch_type_int=metrics_combined.pitch_type_int,
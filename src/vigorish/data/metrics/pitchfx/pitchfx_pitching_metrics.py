@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from copy import deepcopy
-
 import vigorish.database as db
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PitchFxColumns
+from vigorish.data.metrics.pitchfx.pitchfx_groups import PitchFxGroups
 from vigorish.data.metrics.pitchfx.pitchfx_metrics_set import (
     PfxMetricsSetBuilder,
     PitchFxMetricsSet,
@@ -14,18 +14,25 @@ class PitchFxPitchingMetrics:
     rhb: PitchFxMetricsSet
     lhb: PitchFxMetricsSet
 
-    def __init__(self, pfx: list[db.PitchFx], mlb_id: int, p_throws: str, remove_outliers: bool = False):
+    def __init__(
+        self,
+        pfx: list[db.PitchFx] | PitchFxColumns | PitchFxGroups,
+        mlb_id: int,
+        p_throws: str,
+        remove_outliers: bool = False,
+    ):
+        pfx = PitchFxGroups.from_pfx(pfx)
         pfx_metrics_builder = PfxMetricsSetBuilder()
-        pfx_vs_rhb = list(filter(lambda x: x.stand == "R", pfx))
-        pfx_vs_lhb = list(filter(lambda x: x.stand == "L", pfx))
+        pfx_vs_rhb = pfx.filter(stand="R")
+        pfx_vs_lhb = pfx.filter(stand="L")
         self.all = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx), mlb_id=mlb_id, p_throws=p_throws, remove_outliers=remove_outliers
+            pfx, mlb_id=mlb_id, p_throws=p_throws, remove_outliers=remove_outliers
         )
         self.rhb = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_vs_rhb), mlb_id=mlb_id, p_throws=p_throws, bat_stand="R", remove_outliers=remove_outliers
+            pfx_vs_rhb, mlb_id=mlb_id, p_throws=p_throws, bat_stand="R", remove_outliers=remove_outliers
         )
         self.lhb = pfx_metrics_builder.create_pfx_metrics_set(
-            deepcopy(pfx_vs_lhb), mlb_id=mlb_id, p_throws=p_throws, bat_stand="L", remove_outliers=remove_outliers
+            pfx_vs_lhb, mlb_id=mlb_id, p_throws=p_throws, bat_stand="L", remove_outliers=remove_outliers
         )
 
     def as_dict(self):
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from sqlalchemy import and_, case, func, or_
+
+import vigorish.database as db
+from vigorish.views import pfx_col_expressions as pfx_col
+
+PFX_TOTAL_COLUMNS = [
+    pfx_col.total_pitches,
+    pfx_col.total_inside_strike_zone,
+    pfx_col.total_outside_strike_zone,
+    pfx_col.total_called_strikes,
+    pfx_col.total_swinging_strikes,
+    pfx_col.total_swings,
+    pfx_col.total_swings_inside_zone,
+    pfx_col.total_swings_outside_zone,
+    func.sum(case([(and_(db.PitchFx.swing_outside_zone == 1, db.PitchFx.swinging_strike == 1), 1)], else_=0)).label(
+        "total_bad_whiffs"
+    ),
+    pfx_col.total_swings_made_contact,
+    pfx_col.total_contact_inside_zone,
+    pfx_col.total_contact_outside_zone,
+    pfx_col.total_balls_in_play,
+    pfx_col.total_ground_balls,
+    pfx_col.total_line_drives,
+    pfx_col.total_fly_balls,
+    pfx_col.total_popups,
+    pfx_col.total_pa,
+    pfx_col.total_hits,
+    pfx_col.total_outs,
+    pfx_col.total_k,
+    pfx_col.total_bb,
+    pfx_col.total_hbp,
+    pfx_col.total_sac_hit,
+    pfx_col.total_sac_fly,
+    pfx_col.total_errors,
+    pfx_col.total_singles,
+    pfx_col.total_doubles,
+    pfx_col.total_triples,
+    pfx_col.total_homeruns,
+    func.sum(db.PitchFx.ab_result_ibb).label("total_ibb"),
+    pfx_col.total_hard_hits,
+    pfx_col.total_medium_hits,
+    pfx_col.total_soft_hits,
+    pfx_col.total_barrels,
+]
+
+PFX_AVG_COLUMN_NAMES = [
+    "start_speed",
+    "pfx_x",
+    "pfx_z",
+    "px",
+    "pz",
+    "plate_time",
+    "extension",
+    "break_angle",
+    "break_length",
+    "break_y",
+    "spin_rate",
+    "spin_direction",
+]
+
+PFX_NONZERO_AVG_COLUMN_NAMES = ["launch_speed", "launch_angle", "total_distance"]
+
+PFX_SUM_COLUMNS = [
+    func.sum(getattr(db.PitchFx, name)).label(f"sum_{name}")
+    for name in PFX_AVG_COLUMN_NAMES + PFX_NONZERO_AVG_COLUMN_NAMES
+]
+
+PFX_NONZERO_COUNT_COLUMNS = [
+    func.sum(case([(getattr(db.PitchFx, name) != 0, 1)], else_=0)).label(f"count_{name}")
+    for name in PFX_NONZERO_AVG_COLUMN_NAMES
+]
+
+PFX_MAX_COLUMNS = [
+    func.max(case([(db.PitchFx.launch_speed != 0, db.PitchFx.launch_speed)], else_=None)).label("max_launch_speed")
+]
+
+PFX_GROUP_COLUMNS = [
+    func.coalesce(db.PitchFx.season_id, 0).label("season_id"),
+    func.coalesce(db.PitchFx.p_throws, "").label("p_throws"),
+    func.coalesce(db.PitchFx.stand, "").label("stand"),
+    func.coalesce(db.PitchFx.pitch_type_int, 0).label("pitch_type_int"),
+    case([(or_(db.PitchFx.is_invalid_ibb == 1, db.PitchFx.is_out_of_sequence == 1), 0)], else_=1).label("is_valid"),
+]
+
+PFX_AGGREGATE_COLUMNS = PFX_TOTAL_COLUMNS + PFX_SUM_COLUMNS + PFX_NONZERO_COUNT_COLUMNS + PFX_MAX_COLUMNS
+
+
+class PitchFxTotals:
+    """Counts, sums and maximums of the PitchFx columns for a group of pitches, calculated by the database.
+
+    Instances can be combined with merge(), which is how the per-group rows returned by a single
+    GROUP BY query are rolled up into the splits (vs RHB/LHB, by pitch type, by season) needed to
+    build PitchFxMetrics without loading individual pitches into memory.
+    """
+
+    def __init__(self, values: dict[str, float], pitch_types: set[int] = None) -> None:
+        self.values = values
+        self.pitch_types = pitch_types or set()
+
+    def __len__(self) -> int:
+        return int(self.values.get("total_pitches", 0))
+
+    def __getitem__(self, name: str) -> float:
+        return self.values.get(name, 0)
+
+    @classmethod
+    def from_row(cls, row: dict) -> PitchFxTotals:
+        values = {
+            col.name: row[col.name] or 0 for col in PFX_TOTAL_COLUMNS + PFX_SUM_COLUMNS + PFX_NONZERO_COUNT_COLUMNS
+        }
+        values.update({col.name: row[col.name] for col in PFX_MAX_COLUMNS})
+        return cls(values, {row["pitch_type_int"]})
+
+    @classmethod
+    def merge(cls, totals_list: list[PitchFxTotals]) -> PitchFxTotals:
+        values = {}
+        pitch_types = set()
+        for totals in totals_list:
+            pitch_types |= totals.pitch_types
+            for name, value in totals.values.items():
+                values[name] = _max(values.get(name), value) if name.startswith("max_") else values.get(name, 0) + value
+        return cls(values, pitch_types)
+
+
+def _max(first: float, second: float) -> float:
+    return second if first is None else first if second is None else max(first, second)
@@ -1,19 +1,143 @@
-from functools import cached_property
+"""Fuzzy search of the names of all players with pitching or batting stats in the database."""
+import json
+import os
+import re
+from pathlib import Path
+
+from rapidfuzz import fuzz, process
+from sqlalchemy import func, select, union
 
 import vigorish.database as db
-from vigorish.util.string_helpers import fuzzy_match
+from vigorish.util.string_helpers import remove_accents
+
+PLAYER_NAME_INDEX_VERSION = 1
+NON_WORD_REGEX = re.compile(r"[^a-z0-9]+")
 
 
 class PlayerNameSearch:
-    def __init__(self, db_session):
+    """Name and normalized name tokens of every player with a row in the pitch_stats or bat_stats table.
+
+    The index records the largest pitch_stats.id and bat_stats.id that it includes. Before each search these are
+    compared to the largest ids in the database (a single indexed lookup): when rows have been added, only the
+    players in the new rows are queried and added to the index, and when either table has fewer rows (e.g., the
+    database was restored from a backup) the index is rebuilt. Players are queried with a single SELECT DISTINCT that
+    joins player_id to the new pitch_stats and bat_stats rows.
+
+    If index_filepath is provided, the index is saved to that file whenever it changes, so a new process only
+    queries the players that were added since the index was last saved. AddToDatabaseTask calls update() after
+    importing a season, so the players it adds are indexed before the next search.
+    """
+
+    def __init__(self, db_session, index_filepath=None):
         self.db_session = db_session
+        self.index_filepath = Path(index_filepath) if index_filepath else None
+        self.players = {}
+        self.max_stats_ids = None
+        self.choices = []
+        self.choice_ids = []
 
-    @cached_property
+    @property
     def player_id_name_map(self):
-        pitcher_ids = {ps.player_id_mlb for ps in self.db_session.query(db.PitchStats).all()}
-        batter_ids = {bs.player_id_mlb for bs in self.db_session.query(db.BatStats).all()}
-        all_ids = set(list(pitcher_ids) + list(batter_ids))
-        return {player_id: db.PlayerId.find_by_mlb_id(self.db_session, player_id).mlb_name for player_id in all_ids}
+        self.refresh()
+        return {mlb_id: name for (mlb_id, (name, _)) in self.players.items()}
+
+    def fuzzy_match(self, query, score_cutoff=80, limit=10):
+        self.refresh()
+        query = normalize_player_name(query)
+        best_matches = self.extract(query, limit, score_cutoff) or self.extract(query, limit, 0)
+        return [
+            {"match": self.players[self.choice_ids[index]][0], "score": score, "result": self.choice_ids[index]}
+            for (_, score, index) in best_matches
+        ]
+
+    def extract(self, query, limit, score_cutoff):
+        return process.extract(
+            query, self.choices, scorer=fuzz.WRatio, processor=None, limit=limit, score_cutoff=score_cutoff
+        )
+
+    def update(self):
+        """Add new players to an index that has been loaded or saved. An index that has not been built is skipped."""
+        if self.max_stats_ids is not None or (self.index_filepath and self.index_filepath.exists()):
+            self.refresh()
+
+    def refresh(self):
+        if self.max_stats_ids is None:
+            self.read_index()
+        max_stats_ids = self.get_max_stats_ids()
+        if max_stats_ids == self.max_stats_ids:
+            return
+        if not self.max_stats_ids or any(new < old for (new, old) in zip(max_stats_ids, self.max_stats_ids)):
+            self.players = {}
+            self.max_stats_ids = (0, 0)
+        for (mlb_id, name) in self.get_player_names(self.max_stats_ids, max_stats_ids):
+            self.players[mlb_id] = (name, normalize_player_name(name))
+        self.max_stats_ids = max_stats_ids
+        self.build_choices()
+        self.save_index()
+
+    def build_choices(self):
+        self.choice_ids = sorted(self.players)
+        self.choices = [self.players[mlb_id][1] for mlb_id in self.choice_ids]
+
+    def get_max_stats_ids(self):
+        max_pitch_stats_id = select([func.max(db.PitchStats.id)]).scalar_subquery()
+        max_bat_stats_id = select([func.max(db.BatStats.id)]).scalar_subquery()
+        (max_pitch_stats_id, max_bat_stats_id) = self.db_session.execute(
+            select([max_pitch_stats_id, max_bat_stats_id])
+        ).first()
+        return (max_pitch_stats_id or 0, max_bat_stats_id or 0)
+
+    def get_player_names(self, min_stats_ids, max_stats_ids):
+        """Return the mlb_id and name of each player in the stats rows with ids in the range (min, max]."""
+        stats_player_ids = union(
+            *[
+                select([stats.player_id_mlb.label("mlb_id")]).where(stats.id > min_id).where(stats.id <= max_id)
+                for (stats, min_id, max_id) in zip([db.PitchStats, db.BatStats], min_stats_ids, max_stats_ids)
+            ]
+        ).subquery()
+        query = (
+            select([db.PlayerId.mlb_id, db.PlayerId.mlb_name])
+            .distinct()
+            .select_from(db.PlayerId.__table__.join(stats_player_ids, stats_player_ids.c.mlb_id == db.PlayerId.mlb_id))
+            .where(db.PlayerId.mlb_name.isnot(None))
+        )
+        return self.db_session.execute(query).all()
+
+    def read_index(self):
+        if not self.index_filepath or not self.index_filepath.exists():
+            return
+        try:
+            index = json.loads(self.index_filepath.read_text())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if index.get("version") != PLAYER_NAME_INDEX_VERSION:
+            return
+        self.players = {mlb_id: (name, normalized) for (mlb_id, name, normalized) in index["players"]}
+        self.max_stats_ids = tuple(index["max_stats_ids"])
+        self.build_choices()
+
+    def save_index(self):
+        if not self.index_filepath:
+            return
+        index = {
+            "version": PLAYER_NAME_INDEX_VERSION,
+            "max_stats_ids": list(self.max_stats_ids),
+            "players": [[mlb_id, *self.players[mlb_id]] for mlb_id in self.choice_ids],
+        }
+        self.index_filepath.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.index_filepath.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(index))
+        os.replace(temp_file, self.index_filepath)
+
+
+def normalize_player_name(name):
+    """Return the words in name as lowercase ASCII separated by single spaces, e.g. "José Ramírez" -> "jose ramirez"."""
+    return NON_WORD_REGEX.sub(" ", remove_accents(name).lower()).strip()
+
 
-    def fuzzy_match(self, query, score_cutoff=80):
-        return fuzzy_match(query, self.player_id_name_map, score_cutoff)
+def get_player_name_index_filepath(db_engine):
+    """Return the path of the player name index for a SQLite database file (None for any other database)."""
+    if db_engine.url.get_backend_name() != "sqlite" or db_engine.url.database in (None, "", ":memory:"):
+        return None
+    db_filepath = Path(db_engine.url.database)
+    return db_filepath.with_name(f"{db_filepath.stem}.player_names.json")
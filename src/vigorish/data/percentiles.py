@@ -0,0 +1,149 @@
+"""Percentile lookups for pitchfx metrics, answered from the percentile tables loaded into memory."""
+from bisect import bisect_left
+from collections import defaultdict
+from functools import cached_property
+
+import vigorish.database as db
+from vigorish.models.batter_percentiles import (
+    format_player_stat_values as format_batter_stat_values,
+)
+from vigorish.models.pitch_type_percentiles import (
+    format_player_stat_values as format_pitch_type_stat_values,
+)
+
+POS, NEG = True, False
+
+PITCH_TYPE_PERCENTILE_STATS = [
+    ("avg_speed", "avg_speed", POS),
+    ("ops", "ops", NEG),
+    ("zone_rate", "zone_rate", POS),
+    ("o_swing_rate", "o_swing_rate", POS),
+    ("whiff_rate", "whiff_rate", POS),
+    ("bad_whiff_rate", "bad_whiff_rate", POS),
+    ("contact_rate", "contact_rate", NEG),
+    ("ground_ball_rate", "ground_ball_rate", POS),
+    ("barrel_rate", "barrel_rate", NEG),
+    ("avg_exit_velocity", "avg_launch_speed", NEG),
+]
+
+BATTER_PERCENTILE_STATS = [
+    ("bb_rate", "bb_rate", POS),
+    ("k_rate", "k_rate", NEG),
+    ("contact_rate", "contact_rate", POS),
+    ("o_swing_rate", "o_swing_rate", NEG),
+    ("whiff_rate", "whiff_rate", NEG),
+    ("bad_whiff_rate", "bad_whiff_rate", NEG),
+    ("line_drive_rate", "line_drive_rate", POS),
+    ("barrel_rate", "barrel_rate", POS),
+    ("avg_launch_speed", "avg_launch_speed", POS),
+    ("max_launch_speed", "max_launch_speed", POS),
+]
+
+
+class PercentileArray:
+    """The rows of a percentile table for one stat (and pitch type/handedness), searchable with bisect.
+
+    The original queries return the first row in table order where stat_value >= x (or <= x for stats where a lower
+    value is better), without sorting. Only a row whose stat_value is greater than every row before it (less than,
+    for <=) can be the first row to satisfy either condition, so those rows are kept in a list that is strictly
+    increasing (values for <= are negated) and the answer is found with a binary search. This gives the same result
+    as the query even if the table is not sorted by stat_value.
+    """
+
+    def __init__(self):
+        self.pos_values = []
+        self.pos_percentiles = []
+        self.neg_values = []
+        self.neg_percentiles = []
+
+    def add(self, stat_value, percentile):
+        if not self.pos_values or stat_value > self.pos_values[-1]:
+            self.pos_values.append(stat_value)
+            self.pos_percentiles.append(percentile)
+        if not self.neg_values or -stat_value > self.neg_values[-1]:
+            self.neg_values.append(-stat_value)
+            self.neg_percentiles.append(percentile)
+
+    def get_percentile(self, stat_value, pos_stat):
+        if stat_value is None or stat_value != stat_value:
+            return 100.0
+        (values, percentiles) = (
+            (self.pos_values, self.pos_percentiles) if pos_stat else (self.neg_values, self.neg_percentiles)
+        )
+        index = bisect_left(values, stat_value if pos_stat else -stat_value)
+        return percentiles[index] if index < len(values) else 100.0
+
+
+class PercentileLookup:
+    """Calculate percentiles for pitchfx metrics without querying the database for each stat.
+
+    The batter_percentiles and pitch_type_percentiles tables are read once (the first time a percentile is needed)
+    into a PercentileArray for each stat (and pitch type/handedness). The results are identical to the
+    calculate_*_percentiles methods of the BatterPercentile and PitchTypePercentile models.
+    """
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    @cached_property
+    def batter_percentiles(self):
+        bat_perc = db.BatterPercentile
+        query = (
+            self.db_session.query(bat_perc.stat_name, bat_perc.stat_value, bat_perc.percentile)
+            .filter(bat_perc.stat_value.isnot(None))
+            .order_by(bat_perc.id)
+        )
+        percentiles = defaultdict(PercentileArray)
+        for stat_name, stat_value, percentile in query:
+            percentiles[stat_name].add(stat_value, percentile)
+        return dict(percentiles)
+
+    @cached_property
+    def pitch_type_percentiles(self):
+        pt_perc = db.PitchTypePercentile
+        query = (
+            self.db_session.query(
+                pt_perc.stat_name,
+                pt_perc.pitch_type,
+                pt_perc.thrown_r,
+                pt_perc.thrown_l,
+                pt_perc.stat_value,
+                pt_perc.percentile,
+            )
+            .filter(pt_perc.stat_value.isnot(None))
+            .order_by(pt_perc.id)
+        )
+        percentiles = defaultdict(PercentileArray)
+        for stat_name, pitch_type, thrown_r, thrown_l, stat_value, percentile in query:
+            if thrown_r:
+                percentiles[(stat_name, pitch_type, "R")].add(stat_value, percentile)
+            if thrown_l:
+                percentiles[(stat_name, pitch_type, "L")].add(stat_value, percentile)
+        return dict(percentiles)
+
+    def calculate_pitch_type_percentiles(self, p_throws, pfx_metrics):
+        throws = "R" if p_throws == "R" else "L"
+        pitch_type = str(pfx_metrics.pitch_type)
+        percentiles = {"pitch_type": pitch_type}
+        for name, stat_name, pos_stat in PITCH_TYPE_PERCENTILE_STATS:
+            stat_value = getattr(pfx_metrics, stat_name)
+            percentile_array = self.pitch_type_percentiles.get((stat_name, pitch_type, throws))
+            percentile = percentile_array.get_percentile(stat_value, pos_stat) if percentile_array else 100.0
+            percentiles[name] = (stat_value, percentile)
+        return format_pitch_type_stat_values(percentiles)
+
+    def calculate_pitch_type_percentiles_for_metrics_set(self, p_throws, pfx_metrics_set):
+        """Calculate the percentiles for every pitch type in a PitchFxMetricsSet."""
+        return [
+            self.calculate_pitch_type_percentiles(p_throws, pfx_metrics)
+            for pfx_metrics in pfx_metrics_set.metrics_by_pitch_type.values()
+        ]
+
+    def calculate_batter_percentiles(self, pfx_metrics):
+        percentiles = {}
+        for name, stat_name, pos_stat in BATTER_PERCENTILE_STATS:
+            stat_value = getattr(pfx_metrics, stat_name)
+            percentile_array = self.batter_percentiles.get(stat_name)
+            percentile = percentile_array.get_percentile(stat_value, pos_stat) if percentile_array else 100.0
+            percentiles[name] = (stat_value, percentile)
+        return format_batter_stat_values(percentiles)
@@ -39,8 +39,6 @@ class PlayerData:
         if not self.player:
             raise UnknownPlayerException(mlb_id)
         self.player_id = db.PlayerId.find_by_mlb_id(self.db_session, self.mlb_id)
-        self.pitchfx_game_pitch_data_cache = {}
-        self.pitchfx_game_bat_data_cache = {}
 
     @property
     def player_name(self) -> str:
@@ -156,8 +154,14 @@ class PlayerData:
         return self.scraped_data.get_bat_stats_by_opp_by_year_for_player(self.mlb_id)
 
     @cached_property
+    def pfx_pitching_metrics_career_and_by_year(
+        self,
+    ) -> tuple[PitchFxPitchingMetrics, dict[int, PitchFxPitchingMetrics]]:
+        return self.pfx_metrics.for_pitcher_career_and_by_year(self.mlb_id, self.player.throws)
+
+    @property
     def pfx_pitching_metrics_for_career(self) -> PitchFxPitchingMetrics:
-        return self.pfx_metrics.for_pitcher_career(self.mlb_id, self.player.throws)
+        return self.pfx_pitching_metrics_career_and_by_year[0]
 
     @property
     def pfx_pitching_metrics_vs_all_for_career(self) -> PitchFxMetricsSet:
@@ -165,10 +169,9 @@ class PlayerData:
 
     @cached_property
     def percentiles_for_pitch_types_for_career(self) -> list[PitchTypePercentiles]:
-        return [
-            self.scraped_data.calculate_pitch_type_percentiles(self.player.throws, pfx_metrics)
-            for pfx_metrics in self.pfx_pitching_metrics_vs_all_for_career.metrics_by_pitch_type.values()
-        ]
+        return self.scraped_data.calculate_pitch_type_percentiles_for_metrics_set(
+            self.player.throws, self.pfx_pitching_metrics_vs_all_for_career
+        )
 
     @property
     def pfx_pitching_metrics_vs_rhb_for_career(self) -> PitchFxMetricsSet:
@@ -176,10 +179,9 @@ class PlayerData:
 
     @cached_property
     def percentiles_for_pitch_types_vs_rhb_for_career(self) -> list[PitchTypePercentiles]:
-        return [
-            self.scraped_data.calculate_pitch_type_percentiles(self.player.throws, pfx_metrics)
-            for pfx_metrics in self.pfx_pitching_metrics_vs_rhb_for_career.metrics_by_pitch_type.values()
-        ]
+        return self.scraped_data.calculate_pitch_type_percentiles_for_metrics_set(
+            self.player.throws, self.pfx_pitching_metrics_vs_rhb_for_career
+        )
 
     @property
     def pfx_pitching_metrics_vs_lhb_for_career(self) -> PitchFxMetricsSet:
@@ -187,10 +189,9 @@ class PlayerData:
 
     @cached_property
     def percentiles_for_pitch_types_vs_lhb_for_career(self) -> list[PitchTypePercentiles]:
-        return [
-            self.scraped_data.calculate_pitch_type_percentiles(self.player.throws, pfx_metrics)
-            for pfx_metrics in self.pfx_pitching_metrics_vs_lhb_for_career.metrics_by_pitch_type.values()
-        ]
+        return self.scraped_data.calculate_pitch_type_percentiles_for_metrics_set(
+            self.player.throws, self.pfx_pitching_metrics_vs_lhb_for_career
+        )
 
     def get_all_pfx_career_data(
         self,
@@ -210,9 +211,9 @@ class PlayerData:
             },
         }
 
-    @cached_property
+    @property
     def pfx_pitching_metrics_by_year(self) -> dict[int, PitchFxPitchingMetrics]:
-        return self.pfx_metrics.for_pitcher_by_year(self.mlb_id, self.player.throws)
+        return self.pfx_pitching_metrics_career_and_by_year[1]
 
     @property
     def pfx_pitching_metrics_vs_all_by_year(self) -> dict[int, PitchFxMetricsSet]:
@@ -224,11 +225,8 @@ class PlayerData:
     @cached_property
     def percentiles_for_pitch_types_by_year(self) -> dict[int, list[PitchTypePercentiles]]:
         return {
-            year: [
-                self.scraped_data.calculate_pitch_type_percentiles(self.player.throws, pfx_metrics)
-                for pfx_metrics in pfx_metrics_collection.metrics_by_pitch_type.values()
-            ]
-            for year, pfx_metrics_collection in self.pfx_pitching_metrics_vs_all_by_year.items()
+            year: self.scraped_data.calculate_pitch_type_percentiles_for_metrics_set(self.player.throws, pfx_metrics)
+            for year, pfx_metrics in self.pfx_pitching_metrics_vs_all_by_year.items()
         }
 
     @property
@@ -243,11 +241,8 @@ class PlayerData:
         self,
     ) -> dict[int, list[PitchTypePercentiles]]:
         return {
-            year: [
-                self.scraped_data.calculate_pitch_type_percentiles(self.player.throws, pfx_metrics)
-                for pfx_metrics in pfx_metrics_collection.metrics_by_pitch_type.values()
-            ]
-            for year, pfx_metrics_collection in self.pfx_pitching_metrics_vs_rhb_by_year.items()
+            year: self.scraped_data.calculate_pitch_type_percentiles_for_metrics_set(self.player.throws, pfx_metrics)
+            for year, pfx_metrics in self.pfx_pitching_metrics_vs_rhb_by_year.items()
         }
 
     @property
@@ -262,11 +257,8 @@ class PlayerData:
         self,
     ) -> dict[int, list[PitchTypePercentiles]]:
         return {
-            year: [
-                self.scraped_data.calculate_pitch_type_percentiles(self.player.throws, pfx_metrics)
-                for pfx_metrics in pfx_metrics_collection.metrics_by_pitch_type.values()
-            ]
-            for year, pfx_metrics_collection in self.pfx_pitching_metrics_vs_lhb_by_year.items()
+            year: self.scraped_data.calculate_pitch_type_percentiles_for_metrics_set(self.player.throws, pfx_metrics)
+            for year, pfx_metrics in self.pfx_pitching_metrics_vs_lhb_by_year.items()
         }
 
     def get_all_pfx_yearly_data(
@@ -514,21 +506,13 @@ class PlayerData:
         return self.get_pfx_bat_metrics_for_game(bbref_game_id).as_rhb_vs_lhp
 
     def get_pfx_bat_metrics_for_game(self, bbref_game_id):
-        pfx_metrics_for_game = self.pitchfx_game_bat_data_cache.get(bbref_game_id)
-        if not pfx_metrics_for_game:
-            pfx_metrics_for_game = self.pfx_metrics.for_batter_game(self.mlb_id, bbref_game_id)
-            self.pitchfx_game_bat_data_cache[bbref_game_id] = pfx_metrics_for_game
-        return pfx_metrics_for_game
+        return self.pfx_metrics.for_batter_game(self.mlb_id, bbref_game_id)
 
     def get_pfx_pitch_metrics_for_game(self, bbref_game_id=None, pitch_app_id=None):
         (is_valid, bbref_game_id, pitch_app_id) = self.validate_pitch_app(bbref_game_id, pitch_app_id)
         if not is_valid:
             return None
-        pfx_metrics_for_game = self.pitchfx_game_pitch_data_cache.get(bbref_game_id)
-        if not pfx_metrics_for_game:
-            pfx_metrics_for_game = self.pfx_metrics.for_pitcher_game(self.mlb_id, bbref_game_id, self.player.throws)
-            self.pitchfx_game_pitch_data_cache[bbref_game_id] = pfx_metrics_for_game
-        return pfx_metrics_for_game
+        return self.pfx_metrics.for_pitcher_game(self.mlb_id, bbref_game_id, self.player.throws)
 
     def validate_pitch_app(self, bbref_game_id=None, pitch_app_id=None):
         is_valid = False
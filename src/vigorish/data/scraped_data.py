@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
@@ -7,8 +8,9 @@ from vigorish.data.html_storage import HtmlStorage
 from vigorish.data.json_storage import JsonStorage
 from vigorish.data.metrics.bat_stats import BatStatsMetrics, BatStatsMetricsFactory
 from vigorish.data.metrics.pitch_stats import PitchStatsMetrics, PitchStatsMetricsFactory
-from vigorish.data.metrics.pitchfx import PitchFxMetrics
-from vigorish.data.name_search import PlayerNameSearch
+from vigorish.data.metrics.pitchfx import get_pfx_metrics_cache, PitchFxMetrics, PitchFxMetricsSet
+from vigorish.data.name_search import get_player_name_index_filepath, PlayerNameSearch
+from vigorish.data.percentiles import PercentileLookup
 from vigorish.enums import DataSet, DefensePosition, PitchType, VigFile
 from vigorish.util.regex import URL_ID_CONVERT_REGEX, URL_ID_REGEX
 from vigorish.util.result import Result
@@ -22,7 +24,8 @@ class ScrapedData:
         self.file_helper = FileHelper(config)
         self.html_storage = HtmlStorage(config, self.file_helper)
         self.json_storage = JsonStorage(config, self.file_helper)
-        self.name_search = PlayerNameSearch(db_session)
+        self.name_search = PlayerNameSearch(db_session, get_player_name_index_filepath(db_engine))
+        self.percentiles = PercentileLookup(db_session)
         self.bat_stats = BatStatsMetricsFactory(db_session)
         self.pitch_stats = PitchStatsMetricsFactory(db_session)
 
@@ -47,6 +50,9 @@ class ScrapedData:
     def get_html(self, data_set, url_id):
         return self.html_storage.get_html(data_set, url_id)
 
+    def get_cached_html_folderpath(self, data_set, game_date):
+        return self.html_storage.get_cached_html_folderpath(data_set, game_date)
+
     def save_json(self, data_set, parsed_data):
         return self.json_storage.save_json(data_set, parsed_data)
 
@@ -124,6 +130,16 @@ class ScrapedData:
     def get_combined_game_data(self, bbref_game_id):
         return self.json_storage.get_combined_game_data(bbref_game_id)
 
+    def get_json_cache_stats(self):
+        return self.json_storage.cache.stats
+
+    def get_pfx_metrics_cache_stats(self):
+        return get_pfx_metrics_cache().stats
+
+    def invalidate_league_stats(self, year=None):
+        self.bat_stats.invalidate_league_cache(year)
+        self.pitch_stats.invalidate_league_cache(year)
+
     def get_all_brooks_pitch_logs_for_date(self, game_date):
         brooks_game_ids = db.GameScrapeStatus.get_all_brooks_game_ids_for_date(self.db_session, game_date)
         pitch_logs = []
@@ -135,8 +151,10 @@ class ScrapedData:
         return pitch_logs
 
     def get_scraped_ids_from_local_folder(self, file_type, data_set, year):
-        folderpath = self.get_local_folderpath(file_type, data_set, year)
-        url_ids = [file.stem for file in Path(folderpath).glob("*.*")]
+        if file_type == VigFile.SCRAPED_HTML and self.html_storage.html_stored_archive(data_set):
+            return self.validate_url_ids(file_type, data_set, self.html_storage.get_archived_url_ids(data_set, year))
+        file_names = self.file_helper.get_local_file_names(file_type, data_set, year)
+        url_ids = [Path(file_name).stem for file_name in file_names]
         return self.validate_url_ids(file_type, data_set, url_ids)
 
     def validate_url_ids(self, file_type, data_set, url_ids):
@@ -261,37 +279,35 @@ class ScrapedData:
     def player_name_search(self, query):
         return self.name_search.fuzzy_match(query)
 
-    def get_pitch_apps_for_player_up_to_date(self, mlb_id, game_date):
+    def get_pitch_stats_to_date_for_player(self, mlb_id, game_date):
         player_id = db.PlayerId.find_by_mlb_id(self.db_session, mlb_id)
         date_status = db.DateScrapeStatus.find_by_date(self.db_session, game_date)
         if not player_id or not date_status:
-            return []
-        return (
-            self.db_session.query(db.PitchStats)
-            .filter(db.PitchStats.player_id == player_id.db_player_id)
-            .filter(db.PitchStats.date_id <= date_status.id)
-            .filter(db.PitchStats.season_id == date_status.season_id)
+            return None
+        return db.PitchStatsToDate.find_as_of_date(
+            self.db_session, player_id.db_player_id, date_status.season_id, date_status.id
         )
 
     def get_pitcher_record_on_date(self, mlb_id, game_date):
-        pitch_apps = self.get_pitch_apps_for_player_up_to_date(mlb_id, game_date)
-        wins = sum(p.is_wp for p in pitch_apps)
-        losses = sum(p.is_lp for p in pitch_apps)
-        return (wins, losses)
+        stats_to_date = self.get_pitch_stats_to_date_for_player(mlb_id, game_date)
+        return (stats_to_date.wins, stats_to_date.losses) if stats_to_date else (0, 0)
 
     def get_pitcher_total_saves_on_date(self, mlb_id, game_date):
-        pitch_apps = self.get_pitch_apps_for_player_up_to_date(mlb_id, game_date)
-        return sum(p.is_sv for p in pitch_apps)
+        stats_to_date = self.get_pitch_stats_to_date_for_player(mlb_id, game_date)
+        return stats_to_date.saves if stats_to_date else 0
 
     def get_season_standings(self, year, game_date=None):
         standings = []
         all_teams = db.Team.get_all_teams_for_season(self.db_session, year)
+        if not all_teams:
+            return standings
+        (away_games, home_games) = (defaultdict(list), defaultdict(list))
+        for game in db.GameScrapeStatus.get_all_games_for_season(self.db_session, year, game_date) or []:
+            away_games[game.away_team_id_br].append(game)
+            home_games[game.home_team_id_br].append(game)
         for team in all_teams:
-            all_games = db.GameScrapeStatus.get_all_games_for_team(self.db_session, team.team_id_br, year, game_date)
-            away_games = [g for g in all_games if g.away_team_id_br == team.team_id_br]
-            home_games = [g for g in all_games if g.home_team_id_br == team.team_id_br]
-            away_results = self._get_away_game_results(away_games)
-            home_results = self._get_home_game_results(home_games)
+            away_results = self._get_away_game_results(away_games[team.team_id_br])
+            home_results = self._get_home_game_results(home_games[team.team_id_br])
             team_results = self._combine_team_results(team, away_results, home_results)
             standings.append(team_results)
         return standings
@@ -494,10 +510,15 @@ class ScrapedData:
     def calculate_pitch_type_percentiles(
         self, p_throws: str, pfx_metrics: PitchFxMetrics
     ) -> dict[str, PitchType | tuple[float, float]]:
-        return db.PitchTypePercentile.calculate_pitch_type_percentiles(self.db_session, p_throws, pfx_metrics)
+        return self.percentiles.calculate_pitch_type_percentiles(p_throws, pfx_metrics)
+
+    def calculate_pitch_type_percentiles_for_metrics_set(
+        self, p_throws: str, pfx_metrics_set: PitchFxMetricsSet
+    ) -> list[dict[str, PitchType | tuple[float, float]]]:
+        return self.percentiles.calculate_pitch_type_percentiles_for_metrics_set(p_throws, pfx_metrics_set)
 
     def calculate_batter_percentiles(self, pfx_metrics: PitchFxMetrics) -> dict[str, PitchType | tuple[float, float]]:
-        return db.BatterPercentile.calculate_batter_percentiles(self.db_session, pfx_metrics)
+        return self.percentiles.calculate_batter_percentiles(pfx_metrics)
 
     # PLAYER BAT STATS
 
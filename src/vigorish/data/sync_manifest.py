@@ -0,0 +1,73 @@
+"""Record the state of the files in a local folder the last time they were in sync with the S3 bucket."""
+import json
+import os
+from pathlib import Path
+
+SYNC_MANIFEST_FILE_NAME = ".s3_sync_manifest.json"
+
+
+class SyncManifest:
+    """Size, modified time and ETag of each file in a local folder when it was last found to be in sync with S3.
+
+    A local file whose size and modified time match its manifest entry has not changed since the last sync. When
+    uploading, files that have not changed are skipped and the S3 bucket is only listed if a local file has been
+    added or changed. When downloading, files are skipped if the ETag of the S3 object matches the manifest entry.
+    The ETag of a file that was uploaded is calculated the same way as S3 (see calc_s3_etag), so every entry holds
+    the ETag of the S3 object that the file was synced with.
+
+    Entries are added as each file is transferred and the manifest is written to disk every SAVE_INTERVAL entries
+    (and when the sync is complete or fails), so a sync that is interrupted only transfers the remaining files when
+    it is run again.
+    """
+
+    SAVE_INTERVAL = 50
+
+    def __init__(self, folderpath):
+        self.filepath = Path(folderpath).joinpath(SYNC_MANIFEST_FILE_NAME)
+        self.entries = self.read()
+        self.unsaved_entries = 0
+
+    def read(self):
+        if not self.filepath.exists():
+            return {}
+        try:
+            return json.loads(self.filepath.read_text())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+
+    def save(self):
+        if not self.unsaved_entries:
+            return
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.filepath.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+        os.replace(temp_file, self.filepath)
+        self.unsaved_entries = 0
+
+    def file_is_unchanged(self, local_file):
+        entry = self.entries.get(local_file["name"])
+        return bool(entry) and entry["size"] == local_file["size"] and entry["mtime"] == local_file["mtime"]
+
+    def get_etag(self, local_file):
+        entry = self.entries.get(local_file["name"])
+        return entry.get("etag") if entry else None
+
+    def object_is_unchanged(self, s3_object, local_file):
+        entry = self.entries.get(s3_object["name"])
+        return (
+            bool(entry)
+            and bool(s3_object["etag"])
+            and entry["etag"] == s3_object["etag"]
+            and bool(local_file)
+            and self.file_is_unchanged(local_file)
+        )
+
+    def update(self, local_path, etag=None):
+        local_path = Path(local_path)
+        if not local_path.exists():
+            return
+        file_stat = local_path.stat()
+        self.entries[local_path.name] = {"size": file_stat.st_size, "mtime": file_stat.st_mtime, "etag": etag}
+        self.unsaved_entries += 1
+        if self.unsaved_entries >= self.SAVE_INTERVAL:
+            self.save()
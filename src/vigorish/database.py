@@ -12,14 +12,17 @@ from vigorish.models import (
     BatterPercentile,
     DateScrapeStatus,
     DateScrapeStatusCsvRow,
+    DateStatusRollup,
     GameScrapeStatus,
     GameScrapeStatusCsvRow,
+    GameStatusRollup,
     PitchAppScrapeStatus,
     PitchAppScrapeStatusCsvRow,
     PitchFx,
     PitchFxCsvRow,
     PitchStats,
     PitchStatsCsvRow,
+    PitchStatsToDate,
     PitchTypePercentile,
     Player,
     PlayerCsvRow,
@@ -27,6 +30,7 @@ from vigorish.models import (
     ScrapeError,
     ScrapeJob,
     Season,
+    SeasonStatusRollup,
     Team,
     TimeBetweenPitches,
 )
@@ -106,6 +106,7 @@ class HtmlStorageOption(str, Enum):
     LOCAL_FOLDER = "local_folder"
     S3_BUCKET = "s3_bucket"
     BOTH = "both"
+    LOCAL_ARCHIVE = "local_archive"
 
     def __str__(self):
         return str.__str__(self)
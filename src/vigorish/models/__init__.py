@@ -2,6 +2,7 @@
 from vigorish.models.bat_stats import BatStats, BatStatsCsvRow
 from vigorish.models.batter_percentiles import BatterPercentile
 from vigorish.models.pitch_stats import PitchStats, PitchStatsCsvRow
+from vigorish.models.pitch_stats_to_date import PitchStatsToDate
 from vigorish.models.pitch_type_percentiles import PitchTypePercentile
 from vigorish.models.pitchfx import PitchFx, PitchFxCsvRow
 from vigorish.models.player import Player, PlayerCsvRow
@@ -13,5 +14,6 @@ from vigorish.models.season import Season
 from vigorish.models.status_date import DateScrapeStatus, DateScrapeStatusCsvRow
 from vigorish.models.status_game import GameScrapeStatus, GameScrapeStatusCsvRow
 from vigorish.models.status_pitch_appearance import PitchAppScrapeStatus, PitchAppScrapeStatusCsvRow
+from vigorish.models.status_rollup import DateStatusRollup, GameStatusRollup, SeasonStatusRollup
 from vigorish.models.team import Team
 from vigorish.models.time_between_pitches import TimeBetweenPitches
@@ -15,7 +15,7 @@ class BatStats(db.Base):
     __tablename__ = "bat_stats"
     id = Column(Integer, primary_key=True)
     bbref_game_id = Column(String)
-    player_id_mlb = Column(Integer)
+    player_id_mlb = Column(Integer, index=True)
     player_id_bbref = Column(String)
     player_team_id_bbref = Column(String)
     opponent_team_id_bbref = Column(String)
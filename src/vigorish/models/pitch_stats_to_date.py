@@ -0,0 +1,153 @@
+"""Db model that stores the running season totals of each pitcher as of every date that they pitched."""
+from collections import defaultdict
+
+from sqlalchemy import and_, Column, ForeignKey, func, Index, inspect, Integer, select
+from sqlalchemy.ext.hybrid import hybrid_property
+
+import vigorish.database as db
+from vigorish.util.result import Result
+
+# Maps each running total to the pitch_stats column that it sums, None means the running total is a row count.
+PITCH_STATS_TO_DATE_TOTALS = {
+    "total_games": None,
+    "games_as_sp": "is_sp",
+    "games_as_rp": "is_rp",
+    "wins": "is_wp",
+    "losses": "is_lp",
+    "saves": "is_sv",
+    "total_outs": "total_outs",
+}
+
+
+class PitchStatsToDate(db.Base):
+    """Season totals for a pitcher, including every game played on or before date_id.
+
+    A row exists for each date that the pitcher appeared in a game, so the totals as of any date are found in the
+    row with the largest date_id that is less than or equal to that date.
+    """
+
+    __tablename__ = "pitch_stats_to_date"
+    __table_args__ = (
+        Index("ix_pitch_stats_to_date_player_id_season_id_date_id", "player_id", "season_id", "date_id", unique=True),
+    )
+    id = Column(Integer, primary_key=True)
+    player_id_mlb = Column(Integer)
+    total_games = Column(Integer, default=0)
+    games_as_sp = Column(Integer, default=0)
+    games_as_rp = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    saves = Column(Integer, default=0)
+    total_outs = Column(Integer, default=0)
+
+    player_id = Column(Integer, ForeignKey("player.id"))
+    season_id = Column(Integer, ForeignKey("season.id"))
+    date_id = Column(Integer, ForeignKey("scrape_status_date.id"))
+
+    @hybrid_property
+    def innings_pitched(self):
+        (complete_innings, remaining_outs) = divmod(self.total_outs or 0, 3)
+        return float(f"{complete_innings}.{remaining_outs}")
+
+    def __repr__(self):
+        return f"<PitchStatsToDate player_id={self.player_id}, date_id={self.date_id}>"
+
+    def as_dict(self):
+        totals = {name: getattr(self, name) for name in PITCH_STATS_TO_DATE_TOTALS}
+        totals["innings_pitched"] = self.innings_pitched
+        return totals
+
+    @classmethod
+    def find_as_of_date(cls, db_session, player_id, season_id, date_id):
+        return (
+            db_session.query(cls)
+            .filter(cls.player_id == player_id)
+            .filter(cls.season_id == season_id)
+            .filter(cls.date_id <= date_id)
+            .order_by(cls.date_id.desc())
+            .first()
+        )
+
+    @classmethod
+    def add_pitch_stats(cls, db_session, pitch_stats_list):
+        """Add the pitch_stats for newly imported games to the running totals (the session is not committed).
+
+        The games can be added in any order. The totals of every row for the same pitcher and season with a later
+        date_id are also updated.
+        """
+        table = cls.__table__
+        totals_by_date = defaultdict(lambda: dict.fromkeys(PITCH_STATS_TO_DATE_TOTALS, 0))
+        for pitch_stats in pitch_stats_list:
+            key = (pitch_stats.player_id, pitch_stats.season_id, int(pitch_stats.date_id), pitch_stats.player_id_mlb)
+            for name, stat_name in PITCH_STATS_TO_DATE_TOTALS.items():
+                totals_by_date[key][name] += (getattr(pitch_stats, stat_name) or 0) if stat_name else 1
+        for (player_id, season_id, date_id, player_id_mlb), totals in totals_by_date.items():
+            same_season = and_(table.c.player_id == player_id, table.c.season_id == season_id)
+            db_session.execute(
+                table.update()
+                .where(same_season)
+                .where(table.c.date_id >= date_id)
+                .values({name: table.c[name] + value for name, value in totals.items()})
+            )
+            if db_session.execute(select([table.c.id]).where(same_season).where(table.c.date_id == date_id)).first():
+                continue
+            prior_totals = db_session.execute(
+                select([table.c[name] for name in PITCH_STATS_TO_DATE_TOTALS])
+                .where(same_season)
+                .where(table.c.date_id < date_id)
+                .order_by(table.c.date_id.desc())
+                .limit(1)
+            ).first()
+            if prior_totals:
+                totals = {name: value + prior_totals[name] for name, value in totals.items()}
+            row = {"player_id": player_id, "season_id": season_id, "date_id": date_id, "player_id_mlb": player_id_mlb}
+            db_session.execute(table.insert(), {**row, **totals})
+
+    @classmethod
+    def rebuild(cls, db_session, season_id=None):
+        """Recalculate the running totals from the pitch_stats table (for a single season or all seasons).
+
+        The totals for each date are calculated with one INSERT ... SELECT statement that groups the pitch_stats by
+        pitcher and date and accumulates each group with a window function partitioned by pitcher and season.
+        """
+        table = cls.__table__
+        pitch_stats = db.PitchStats.__table__
+        window = {"partition_by": [pitch_stats.c.player_id, pitch_stats.c.season_id], "order_by": pitch_stats.c.date_id}
+        running_totals = [
+            func.sum(func.coalesce(func.sum(pitch_stats.c[stat_name]), 0) if stat_name else func.count())
+            .over(**window)
+            .label(name)
+            for name, stat_name in PITCH_STATS_TO_DATE_TOTALS.items()
+        ]
+        query = (
+            select(
+                [
+                    pitch_stats.c.player_id,
+                    pitch_stats.c.season_id,
+                    pitch_stats.c.date_id,
+                    func.max(pitch_stats.c.player_id_mlb).label("player_id_mlb"),
+                ]
+                + running_totals
+            )
+            .where(pitch_stats.c.player_id.isnot(None))
+            .group_by(pitch_stats.c.player_id, pitch_stats.c.season_id, pitch_stats.c.date_id)
+        )
+        delete = table.delete()
+        if season_id:
+            query = query.where(pitch_stats.c.season_id == season_id)
+            delete = delete.where(table.c.season_id == season_id)
+        db_session.execute(delete)
+        columns = ["player_id", "season_id", "date_id", "player_id_mlb"] + list(PITCH_STATS_TO_DATE_TOTALS)
+        result = db_session.execute(table.insert().from_select(columns, query))
+        db_session.commit()
+        return Result.Ok(result.rowcount)
+
+
+def create_pitch_stats_to_date_table(db_session):
+    """Create and populate the pitch_stats_to_date table in a database that was created before it was added."""
+    db_engine = db_session.get_bind()
+    table_names = inspect(db_engine).get_table_names()
+    if "pitch_stats" not in table_names or PitchStatsToDate.__tablename__ in table_names:
+        return Result.Ok()
+    PitchStatsToDate.__table__.create(db_engine)
+    return PitchStatsToDate.rebuild(db_session)
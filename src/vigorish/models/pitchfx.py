@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from dataclass_csv import accept_whitespaces, dateformat
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
@@ -14,6 +14,12 @@ from vigorish.util.dt_format_strings import CSV_UTC, DT_AWARE
 class PitchFx(db.Base):
 
     __tablename__ = "pitchfx"
+    __table_args__ = (
+        Index("ix_pitchfx_pitcher_id_season_id", "pitcher_id", "season_id"),
+        Index("ix_pitchfx_batter_id_season_id", "batter_id", "season_id"),
+        Index("ix_pitchfx_game_status_id_batter_id", "game_status_id", "batter_id"),
+        Index("ix_pitchfx_date_id_is_barreled", "date_id", "is_barreled"),
+    )
     id = Column(Integer, primary_key=True)
     bb_game_id = Column(String)
     bbref_game_id = Column(String)
@@ -119,10 +125,10 @@ class PitchFx(db.Base):
     is_invalid_ibb = Column(Integer)
     is_out_of_sequence = Column(Integer)
 
-    pitcher_id = Column(Integer, ForeignKey("player.id"), index=True)
-    batter_id = Column(Integer, ForeignKey("player.id"), index=True)
-    team_pitching_id = Column(Integer, ForeignKey("team.id"))
-    team_batting_id = Column(Integer, ForeignKey("team.id"))
+    pitcher_id = Column(Integer, ForeignKey("player.id"))
+    batter_id = Column(Integer, ForeignKey("player.id"))
+    team_pitching_id = Column(Integer, ForeignKey("team.id"), index=True)
+    team_batting_id = Column(Integer, ForeignKey("team.id"), index=True)
     game_status_id = Column(Integer, ForeignKey("scrape_status_game.id"))
     pitch_app_db_id = Column(Integer, ForeignKey("scrape_status_pitch_app.id"), index=True)
     date_id = Column(Integer, ForeignKey("scrape_status_date.id"))
@@ -269,6 +275,10 @@ class PitchFx(db.Base):
 
     @classmethod
     def from_dict(cls, pfx_dict):
+        return cls(**cls.get_column_values(pfx_dict))
+
+    @classmethod
+    def get_column_values(cls, pfx_dict):
         pfx_dict = cls.update_pfx_dict(pfx_dict)
         pfx_dict["zone_location"] = int(pfx_dict["zone_location"])
         pfx_dict["batter_did_swing"] = int(pfx_dict["batter_did_swing"])
@@ -307,7 +317,7 @@ class PitchFx(db.Base):
         pfx_dict["ab_result_unclear"] = int(pfx_dict["ab_result_unclear"])
         pfx_dict["is_sp"] = int(pfx_dict["is_sp"])
         pfx_dict["is_rp"] = int(pfx_dict["is_rp"])
-        return cls(**pfx_dict)
+        return pfx_dict
 
     @staticmethod
     def update_pfx_dict(pfx_dict):
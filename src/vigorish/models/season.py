@@ -5,7 +5,7 @@ from datetime import date, datetime
 
 from sqlalchemy import Column, DateTime, Integer
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import joinedload, relationship
 from sqlalchemy.types import Enum
 
 import vigorish.database as db
@@ -31,27 +31,6 @@ class Season(db.Base):
     games = relationship("GameScrapeStatus", backref="season")
     pitch_apps = relationship("PitchAppScrapeStatus", backref="season")
     scrape_jobs = relationship("ScrapeJob", backref="season")
-    pitch_app_status = relationship(
-        "Season_PitchApp_View",
-        backref="original",
-        uselist=False,
-        primaryjoin="Season.id==Season_PitchApp_View.id",
-        foreign_keys="Season_PitchApp_View.id",
-    )
-    game_status = relationship(
-        "Season_Game_View",
-        backref="original",
-        uselist=False,
-        primaryjoin="Season.id==Season_Game_View.id",
-        foreign_keys="Season_Game_View.id",
-    )
-    date_status = relationship(
-        "Season_Date_View",
-        backref="original",
-        uselist=False,
-        primaryjoin="Season.id==Season_Date_View.id",
-        foreign_keys="Season_Date_View.id",
-    )
 
     @hybrid_property
     def name(self):
@@ -74,13 +53,13 @@ class Season(db.Base):
         today = date.today()
         if today.year == self.year and today < self.end_date.date():
             return (today - self.start_date.date()).days
-        return self.date_status.total_days
+        return self.status_rollup.total_days
 
     @hybrid_property
     def total_days_scraped_bbref(self):
         return (
-            self.date_status.total_scraped_daily_dash_bbref
-            if self.date_status and self.date_status.total_scraped_daily_dash_bbref
+            self.status_rollup.total_scraped_daily_dash_bbref
+            if self.status_rollup and self.status_rollup.total_scraped_daily_dash_bbref
             else 0
         )
 
@@ -95,8 +74,8 @@ class Season(db.Base):
     @hybrid_property
     def total_days_scraped_brooks(self):
         return (
-            self.date_status.total_scraped_daily_dash_brooks
-            if self.date_status and self.date_status.total_scraped_daily_dash_brooks
+            self.status_rollup.total_scraped_daily_dash_brooks
+            if self.status_rollup and self.status_rollup.total_scraped_daily_dash_brooks
             else 0
         )
 
@@ -110,21 +89,21 @@ class Season(db.Base):
 
     @hybrid_property
     def total_games(self):
-        return self.game_status.total_games if (self.game_status and self.game_status.total_games) else 0
+        return self.status_rollup.total_games if (self.status_rollup and self.status_rollup.total_games) else 0
 
     @hybrid_property
     def total_games_combined_success(self):
         return (
-            self.game_status.total_combined_data_success
-            if self.game_status and self.game_status.total_combined_data_success
+            self.status_rollup.total_combined_data_success
+            if self.status_rollup and self.status_rollup.total_combined_data_success
             else 0
         )
 
     @hybrid_property
     def total_games_combined_fail(self):
         return (
-            self.game_status.total_combined_data_fail
-            if self.game_status and self.game_status.total_combined_data_fail
+            self.status_rollup.total_combined_data_fail
+            if self.status_rollup and self.status_rollup.total_combined_data_fail
             else 0
         )
 
@@ -135,8 +114,8 @@ class Season(db.Base):
     @hybrid_property
     def total_bbref_boxscores_scraped(self):
         return (
-            self.game_status.total_scraped_bbref_boxscore
-            if self.game_status and self.game_status.total_scraped_bbref_boxscore
+            self.status_rollup.total_scraped_bbref_boxscore
+            if self.status_rollup and self.status_rollup.total_scraped_bbref_boxscore
             else 0
         )
 
@@ -151,8 +130,8 @@ class Season(db.Base):
     @hybrid_property
     def total_brooks_pitch_logs_scraped(self):
         return (
-            self.game_status.total_scraped_brooks_pitch_logs
-            if self.game_status and self.game_status.total_scraped_brooks_pitch_logs
+            self.status_rollup.total_scraped_brooks_pitch_logs
+            if self.status_rollup and self.status_rollup.total_scraped_brooks_pitch_logs
             else 0
         )
 
@@ -167,46 +146,46 @@ class Season(db.Base):
     @hybrid_property
     def pitch_app_count_bbref(self):
         return (
-            self.game_status.total_pitch_app_count_bbref
-            if self.game_status and self.game_status.total_pitch_app_count_bbref
+            self.status_rollup.total_pitch_app_count_bbref
+            if self.status_rollup and self.status_rollup.total_pitch_app_count_bbref
             else 0
         )
 
     @hybrid_property
     def pitch_app_count_brooks(self):
         return (
-            self.game_status.total_pitch_app_count_brooks
-            if self.game_status and self.game_status.total_pitch_app_count_brooks
+            self.status_rollup.total_pitch_app_count_brooks
+            if self.status_rollup and self.status_rollup.total_pitch_app_count_brooks
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_bbref(self):
         return (
-            self.game_status.total_pitch_count_bbref
-            if self.game_status and self.game_status.total_pitch_count_bbref
+            self.status_rollup.total_pitch_count_bbref
+            if self.status_rollup and self.status_rollup.total_pitch_count_bbref
             else 0
         )
 
     @hybrid_property
     def pitch_app_count_pitchfx(self):
         return (
-            self.pitch_app_status.total_pitchfx if self.pitch_app_status and self.pitch_app_status.total_pitchfx else 0
+            self.status_rollup.total_pitchfx if self.status_rollup and self.status_rollup.total_pitchfx else 0
         )
 
     @hybrid_property
     def total_pitch_apps_scraped_pitchfx(self):
         return (
-            self.pitch_app_status.total_pitchfx_scraped
-            if self.pitch_app_status and self.pitch_app_status.total_pitchfx_scraped
+            self.status_rollup.total_pitchfx_scraped
+            if self.status_rollup and self.status_rollup.total_pitchfx_scraped
             else 0
         )
 
     @hybrid_property
     def total_pitch_apps_no_pitchfx_data(self):
         return (
-            self.pitch_app_status.total_no_pitchfx_data
-            if self.pitch_app_status and self.pitch_app_status.total_no_pitchfx_data
+            self.status_rollup.total_no_pitchfx_data
+            if self.status_rollup and self.status_rollup.total_no_pitchfx_data
             else 0
         )
 
@@ -217,24 +196,24 @@ class Season(db.Base):
     @hybrid_property
     def total_pitch_apps_combined_data(self):
         return (
-            self.pitch_app_status.total_combined_pitchfx_bbref_data
-            if self.pitch_app_status and self.pitch_app_status.total_combined_pitchfx_bbref_data
+            self.status_rollup.total_combined_pitchfx_bbref_data
+            if self.status_rollup and self.status_rollup.total_combined_pitchfx_bbref_data
             else 0
         )
 
     @hybrid_property
     def total_pitch_apps_pitchfx_error(self):
         return (
-            self.pitch_app_status.total_pitchfx_error
-            if self.pitch_app_status and self.pitch_app_status.total_pitchfx_error
+            self.status_rollup.total_pitchfx_error
+            if self.status_rollup and self.status_rollup.total_pitchfx_error
             else 0
         )
 
     @hybrid_property
     def total_pitch_apps_invalid_pitchfx(self):
         return (
-            self.pitch_app_status.total_invalid_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_invalid_pitchfx
+            self.status_rollup.total_invalid_pitchfx
+            if self.status_rollup and self.status_rollup.total_invalid_pitchfx
             else 0
         )
 
@@ -245,96 +224,96 @@ class Season(db.Base):
     @hybrid_property
     def total_pitch_count_pitch_logs(self):
         return (
-            self.pitch_app_status.total_pitch_count_pitch_log
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_pitch_log
+            self.status_rollup.total_pitch_count_pitch_log
+            if self.status_rollup and self.status_rollup.total_pitch_count_pitch_log
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_bbref_audited(self):
         return (
-            self.pitch_app_status.total_pitch_count_bbref
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_bbref
+            self.status_rollup.total_pitch_count_bbref_audited
+            if self.status_rollup and self.status_rollup.total_pitch_count_bbref_audited
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_pitchfx(self):
         return (
-            self.pitch_app_status.total_pitch_count_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_pitchfx
+            self.status_rollup.total_pitch_count_pitchfx
+            if self.status_rollup and self.status_rollup.total_pitch_count_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_pitchfx_audited(self):
         return (
-            self.pitch_app_status.total_pitch_count_pitchfx_audited
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_pitchfx_audited
+            self.status_rollup.total_pitch_count_pitchfx_audited
+            if self.status_rollup and self.status_rollup.total_pitch_count_pitchfx_audited
             else 0
         )
 
     @hybrid_property
     def total_missing_pitchfx_count(self):
         return (
-            self.pitch_app_status.total_missing_pitchfx_count
-            if self.pitch_app_status and self.pitch_app_status.total_missing_pitchfx_count
+            self.status_rollup.total_missing_pitchfx_count
+            if self.status_rollup and self.status_rollup.total_missing_pitchfx_count
             else 0
         )
 
     @hybrid_property
     def total_removed_pitchfx_count(self):
         return (
-            self.pitch_app_status.total_removed_pitchfx_count
-            if self.pitch_app_status and self.pitch_app_status.total_removed_pitchfx_count
+            self.status_rollup.total_removed_pitchfx_count
+            if self.status_rollup and self.status_rollup.total_removed_pitchfx_count
             else 0
         )
 
     @hybrid_property
     def total_batters_faced_bbref(self):
         return (
-            self.pitch_app_status.total_batters_faced_bbref
-            if self.pitch_app_status and self.pitch_app_status.total_batters_faced_bbref
+            self.status_rollup.total_batters_faced_bbref
+            if self.status_rollup and self.status_rollup.total_batters_faced_bbref
             else 0
         )
 
     @hybrid_property
     def total_batters_faced_pitchfx(self):
         return (
-            self.pitch_app_status.total_batters_faced_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_batters_faced_pitchfx
+            self.status_rollup.total_batters_faced_pitchfx
+            if self.status_rollup and self.status_rollup.total_batters_faced_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_at_bats_missing_pitchfx(self):
         return (
-            self.pitch_app_status.total_at_bats_missing_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_missing_pitchfx
+            self.status_rollup.total_at_bats_missing_pitchfx
+            if self.status_rollup and self.status_rollup.total_at_bats_missing_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_at_bats_removed_pitchfx(self):
         return (
-            self.pitch_app_status.total_at_bats_removed_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_removed_pitchfx
+            self.status_rollup.total_at_bats_removed_pitchfx
+            if self.status_rollup and self.status_rollup.total_at_bats_removed_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_at_bats_pitchfx_error(self):
         return (
-            self.pitch_app_status.total_at_bats_pitchfx_error
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_pitchfx_error
+            self.status_rollup.total_at_bats_pitchfx_error
+            if self.status_rollup and self.status_rollup.total_at_bats_pitchfx_error
             else 0
         )
 
     @hybrid_property
     def total_at_bats_invalid_pitchfx(self):
         return (
-            self.pitch_app_status.total_at_bats_invalid_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_invalid_pitchfx
+            self.status_rollup.total_at_bats_invalid_pitchfx
+            if self.status_rollup and self.status_rollup.total_at_bats_invalid_pitchfx
             else 0
         )
 
@@ -342,7 +321,7 @@ class Season(db.Base):
     def scraped_all_pitchfx_logs(self):
         return (
             True
-            if not self.pitch_apps
+            if not self.pitch_app_count_pitchfx
             else False
             if not self.scraped_all_brooks_pitch_logs
             else self.pitch_app_count_pitchfx == self.total_pitch_apps_scraped_pitchfx
@@ -352,7 +331,7 @@ class Season(db.Base):
     def combined_data_for_all_pitchfx_logs(self):
         return (
             False
-            if not self.pitch_apps or not self.scraped_all_pitchfx_logs
+            if not self.pitch_app_count_pitchfx or not self.scraped_all_pitchfx_logs
             else self.pitch_app_count_pitchfx == self.total_pitch_apps_combined_data
         )
 
@@ -360,16 +339,16 @@ class Season(db.Base):
     def pitchfx_error_for_any_pitchfx_logs(self):
         return (
             False
-            if not self.pitch_apps or not self.scraped_all_pitchfx_logs
-            else any((pfx.pitchfx_error or pfx.invalid_pitchfx) for pfx in self.pitch_apps)
+            if not self.pitch_app_count_pitchfx or not self.scraped_all_pitchfx_logs
+            else self.total_pitch_apps_pitchfx_error + self.total_pitch_apps_invalid_pitchfx > 0
         )
 
     @hybrid_property
     def pitchfx_is_valid_for_all_pitchfx_logs(self):
         return (
             True
-            if not self.pitch_apps or not self.scraped_all_pitchfx_logs
-            else all(not (pfx.pitchfx_error or pfx.invalid_pitchfx) for pfx in self.pitch_apps)
+            if not self.pitch_app_count_pitchfx or not self.scraped_all_pitchfx_logs
+            else self.total_pitch_apps_pitchfx_error + self.total_pitch_apps_invalid_pitchfx == 0
         )
 
     @hybrid_property
@@ -546,7 +525,12 @@ class Season(db.Base):
         today = datetime.today()
         if today < season.start_date:
             season = cls.find_by_year(db_session, year - 1)
-        scraped_dates_in_season = [d.game_date for d in season.dates if d.combined_data_for_all_pitchfx_logs]
+        dates_in_season = (
+            db_session.query(db.DateScrapeStatus)
+            .options(joinedload(db.DateScrapeStatus.status_rollup))
+            .filter_by(season_id=season.id)
+        )
+        scraped_dates_in_season = [d.game_date for d in dates_in_season if d.combined_data_for_all_pitchfx_logs]
         return max(scraped_dates_in_season) if scraped_dates_in_season else season.start_date
 
     @classmethod
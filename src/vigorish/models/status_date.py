@@ -23,13 +23,6 @@ class DateScrapeStatus(db.Base):
 
     games = relationship("GameScrapeStatus", backref="date")
     pitch_apps = relationship("PitchAppScrapeStatus", backref="date")
-    pitch_app_status = relationship(
-        "Date_PitchApp_View",
-        backref="original",
-        uselist=False,
-        primaryjoin="DateScrapeStatus.id==Date_PitchApp_View.id",
-        foreign_keys="Date_PitchApp_View.id",
-    )
 
     @hybrid_property
     def game_date_str(self):
@@ -37,15 +30,15 @@ class DateScrapeStatus(db.Base):
 
     @hybrid_property
     def total_games(self):
-        return len(self.games) if self.games else 0
+        return self.status_rollup.total_games if self.status_rollup else 0
 
     @hybrid_property
     def total_games_combined_success(self):
-        return sum(game.combined_data_success for game in self.games)
+        return self.status_rollup.total_combined_data_success if self.status_rollup else 0
 
     @hybrid_property
     def total_games_combined_fail(self):
-        return sum(game.combined_data_fail for game in self.games)
+        return self.status_rollup.total_combined_data_fail if self.status_rollup else 0
 
     @hybrid_property
     def total_games_combined(self):
@@ -53,63 +46,63 @@ class DateScrapeStatus(db.Base):
 
     @hybrid_property
     def total_bbref_boxscores_scraped(self):
-        return sum(game.scraped_bbref_boxscore for game in self.games)
+        return self.status_rollup.total_scraped_bbref_boxscore if self.status_rollup else 0
 
     @hybrid_property
     def percent_complete_bbref_boxscores_scraped(self):
-        return self.total_bbref_boxscores_scraped / float(len(self.games)) if len(self.games) > 0 else 0.0
+        return self.total_bbref_boxscores_scraped / float(self.total_games) if self.total_games > 0 else 0.0
 
     @hybrid_property
     def scraped_all_bbref_boxscores(self):
         if not self.scraped_daily_dash_bbref or not self.scraped_daily_dash_brooks:
             return False
-        return all(game.scraped_bbref_boxscore == 1 for game in self.games)
+        return self.total_bbref_boxscores_scraped == self.total_games
 
     @hybrid_property
     def total_brooks_pitch_logs_scraped(self):
-        return sum(game.scraped_brooks_pitch_logs for game in self.games)
+        return self.status_rollup.total_scraped_brooks_pitch_logs if self.status_rollup else 0
 
     @hybrid_property
     def percent_complete_brooks_pitch_logs(self):
-        return self.total_brooks_pitch_logs_scraped / float(len(self.games)) if len(self.games) > 0 else 0.0
+        return self.total_brooks_pitch_logs_scraped / float(self.total_games) if self.total_games > 0 else 0.0
 
     @hybrid_property
     def scraped_all_brooks_pitch_logs(self):
         if not self.scraped_daily_dash_bbref or not self.scraped_daily_dash_brooks:
             return False
-        return all(game.scraped_brooks_pitch_logs == 1 for game in self.games)
+        return self.total_brooks_pitch_logs_scraped == self.total_games
 
     @hybrid_property
     def pitch_app_count_bbref(self):
-        return sum(game.pitch_app_count_bbref for game in self.games)
+        return self.status_rollup.total_pitch_app_count_bbref if self.status_rollup else 0
 
     @hybrid_property
     def pitch_app_count_brooks(self):
-        return sum(game.pitch_app_count_brooks for game in self.games)
+        return self.status_rollup.total_pitch_app_count_brooks if self.status_rollup else 0
 
     @hybrid_property
     def total_pitch_count_bbref(self):
-        return sum(game.total_pitch_count_bbref for game in self.games)
+        return self.status_rollup.total_pitch_count_bbref if self.status_rollup else 0
 
     @hybrid_property
     def pitch_app_count_pitchfx(self):
         return (
-            self.pitch_app_status.total_pitchfx if self.pitch_app_status and self.pitch_app_status.total_pitchfx else 0
+            self.status_rollup.total_pitchfx if self.status_rollup and self.status_rollup.total_pitchfx else 0
         )
 
     @hybrid_property
     def total_pitch_apps_scraped_pitchfx(self):
         return (
-            self.pitch_app_status.total_pitchfx_scraped
-            if self.pitch_app_status and self.pitch_app_status.total_pitchfx_scraped
+            self.status_rollup.total_pitchfx_scraped
+            if self.status_rollup and self.status_rollup.total_pitchfx_scraped
             else 0
         )
 
     @hybrid_property
     def total_pitch_apps_no_pitchfx_data(self):
         return (
-            self.pitch_app_status.total_no_pitchfx_data
-            if self.pitch_app_status and self.pitch_app_status.total_no_pitchfx_data
+            self.status_rollup.total_no_pitchfx_data
+            if self.status_rollup and self.status_rollup.total_no_pitchfx_data
             else 0
         )
 
@@ -120,24 +113,24 @@ class DateScrapeStatus(db.Base):
     @hybrid_property
     def total_pitch_apps_combined_data(self):
         return (
-            self.pitch_app_status.total_combined_pitchfx_bbref_data
-            if self.pitch_app_status and self.pitch_app_status.total_combined_pitchfx_bbref_data
+            self.status_rollup.total_combined_pitchfx_bbref_data
+            if self.status_rollup and self.status_rollup.total_combined_pitchfx_bbref_data
             else 0
         )
 
     @hybrid_property
     def total_pitch_apps_pitchfx_error(self):
         return (
-            self.pitch_app_status.total_pitchfx_error
-            if self.pitch_app_status and self.pitch_app_status.total_pitchfx_error
+            self.status_rollup.total_pitchfx_error
+            if self.status_rollup and self.status_rollup.total_pitchfx_error
             else 0
         )
 
     @hybrid_property
     def total_pitch_apps_invalid_pitchfx(self):
         return (
-            self.pitch_app_status.total_invalid_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_invalid_pitchfx
+            self.status_rollup.total_invalid_pitchfx
+            if self.status_rollup and self.status_rollup.total_invalid_pitchfx
             else 0
         )
 
@@ -148,104 +141,104 @@ class DateScrapeStatus(db.Base):
     @hybrid_property
     def total_pitch_count_pitch_logs(self):
         return (
-            self.pitch_app_status.total_pitch_count_pitch_log
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_pitch_log
+            self.status_rollup.total_pitch_count_pitch_log
+            if self.status_rollup and self.status_rollup.total_pitch_count_pitch_log
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_bbref_audited(self):
         return (
-            self.pitch_app_status.total_pitch_count_bbref
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_bbref
+            self.status_rollup.total_pitch_count_bbref_audited
+            if self.status_rollup and self.status_rollup.total_pitch_count_bbref_audited
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_pitchfx(self):
         return (
-            self.pitch_app_status.total_pitch_count_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_pitchfx
+            self.status_rollup.total_pitch_count_pitchfx
+            if self.status_rollup and self.status_rollup.total_pitch_count_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_pitch_count_pitchfx_audited(self):
         return (
-            self.pitch_app_status.total_pitch_count_pitchfx_audited
-            if self.pitch_app_status and self.pitch_app_status.total_pitch_count_pitchfx_audited
+            self.status_rollup.total_pitch_count_pitchfx_audited
+            if self.status_rollup and self.status_rollup.total_pitch_count_pitchfx_audited
             else 0
         )
 
     @hybrid_property
     def total_missing_pitchfx_count(self):
         return (
-            self.pitch_app_status.total_missing_pitchfx_count
-            if self.pitch_app_status and self.pitch_app_status.total_missing_pitchfx_count
+            self.status_rollup.total_missing_pitchfx_count
+            if self.status_rollup and self.status_rollup.total_missing_pitchfx_count
             else 0
         )
 
     @hybrid_property
     def total_removed_pitchfx_count(self):
         return (
-            self.pitch_app_status.total_removed_pitchfx_count
-            if self.pitch_app_status and self.pitch_app_status.total_removed_pitchfx_count
+            self.status_rollup.total_removed_pitchfx_count
+            if self.status_rollup and self.status_rollup.total_removed_pitchfx_count
             else 0
         )
 
     @hybrid_property
     def total_batters_faced_bbref(self):
         return (
-            self.pitch_app_status.total_batters_faced_bbref
-            if self.pitch_app_status and self.pitch_app_status.total_batters_faced_bbref
+            self.status_rollup.total_batters_faced_bbref
+            if self.status_rollup and self.status_rollup.total_batters_faced_bbref
             else 0
         )
 
     @hybrid_property
     def total_batters_faced_pitchfx(self):
         return (
-            self.pitch_app_status.total_batters_faced_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_batters_faced_pitchfx
+            self.status_rollup.total_batters_faced_pitchfx
+            if self.status_rollup and self.status_rollup.total_batters_faced_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_at_bats_pitchfx_complete(self):
         return (
-            self.pitch_app_status.total_at_bats_pitchfx_complete
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_pitchfx_complete
+            self.status_rollup.total_at_bats_pitchfx_complete
+            if self.status_rollup and self.status_rollup.total_at_bats_pitchfx_complete
             else 0
         )
 
     @hybrid_property
     def total_at_bats_missing_pitchfx(self):
         return (
-            self.pitch_app_status.total_at_bats_missing_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_missing_pitchfx
+            self.status_rollup.total_at_bats_missing_pitchfx
+            if self.status_rollup and self.status_rollup.total_at_bats_missing_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_at_bats_removed_pitchfx(self):
         return (
-            self.pitch_app_status.total_at_bats_removed_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_removed_pitchfx
+            self.status_rollup.total_at_bats_removed_pitchfx
+            if self.status_rollup and self.status_rollup.total_at_bats_removed_pitchfx
             else 0
         )
 
     @hybrid_property
     def total_at_bats_pitchfx_error(self):
         return (
-            self.pitch_app_status.total_at_bats_pitchfx_error
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_pitchfx_error
+            self.status_rollup.total_at_bats_pitchfx_error
+            if self.status_rollup and self.status_rollup.total_at_bats_pitchfx_error
             else 0
         )
 
     @hybrid_property
     def total_at_bats_invalid_pitchfx(self):
         return (
-            self.pitch_app_status.total_at_bats_invalid_pitchfx
-            if self.pitch_app_status and self.pitch_app_status.total_at_bats_invalid_pitchfx
+            self.status_rollup.total_at_bats_invalid_pitchfx
+            if self.status_rollup and self.status_rollup.total_at_bats_invalid_pitchfx
             else 0
         )
 
@@ -253,7 +246,7 @@ class DateScrapeStatus(db.Base):
     def scraped_all_pitchfx_logs(self):
         return (
             True
-            if not self.pitch_apps
+            if not self.pitch_app_count_pitchfx
             else False
             if not self.scraped_all_brooks_pitch_logs
             else self.pitch_app_count_pitchfx == self.total_pitch_apps_scraped_pitchfx
@@ -263,7 +256,7 @@ class DateScrapeStatus(db.Base):
     def combined_data_for_all_pitchfx_logs(self):
         return (
             False
-            if not self.pitch_apps or not self.scraped_all_pitchfx_logs
+            if not self.pitch_app_count_pitchfx or not self.scraped_all_pitchfx_logs
             else self.pitch_app_count_pitchfx == self.total_pitch_apps_combined_data
         )
 
@@ -271,16 +264,16 @@ class DateScrapeStatus(db.Base):
     def pitchfx_error_for_any_pitchfx_logs(self):
         return (
             False
-            if not self.pitch_apps or not self.scraped_all_pitchfx_logs
-            else any((pfx.pitchfx_error or pfx.invalid_pitchfx) for pfx in self.pitch_apps)
+            if not self.pitch_app_count_pitchfx or not self.scraped_all_pitchfx_logs
+            else self.total_pitch_apps_pitchfx_error + self.total_pitch_apps_invalid_pitchfx > 0
         )
 
     @hybrid_property
     def pitchfx_is_valid_for_all_pitchfx_logs(self):
         return (
             True
-            if not self.pitch_apps or not self.scraped_all_pitchfx_logs
-            else all(not (pfx.pitchfx_error or pfx.invalid_pitchfx) for pfx in self.pitch_apps)
+            if not self.pitch_app_count_pitchfx or not self.scraped_all_pitchfx_logs
+            else self.total_pitch_apps_pitchfx_error + self.total_pitch_apps_invalid_pitchfx == 0
         )
 
     @hybrid_property
@@ -343,6 +343,20 @@ class GameScrapeStatus(db.Base):
 
     @classmethod
     def get_all_games_for_team(cls, db_session, team_id_br, year, game_date=None):
+        query = cls._get_completed_games_query(db_session, year, game_date)
+        if not query:
+            return None
+        return query.filter(or_(cls.away_team_id_br == team_id_br, cls.home_team_id_br == team_id_br)).all()
+
+    @classmethod
+    def get_all_games_for_season(cls, db_session, year, game_date=None):
+        query = cls._get_completed_games_query(db_session, year, game_date)
+        if not query:
+            return None
+        return query.all()
+
+    @classmethod
+    def _get_completed_games_query(cls, db_session, year, game_date=None):
         if not game_date:
             game_date = db.Season.get_most_recent_scraped_date(db_session, year)
         if game_date.year != year:
@@ -355,10 +369,8 @@ class GameScrapeStatus(db.Base):
             db_session.query(cls)
             .filter(cls.season_id == season.id)
             .filter(cls.scrape_status_date_id <= date_id)
-            .filter(or_(cls.away_team_id_br == team_id_br, cls.home_team_id_br == team_id_br))
             .filter(cls.scraped_bbref_boxscore == 1)
             .order_by(cls.scrape_status_date_id)
-            .all()
         )
 
     @classmethod
@@ -366,6 +378,10 @@ class GameScrapeStatus(db.Base):
         all_games = db_session.query(cls).all()
         return {g.bbref_game_id: g.id for g in all_games}
 
+    @classmethod
+    def get_game_status_map_for_season(cls, db_session, season_id):
+        return {g.bbref_game_id: g for g in db_session.query(cls).filter_by(season_id=season_id).all()}
+
 
 @accept_whitespaces
 @dateformat(DATE_ONLY)
@@ -118,6 +118,10 @@ class PitchAppScrapeStatus(db.Base):
         all_pitch_apps = db_session.query(cls).all()
         return {pa.pitch_app_id: pa.id for pa in all_pitch_apps}
 
+    @classmethod
+    def get_pitch_app_status_map_for_season(cls, db_session, season_id):
+        return {pa.pitch_app_id: pa for pa in db_session.query(cls).filter_by(season_id=season_id).all()}
+
 
 @accept_whitespaces
 @dataclass
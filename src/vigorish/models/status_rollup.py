@@ -0,0 +1,130 @@
+"""Db models that store the scrape status totals for each season, date and game."""
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.orm import backref, relationship
+
+import vigorish.database as db
+
+# Maps each rollup column to the scrape_status column that it totals, None means the rollup column is a row count.
+DATE_STATUS_TOTALS = {
+    "total_days": None,
+    "total_scraped_daily_dash_bbref": "scraped_daily_dash_bbref",
+    "total_scraped_daily_dash_brooks": "scraped_daily_dash_brooks",
+    "total_game_count_bbref": "game_count_bbref",
+    "total_game_count_brooks": "game_count_brooks",
+}
+
+GAME_STATUS_TOTALS = {
+    "total_games": None,
+    "total_scraped_bbref_boxscore": "scraped_bbref_boxscore",
+    "total_scraped_brooks_pitch_logs": "scraped_brooks_pitch_logs",
+    "total_combined_data_success": "combined_data_success",
+    "total_combined_data_fail": "combined_data_fail",
+    "total_pitch_app_count_bbref": "pitch_app_count_bbref",
+    "total_pitch_app_count_brooks": "pitch_app_count_brooks",
+    "total_pitch_count_bbref": "total_pitch_count_bbref",
+}
+
+PITCH_APP_STATUS_TOTALS = {
+    "total_pitchfx": None,
+    "total_pitchfx_scraped": "scraped_pitchfx",
+    "total_no_pitchfx_data": "no_pitchfx_data",
+    "total_combined_pitchfx_bbref_data": "combined_pitchfx_bbref_data",
+    "total_batters_faced_bbref": "batters_faced_bbref",
+    "total_batters_faced_pitchfx": "batters_faced_pitchfx",
+    "total_pitch_count_pitch_log": "pitch_count_pitch_log",
+    "total_pitch_count_bbref_audited": "pitch_count_bbref",
+    "total_pitch_count_pitchfx": "pitch_count_pitchfx",
+    "total_pitch_count_pitchfx_audited": "pitch_count_pitchfx_audited",
+    "total_at_bats_pitchfx_complete": "total_at_bats_pitchfx_complete",
+    "total_patched_pitchfx_count": "patched_pitchfx_count",
+    "total_at_bats_patched_pitchfx": "total_at_bats_patched_pitchfx",
+    "total_missing_pitchfx_count": "missing_pitchfx_count",
+    "total_at_bats_missing_pitchfx": "total_at_bats_missing_pitchfx",
+    "total_removed_pitchfx_count": "removed_pitchfx_count",
+    "total_at_bats_removed_pitchfx": "total_at_bats_removed_pitchfx",
+    "total_pitchfx_error": "pitchfx_error",
+    "total_at_bats_pitchfx_error": "total_at_bats_pitchfx_error",
+    "total_invalid_pitchfx": "invalid_pitchfx",
+    "total_invalid_pitchfx_count": "invalid_pitchfx_count",
+    "total_at_bats_invalid_pitchfx": "total_at_bats_invalid_pitchfx",
+}
+
+
+class DateStatusTotals:
+    total_days = Column(Integer, default=0)
+    total_scraped_daily_dash_bbref = Column(Integer, default=0)
+    total_scraped_daily_dash_brooks = Column(Integer, default=0)
+    total_game_count_bbref = Column(Integer, default=0)
+    total_game_count_brooks = Column(Integer, default=0)
+
+
+class GameStatusTotals:
+    total_games = Column(Integer, default=0)
+    total_scraped_bbref_boxscore = Column(Integer, default=0)
+    total_scraped_brooks_pitch_logs = Column(Integer, default=0)
+    total_combined_data_success = Column(Integer, default=0)
+    total_combined_data_fail = Column(Integer, default=0)
+    total_pitch_app_count_bbref = Column(Integer, default=0)
+    total_pitch_app_count_brooks = Column(Integer, default=0)
+    total_pitch_count_bbref = Column(Integer, default=0)
+
+
+class PitchAppStatusTotals:
+    total_pitchfx = Column(Integer, default=0)
+    total_pitchfx_scraped = Column(Integer, default=0)
+    total_no_pitchfx_data = Column(Integer, default=0)
+    total_combined_pitchfx_bbref_data = Column(Integer, default=0)
+    total_batters_faced_bbref = Column(Integer, default=0)
+    total_batters_faced_pitchfx = Column(Integer, default=0)
+    total_pitch_count_pitch_log = Column(Integer, default=0)
+    total_pitch_count_bbref_audited = Column(Integer, default=0)
+    total_pitch_count_pitchfx = Column(Integer, default=0)
+    total_pitch_count_pitchfx_audited = Column(Integer, default=0)
+    total_at_bats_pitchfx_complete = Column(Integer, default=0)
+    total_patched_pitchfx_count = Column(Integer, default=0)
+    total_at_bats_patched_pitchfx = Column(Integer, default=0)
+    total_missing_pitchfx_count = Column(Integer, default=0)
+    total_at_bats_missing_pitchfx = Column(Integer, default=0)
+    total_removed_pitchfx_count = Column(Integer, default=0)
+    total_at_bats_removed_pitchfx = Column(Integer, default=0)
+    total_pitchfx_error = Column(Integer, default=0)
+    total_at_bats_pitchfx_error = Column(Integer, default=0)
+    total_invalid_pitchfx = Column(Integer, default=0)
+    total_invalid_pitchfx_count = Column(Integer, default=0)
+    total_at_bats_invalid_pitchfx = Column(Integer, default=0)
+
+
+class SeasonStatusRollup(DateStatusTotals, GameStatusTotals, PitchAppStatusTotals, db.Base):
+    """Totals of the date, game and pitch app scrape status records for a single season."""
+
+    __tablename__ = "status_rollup_season"
+    id = Column(Integer, ForeignKey("season.id"), primary_key=True)
+
+    season = relationship("Season", backref=backref("status_rollup", uselist=False))
+
+    def __repr__(self):
+        return f"<SeasonStatusRollup season_id={self.id}>"
+
+
+class DateStatusRollup(GameStatusTotals, PitchAppStatusTotals, db.Base):
+    """Totals of the game and pitch app scrape status records for a single date."""
+
+    __tablename__ = "status_rollup_date"
+    id = Column(Integer, ForeignKey("scrape_status_date.id"), primary_key=True)
+
+    date = relationship("DateScrapeStatus", backref=backref("status_rollup", uselist=False))
+
+    def __repr__(self):
+        return f"<DateStatusRollup date_id={self.id}>"
+
+
+class GameStatusRollup(PitchAppStatusTotals, db.Base):
+    """Totals of the pitch app scrape status records for a single game."""
+
+    __tablename__ = "status_rollup_game"
+    id = Column(Integer, ForeignKey("scrape_status_game.id"), primary_key=True)
+
+    game = relationship("GameScrapeStatus", backref=backref("status_rollup", uselist=False))
+
+    def __repr__(self):
+        return f"<GameStatusRollup game_id={self.id}>"
@@ -37,8 +37,4 @@ class ScrapeBBRefBoxscores(ScrapeTaskABC):
         return parse_bbref_boxscore(url_details.html, url_details.url, url_details.url_id)
 
     def update_status(self, parsed_data):
-        result = update_status_bbref_boxscore(self.db_session, parsed_data)
-        if result.failure:
-            return result
-        self.db_session.commit()
-        return Result.Ok()
+        return update_status_bbref_boxscore(self.db_session, parsed_data)
@@ -31,8 +31,4 @@ class ScrapeBBRefGamesForDate(ScrapeTaskABC):
         return result
 
     def update_status(self, parsed_data):
-        result = update_bbref_games_for_date_single_date(self.db_session, parsed_data)
-        if result.failure:
-            return result
-        self.db_session.commit()
-        return Result.Ok()
+        return update_bbref_games_for_date_single_date(self.db_session, parsed_data)
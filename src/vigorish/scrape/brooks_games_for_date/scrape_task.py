@@ -10,6 +10,9 @@ from vigorish.util.result import Result
 
 
 class ScrapeBrooksGamesForDate(ScrapeTaskABC):
+    # The parser queries the database, so HTML must be parsed on the same thread as the db session is used
+    stream_parsed_html = False
+
     def __init__(self, app, db_job):
         self.data_set = DataSet.BROOKS_GAMES_FOR_DATE
         super().__init__(app, db_job)
@@ -48,8 +51,4 @@ class ScrapeBrooksGamesForDate(ScrapeTaskABC):
         )
 
     def update_status(self, parsed_data):
-        result = update_brooks_games_for_date_single_date(self.db_session, parsed_data)
-        if result.failure:
-            return result
-        self.db_session.commit()
-        return Result.Ok()
+        return update_brooks_games_for_date_single_date(self.db_session, parsed_data)
@@ -9,6 +9,9 @@ from vigorish.util.result import Result
 
 
 class ScrapeBrooksPitchLogs(ScrapeTaskABC):
+    # Pitch logs are parsed and saved one game at a time, after HTML for every pitch appearance is scraped
+    parse_on_arrival = False
+
     def __init__(self, app, db_job):
         self.data_set = DataSet.BROOKS_PITCH_LOGS
         self.req_data_set = DataSet.BROOKS_GAMES_FOR_DATE
@@ -68,17 +71,15 @@ class ScrapeBrooksPitchLogs(ScrapeTaskABC):
                 result = self.update_status(pitch_logs_for_game)
                 if result.failure:
                     return result
+                self.status_batch.add(game.bbref_game_id)
                 parsed += 1
                 self.spinner.text = self.url_tracker.parse_html_report(parsed, game.bbref_game_id)
-                self.db_session.commit()
+        self.status_batch.commit()
         return Result.Ok()
 
     def parse_html(self, url_details):
         pass
 
     def update_status(self, parsed_data):
-        result = update_status_brooks_pitch_logs_for_game(self.db_session, parsed_data)
-        if result.failure:
-            return result
-        self.db_session.commit()
+        update_status_brooks_pitch_logs_for_game(self.db_session, parsed_data)
         return Result.Ok()
@@ -11,6 +11,7 @@ class ScrapeBrooksPitchFx(ScrapeTaskABC):
     def __init__(self, app, db_job):
         self.data_set = DataSet.BROOKS_PITCHFX
         self.req_data_set = DataSet.BROOKS_PITCH_LOGS
+        self.pitch_logs = {}
         super().__init__(app, db_job)
 
     def check_prerequisites(self, game_date):
@@ -35,7 +36,7 @@ class ScrapeBrooksPitchFx(ScrapeTaskABC):
         return Result.Ok() if not scraped_brooks_pitchfx else Result.Fail("skip")
 
     def parse_scraped_html(self):
-        parsed = 0
+        parsed = len(self.url_tracker.parsed_url_ids)
         for game_date in self.date_range:
             pitch_logs_for_date = self.scraped_data.get_all_brooks_pitch_logs_for_date(game_date)
             if not pitch_logs_for_date:
@@ -50,6 +51,8 @@ class ScrapeBrooksPitchFx(ScrapeTaskABC):
                         continue
                     if pitch_log.pitch_app_id not in self.url_tracker.parse_url_ids:
                         continue
+                    if pitch_log.pitch_app_id in self.url_tracker.parsed_url_ids:
+                        continue
                     html = self.url_tracker.get_html(pitch_log.pitch_app_id)
                     result = parse_pitchfx_log(html, pitch_log)
                     if result.failure:
@@ -61,17 +64,38 @@ class ScrapeBrooksPitchFx(ScrapeTaskABC):
                     result = self.update_status(pitchfx_log)
                     if result.failure:
                         return Result.Fail(f"Error! {result.error} (ID: {pitch_log.pitch_app_id})")
+                    self.status_batch.add(pitch_log.pitch_app_id)
                     parsed += 1
                     self.spinner.text = self.url_tracker.parse_html_report(parsed, game_id)
-                    self.db_session.commit()
+        self.status_batch.commit()
         return Result.Ok()
 
+    def scrape_missing_html(self):
+        self.load_pitch_logs()
+        return super().scrape_missing_html()
+
+    def stream_scraped_html(self):
+        self.load_pitch_logs()
+        return super().stream_scraped_html()
+
+    def load_pitch_logs(self):
+        """Read the pitch logs for every date in the job before any HTML is parsed.
+
+        parse_html runs on the parser thread when parsed HTML is streamed, so it must not use db_session (which the
+        main thread is using to commit the status updates). It only reads the pitch logs loaded here.
+        """
+        for game_date in self.url_tracker.all_urls:
+            for pitch_logs_for_game in self.scraped_data.get_all_brooks_pitch_logs_for_date(game_date) or []:
+                self.pitch_logs.update({plog.pitch_app_id: plog for plog in pitch_logs_for_game.pitch_logs})
+
     def parse_html(self, url_details):
-        pass
+        pitch_log = self.get_pitch_log(url_details.url_id)
+        if not pitch_log or not pitch_log.parsed_all_info:
+            return Result.Ok()
+        return parse_pitchfx_log(url_details.html, pitch_log)
+
+    def get_pitch_log(self, pitch_app_id):
+        return self.pitch_logs.get(pitch_app_id)
 
     def update_status(self, parsed_data):
-        result = update_status_brooks_pitchfx_log(self.db_session, parsed_data)
-        if result.failure:
-            return result
-        self.db_session.commit()
-        return Result.Ok()
+        return update_status_brooks_pitchfx_log(self.db_session, parsed_data)
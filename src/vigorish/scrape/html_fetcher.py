@@ -0,0 +1,148 @@
+"""Download HTML pages concurrently with asyncio, spacing out requests to each host per the scrape delay settings."""
+import asyncio
+import os
+import random
+import threading
+import time
+from queue import Queue
+from urllib.parse import urlparse
+
+from vigorish.config.types.batch_job_settings import BatchJobSettings
+from vigorish.config.types.batch_scrape_delay import BatchScrapeDelay
+from vigorish.config.types.url_scrape_delay import UrlScrapeDelay
+from vigorish.util.request_url import request_url_with_retries
+from vigorish.util.result import Result
+
+FETCH_COMPLETE = object()
+
+
+def get_scrape_html_concurrency():
+    concurrency = os.environ.get("SCRAPE_HTML_CONCURRENCY", "")
+    return int(concurrency) if concurrency.isdigit() else 0
+
+
+class HostRateLimiter:
+    """Schedule requests so that each host sees the same delays as the Node.js scraper would produce.
+
+    Consecutive requests to a host are spaced by the URL_SCRAPE_DELAY setting and, if batched scraping is
+    enabled, a BATCH_SCRAPE_DELAY pause is inserted after each batch of BATCH_JOB_SETTINGS URLs. Requests
+    to different hosts are not delayed by each other.
+    """
+
+    def __init__(self, url_delay, batch_job, batch_delay):
+        self.url_delay = url_delay
+        self.batch_job = batch_job
+        self.batch_delay = batch_delay
+        self.next_request_time = {}
+        self.remaining_in_batch = {}
+
+    @classmethod
+    def from_config(cls, config, data_set):
+        url_delay = config.get_current_setting("URL_SCRAPE_DELAY", data_set)
+        batch_job = config.get_current_setting("BATCH_JOB_SETTINGS", data_set)
+        batch_delay = config.get_current_setting("BATCH_SCRAPE_DELAY", data_set)
+        if url_delay and batch_job and batch_delay:
+            return cls(url_delay, batch_job, batch_delay)
+        return cls(
+            UrlScrapeDelay(True, True, 0, 3, 6),
+            BatchJobSettings(True, True, 0, 50, 80),
+            BatchScrapeDelay(True, True, 0, 30, 45),
+        )
+
+    def get_url_delay(self):
+        if not self.url_delay.delay_is_required:
+            return 0
+        if not self.url_delay.delay_is_random:
+            return self.url_delay.delay_uniform_ms / 1000
+        return random.randint(self.url_delay.delay_random_min_ms, self.url_delay.delay_random_max_ms) / 1000
+
+    def get_batch_size(self):
+        if not self.batch_job.batched_scraping_enabled:
+            return 0
+        if not self.batch_job.batch_size_is_random:
+            return self.batch_job.batch_size_uniform
+        return random.randint(self.batch_job.batch_size_random_min, self.batch_job.batch_size_random_max)
+
+    def get_batch_delay(self):
+        if not self.batch_delay.delay_is_required:
+            return 0
+        if not self.batch_delay.delay_is_random:
+            return self.batch_delay.delay_uniform_ms / 1000
+        return random.randint(self.batch_delay.delay_random_min_ms, self.batch_delay.delay_random_max_ms) / 1000
+
+    def reserve(self, host):
+        """Reserve the next time slot for a request to host and return the number of seconds to wait for it."""
+        now = time.monotonic()
+        request_time = max(now, self.next_request_time.get(host, now))
+        delay = self.get_url_delay()
+        remaining = self.remaining_in_batch.get(host) or self.get_batch_size()
+        if remaining:
+            remaining -= 1
+            if not remaining:
+                delay += self.get_batch_delay()
+        self.remaining_in_batch[host] = remaining
+        self.next_request_time[host] = request_time + delay
+        return request_time - now
+
+
+class AsyncHtmlFetcher:
+    """Download a list of URLs with at most max_concurrency requests in flight.
+
+    The event loop runs in a background thread and fetch_all() yields each page as soon as it has been
+    written to UrlDetails.scraped_file_path, so the caller can save and parse one page while the
+    remaining pages are still being downloaded. Each request waits for its rate limiter time slot before it
+    takes one of the max_concurrency slots, so a slot is never held while waiting. A result is yielded for
+    every URL; an error requesting one URL is returned as a failed result for that URL only.
+    """
+
+    def __init__(self, rate_limiter, max_concurrency=4, request_url=request_url_with_retries):
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self.request_url = request_url
+
+    def fetch_all(self, urls, stopped=None):
+        """Yield (url_details, result) for each URL in the order that the pages are received.
+
+        Pending requests are cancelled when the generator is closed or when the optional stopped event is set.
+        """
+        results = Queue()
+        cancelled = threading.Event()
+        fetch_all = self._fetch_all(urls, results, cancelled, stopped or cancelled)
+        thread = threading.Thread(target=asyncio.run, args=(fetch_all,), daemon=True)
+        thread.start()
+        try:
+            while (fetched := results.get()) is not FETCH_COMPLETE:
+                yield fetched
+        finally:
+            cancelled.set()
+            thread.join()
+
+    async def _fetch_all(self, urls, results, cancelled, stopped):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        fetch_all = asyncio.gather(
+            *[self._fetch(url_details, semaphore, results) for url_details in urls], return_exceptions=True
+        )
+        try:
+            while not fetch_all.done() and not cancelled.is_set() and not stopped.is_set():
+                await asyncio.wait([fetch_all], timeout=0.1)
+        finally:
+            fetch_all.cancel()
+            results.put(FETCH_COMPLETE)
+
+    async def _fetch(self, url_details, semaphore, results):
+        try:
+            await asyncio.sleep(self.rate_limiter.reserve(urlparse(url_details.url).netloc))
+            async with semaphore:
+                result = await asyncio.to_thread(self._fetch_html, url_details)
+        except Exception as e:
+            result = Result.Fail(f"Error occurred scraping URL: {url_details.url} ({repr(e)})")
+        results.put((url_details, result))
+
+    def _fetch_html(self, url_details):
+        result = self.request_url(url_details.url)
+        if result.failure:
+            return result
+        url_details.scraped_file_path.write_text(result.value.text)
+        if not url_details.scraped_html_is_valid:
+            return Result.Fail(f"HTML received from URL is not valid: {url_details.url}")
+        return Result.Ok(url_details)
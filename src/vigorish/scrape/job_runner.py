@@ -15,6 +15,7 @@ from vigorish.scrape.bbref_games_for_date.scrape_task import ScrapeBBRefGamesFor
 from vigorish.scrape.brooks_games_for_date.scrape_task import ScrapeBrooksGamesForDate
 from vigorish.scrape.brooks_pitch_logs.scrape_task import ScrapeBrooksPitchLogs
 from vigorish.scrape.brooks_pitchfx.scrape_task import ScrapeBrooksPitchFx
+from vigorish.scrape.html_fetcher import get_scrape_html_concurrency
 from vigorish.status.report_status import report_date_range_status, report_season_status
 from vigorish.util.datetime_util import get_date_range
 from vigorish.util.dt_format_strings import DATE_ONLY_2
@@ -157,9 +158,10 @@ class JobRunner:
 
     def initialize(self):
         errors = []
-        if not node_is_installed():
+        nodejs_required = not get_scrape_html_concurrency()
+        if nodejs_required and not node_is_installed():
             errors.append(NODEJS_INSTALL_ERROR)
-        elif not node_modules_folder_exists():
+        elif nodejs_required and not node_modules_folder_exists():
             errors.append(NPM_PACKAGES_INSTALL_ERROR)
         result = self.check_url_delay_settings()
         if result.failure:
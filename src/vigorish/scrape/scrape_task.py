@@ -1,8 +1,11 @@
 """Base task that defines the template method for a scrape task."""
+import os
 from abc import ABC, abstractmethod
 from functools import partial
+from queue import Queue
 from signal import SIGINT, signal
 from sys import exit
+from threading import Event, Lock, Thread
 
 from getch import pause
 from halo import Halo
@@ -10,12 +13,27 @@ from halo import Halo
 from vigorish.cli.components import print_message
 from vigorish.config.project_paths import NODEJS_SCRIPT
 from vigorish.constants import JOB_SPINNER_COLORS
-from vigorish.enums import DataSet, ScrapeCondition
+from vigorish.enums import DataSet, ScrapeCondition, VigFile
+from vigorish.scrape.html_fetcher import (
+    AsyncHtmlFetcher,
+    get_scrape_html_concurrency,
+    HostRateLimiter,
+)
 from vigorish.scrape.url_tracker import UrlTracker
+from vigorish.status.status_batch import StatusUpdateBatch
 from vigorish.util.datetime_util import get_date_range
+from vigorish.util.numeric_helpers import ONE_KB
 from vigorish.util.result import Result
 from vigorish.util.sys_helpers import execute_nodejs_script
 
+PAGES_COMPLETE = object()
+PARSE_COMPLETE = object()
+
+
+def get_scrape_stream_batch_size():
+    batch_size = os.environ.get("SCRAPE_STREAM_BATCH_SIZE", "")
+    return int(batch_size) if batch_size.isdigit() else 0
+
 
 def user_cancelled(db_session, active_job, spinner, signal_received, frame):
     spinner.stop()
@@ -27,6 +45,8 @@ def user_cancelled(db_session, active_job, spinner, signal_received, frame):
 class ScrapeTaskABC(ABC):
     data_set: DataSet
     url_tracker: UrlTracker
+    parse_on_arrival = True
+    stream_parsed_html = True
 
     def __init__(self, app, db_job):
         self.app = app
@@ -40,6 +60,13 @@ class ScrapeTaskABC(ABC):
         self.total_days = self.db_job.total_days
         self.scrape_condition = self.app.get_current_setting("SCRAPE_CONDITION", self.data_set)
         self.spinner = Halo(color=JOB_SPINNER_COLORS[self.data_set], spinner="dots3")
+        self.spinner_lock = Lock()
+        self.html_fetcher = None
+        self.stream_batch_size = get_scrape_stream_batch_size()
+        self.status_batch = StatusUpdateBatch(self.db_session, batch_size=self.stream_batch_size or None)
+        concurrency = get_scrape_html_concurrency()
+        if concurrency:
+            self.html_fetcher = AsyncHtmlFetcher(HostRateLimiter.from_config(self.config, self.data_set), concurrency)
 
     @property
     def date_range(self):
@@ -60,10 +87,15 @@ class ScrapeTaskABC(ABC):
         result = (
             self.initialize()
             .on_success(self.identify_needed_urls)
+            .on_success(self.resume_from_saved_json)
             .on_success(self.retrieve_scraped_html)
-            .on_success(self.scrape_missing_html)
-            .on_success(self.parse_scraped_html)
         )
+        if self.stream_batch_size and self.parse_on_arrival and self.stream_parsed_html:
+            result = result.on_success(self.stream_scraped_html)
+        else:
+            result = result.on_success(self.scrape_missing_html).on_success(self.parse_scraped_html)
+        result = result.on_success(self.check_failed_urls)
+        self.status_batch.commit()
         self.spinner.stop()
         if result.failure:
             return result
@@ -96,10 +128,39 @@ class ScrapeTaskABC(ABC):
             self.spinner.text = self.url_tracker.identify_html_report
         return Result.Ok()
 
+    def resume_from_saved_json(self):
+        """Re-apply the status updates for URLs that were parsed by a previous job but never committed.
+
+        JSON files are saved before the status records are updated, so a JSON file in the local folder is proof
+        that the URL was parsed. If the status updates were lost (e.g., the job was killed before the batch was
+        committed), they are recreated from the JSON file instead of scraping and parsing the URL again.
+        """
+        if self.scrape_condition != ScrapeCondition.ONLY_MISSING_DATA or not self.parse_on_arrival:
+            return Result.Ok()
+        saved_url_ids = set(
+            self.scraped_data.get_scraped_ids_from_local_folder(VigFile.PARSED_JSON, self.data_set, self.season.year)
+        )
+        for url in self.url_tracker.need_urls[:]:
+            if url.url_id not in saved_url_ids:
+                continue
+            parsed_data = self.scraped_data.get_scraped_data(self.data_set, url.url_id, apply_patch_list=False)
+            if not parsed_data:
+                continue
+            result = self.update_status(parsed_data)
+            if result.failure:
+                return result
+            self.status_batch.add(url.url_id)
+            self.url_tracker.need_urls.remove(url)
+            self.url_tracker.skip_urls.append(url)
+        self.status_batch.commit()
+        return Result.Ok()
+
     def retrieve_scraped_html(self):
         self.spinner.text = self.url_tracker.retrieve_html_report
         if not self.url_tracker.need_urls:
             return Result.Fail("skip")
+        if self.scraped_data.html_storage.html_stored_local(self.data_set):
+            self.find_cached_html_in_file_index()
         for url in self.url_tracker.need_urls[:]:
             self.scraped_data.get_html(self.data_set, url.url_id)
             if not url.html_was_scraped:
@@ -110,7 +171,29 @@ class ScrapeTaskABC(ABC):
             self.spinner.text = self.url_tracker.retrieve_html_report
         return Result.Ok()
 
+    def find_cached_html_in_file_index(self):
+        """Move each URL with a valid HTML file in the local folder to cached_urls without checking each file.
+
+        The remaining URLs are checked individually since they may be in the folder where the Node.js script saves
+        HTML, or in the S3 bucket.
+        """
+        file_names = {}
+        need_urls = []
+        for url in self.url_tracker.need_urls:
+            folderpath = url.cachedHtmlFolderPath
+            if folderpath not in file_names:
+                file_index = self.scraped_data.file_helper.get_file_index(folderpath)
+                file_names[folderpath] = file_index.get_names(min_size=ONE_KB)
+            if url.fileName in file_names[folderpath]:
+                self.url_tracker.cached_urls.append(url)
+            else:
+                need_urls.append(url)
+        self.url_tracker.need_urls = need_urls
+        self.spinner.text = self.url_tracker.retrieve_html_report
+
     def scrape_missing_html(self):
+        if self.html_fetcher:
+            return self.fetch_missing_html()
         while not self.url_tracker.html_scraping_complete:
             self.spinner.text = self.url_tracker.scrape_html_report
             self.spinner.stop_and_persist(self.spinner.frame(), "")
@@ -120,14 +203,46 @@ class ScrapeTaskABC(ABC):
             for url in self.url_tracker.missing_urls[:]:
                 if not url.scraped_html_is_valid:
                     continue
-                result = self.scraped_data.save_html(self.data_set, url.url_id, url.html)
+                result = self.save_scraped_html(url)
                 if result.failure:
                     return result
-                self.url_tracker.completed_urls.append(url)
-                self.url_tracker.missing_urls.remove(url)
                 self.spinner.text = self.url_tracker.save_html_report
         return Result.Ok()
 
+    def fetch_missing_html(self):
+        """Scrape missing HTML with the asyncio fetcher instead of the Node.js script. Each page is saved (and
+        parsed, if parse_on_arrival is set) as soon as it is received, while other pages are still downloading.
+
+        A URL that cannot be scraped is moved to url_tracker.failed_urls and the remaining URLs are scraped and
+        parsed as usual. The failed URLs are reported by check_failed_urls once the task is otherwise complete.
+        """
+        self.spinner.text = self.url_tracker.scrape_html_report
+        for url, result in self.html_fetcher.fetch_all(self.url_tracker.missing_urls[:]):
+            if result.failure:
+                self.url_tracker.add_failed_url(url, result.error)
+                self.spinner.text = self.url_tracker.scrape_html_report
+                continue
+            result = self.save_scraped_html(url)
+            if result.failure:
+                return result
+            if self.parse_on_arrival:
+                result = self.parse_scraped_url(url)
+                if result.failure:
+                    return result
+            self.spinner.text = self.url_tracker.scrape_html_report
+        return Result.Ok()
+
+    def check_failed_urls(self):
+        return Result.Fail(self.url_tracker.failed_urls_report) if self.url_tracker.failed_urls else Result.Ok()
+
+    def save_scraped_html(self, url):
+        result = self.scraped_data.save_html(self.data_set, url.url_id, url.html)
+        if result.failure:
+            return result
+        self.url_tracker.completed_urls.append(url)
+        self.url_tracker.missing_urls.remove(url)
+        return Result.Ok()
+
     def invoke_nodejs_script(self):
         missing_urls_filepath = self.url_tracker.create_missing_urls_json_file()
         script_args = self.config.get_nodejs_script_args(self.data_set, missing_urls_filepath)
@@ -137,32 +252,160 @@ class ScrapeTaskABC(ABC):
         return result
 
     def parse_scraped_html(self):
-        parsed = 0
+        parsed = len(self.url_tracker.parsed_url_ids)
         self.spinner.text = self.url_tracker.parse_html_report(parsed)
         for urls_for_date in self.url_tracker.all_urls.values():
             for url_details in urls_for_date:
                 if url_details.url_id not in self.url_tracker.parse_url_ids:
                     continue
-                result = self.parse_html(url_details)
-                if result.failure:
-                    if (
-                        "Unable to parse any game data" in result.error
-                        or "will be completed at a later date" in result.error
-                    ):
-                        continue
-                    return result
-                parsed_data = result.value
-                result = self.scraped_data.save_json(self.data_set, parsed_data)
-                if result.failure:
-                    return result
-                result = self.update_status(parsed_data)
+                if url_details.url_id in self.url_tracker.parsed_url_ids:
+                    continue
+                result = self.parse_scraped_url(url_details)
                 if result.failure:
                     return result
-                self.db_session.commit()
+                if not result.value:
+                    continue
                 parsed += 1
                 self.spinner.text = self.url_tracker.parse_html_report(parsed)
+        self.status_batch.commit()
+        return Result.Ok()
+
+    def parse_scraped_url(self, url_details):
+        result = self.parse_url(url_details)
+        if result.failure or not result.value:
+            return result
+        parsed_data = result.value
+        result = self.save_parsed_data(url_details, parsed_data)
+        return result if result.failure else Result.Ok(parsed_data)
+
+    def parse_url(self, url_details):
+        result = self.parse_html(url_details)
+        if result.failure:
+            if (
+                "Unable to parse any game data" in result.error
+                or "will be completed at a later date" in result.error
+            ):
+                return Result.Ok()
+            return result
+        return Result.Ok(result.value) if result.value else Result.Ok()
+
+    def save_parsed_data(self, url_details, parsed_data):
+        result = self.scraped_data.save_json(self.data_set, parsed_data)
+        if result.failure:
+            return result
+        result = self.update_status(parsed_data)
+        if result.failure:
+            return result
+        self.status_batch.add(url_details.url_id)
+        self.url_tracker.parsed_url_ids.add(url_details.url_id)
         return Result.Ok()
 
+    def stream_scraped_html(self):
+        """Parse HTML in a background thread while missing HTML is still being scraped.
+
+        Cached pages are parsed immediately and scraped pages are parsed as soon as they arrive. Parsed data
+        flows through a queue back to this thread, which saves the HTML and JSON files and updates the scrape
+        status records in batches of SCRAPE_STREAM_BATCH_SIZE items. The spinner is shared with the thread that
+        runs the Node.js script, so it is only changed while holding spinner_lock. Pages that could not be
+        scraped skip the parser and are moved to url_tracker.failed_urls once the other threads have stopped.
+        """
+        pages = Queue()
+        failed_pages = Queue()
+        parsed_results = Queue()
+        stopped = Event()
+        threads = [
+            Thread(target=self.scrape_pages, args=(pages, failed_pages, stopped), daemon=True),
+            Thread(target=self.parse_pages, args=(pages, parsed_results, stopped), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            return self.write_parsed_results(parsed_results)
+        finally:
+            stopped.set()
+            for thread in threads:
+                thread.join()
+            while not failed_pages.empty():
+                (url, result) = failed_pages.get()
+                self.url_tracker.add_failed_url(url, result.error)
+
+    def scrape_pages(self, pages, failed_pages, stopped):
+        try:
+            if self.html_fetcher:
+                for url, result in self.html_fetcher.fetch_all(self.url_tracker.missing_urls[:], stopped):
+                    (pages if result.success else failed_pages).put((url, result))
+            else:
+                self.scrape_pages_nodejs(pages, stopped)
+        except Exception as e:
+            pages.put((None, Result.Fail(f"Error occurred scraping HTML: {repr(e)}")))
+        finally:
+            pages.put(PAGES_COMPLETE)
+
+    def scrape_pages_nodejs(self, pages, stopped):
+        queued_url_ids = set()
+        while not stopped.is_set() and not all(url.html_was_scraped for url in self.url_tracker.parse_urls):
+            with self.spinner_lock:
+                self.spinner.stop_and_persist(self.spinner.frame(), "")
+            self.invoke_nodejs_script()
+            with self.spinner_lock:
+                self.spinner.start()
+            for url in self.url_tracker.missing_urls[:]:
+                if url.scraped_html_is_valid and url.url_id not in queued_url_ids:
+                    queued_url_ids.add(url.url_id)
+                    pages.put((url, Result.Ok()))
+
+    def parse_pages(self, pages, parsed_results, stopped):
+        try:
+            for url in self.url_tracker.cached_urls[:]:
+                if stopped.is_set():
+                    return
+                if url.url_id not in self.url_tracker.parsed_url_ids:
+                    parsed_results.put((url, self.parse_url(url)))
+            while (page := pages.get()) is not PAGES_COMPLETE:
+                if stopped.is_set():
+                    return
+                url, result = page
+                parsed_results.put((url, result if result.failure else self.parse_url(url)))
+        except Exception as e:
+            parsed_results.put((None, Result.Fail(f"Error occurred parsing HTML: {repr(e)}")))
+        finally:
+            parsed_results.put(PARSE_COMPLETE)
+
+    def write_parsed_results(self, parsed_results):
+        """Save each parsed result in the order it arrives and stop at the first failure.
+
+        The status updates for every result saved before the failure are committed, whichever step failed.
+        """
+        parsed = len(self.url_tracker.parsed_url_ids)
+        self.update_spinner_text(self.url_tracker.parse_html_report(parsed))
+        result = Result.Ok()
+        while (parsed_result := parsed_results.get()) is not PARSE_COMPLETE:
+            result = self.write_parsed_result(*parsed_result)
+            if result.failure:
+                break
+            if result.value:
+                parsed += 1
+                self.update_spinner_text(self.url_tracker.parse_html_report(parsed))
+        self.status_batch.commit()
+        return result if result.failure else Result.Ok()
+
+    def write_parsed_result(self, url, result):
+        if result.failure:
+            return result
+        parsed_data = result.value
+        if url in self.url_tracker.missing_urls:
+            result = self.save_scraped_html(url)
+            if result.failure:
+                return result
+        if not parsed_data:
+            return Result.Ok(False)
+        result = self.save_parsed_data(url, parsed_data)
+        return result if result.failure else Result.Ok(True)
+
+    def update_spinner_text(self, text):
+        with self.spinner_lock:
+            self.spinner.text = text
+
     @abstractmethod
     def check_prerequisites(self, game_date):
         pass
@@ -149,7 +149,7 @@ def get_filename(scraped_data, data_set, identifier):
 
 
 def get_cached_html_folderpath(scraped_data, data_set, game_date):
-    return scraped_data.file_helper.get_local_folderpath(VigFile.SCRAPED_HTML, data_set, game_date)
+    return scraped_data.get_cached_html_folderpath(data_set, game_date)
 
 
 def get_scraped_html_folderpath(db_job, data_set):
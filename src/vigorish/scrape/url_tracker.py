@@ -17,6 +17,9 @@ class UrlTracker:
         self.cached_urls = []
         self.completed_urls = []
         self.skip_urls = []
+        self.failed_urls = []
+        self.fetch_errors = {}
+        self.parsed_url_ids = set()
         self.missing_urls_filepath = self.db_job.url_set_filepath
         self.scraped_html_folderpath = self.db_job.scraped_html_folders[self.data_set]
 
@@ -69,8 +72,22 @@ class UrlTracker:
         report = f"Scraping missing HTML... ({len(self.skip_urls)} Skipped,"
         if self.completed_urls:
             report = f"{report} {len(self.completed_urls)} Scraped,"
+        if self.failed_urls:
+            report = f"{report} {len(self.failed_urls)} Failed,"
         return f"{report} {len(self.cached_urls)} Found, {len(self.missing_urls)} Missing)"
 
+    @property
+    def failed_urls_report(self):
+        errors = "\n".join(self.fetch_errors[url.url_id] for url in self.failed_urls)
+        return f"Failed to scrape HTML for {len(self.failed_urls)} URLs:\n{errors}"
+
+    def add_failed_url(self, url, error):
+        """Move url from missing_urls to failed_urls, so it is not parsed, and record the error."""
+        if url in self.missing_urls:
+            self.missing_urls.remove(url)
+        self.failed_urls.append(url)
+        self.fetch_errors[url.url_id] = error
+
     @property
     def save_html_report(self):
         total_urls = len(self.missing_urls) + len(self.completed_urls)
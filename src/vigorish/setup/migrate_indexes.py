@@ -0,0 +1,35 @@
+"""Bring the indexes of an existing database in line with the indexes defined by the models."""
+from sqlalchemy import inspect
+
+import vigorish.database as db
+from vigorish.util.result import Result
+
+# Single-column indexes that were replaced by a composite index with the same leading column
+OBSOLETE_INDEXES = {
+    "pitchfx": ["ix_pitchfx_pitcher_id", "ix_pitchfx_batter_id"],
+}
+
+
+def migrate_indexes(db_engine):
+    """Create the model indexes that are missing from a database that was created before they were added.
+
+    Indexes listed in OBSOLETE_INDEXES are dropped if they exist. Indexes are only created for tables that already
+    exist, and creating an index on a large table (e.g., pitchfx) can take some time, but this only happens the first
+    time the app is started after the index is added to a model.
+    """
+    inspector = inspect(db_engine)
+    table_names = inspector.get_table_names()
+    created, dropped = [], []
+    for table in db.Base.metadata.sorted_tables:
+        if table.name not in table_names or not (table.indexes or table.name in OBSOLETE_INDEXES):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index_name in OBSOLETE_INDEXES.get(table.name, []):
+            if index_name in existing:
+                db_engine.execute(f"DROP INDEX {index_name}")
+                dropped.append(index_name)
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in existing:
+                index.create(db_engine)
+                created.append(index.name)
+    return Result.Ok({"created": created, "dropped": dropped})
@@ -0,0 +1,38 @@
+"""Apply the schema changes that databases created by an earlier version of vigorish are missing, once per database."""
+from vigorish.models.pitch_stats_to_date import create_pitch_stats_to_date_table
+from vigorish.setup.migrate_indexes import migrate_indexes
+from vigorish.status.update_status_rollups import create_status_rollup_tables
+from vigorish.util.result import Result
+
+# Increase this value whenever a step is added to migrate_schema
+SCHEMA_VERSION = 1
+
+
+def migrate_schema(db_session):
+    """Create the tables and indexes that are missing from a database that was created before they were added.
+
+    For SQLite databases the schema version is stored in PRAGMA user_version, and the migrations only run when it
+    is less than SCHEMA_VERSION (the first time the app is started with a database created by an earlier version).
+    Every step checks the schema before changing it, so for other databases the steps run each time instead.
+    """
+    db_engine = db_session.get_bind()
+    if get_schema_version(db_engine) >= SCHEMA_VERSION:
+        return Result.Ok()
+    for migrate in [create_status_rollup_tables, create_pitch_stats_to_date_table]:
+        result = migrate(db_session)
+        if result.failure:
+            return result
+    migrate_indexes(db_engine)
+    set_schema_version(db_engine, SCHEMA_VERSION)
+    return Result.Ok()
+
+
+def get_schema_version(db_engine):
+    if db_engine.url.get_backend_name() != "sqlite":
+        return 0
+    return db_engine.execute("PRAGMA user_version").scalar()
+
+
+def set_schema_version(db_engine, version):
+    if db_engine.url.get_backend_name() == "sqlite":
+        db_engine.execute(f"PRAGMA user_version = {int(version)}")
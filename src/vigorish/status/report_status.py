@@ -1,6 +1,7 @@
 import vigorish.database as db
 from vigorish.cli.components.viewers import DictListTableViewer, DisplayPage, PageViewer
 from vigorish.enums import StatusReport
+from vigorish.status.status_snapshot import get_season_status, StatusSnapshot
 from vigorish.util.datetime_util import get_date_range
 from vigorish.util.dt_format_strings import DATE_MONTH_NAME, DATE_ONLY
 from vigorish.util.list_helpers import flatten_list2d, make_chunked_list
@@ -13,7 +14,15 @@ def report_status_single_date(db_session, game_date, report_type):
     result = _validate_single_date(db_session, game_date)
     if result.failure:
         return result
-    date_status = result.value
+    snapshot = StatusSnapshot(
+        db_session,
+        game_date,
+        game_date,
+        include_games=report_type == StatusReport.SINGLE_DATE_WITH_GAME_STATUS,
+        include_missing_pitchfx=report_type
+        in [StatusReport.DATE_DETAIL_MISSING_PITCHFX, StatusReport.SINGLE_DATE_WITH_GAME_STATUS],
+    )
+    date_status = snapshot.get_date_status(game_date)
     date_str = game_date.strftime(DATE_MONTH_NAME)
     heading = f"### OVERALL STATUS FOR {date_str} ###"
     pages.append(DisplayPage(date_status.status_report(), heading, wrap=False))
@@ -26,14 +35,14 @@ def report_status_single_date(db_session, game_date, report_type):
         StatusReport.DATE_DETAIL_MISSING_PITCHFX,
         StatusReport.SINGLE_DATE_WITH_GAME_STATUS,
     ]:
-        pages.extend(_get_missing_pfx_data_report_for_date(db_session, date_status))
+        pages.extend(_get_missing_pfx_data_report_for_date(snapshot, date_status))
     return Result.Ok(_create_report_viewer(pages, text_color="bright_magenta"))
 
 
 def report_season_status(db_session, year, report_type):
     if report_type == StatusReport.NONE:
         return Result.Fail("no report")
-    season = db.Season.find_by_year(db_session, year)
+    season = get_season_status(db_session, year)
     if report_type == StatusReport.SEASON_SUMMARY:
         heading = f"### STATUS REPORT FOR {season.name} ###"
         pages = [DisplayPage(season.status_report(), heading, wrap=False)]
@@ -44,11 +53,17 @@ def report_season_status(db_session, year, report_type):
 def report_date_range_status(db_session, start_date, end_date, report_type):
     if report_type == StatusReport.NONE:
         return Result.Fail("no report")
-    result = _construct_date_range_status(db_session, start_date, end_date, report_type)
+    snapshot = StatusSnapshot(
+        db_session,
+        start_date,
+        end_date,
+        include_missing_pitchfx=report_type == StatusReport.DATE_DETAIL_MISSING_PITCHFX,
+    )
+    result = _construct_date_range_status(snapshot, start_date, end_date, report_type)
     if result.failure:
         return result
     status_date_range = result.value
-    return _get_report_for_date_range(db_session, start_date, end_date, status_date_range, report_type)
+    return _get_report_for_date_range(snapshot, start_date, end_date, status_date_range, report_type)
 
 
 def _validate_single_date(db_session, game_date):
@@ -69,7 +84,7 @@ def _validate_single_date(db_session, game_date):
     return Result.Ok(date_status)
 
 
-def _construct_date_range_status(db_session, start_date, end_date, report_type):
+def _construct_date_range_status(snapshot, start_date, end_date, report_type):
     show_all = False
     if report_type in [
         StatusReport.DATE_SUMMARY_ALL_DATES,
@@ -79,7 +94,7 @@ def _construct_date_range_status(db_session, start_date, end_date, report_type):
         show_all = True
     status_date_range = []
     for game_date in get_date_range(start_date, end_date):
-        date_status = db.DateScrapeStatus.find_by_date(db_session, game_date)
+        date_status = snapshot.get_date_status(game_date)
         if not date_status:
             error = "scrape_status_date does not contain an entry for date: {game_date.strftime(DATE_ONLY)}"
             return Result.Fail(error)
@@ -89,42 +104,42 @@ def _construct_date_range_status(db_session, start_date, end_date, report_type):
     return Result.Ok(status_date_range)
 
 
-def _get_report_for_date_range(db_session, start_date, end_date, status_date_range, report_type):
+def _get_report_for_date_range(snapshot, start_date, end_date, status_date_range, report_type):
     if report_type in [
         StatusReport.DATE_DETAIL_MISSING_DATA,
         StatusReport.DATE_DETAIL_ALL_DATES,
     ]:
-        return _get_detailed_report_for_date_range(db_session, status_date_range, False)
+        return _get_detailed_report_for_date_range(snapshot, status_date_range, False)
     if report_type == StatusReport.DATE_DETAIL_MISSING_PITCHFX:
-        return _get_detailed_report_for_date_range(db_session, status_date_range, True)
+        return _get_detailed_report_for_date_range(snapshot, status_date_range, True)
     return _get_summary_report_for_date_range(start_date, end_date, status_date_range)
 
 
-def _get_detailed_report_for_date_range(db_session, status_date_range, missing_pitchfx):
+def _get_detailed_report_for_date_range(snapshot, status_date_range, missing_pitchfx):
     pages = []
     for date_status in status_date_range:
         game_date_str = date_status.game_date.strftime(DATE_MONTH_NAME)
         heading = f"### STATUS REPORT FOR {game_date_str} ###"
         pages.append(DisplayPage(date_status.status_report(), heading, wrap=False))
         if missing_pitchfx:
-            pages.extend(_get_missing_pfx_data_report_for_date(db_session, date_status))
+            pages.extend(_get_missing_pfx_data_report_for_date(snapshot, date_status))
     return Result.Ok(_create_report_viewer(pages, text_color="bright_cyan"))
 
 
-def _get_missing_pfx_data_report_for_date(db_session, date_status):
+def _get_missing_pfx_data_report_for_date(snapshot, date_status):
     game_date_str = date_status.game_date.strftime(DATE_MONTH_NAME)
     heading = f"### MISSING PITCHFX DATA FOR {game_date_str} ###"
-    missing_pfx_ids_list = _get_missing_pfx_ids_for_date(db_session, date_status)
+    missing_pfx_ids_list = _get_missing_pfx_ids_for_date(snapshot, date_status)
     chunked_list = make_chunked_list(missing_pfx_ids_list, chunk_size=4)
     return [DisplayPage(chunk, heading, wrap=False) for chunk in chunked_list]
 
 
-def _get_missing_pfx_ids_for_date(db_session, date_status):
+def _get_missing_pfx_ids_for_date(snapshot, date_status):
     if date_status.scraped_all_pitchfx_logs:
         return ["All PitchFX logs have been scraped"]
     if not date_status.scraped_all_brooks_pitch_logs:
         return ["Pitch Appearance IDs without PitchFx data cannot be reported until all pitch logs have been scraped."]
-    missing_ids = db.DateScrapeStatus.get_unscraped_pitch_app_ids_for_date(db_session, date_status.game_date)
+    missing_ids = snapshot.get_missing_pitch_app_ids_for_date(date_status.game_date)
     return flatten_list2d([_format_id_list(game_id, id_list) for game_id, id_list in missing_ids.items()])
 
 
@@ -0,0 +1,56 @@
+"""Commit scrape status updates in batches instead of after every parsed URL."""
+import os
+import time
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_BATCH_SECONDS = 5
+
+
+def get_status_batch_size():
+    batch_size = os.environ.get("STATUS_BATCH_SIZE", "")
+    return int(batch_size) if batch_size.isdigit() else DEFAULT_BATCH_SIZE
+
+
+def get_status_batch_seconds():
+    batch_seconds = os.environ.get("STATUS_BATCH_SECONDS", "")
+    return int(batch_seconds) if batch_seconds.isdigit() else DEFAULT_BATCH_SECONDS
+
+
+class StatusUpdateBatch:
+    """Group the changes made by the update_status_* functions into one transaction per batch.
+
+    The batch is committed when it holds batch_size updates or when batch_seconds have passed since its first
+    update, whichever comes first. Updates that have not been committed are lost if the process is killed, but
+    the JSON file for each update is saved before the update is made, so the scrape task can re-apply them from
+    the JSON files when the job is resumed.
+    """
+
+    def __init__(self, db_session, batch_size=None, batch_seconds=None):
+        self.db_session = db_session
+        self.batch_size = batch_size or get_status_batch_size()
+        self.batch_seconds = batch_seconds if batch_seconds is not None else get_status_batch_seconds()
+        self.pending_ids = []
+        self.batch_started = None
+        self.total_commits = 0
+
+    @property
+    def batch_is_full(self):
+        if len(self.pending_ids) >= self.batch_size:
+            return True
+        return bool(self.batch_seconds) and time.monotonic() - self.batch_started >= self.batch_seconds
+
+    def add(self, url_id):
+        """Record that the status for url_id has been updated, and commit the batch if it is full."""
+        if not self.pending_ids:
+            self.batch_started = time.monotonic()
+        self.pending_ids.append(url_id)
+        if self.batch_is_full:
+            self.commit()
+
+    def commit(self):
+        if not self.pending_ids:
+            return
+        self.db_session.commit()
+        self.pending_ids = []
+        self.batch_started = None
+        self.total_commits += 1
@@ -0,0 +1,82 @@
+"""Load the scrape status records needed to report on a range of dates with a fixed number of queries."""
+from collections import defaultdict
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+
+import vigorish.database as db
+from vigorish.enums import SeasonType
+from vigorish.util.exceptions import InvalidSeasonException
+from vigorish.util.string_helpers import get_date_status_id_from_game_date
+
+
+class StatusSnapshot:
+    """The date and game scrape status for a range of dates, held in memory.
+
+    All of the records are loaded with their status totals when the snapshot is created, so reports can read every
+    counter from the snapshot without running any more queries. The number of queries used to create the snapshot
+    does not depend on the number of dates in the range:
+
+    - one query for the dates in the range and their status totals
+    - two queries for the games on each date and their pitch apps, if include_games is True
+    - one query for the pitch apps that have not been scraped, if include_missing_pitchfx is True
+    """
+
+    def __init__(self, db_session, start_date, end_date, include_games=False, include_missing_pitchfx=False):
+        self.db_session = db_session
+        self.start_id = get_date_status_id(start_date)
+        self.end_id = get_date_status_id(end_date)
+        self.dates = self.get_date_status_records(include_games)
+        self.missing_pitch_app_ids = self.get_missing_pitch_app_ids() if include_missing_pitchfx else {}
+
+    def get_date_status_records(self, include_games):
+        query = (
+            self.db_session.query(db.DateScrapeStatus)
+            .options(joinedload(db.DateScrapeStatus.status_rollup))
+            .filter(db.DateScrapeStatus.id.between(self.start_id, self.end_id))
+        )
+        if include_games:
+            query = query.options(selectinload(db.DateScrapeStatus.games).selectinload(db.GameScrapeStatus.pitch_apps))
+        return {date_status.id: date_status for date_status in query.all()}
+
+    def get_missing_pitch_app_ids(self):
+        query = (
+            select(
+                [
+                    db.PitchAppScrapeStatus.scrape_status_date_id,
+                    db.PitchAppScrapeStatus.bbref_game_id,
+                    db.PitchAppScrapeStatus.pitch_app_id,
+                ]
+            )
+            .where(db.PitchAppScrapeStatus.scrape_status_date_id.between(self.start_id, self.end_id))
+            .where(db.PitchAppScrapeStatus.scraped_pitchfx == 0)
+            .order_by(db.PitchAppScrapeStatus.id)
+        )
+        missing_pitch_app_ids = defaultdict(lambda: defaultdict(list))
+        for date_id, bbref_game_id, pitch_app_id in self.db_session.execute(query):
+            missing_pitch_app_ids[date_id][bbref_game_id].append(pitch_app_id)
+        return missing_pitch_app_ids
+
+    def get_date_status(self, game_date):
+        return self.dates.get(get_date_status_id(game_date))
+
+    def get_missing_pitch_app_ids_for_date(self, game_date):
+        return self.missing_pitch_app_ids.get(get_date_status_id(game_date), {})
+
+
+def get_date_status_id(game_date):
+    return int(get_date_status_id_from_game_date(game_date))
+
+
+def get_season_status(db_session, year, season_type=SeasonType.REGULAR_SEASON):
+    """Load a season and its status totals with a single query."""
+    season = (
+        db_session.query(db.Season)
+        .options(joinedload(db.Season.status_rollup))
+        .filter_by(season_type=season_type)
+        .filter_by(year=year)
+        .first()
+    )
+    if not season:
+        raise InvalidSeasonException(year)
+    return season
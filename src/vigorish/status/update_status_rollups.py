@@ -0,0 +1,178 @@
+"""Maintain the season, date and game scrape status rollups as the scrape status records are changed."""
+from collections import defaultdict
+
+from sqlalchemy import event, func, inspect, select
+
+import vigorish.database as db
+from vigorish.models.status_rollup import (
+    DATE_STATUS_TOTALS,
+    GAME_STATUS_TOTALS,
+    PITCH_APP_STATUS_TOTALS,
+)
+from vigorish.util.result import Result
+
+STATUS_TOTALS = {
+    db.DateScrapeStatus: DATE_STATUS_TOTALS,
+    db.GameScrapeStatus: GAME_STATUS_TOTALS,
+    db.PitchAppScrapeStatus: PITCH_APP_STATUS_TOTALS,
+}
+
+STATUS_ROLLUP_PARENTS = {
+    db.DateScrapeStatus: [(db.SeasonStatusRollup, "season_id")],
+    db.GameScrapeStatus: [(db.DateStatusRollup, "scrape_status_date_id"), (db.SeasonStatusRollup, "season_id")],
+    db.PitchAppScrapeStatus: [
+        (db.GameStatusRollup, "scrape_status_game_id"),
+        (db.DateStatusRollup, "scrape_status_date_id"),
+        (db.SeasonStatusRollup, "season_id"),
+    ],
+}
+
+STATUS_ROLLUPS = {
+    db.Season: db.SeasonStatusRollup,
+    db.DateScrapeStatus: db.DateStatusRollup,
+    db.GameScrapeStatus: db.GameStatusRollup,
+}
+
+ROLLUP_TOTALS = {
+    db.SeasonStatusRollup: {**DATE_STATUS_TOTALS, **GAME_STATUS_TOTALS, **PITCH_APP_STATUS_TOTALS},
+    db.DateStatusRollup: {**GAME_STATUS_TOTALS, **PITCH_APP_STATUS_TOTALS},
+    db.GameStatusRollup: PITCH_APP_STATUS_TOTALS,
+}
+
+
+def track_status_rollups(db_session):
+    """Update the rollups from the changes made to the scrape status records each time db_session is flushed.
+
+    The update_status_* functions only change the scrape status records, the difference between the old and new
+    value of each column is added to the rollups for the season, date and game that the record belongs to. Changes
+    made without the ORM (e.g., restoring the database from a backup) are not tracked, call rebuild_status_rollups
+    after making changes this way.
+    """
+    if not event.contains(db_session, "before_flush", update_status_rollups):
+        event.listen(db_session, "before_flush", update_status_rollups)
+
+
+def update_status_rollups(db_session, flush_context, instances):
+    rollups = {}
+    for record in list(db_session.new):
+        if type(record) in STATUS_ROLLUPS and not record.status_rollup:
+            record.status_rollup = create_status_rollup(db_session, STATUS_ROLLUPS[type(record)], record.id, rollups)
+    for record in list(db_session.deleted):
+        if type(record) in STATUS_ROLLUPS and record.status_rollup:
+            db_session.delete(record.status_rollup)
+    for (rollup_model, rollup_id), changes in get_status_changes(db_session).items():
+        rollup = get_status_rollup(db_session, rollup_model, rollup_id, rollups)
+        for rollup_col, change in changes.items():
+            if change:
+                setattr(rollup, rollup_col, (getattr(rollup, rollup_col) or 0) + change)
+
+
+def get_status_changes(db_session):
+    status_changes = defaultdict(lambda: defaultdict(int))
+    for status_model, totals in STATUS_TOTALS.items():
+        status_cols = [status_col for status_col in totals.values() if status_col]
+        new = [record for record in db_session.new if isinstance(record, status_model)]
+        dirty = [
+            record
+            for record in db_session.dirty
+            if isinstance(record, status_model) and status_columns_changed(record, status_cols)
+        ]
+        deleted = [record for record in db_session.deleted if isinstance(record, status_model)]
+        if not new and not dirty and not deleted:
+            continue
+        saved_values = get_saved_values(db_session, status_model, status_cols, [r.id for r in dirty + deleted])
+        for record in new + dirty:
+            current_values = {status_col: getattr(record, status_col) for status_col in status_cols}
+            add_status_change(status_changes, record, totals, current_values, 1)
+        for record in dirty + deleted:
+            add_status_change(status_changes, record, totals, saved_values.get(record.id, {}), -1)
+    return status_changes
+
+
+def status_columns_changed(record, status_cols):
+    record_state = inspect(record)
+    return any(record_state.attrs[status_col].history.has_changes() for status_col in status_cols)
+
+
+def get_saved_values(db_session, status_model, status_cols, record_ids):
+    if not record_ids:
+        return {}
+    query = select([status_model.id] + [getattr(status_model, status_col) for status_col in status_cols]).where(
+        status_model.id.in_(record_ids)
+    )
+    return {row.id: dict(row._mapping) for row in db_session.execute(query)}
+
+
+def add_status_change(status_changes, record, totals, values, sign):
+    for rollup_model, parent_id_col in STATUS_ROLLUP_PARENTS[type(record)]:
+        parent_id = getattr(record, parent_id_col)
+        if not parent_id:
+            continue
+        rollup_changes = status_changes[(rollup_model, parent_id)]
+        for rollup_col, status_col in totals.items():
+            rollup_changes[rollup_col] += sign * (int(values.get(status_col) or 0) if status_col else 1)
+
+
+def get_status_rollup(db_session, rollup_model, rollup_id, rollups):
+    if (rollup_model, rollup_id) not in rollups:
+        rollup = db_session.get(rollup_model, rollup_id)
+        if not rollup:
+            rollup = create_status_rollup(db_session, rollup_model, rollup_id, rollups)
+        rollups[(rollup_model, rollup_id)] = rollup
+    return rollups[(rollup_model, rollup_id)]
+
+
+def create_status_rollup(db_session, rollup_model, rollup_id, rollups):
+    rollup = rollup_model(**dict.fromkeys(ROLLUP_TOTALS[rollup_model], 0))
+    db_session.add(rollup)
+    if rollup_id:
+        rollup.id = rollup_id
+        rollups[(rollup_model, rollup_id)] = rollup
+    return rollup
+
+
+def rebuild_status_rollups(db_session):
+    """Replace the contents of the rollup tables with totals calculated from the scrape status tables."""
+    rollup_counts = {}
+    for record_model, rollup_model in STATUS_ROLLUPS.items():
+        rollups = {
+            record_id: {"id": record_id, **dict.fromkeys(ROLLUP_TOTALS[rollup_model], 0)}
+            for record_id in db_session.execute(select([record_model.id])).scalars()
+        }
+        for status_model, parents in STATUS_ROLLUP_PARENTS.items():
+            for parent_id_col in [col for parent_model, col in parents if parent_model == rollup_model]:
+                for row in get_status_totals(db_session, status_model, parent_id_col):
+                    if row.id in rollups:
+                        rollups[row.id].update({col: value or 0 for col, value in row._mapping.items() if col != "id"})
+        db_session.execute(rollup_model.__table__.delete())
+        if rollups:
+            db_session.execute(rollup_model.__table__.insert(), list(rollups.values()))
+        rollup_counts[rollup_model] = len(rollups)
+    db_session.commit()
+    return Result.Ok(rollup_counts)
+
+
+def get_status_totals(db_session, status_model, parent_id_col):
+    parent_id = getattr(status_model, parent_id_col)
+    totals = [
+        (func.sum(getattr(status_model, status_col)) if status_col else func.count(status_model.id)).label(rollup_col)
+        for rollup_col, status_col in STATUS_TOTALS[status_model].items()
+    ]
+    query = select([parent_id.label("id")] + totals).where(parent_id.isnot(None)).group_by(parent_id)
+    return db_session.execute(query)
+
+
+def create_status_rollup_tables(db_session):
+    """Create the rollup tables if they do not exist in a database that was created before they were added."""
+    db_engine = db_session.get_bind()
+    table_names = inspect(db_engine).get_table_names()
+    if "season" not in table_names:
+        return Result.Ok()
+    missing_tables = [
+        rollup_model.__table__ for rollup_model in ROLLUP_TOTALS if rollup_model.__tablename__ not in table_names
+    ]
+    if not missing_tables:
+        return Result.Ok()
+    for table in missing_tables:
+        table.create(db_engine)
+    return rebuild_status_rollups(db_session)
@@ -1,20 +1,32 @@
 from datetime import datetime
 from functools import cached_property
+from time import perf_counter
 
 from events import Events
 
 import vigorish.database as db
 from vigorish.data.game_data import GameData
+from vigorish.data.metrics.pitchfx import get_pfx_metrics_cache
 from vigorish.tasks.base import Task
 from vigorish.util.dt_format_strings import DATE_ONLY_TABLE_ID
 from vigorish.util.result import Result
 from vigorish.util.string_helpers import get_bbref_team_id, validate_bbref_game_id
 
+GAMES_PER_COMMIT = 50
+PFX_INSERT_BATCH_SIZE = 10000
+
 
 class AddToDatabaseTask(Task):
     def __init__(self, app):
         super().__init__(app)
         self._team_id_map = {}
+        self.bulk_insert = False
+        self.games_per_commit = GAMES_PER_COMMIT
+        self.pfx_rows = []
+        self.pfx_player_ids = set()
+        self.pfx_years = set()
+        self.total_pfx_added = 0
+        self.start_time = 0.0
         self.events = Events(
             (
                 "find_all_games_eligible_for_import_start",
@@ -41,6 +53,11 @@ class AddToDatabaseTask(Task):
     def pitch_app_id_map(self):
         return db.PitchAppScrapeStatus.get_pitch_app_id_map(self.db_session)
 
+    @property
+    def pfx_per_sec(self):
+        elapsed = perf_counter() - self.start_time
+        return self.total_pfx_added / elapsed if elapsed else 0.0
+
     def get_team_id_map_for_year(self, year):
         team_id_map_for_year = self._team_id_map.get(year)
         if not team_id_map_for_year:
@@ -48,7 +65,9 @@ class AddToDatabaseTask(Task):
             self._team_id_map[year] = team_id_map_for_year
         return team_id_map_for_year
 
-    def execute(self, year=None):
+    def execute(self, year=None, bulk_insert=False, games_per_commit=GAMES_PER_COMMIT):
+        self.bulk_insert = bulk_insert
+        self.games_per_commit = games_per_commit
         return self.add_data_for_year(year) if year else self.add_all_data()
 
     def add_all_data(self):
@@ -67,10 +86,16 @@ class AddToDatabaseTask(Task):
             return Result.Fail(error)
         self.events.add_data_to_db_start(year, game_ids)
         self.add_data_for_games(year, game_ids)
+        self.scraped_data.invalidate_league_stats(year)
+        self.scraped_data.name_search.update()
         self.events.add_data_to_db_complete(year)
         return Result.Ok()
 
     def add_data_for_games(self, year, game_ids):
+        self.total_pfx_added = 0
+        self.start_time = perf_counter()
+        if self.bulk_insert:
+            return self.add_data_for_games_bulk(year, game_ids)
         for num, game_id in enumerate(game_ids, start=1):
             game_data = GameData(self.app, game_id)
             result = self.add_player_stats_to_database(game_id, game_data)
@@ -79,7 +104,29 @@ class AddToDatabaseTask(Task):
             result = self.add_pitchfx_to_database(game_data)
             if result.failure:
                 return result
-            self.events.add_data_to_db_progress(num, year, game_id)
+            self.events.add_data_to_db_progress(num, year, game_id, self.pfx_per_sec)
+
+    def add_data_for_games_bulk(self, year, game_ids):
+        season_id = self.season_id_map[year]
+        game_status_map = db.GameScrapeStatus.get_game_status_map_for_season(self.db_session, season_id)
+        pitch_app_map = db.PitchAppScrapeStatus.get_pitch_app_status_map_for_season(self.db_session, season_id)
+        for num, game_id in enumerate(game_ids, start=1):
+            game_status = game_status_map.get(game_id)
+            if not game_status:
+                self.commit_bulk_insert()
+                error = f"Import aborted! Game status '{game_id}' not found in database"
+                return Result.Fail(error)
+            game_data = GameData(self.app, game_id)
+            self.add_player_stats_bulk(game_id, game_data, game_status)
+            result = self.add_pitchfx_bulk(game_data, pitch_app_map)
+            if result.failure:
+                self.commit_bulk_insert()
+                return result
+            if num % self.games_per_commit == 0:
+                self.commit_bulk_insert()
+            self.events.add_data_to_db_progress(num, year, game_id, self.pfx_per_sec)
+        self.commit_bulk_insert()
+        return Result.Ok()
 
     def add_player_stats_to_database(self, game_id, game_data):
         game_status = db.GameScrapeStatus.find_by_bbref_game_id(self.db_session, game_id)
@@ -93,6 +140,29 @@ class AddToDatabaseTask(Task):
         return Result.Ok()
 
     def add_bat_stats_to_database(self, game_id, game_data, game_status):
+        self.db_session.add_all(self.get_bat_stats_for_game(game_id, game_data))
+        game_status.imported_bat_stats = 1
+        self.db_session.commit()
+
+    def add_pitch_stats_to_database(self, game_id, game_data, game_status):
+        pitch_stats = self.get_pitch_stats_for_game(game_id, game_data)
+        self.db_session.add_all(pitch_stats)
+        db.PitchStatsToDate.add_pitch_stats(self.db_session, pitch_stats)
+        game_status.imported_pitch_stats = 1
+        self.db_session.commit()
+
+    def add_player_stats_bulk(self, game_id, game_data, game_status):
+        if not game_status.imported_bat_stats:
+            self.db_session.bulk_save_objects(self.get_bat_stats_for_game(game_id, game_data))
+            game_status.imported_bat_stats = 1
+        if not game_status.imported_pitch_stats:
+            pitch_stats = self.get_pitch_stats_for_game(game_id, game_data)
+            self.db_session.bulk_save_objects(pitch_stats)
+            db.PitchStatsToDate.add_pitch_stats(self.db_session, pitch_stats)
+            game_status.imported_pitch_stats = 1
+
+    def get_bat_stats_for_game(self, game_id, game_data):
+        all_bat_stats = []
         for team_boxscore in game_data.bat_boxscore.values():
             for player_boxscore in team_boxscore.values():
                 bat_stats_dict = game_data.get_bat_stats(player_boxscore["mlb_id"]).value
@@ -102,19 +172,16 @@ class AddToDatabaseTask(Task):
                 bat_stats_dict["bat_order"] = player_boxscore["bat_order"]
                 bat_stats_dict["def_position"] = player_boxscore["def_position"]
                 bat_stats = db.BatStats.from_dict(game_id, bat_stats_dict)
-                bat_stats = self.update_player_stats_relationships(bat_stats)
-                self.db_session.add(bat_stats)
-        game_status.imported_bat_stats = 1
-        self.db_session.commit()
+                all_bat_stats.append(self.update_player_stats_relationships(bat_stats))
+        return all_bat_stats
 
-    def add_pitch_stats_to_database(self, game_id, game_data, game_status):
+    def get_pitch_stats_for_game(self, game_id, game_data):
+        all_pitch_stats = []
         for mlb_id in game_data.pitch_stats_player_ids:
             pitch_stats_dict = game_data.get_pitch_app_stats(mlb_id).value
             pitch_stats = db.PitchStats.from_dict(game_id, pitch_stats_dict)
-            pitch_stats = self.update_player_stats_relationships(pitch_stats)
-            self.db_session.add(pitch_stats)
-        game_status.imported_pitch_stats = 1
-        self.db_session.commit()
+            all_pitch_stats.append(self.update_player_stats_relationships(pitch_stats))
+        return all_pitch_stats
 
     def update_player_stats_relationships(self, stats):
         game_date = self.get_game_date_from_bbref_game_id(stats.bbref_game_id)
@@ -135,25 +202,63 @@ class AddToDatabaseTask(Task):
             if pitch_app.imported_pitchfx:
                 continue
             for pfx_dict in pfx_dict_list:
-                pfx = db.PitchFx.from_dict(pfx_dict)
-                pfx = self.update_pitchfx_relationships(pfx)
-                self.db_session.add(pfx)
+                pfx = self.update_pitchfx_relationships(db.PitchFx.get_column_values(pfx_dict))
+                self.db_session.add(db.PitchFx(**pfx))
+                self.pfx_player_ids.update([pfx["pitcher_id_mlb"], pfx["batter_id_mlb"]])
+            self.pfx_years.add(game_data.game_date.year)
             pitch_app.imported_pitchfx = 1
+            self.total_pfx_added += len(pfx_dict_list)
         self.db_session.commit()
+        self.invalidate_pfx_metrics()
         return Result.Ok()
 
+    def add_pitchfx_bulk(self, game_data, pitch_app_map):
+        for pitch_app_id, pfx_dict_list in game_data.all_pitchfx.items():
+            pitch_app = pitch_app_map.get(pitch_app_id)
+            if not pitch_app:
+                error = f"Import aborted! Pitch app '{pitch_app_id}' not found in database"
+                return Result.Fail(error)
+            if pitch_app.imported_pitchfx:
+                continue
+            for pfx_dict in pfx_dict_list:
+                pfx = self.update_pitchfx_relationships(db.PitchFx.get_column_values(pfx_dict))
+                self.pfx_rows.append(pfx)
+                self.pfx_player_ids.update([pfx["pitcher_id_mlb"], pfx["batter_id_mlb"]])
+            self.pfx_years.add(game_data.game_date.year)
+            pitch_app.imported_pitchfx = 1
+            self.total_pfx_added += len(pfx_dict_list)
+        if len(self.pfx_rows) >= PFX_INSERT_BATCH_SIZE:
+            self.insert_pfx_rows()
+        return Result.Ok()
+
+    def insert_pfx_rows(self):
+        if self.pfx_rows:
+            self.db_session.execute(db.PitchFx.__table__.insert(), self.pfx_rows)
+            self.pfx_rows = []
+
+    def commit_bulk_insert(self):
+        self.insert_pfx_rows()
+        self.db_session.commit()
+        self.invalidate_pfx_metrics()
+
+    def invalidate_pfx_metrics(self):
+        if self.pfx_player_ids or self.pfx_years:
+            get_pfx_metrics_cache().invalidate(str(self.db_engine.url), self.pfx_player_ids, self.pfx_years)
+        self.pfx_player_ids = set()
+        self.pfx_years = set()
+
     def update_pitchfx_relationships(self, pfx):
-        game_date = self.get_game_date_from_bbref_game_id(pfx.bbref_game_id)
-        pitcher_team_id_br = get_bbref_team_id(pfx.pitcher_team_id_bb)
-        opponent_team_id_br = get_bbref_team_id(pfx.opponent_team_id_bb)
-        pfx.pitcher_id = self.player_id_map[pfx.pitcher_id_mlb]
-        pfx.batter_id = self.player_id_map[pfx.batter_id_mlb]
-        pfx.team_pitching_id = self.get_team_id_map_for_year(game_date.year)[pitcher_team_id_br]
-        pfx.team_batting_id = self.get_team_id_map_for_year(game_date.year)[opponent_team_id_br]
-        pfx.season_id = self.season_id_map[game_date.year]
-        pfx.date_id = self.get_date_status_id_from_game_date(game_date)
-        pfx.game_status_id = self.game_id_map[pfx.bbref_game_id]
-        pfx.pitch_app_db_id = self.pitch_app_id_map[pfx.pitch_app_id]
+        game_date = self.get_game_date_from_bbref_game_id(pfx["bbref_game_id"])
+        pitcher_team_id_br = get_bbref_team_id(pfx["pitcher_team_id_bb"])
+        opponent_team_id_br = get_bbref_team_id(pfx["opponent_team_id_bb"])
+        pfx["pitcher_id"] = self.player_id_map[pfx["pitcher_id_mlb"]]
+        pfx["batter_id"] = self.player_id_map[pfx["batter_id_mlb"]]
+        pfx["team_pitching_id"] = self.get_team_id_map_for_year(game_date.year)[pitcher_team_id_br]
+        pfx["team_batting_id"] = self.get_team_id_map_for_year(game_date.year)[opponent_team_id_br]
+        pfx["season_id"] = self.season_id_map[game_date.year]
+        pfx["date_id"] = self.get_date_status_id_from_game_date(game_date)
+        pfx["game_status_id"] = self.game_id_map[pfx["bbref_game_id"]]
+        pfx["pitch_app_db_id"] = self.pitch_app_id_map[pfx["pitch_app_id"]]
         return pfx
 
     def get_game_date_from_bbref_game_id(self, bbref_game_id):
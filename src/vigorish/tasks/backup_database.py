@@ -1,14 +1,21 @@
+"""Export the database tables to CSV files in a single compressed zip file."""
+import csv
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from queue import Full, Queue
+from threading import Event
+from time import perf_counter
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from events import Events
-from sqlalchemy import select
+from sqlalchemy import func, null, select
 
 import vigorish.database as db
 from vigorish.tasks.base import Task
-from vigorish.util.dataclass_helpers import serialize_db_object_to_csv
+from vigorish.util.dataclass_helpers import get_csv_value_serializers
 from vigorish.util.dt_format_strings import CSV_UTC, DATE_ONLY, DT_AWARE, FILE_TIMESTAMP
 from vigorish.util.numeric_helpers import ONE_PERCENT
 from vigorish.util.result import Result
@@ -23,120 +30,172 @@ DB_MODEL_TO_CSV_MAP = {
     db.PitchFx: {"dataclass": db.PitchFxCsvRow, "date_format": CSV_UTC},
 }
 
+EXPORT_BATCH_SIZE = 5000
+MAX_QUEUED_BATCHES = 4
+QUEUE_TIMEOUT_SECONDS = 0.1
+
 
 class BackupDatabaseTask(Task):
+    """Stream every table into a CSV file inside a new zip file, without loading a table into memory.
+
+    Each table is read by a separate thread with its own connection, one batch of rows at a time, using keyset
+    pagination (WHERE id > last_id ORDER BY id LIMIT n) so every query is an index range scan. Each batch is
+    converted to CSV text by the thread that read it and placed in a bounded queue for that table. The calling
+    thread writes the queued batches to the zip file one table at a time (a zip file can only be written to one
+    entry at a time), and a thread that gets too far ahead waits for its queue to drain. The memory used is
+    therefore constant no matter how many rows are in the pitchfx table, and the CSV files are compressed as they
+    are written rather than in a second pass.
+    """
+
     def __init__(self, app):
         super().__init__(app)
         self.csv_folder = None
+        self.table_stats = {}
+        self.cancelled = Event()
         self.events = Events(
             (
                 "backup_database_start",
                 "backup_table_start",
                 "backup_table_progress",
                 "backup_table_complete",
-                "create_zip_file_start",
-                "create_zip_file_complete",
                 "backup_database_complete",
             )
         )
 
     def execute(self):
         csv_map = self.get_csv_map()
+        zip_file = self.csv_folder.parent.joinpath(f"{self.csv_folder.name}.zip")
+        self.table_stats = {}
+        self.cancelled.clear()
         self.events.backup_database_start(len(csv_map))
-        for table_num, (table, csv_file) in enumerate(csv_map.items(), start=1):
-            self.events.backup_table_start(table_num, table)
-            self.export_table_to_csv(table, csv_file)
-            self.events.backup_table_complete(table_num, table)
-        self.events.create_zip_file_start()
-        zip_file = self.create_zip_file(csv_map)
-        self.remove_csv_files(csv_map)
-        self.events.create_zip_file_complete()
+        table_queues = {table: Queue(maxsize=MAX_QUEUED_BATCHES) for table in csv_map}
+        with ThreadPoolExecutor(max_workers=len(csv_map)) as executor:
+            for table, batches in table_queues.items():
+                executor.submit(self.export_table, table, batches)
+            try:
+                with ZipFile(zip_file, "w", ZIP_DEFLATED) as zip:
+                    for table_num, (table, csv_file) in enumerate(csv_map.items(), start=1):
+                        self.events.backup_table_start(table_num, table)
+                        arcname = f"{self.csv_folder.name}/{csv_file}"
+                        self.write_table_to_zip(zip, arcname, table_queues[table])
+                        self.events.backup_table_complete(table_num, table, self.table_stats[table])
+            except Exception:
+                self.cancelled.set()
+                zip_file.unlink(missing_ok=True)
+                raise
         self.events.backup_database_complete()
         return Result.Ok(zip_file)
 
     def get_csv_map(self):
-        self.csv_folder = self.create_csv_folder()
+        self.csv_folder = self.get_csv_folder()
         return {
-            db.Player: self.csv_folder.joinpath("new_players.csv"),
-            db.DateScrapeStatus: self.csv_folder.joinpath("scrape_status_date.csv"),
-            db.GameScrapeStatus: self.csv_folder.joinpath("scrape_status_game.csv"),
-            db.PitchAppScrapeStatus: self.csv_folder.joinpath("scrape_status_pitch_app.csv"),
-            db.BatStats: self.csv_folder.joinpath("bat_stats.csv"),
-            db.PitchStats: self.csv_folder.joinpath("pitch_stats.csv"),
-            db.PitchFx: self.csv_folder.joinpath("pitchfx.csv"),
+            db.Player: "new_players.csv",
+            db.DateScrapeStatus: "scrape_status_date.csv",
+            db.GameScrapeStatus: "scrape_status_game.csv",
+            db.PitchAppScrapeStatus: "scrape_status_pitch_app.csv",
+            db.BatStats: "bat_stats.csv",
+            db.PitchStats: "pitch_stats.csv",
+            db.PitchFx: "pitchfx.csv",
         }
 
-    def create_csv_folder(self):
-        backup_folder = self.app.get_current_setting("DB_BACKUP_FOLDER_PATH")
+    def get_csv_folder(self):
+        backup_folder = Path(self.app.get_current_setting("DB_BACKUP_FOLDER_PATH"))
+        backup_folder.mkdir(parents=True, exist_ok=True)
         folder_name = f"{datetime.now(timezone.utc).strftime(FILE_TIMESTAMP)}"
         if os.environ.get("ENV") == "TEST":
             folder_name = "__timestamp__"
-        csv_folder = Path(backup_folder).joinpath(folder_name)
-        csv_folder.mkdir(parents=True)
-        return csv_folder
-
-    def export_table_to_csv(self, table, csv_file):
-        export_query = self.get_table_export_query(table)
-        export_ids = self.get_row_ids_to_export(export_query)
-        total_rows = len(export_ids)
-        if not total_rows:
-            return
-        self.append_to_csv(csv_file, text=self.get_csv_column_names(table))
-        chunk_size, chunk_count, row_count, last_reported = 10000, 0, 0, 0
-        while True:
-            start = chunk_size * chunk_count
-            stop = min(start + chunk_size, total_rows)
-            chunk_ids = export_ids[start:stop]
-            if not chunk_ids:
-                break
-            table_chunk = self.db_session.query(table).filter(table.id.in_(chunk_ids)).all()
-            if len(table_chunk) != len(chunk_ids):
-                error = (
-                    f"len(table_chunk)={len(table_chunk)}, len(chunk_ids)={len(chunk_ids)}\n"
-                    f"table: {table.__tablename__}, total_rows: {total_rows},\n"
-                    f"chunk_count: {chunk_count}, row_count: {row_count}"
-                )
-                raise ValueError(error)
-            self.append_to_csv(csv_file, text=self.create_csv_rows(table_chunk, table))
-            row_count += len(table_chunk)
-            chunk_count += 1
-            last_reported = self.report_progress(row_count, total_rows, last_reported)
-            if row_count == total_rows:
-                break
-
-    def get_table_export_query(self, table):
-        query_map = {
-            db.Player: select([db.Player.id]).where(db.Player.add_to_db_backup),
-            db.DateScrapeStatus: select([db.DateScrapeStatus.id]),
-            db.GameScrapeStatus: select([db.GameScrapeStatus.id]),
-            db.PitchAppScrapeStatus: select([db.PitchAppScrapeStatus.id]),
-            db.BatStats: select([db.BatStats.id]),
-            db.PitchStats: select([db.PitchStats.id]),
-            db.PitchFx: select([db.PitchFx.id]),
-        }
-        return query_map[table]
-
-    def get_row_ids_to_export(self, export_query):
-        return [list(r)[0] for r in self.db_engine.execute(export_query).fetchall() if list(r)[0]]
-
-    def append_to_csv(self, csv_file, text):
-        with csv_file.open("a") as csv:
-            csv.write(f"{text}\n")
-
-    def get_csv_column_names(self, table):
-        csv_dataclass = DB_MODEL_TO_CSV_MAP[table]["dataclass"]
-        return ",".join(list(csv_dataclass.__dataclass_fields__.keys()))
-
-    def create_csv_rows(self, table_chunk, table):
-        csv_rows = [
-            serialize_db_object_to_csv(
-                db_obj,
-                dataclass=DB_MODEL_TO_CSV_MAP[table]["dataclass"],
-                date_format=DB_MODEL_TO_CSV_MAP[table]["date_format"],
-            )
-            for db_obj in table_chunk
+        return backup_folder.joinpath(folder_name)
+
+    def export_table(self, table, batches):
+        """Read all rows from table in batches and put the CSV text for each batch in the queue (worker thread).
+
+        The first item placed in the queue is the total number of rows, and the last item is None (or the exception
+        that was raised, which is re-raised by the thread writing the zip file).
+        """
+        try:
+            start = perf_counter()
+            waiting = 0.0
+            csv_dataclass = DB_MODEL_TO_CSV_MAP[table]["dataclass"]
+            serializers = get_csv_value_serializers(csv_dataclass, DB_MODEL_TO_CSV_MAP[table]["date_format"])
+            columns = self.get_export_columns(table, csv_dataclass)
+            header = self.get_csv_text([list(csv_dataclass.__dataclass_fields__)])
+            row_count = 0
+            with self.db_engine.connect() as conn:
+                total_rows = conn.execute(self.get_row_count_query(table)).scalar()
+                waiting += self.put_in_queue(batches, total_rows)
+                waiting += self.put_in_queue(batches, (0, header))
+                last_id = 0
+                while True:
+                    rows = conn.execute(self.get_table_export_query(table, columns, last_id)).fetchall()
+                    if not rows:
+                        break
+                    csv_rows = ([serialize(val) for (serialize, val) in zip(serializers, row)] for row in rows)
+                    waiting += self.put_in_queue(batches, (len(rows), self.get_csv_text(csv_rows)))
+                    row_count += len(rows)
+                    last_id = rows[-1][0]
+            elapsed = perf_counter() - start - waiting
+            self.table_stats[table] = {
+                "rows": row_count,
+                "seconds": elapsed,
+                "rows_per_sec": row_count / elapsed if elapsed else 0.0,
+            }
+            self.put_in_queue(batches, None)
+        except Exception as ex:
+            if not self.cancelled.is_set():
+                self.put_in_queue(batches, ex)
+
+    def get_export_columns(self, table, csv_dataclass):
+        table_columns = table.__table__.columns
+        return [
+            table_columns[name] if name in table_columns else null().label(name)
+            for name in csv_dataclass.__dataclass_fields__
         ]
-        return "\n".join(csv_rows)
+
+    def get_row_count_query(self, table):
+        query = select([func.count(table.id)])
+        return query.where(db.Player.add_to_db_backup) if table is db.Player else query
+
+    def get_table_export_query(self, table, columns, last_id):
+        query = select(columns).where(table.id > last_id)
+        if table is db.Player:
+            query = query.where(db.Player.add_to_db_backup)
+        return query.order_by(table.id).limit(EXPORT_BATCH_SIZE)
+
+    def get_csv_text(self, rows):
+        csv_text = io.StringIO()
+        csv.writer(csv_text, lineterminator="\n").writerows(rows)
+        return csv_text.getvalue().encode("utf-8")
+
+    def put_in_queue(self, batches, item):
+        """Wait until there is room in the queue for item and return the number of seconds spent waiting."""
+        start = perf_counter()
+        while not self.cancelled.is_set():
+            try:
+                batches.put(item, timeout=QUEUE_TIMEOUT_SECONDS)
+                return perf_counter() - start
+            except Full:
+                continue
+        raise InterruptedError("Backup was cancelled")
+
+    def write_table_to_zip(self, zip, arcname, batches):
+        total_rows = self.get_from_queue(batches)
+        row_count, last_reported = 0, 0
+        with zip.open(arcname, "w", force_zip64=True) as csv_file:
+            while True:
+                batch = self.get_from_queue(batches)
+                if batch is None:
+                    break
+                (batch_rows, csv_text) = batch
+                csv_file.write(csv_text)
+                row_count += batch_rows
+                if total_rows:
+                    last_reported = self.report_progress(row_count, total_rows, last_reported)
+
+    def get_from_queue(self, batches):
+        item = batches.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
 
     def report_progress(self, count, total, last_reported):
         percent_complete = count / float(total)
@@ -144,16 +203,3 @@ class BackupDatabaseTask(Task):
             self.events.backup_table_progress(percent_complete)
             last_reported = percent_complete
         return last_reported
-
-    def create_zip_file(self, csv_map):
-        zip_file = self.csv_folder.parent.joinpath(f"{self.csv_folder.name}.zip")
-        with ZipFile(zip_file, "w", ZIP_DEFLATED) as zip:
-            for csv_file in csv_map.values():
-                arcname = f"{self.csv_folder.name}/{csv_file.name}"
-                zip.write(csv_file, arcname=arcname)
-        return zip_file
-
-    def remove_csv_files(self, csv_map):
-        for csv_file in csv_map.values():
-            csv_file.unlink()
-        self.csv_folder.rmdir()
@@ -51,8 +51,10 @@ class CombineScrapedDataTask(Task):
     save_combined_data_success: bool
     error_messages: list[str]
 
-    def __init__(self, app):
+    def __init__(self, app, add_new_players=True):
         super().__init__(app)
+        self.add_new_players = add_new_players
+        self.new_players = {}
 
     @property
     def away_team_id_br(self):
@@ -76,6 +78,7 @@ class CombineScrapedDataTask(Task):
         self.write_json = write_json
         self.update_db = update_db
         self.error_messages = []
+        self.new_players = {}
         result = (
             self.gather_scraped_data()
             .on_failure(self.gather_scraped_data_failed)
@@ -93,9 +96,35 @@ class CombineScrapedDataTask(Task):
         )
         return result.value
 
+    def save_results(self, bbref_game_id, results, write_json=True, update_db=True):
+        """Save the results of calling execute(write_json=False, update_db=False) for a game, usually in another
+        process, and return the same value that execute() would have returned with write_json/update_db enabled.
+        """
+        if not results["gather_scraped_data_success"]:
+            return results
+        self.bbref_game_id = bbref_game_id
+        self.write_json = write_json
+        self.update_db = update_db
+        self.error_messages = []
+        self.gather_scraped_data_success = True
+        self.game_status = db.GameScrapeStatus.find_by_bbref_game_id(self.db_session, self.bbref_game_id)
+        if results["combined_data_success"]:
+            self.update_game_start_time_from_combined_data(results["boxscore"])
+        result = (
+            (Result.Ok(results["boxscore"]) if results["combined_data_success"] else Result.Fail(results["error"]))
+            .on_both(self.update_game_status)
+            .on_failure(self.combined_data_failed)
+            .on_success(self.save_combined_data)
+            .on_failure(self.save_combined_data_failed)
+            .on_success(self.check_update_db)
+            .on_success(self.update_pitch_app_status)
+        )
+        return result.value
+
     def investigate(self, bbref_game_id, apply_patch_list=False):
         self.bbref_game_id = bbref_game_id
         self.apply_patch_list = apply_patch_list
+        self.update_db = True
         result = self.gather_scraped_data()
         if result.failure:
             return {"gather_scraped_data_success": False, "error": result.error}
@@ -182,7 +211,15 @@ class CombineScrapedDataTask(Task):
         self.game_status.game_time_hour = game_start_time.hour
         self.game_status.game_time_minute = game_start_time.minute
         self.game_status.game_time_zone = "America/New_York"
-        self.db_session.commit()
+        if self.update_db:
+            self.db_session.commit()
+
+    def update_game_start_time_from_combined_data(self, combined_data):
+        if not self.update_db or self.game_status.game_start_time:
+            return
+        self.game_status.game_time_hour = combined_data["game_meta_info"]["game_time_hour"]
+        self.game_status.game_time_minute = combined_data["game_meta_info"]["game_time_minute"]
+        self.game_status.game_time_zone = "America/New_York"
 
     def get_all_pbp_events_for_game(self):
         result = self.get_player_id_dict_for_game()
@@ -232,18 +269,37 @@ class CombineScrapedDataTask(Task):
             name = split[0].strip()
             team_id = split[1].strip()
             player = db.PlayerId.find_by_bbref_id(self.db_session, bbref_id)
-            if not player:
-                result = ScrapeMlbPlayerInfoTask(self.app).execute(name, bbref_id, self.boxscore.game_date)
+            if player:
+                mlb_id = player.mlb_id
+            else:
+                result = self.add_new_player(name, bbref_id)
                 if result.failure:
                     return result
-                player = result.value
+                mlb_id = result.value
             player_id_dict[bbref_id] = {
                 "name": name,
-                "mlb_id": player.mlb_id,
+                "mlb_id": mlb_id,
                 "team_id_bbref": team_id,
             }
+        if self.new_players:
+            return Result.Fail(f"Players must be added to the database: {', '.join(sorted(self.new_players))}")
         return Result.Ok(player_id_dict)
 
+    def add_new_player(self, name, bbref_id):
+        """Scrape the info for a player that is not in the database and return the player's MLB ID.
+
+        If add_new_players is False, the player is not added to the database. The values for the new player row
+        are stored in new_players and the game cannot be combined until the caller has added them.
+        """
+        if self.add_new_players:
+            result = ScrapeMlbPlayerInfoTask(self.app).execute(name, bbref_id, self.boxscore.game_date)
+            return result if result.failure else Result.Ok(result.value.mlb_id)
+        result = ScrapeMlbPlayerInfoTask(self.app).execute(name, bbref_id, self.boxscore.game_date, add_to_db=False)
+        if result.failure:
+            return result
+        self.new_players[bbref_id] = result.value
+        return Result.Ok(result.value["mlb_id"])
+
     def get_all_events(self):
         game_events = flatten_list2d([inning.game_events for inning in self.boxscore.innings_list])
         substitutions = flatten_list2d([inning.substitutions for inning in self.boxscore.innings_list])
@@ -1409,7 +1465,7 @@ class CombineScrapedDataTask(Task):
         }
         return result
 
-    def check_update_db(self, value):
+    def check_update_db(self, value=None):
         self.save_combined_data_success = True
         if self.update_db:
             return Result.Ok()
@@ -0,0 +1,129 @@
+"""Combine scraped data for many games at once using a pool of worker processes."""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import vigorish.database as db
+from vigorish.config.config_file import ConfigFile
+from vigorish.config.dotenv_file import DotEnvFile
+from vigorish.data.scraped_data import ScrapedData
+from vigorish.tasks.base import Task
+from vigorish.tasks.combine_scraped_data import CombineScrapedDataTask
+from vigorish.tasks.scrape_mlb_player_info import ScrapeMlbPlayerInfoTask
+from vigorish.util.result import Result
+
+_worker_task = None
+
+
+def get_combine_data_worker_count():
+    workers = os.environ.get("COMBINE_DATA_WORKERS", "")
+    return int(workers) if workers.isdigit() and int(workers) > 0 else 1
+
+
+class CombineDataWorkerApp:
+    """The application state that CombineScrapedDataTask needs in a worker process.
+
+    Unlike Vigorish, creating it does not run any migrations or status rollup setup. SQLite connections are set
+    to query_only, so any attempt by a worker to write to the database fails instead of competing with the
+    process that calls CombineScrapedDataParallelTask.execute().
+    """
+
+    def __init__(self, dotenv_filepath, db_url):
+        self.dotenv = DotEnvFile(dotenv_filepath=dotenv_filepath)
+        self.config = ConfigFile()
+        self.db_url = db_url
+        self.db_engine = create_engine(db_url, connect_args={"check_same_thread": False})
+        if self.db_engine.url.get_backend_name() == "sqlite":
+            event.listen(self.db_engine, "connect", set_query_only)
+        self.db_session = sessionmaker(bind=self.db_engine, autoflush=False)()
+        self.scraped_data = ScrapedData(self.db_engine, self.db_session, self.config)
+
+
+def set_query_only(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA query_only = ON")
+
+
+def _init_worker(dotenv_filepath, db_url):
+    global _worker_task
+    _worker_task = CombineScrapedDataTask(CombineDataWorkerApp(dotenv_filepath, db_url), add_new_players=False)
+
+
+def _combine_data_for_game(bbref_game_id, apply_patch_list):
+    results = _worker_task.execute(bbref_game_id, apply_patch_list, write_json=False, update_db=False)
+    _worker_task.db_session.rollback()
+    return (results, list(_worker_task.new_players.values()))
+
+
+class CombineScrapedDataParallelTask(Task):
+    """Combine scraped data for a list of games, spreading the CPU-bound work across multiple processes.
+
+    Worker processes decode the scraped data, match play-by-play events to PitchFX data and audit the result
+    for each game without writing anything. The process that calls execute() is the only writer: it saves the
+    combined data JSON files and updates the game/pitch app status records as each game is completed. If a
+    worker finds players that are not in the database, it scrapes their info and returns it instead of
+    combining the game. This process adds the players to the database and submits the game again (once).
+    """
+
+    def __init__(self, app, max_workers=None):
+        super().__init__(app)
+        self.max_workers = max_workers or get_combine_data_worker_count()
+        self.combine_data = CombineScrapedDataTask(app)
+        self._pool = None
+
+    @property
+    def pool(self):
+        if not self._pool:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.app.dotenv_filepath, self.app.db_url),
+            )
+        return self._pool
+
+    def execute(self, bbref_game_ids, apply_patch_list=True, write_json=True, update_db=True):
+        return dict(self.combine_games(bbref_game_ids, apply_patch_list, write_json, update_db))
+
+    def combine_games(self, bbref_game_ids, apply_patch_list=True, write_json=True, update_db=True):
+        """Yield (bbref_game_id, results) for each game in the order that they are completed, where results is the
+        same dict returned by CombineScrapedDataTask.execute.
+        """
+        futures = {
+            self.pool.submit(_combine_data_for_game, bbref_game_id, apply_patch_list): bbref_game_id
+            for bbref_game_id in bbref_game_ids
+        }
+        resubmitted = set()
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    bbref_game_id = futures.pop(future)
+                    (results, new_players) = future.result()
+                    if new_players and bbref_game_id not in resubmitted:
+                        result = self.add_new_players(new_players)
+                        if result.success:
+                            resubmitted.add(bbref_game_id)
+                            future = self.pool.submit(_combine_data_for_game, bbref_game_id, apply_patch_list)
+                            futures[future] = bbref_game_id
+                            continue
+                        results = {"gather_scraped_data_success": False, "error": result.error}
+                    results = self.combine_data.save_results(bbref_game_id, results, write_json, update_db)
+                    yield (bbref_game_id, results)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def add_new_players(self, new_players):
+        for player_dict in new_players:
+            if db.PlayerId.find_by_bbref_id(self.db_session, player_dict["bbref_id"]):
+                continue
+            result = ScrapeMlbPlayerInfoTask(self.app).add_player_to_database(player_dict)
+            if result.failure:
+                return result
+        return Result.Ok()
+
+    def shutdown(self):
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -100,8 +100,7 @@ class ImportScrapedDataTask(Task):
         )
         for pitch_app_id in invalid_ids:
             invalid_pitchfx_log = Path(pfx_folderpath).joinpath(f"{pitch_app_id}.json")
-            if invalid_pitchfx_log.exists():
-                invalid_pitchfx_log.unlink()
+            self.scraped_data.file_helper.delete_file(invalid_pitchfx_log)
 
     def _import_scraped_data(self, mlb_season_map, overwrite_existing):
         self.events.import_scraped_data_start()
@@ -0,0 +1,18 @@
+"""Recalculate the running season totals for each pitcher from the pitch_stats table."""
+from events import Events
+
+import vigorish.database as db
+from vigorish.tasks.base import Task
+
+
+class RebuildPitchStatsToDateTask(Task):
+    def __init__(self, app):
+        super().__init__(app)
+        self.events = Events(("rebuild_pitch_stats_to_date_start", "rebuild_pitch_stats_to_date_complete"))
+
+    def execute(self, year=None):
+        season_id = db.Season.find_by_year(self.db_session, year).id if year else None
+        self.events.rebuild_pitch_stats_to_date_start(year)
+        result = db.PitchStatsToDate.rebuild(self.db_session, season_id)
+        self.events.rebuild_pitch_stats_to_date_complete(result.value)
+        return result
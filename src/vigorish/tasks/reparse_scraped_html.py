@@ -0,0 +1,146 @@
+"""Re-parse a season of cached HTML in worker processes, saving the parsed data from the parent process."""
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from pathlib import Path
+
+from vigorish.enums import DataSet, VigFile
+from vigorish.scrape.bbref_boxscores.parse_html import parse_bbref_boxscore
+from vigorish.scrape.brooks_pitchfx.parse_html import parse_pitchfx_log
+from vigorish.status.status_batch import StatusUpdateBatch
+from vigorish.status.update_status_bbref_boxscores import update_status_bbref_boxscore
+from vigorish.status.update_status_brooks_pitchfx import update_status_brooks_pitchfx_log
+from vigorish.tasks.base import Task
+from vigorish.util.result import Result
+from vigorish.util.string_helpers import validate_bbref_game_id, validate_pitch_app_id
+
+REPARSE_DATA_SETS = [DataSet.BBREF_BOXSCORES, DataSet.BROOKS_PITCHFX]
+
+
+def _parse_bbref_boxscore(html_path, url, bbref_game_id):
+    return parse_bbref_boxscore(Path(html_path).read_text(), url, bbref_game_id)
+
+
+def _parse_pitchfx_log(html_path, pitch_log):
+    return parse_pitchfx_log(Path(html_path).read_text(), pitch_log)
+
+
+class ReparseScrapedHtmlTask(Task):
+    """Parse every cached HTML file for a season again, e.g., after a bug in a parser has been fixed.
+
+    Parsing is CPU-bound, so each HTML file is parsed in a worker process. The parsed dataclasses are sent back
+    to the parent process, which saves the JSON files and updates the scrape status records in batches. Only
+    HTML files stored in the local folder are parsed, the IDs of any files that cannot be retrieved are reported
+    as missing_html instead of being parsed.
+    """
+
+    def __init__(self, app, max_workers=None):
+        super().__init__(app)
+        self.max_workers = max_workers or os.cpu_count()
+        self.status_batch = StatusUpdateBatch(self.db_session)
+        self.update_status = {
+            DataSet.BBREF_BOXSCORES: update_status_bbref_boxscore,
+            DataSet.BROOKS_PITCHFX: update_status_brooks_pitchfx_log,
+        }
+
+    def execute(self, year, data_sets=None):
+        data_sets = data_sets or REPARSE_DATA_SETS
+        invalid_data_sets = [str(data_set) for data_set in data_sets if data_set not in REPARSE_DATA_SETS]
+        if invalid_data_sets:
+            return Result.Fail(f"Re-parsing HTML is not supported for data set(s): {', '.join(invalid_data_sets)}")
+        reparse_results = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            for data_set in data_sets:
+                reparse_results[data_set] = self.reparse_data_set(pool, data_set, year)
+        return Result.Ok(reparse_results)
+
+    def reparse_data_set(self, pool, data_set, year):
+        start = time.perf_counter()
+        (parse_tasks, missing_html) = self.get_parse_tasks(data_set, year)
+        futures = {pool.submit(*parse_task): url_id for url_id, parse_task in parse_tasks.items()}
+        errors = {}
+        for future in as_completed(futures):
+            url_id = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = Result.Fail(f"Error occurred parsing HTML: {repr(e)}")
+            if result.success:
+                result = self.save_parsed_data(data_set, url_id, result.value)
+            if result.failure:
+                errors[url_id] = result.error
+        self.status_batch.commit()
+        elapsed = time.perf_counter() - start
+        return {
+            "total_pages": len(parse_tasks),
+            "parsed": len(parse_tasks) - len(errors),
+            "errors": errors,
+            "missing_html": missing_html,
+            "elapsed": elapsed,
+            "pages_per_sec": len(parse_tasks) / elapsed if elapsed else 0.0,
+        }
+
+    def get_parse_tasks(self, data_set, year):
+        url_ids = self.scraped_data.get_scraped_ids_from_local_folder(VigFile.SCRAPED_HTML, data_set, year)
+        missing_html = []
+        if data_set == DataSet.BBREF_BOXSCORES:
+            parse_tasks = self.get_parse_tasks_bbref_boxscores(url_ids, missing_html)
+        else:
+            parse_tasks = self.get_parse_tasks_brooks_pitchfx(url_ids, missing_html)
+        return (parse_tasks, sorted(missing_html))
+
+    def get_parse_tasks_bbref_boxscores(self, bbref_game_ids, missing_html):
+        parse_tasks = {}
+        for game_date, game_ids in self.group_by_game_date(bbref_game_ids, validate_bbref_game_id).items():
+            games_for_date = self.scraped_data.get_bbref_games_for_date(game_date)
+            if not games_for_date:
+                continue
+            boxscore_urls = {game_info.bbref_game_id: game_info.url for game_info in games_for_date.games}
+            for bbref_game_id in game_ids:
+                if bbref_game_id not in boxscore_urls:
+                    continue
+                html_path = self.scraped_data.get_html(DataSet.BBREF_BOXSCORES, bbref_game_id)
+                if not html_path:
+                    missing_html.append(bbref_game_id)
+                    continue
+                url = boxscore_urls[bbref_game_id]
+                parse_tasks[bbref_game_id] = (_parse_bbref_boxscore, str(html_path), url, bbref_game_id)
+        return parse_tasks
+
+    def get_parse_tasks_brooks_pitchfx(self, pitch_app_ids, missing_html):
+        parse_tasks = {}
+        for game_date, pitch_app_ids_for_date in self.group_by_game_date(pitch_app_ids, validate_pitch_app_id).items():
+            pitch_logs = {
+                pitch_log.pitch_app_id: pitch_log
+                for pitch_logs_for_game in self.scraped_data.get_all_brooks_pitch_logs_for_date(game_date)
+                for pitch_log in pitch_logs_for_game.pitch_logs
+            }
+            for pitch_app_id in pitch_app_ids_for_date:
+                pitch_log = pitch_logs.get(pitch_app_id)
+                if not pitch_log or not pitch_log.parsed_all_info:
+                    continue
+                html_path = self.scraped_data.get_html(DataSet.BROOKS_PITCHFX, pitch_app_id)
+                if not html_path:
+                    missing_html.append(pitch_app_id)
+                    continue
+                parse_tasks[pitch_app_id] = (_parse_pitchfx_log, str(html_path), pitch_log)
+        return parse_tasks
+
+    def group_by_game_date(self, url_ids, validate_url_id):
+        url_ids_by_date = defaultdict(list)
+        for url_id in url_ids:
+            result = validate_url_id(url_id)
+            if result.success:
+                url_ids_by_date[result.value["game_date"]].append(url_id)
+        return url_ids_by_date
+
+    def save_parsed_data(self, data_set, url_id, parsed_data):
+        result = self.scraped_data.save_json(data_set, parsed_data)
+        if result.failure:
+            return result
+        result = self.update_status[data_set](self.db_session, parsed_data)
+        if result.failure:
+            return result
+        self.status_batch.add(url_id)
+        return Result.Ok()
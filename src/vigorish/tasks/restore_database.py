@@ -7,8 +7,17 @@ from dataclass_csv import DataclassReader
 from events import Events
 
 import vigorish.database as db
+from vigorish.data.metrics.pitchfx import get_pfx_metrics_cache
 from vigorish.enums import DataSet
+from vigorish.status.update_status_rollups import rebuild_status_rollups
 from vigorish.tasks.base import Task
+from vigorish.util.bulk_load import (
+    bulk_insert,
+    deferred_indexes,
+    read_csv_column_batches,
+    sqlite_bulk_load_pragmas,
+)
+from vigorish.util.dataclass_helpers import get_csv_column_parsers
 from vigorish.util.result import Result
 from vigorish.util.string_helpers import (
     get_bbref_team_id,
@@ -40,6 +49,16 @@ BATCH_SIZE = 20000
 
 
 class RestoreDatabaseTask(Task):
+    """Replace the contents of the database with the tables stored in a backup zip file.
+
+    By default, the CSV files are read directly from the zip file and loaded in bulk: each batch of rows is parsed
+    and mapped to the foreign keys of the new database one column at a time (each distinct value is looked up once),
+    all rows for a table are inserted in a single transaction, the secondary indexes of each table are created after
+    the table is loaded, and SQLite pragmas that favor throughput over durability are applied for the duration of
+    the load. With bulk_load=False, the CSV files are extracted and each row is converted by DataclassReader and the
+    update_*_relationships methods (the original implementation).
+    """
+
     def __init__(self, app):
         super().__init__(app)
         backup_folder_setting = self.config.all_settings.get("DB_BACKUP_FOLDER_PATH")
@@ -87,6 +106,18 @@ class RestoreDatabaseTask(Task):
             db.PitchFxCsvRow: self.update_pitchfx_relationships,
         }
 
+    @property
+    def map_columns_map(self):
+        return {
+            db.PlayerCsvRow: self.map_player_columns,
+            db.DateScrapeStatusCsvRow: self.map_date_status_columns,
+            db.GameScrapeStatusCsvRow: self.map_game_status_columns,
+            db.PitchAppScrapeStatusCsvRow: self.map_pitch_app_status_columns,
+            db.BatStatsCsvRow: self.map_bat_stats_columns,
+            db.PitchStatsCsvRow: self.map_pitch_stats_columns,
+            db.PitchFxCsvRow: self.map_pitchfx_columns,
+        }
+
     def get_team_id_map_for_year(self, year):
         team_id_map_for_year = self._team_id_map.get(year)
         if not team_id_map_for_year:
@@ -155,12 +186,72 @@ class RestoreDatabaseTask(Task):
         pfx_dict["pitch_app_db_id"] = self.pitch_app_id_map[pfx_dict["pitch_app_id"]]
         return pfx_dict
 
-    def execute(self, zip_file=None, csv_folder=None):
+    def map_player_columns(self, columns):
+        return columns
+
+    def map_date_status_columns(self, columns):
+        columns["season_id"] = map_values(lambda game_date: self.season_id_map[game_date.year], columns["game_date"])
+        return columns
+
+    def map_game_status_columns(self, columns):
+        columns = self.map_date_status_columns(columns)
+        columns["scrape_status_date_id"] = map_values(get_date_status_id_from_game_date, columns["game_date"])
+        return columns
+
+    def map_pitch_app_status_columns(self, columns):
+        game_dates = map_values(get_game_date_from_bbref_game_id, columns["bbref_game_id"])
+        columns["pitcher_id"] = map_values(self.player_id_map.__getitem__, columns["pitcher_id_mlb"])
+        columns["season_id"] = map_values(lambda game_date: self.season_id_map[game_date.year], game_dates)
+        columns["scrape_status_date_id"] = map_values(get_date_status_id_from_game_date, game_dates)
+        columns["scrape_status_game_id"] = map_values(self.game_id_map.__getitem__, columns["bbref_game_id"])
+        return columns
+
+    def map_player_stats_columns(self, columns):
+        game_dates = map_values(get_game_date_from_bbref_game_id, columns["bbref_game_id"])
+        columns["player_id"] = map_values(self.player_id_map.__getitem__, columns["player_id_mlb"])
+        columns["player_team_id"] = self.map_team_ids(game_dates, columns["player_team_id_bbref"])
+        columns["opponent_team_id"] = self.map_team_ids(game_dates, columns["opponent_team_id_bbref"])
+        columns["season_id"] = map_values(lambda game_date: self.season_id_map[game_date.year], game_dates)
+        columns["date_id"] = map_values(get_date_status_id_from_game_date, game_dates)
+        columns["game_status_id"] = map_values(self.game_id_map.__getitem__, columns["bbref_game_id"])
+        return columns
+
+    def map_bat_stats_columns(self, columns):
+        return self.map_player_stats_columns(columns)
+
+    def map_pitch_stats_columns(self, columns):
+        columns = self.map_player_stats_columns(columns)
+        columns["pitch_app_db_id"] = map_values(self.pitch_app_id_map.__getitem__, columns["pitch_app_id"])
+        return columns
+
+    def map_pitchfx_columns(self, columns):
+        game_dates = map_values(get_game_date_from_bbref_game_id, columns["bbref_game_id"])
+        pitcher_team_ids = map_values(get_bbref_team_id, columns["pitcher_team_id_bb"])
+        opponent_team_ids = map_values(get_bbref_team_id, columns["opponent_team_id_bb"])
+        columns["pitcher_id"] = map_values(self.player_id_map.__getitem__, columns["pitcher_id_mlb"])
+        columns["batter_id"] = map_values(self.player_id_map.__getitem__, columns["batter_id_mlb"])
+        columns["team_pitching_id"] = self.map_team_ids(game_dates, pitcher_team_ids)
+        columns["team_batting_id"] = self.map_team_ids(game_dates, opponent_team_ids)
+        columns["season_id"] = map_values(lambda game_date: self.season_id_map[game_date.year], game_dates)
+        columns["date_id"] = map_values(get_date_status_id_from_game_date, game_dates)
+        columns["game_status_id"] = map_values(self.game_id_map.__getitem__, columns["bbref_game_id"])
+        columns["pitch_app_db_id"] = map_values(self.pitch_app_id_map.__getitem__, columns["pitch_app_id"])
+        return columns
+
+    def map_team_ids(self, game_dates, team_ids_br):
+        return map_values(
+            lambda date_team: self.get_team_id_map_for_year(date_team[0].year)[date_team[1]],
+            list(zip(game_dates, team_ids_br)),
+        )
+
+    def execute(self, zip_file=None, csv_folder=None, bulk_load=True):
         if not zip_file:
             result = self.get_most_recent_backup()
             if result.failure:
                 return result
             zip_file = result.value
+        if bulk_load:
+            return self.bulk_load_backup(Path(zip_file), csv_folder)
         self.events.unzip_backup_files_start()
         self.csv_map = self.unzip_csv_files(zip_file)
         self.events.unzip_backup_files_complete()
@@ -173,6 +264,35 @@ class RestoreDatabaseTask(Task):
         self.events.restore_database_complete()
         return Result.Ok()
 
+    def bulk_load_backup(self, zip_file, csv_folder=None):
+        result = self.app.prepare_database_for_restore(csv_folder)
+        if result.failure:
+            return result
+        self.events.restore_database_start()
+        with ZipFile(zip_file, mode="r") as zip, self.db_engine.connect() as conn:
+            with sqlite_bulk_load_pragmas(conn):
+                for num in sorted(RESTORE_TABLE_ORDER.keys()):
+                    (dataclass, db_table) = RESTORE_TABLE_ORDER[num]
+                    arcname = f"{zip_file.stem}/{DATACLASS_CSV_MAP[dataclass]}"
+                    self.events.restore_table_start(db_table)
+                    with zip.open(arcname) as csv_file:
+                        self.bulk_load_table_from_csv(conn, csv_file, dataclass, db_table)
+                    self.events.restore_table_complete(db_table)
+        rebuild_status_rollups(self.db_session)
+        db.PitchStatsToDate.rebuild(self.db_session)
+        get_pfx_metrics_cache().invalidate(str(self.db_engine.url))
+        self.scraped_data.invalidate_league_stats()
+        self.events.restore_database_complete()
+        return Result.Ok()
+
+    def bulk_load_table_from_csv(self, conn, csv_file, dataclass, db_table):
+        column_parsers = get_csv_column_parsers(dataclass)
+        with deferred_indexes(conn, db_table.__table__), conn.begin():
+            batches = read_csv_column_batches(csv_file, column_parsers, BATCH_SIZE)
+            for batch_count, columns in enumerate(batches, start=1):
+                bulk_insert(conn, db_table.__table__, self.map_columns_map[dataclass](columns))
+                self.events.batch_insert_performed(batch_count)
+
     def get_most_recent_backup(self):
         backup_zip_files = list(Path(self.backup_folder).glob("*.zip"))
         if not backup_zip_files:
@@ -193,6 +313,10 @@ class RestoreDatabaseTask(Task):
             self.events.restore_table_start(db_table)
             self.restore_table_from_csv(csv_file, dataclass, db_table)
             self.events.restore_table_complete(db_table)
+        rebuild_status_rollups(self.db_session)
+        db.PitchStatsToDate.rebuild(self.db_session)
+        get_pfx_metrics_cache().invalidate(str(self.db_engine.url))
+        self.scraped_data.invalidate_league_stats()
 
     def restore_table_from_csv(self, csv_file, dataclass, db_table):
         with open(csv_file) as csv:
@@ -220,3 +344,9 @@ class RestoreDatabaseTask(Task):
         for csv_file in self.csv_map.values():
             csv_file.unlink()
         self.csv_folder.rmdir()
+
+
+def map_values(func, values):
+    """Return [func(value) for value in values], calling func only once for each distinct value."""
+    mapped = {value: func(value) for value in set(values)}
+    return list(map(mapped.__getitem__, values))
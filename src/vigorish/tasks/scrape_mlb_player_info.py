@@ -107,17 +107,20 @@ class ScrapeMlbPlayerInfoTask(Task):
         except SQLAlchemyError as e:  # pragma: no cover
             return Result.Fail(f"Error: {repr(e)}")
 
-    def execute(self, name, bbref_id, game_date):
+    def execute(self, name, bbref_id, game_date, add_to_db=True):
+        """Scrape the player's info and add the player to the database. If add_to_db is False, the player is not
+        added and the dict of values for the new player row is returned instead.
+        """
         name = remove_accents(name)
         self.name = name
-        return (
+        result = (
             self.get_search_url(name)
             .on_success(request_url_with_retries)
             .on_success(self.decode_json_response)
             .on_success(self.get_player_data, name, game_date)
             .on_success(self.parse_player_data, bbref_id)
-            .on_success(self.add_player_to_database)
         )
+        return result.on_success(self.add_player_to_database) if add_to_db else result
 
     def get_search_url(self, name):
         self.events.scrape_player_info_start(name)
@@ -13,6 +13,7 @@ from vigorish.enums import DataSet, SyncDirection, VigFile
 from vigorish.tasks.base import Task
 from vigorish.tasks.sync_scraped_data import SyncScrapedDataTask
 from vigorish.util.result import Result
+from vigorish.util.sys_helpers import file_size_str
 
 SYNC_STATUS_TEXT_COLOR = {
     "out_of_sync": "bright_green",
@@ -101,18 +102,6 @@ class SyncDataNoPromptsTask(Task):
         self.sync_results.append((error_message, SYNC_STATUS_TEXT_COLOR["error"]))
         self.results[self.data_set] = Result.Fail(error_message)
 
-    def get_s3_objects_start(self):
-        subprocess.run(["clear"])
-        self.spinners["default"] = Halo(
-            spinner=get_random_dots_spinner(),
-            color=get_random_cli_color(),
-            text="Retrieving data for all objects stored in S3...",
-        )
-        self.spinners["default"].start()
-
-    def get_s3_objects_complete(self):
-        self.spinners["default"].stop()
-
     def find_out_of_sync_files_start(self):
         self.spinners[self.data_set] = Halo(
             spinner=get_random_dots_spinner(),
@@ -148,16 +137,18 @@ class SyncDataNoPromptsTask(Task):
         progress_message = f"{direction}loading: {name} | {percent:.0%} ({complete}/{total} Files)"
         self.spinners[self.data_set].text = progress_message
 
-    def sync_files_complete(self):
+    def sync_files_complete(self, sync_stats):
         dest_folder = "local folder" if self.sync_direction == SyncDirection.DOWN_TO_LOCAL else "s3 bucket"
         src_folder = "s3 bucket" if self.sync_direction == SyncDirection.DOWN_TO_LOCAL else "local folder"
-        sync_complete = f"[{self.year} {self.file_type} {self.data_set}] {dest_folder} is in sync with {src_folder}!"
+        sync_complete = (
+            f"[{self.year} {self.file_type} {self.data_set}] {dest_folder} is in sync with {src_folder}! "
+            f"({sync_stats['files']} files, {file_size_str(sync_stats['bytes'])} in {sync_stats['seconds']:.1f}s, "
+            f"{sync_stats['files_per_sec']:.1f} files/sec, {file_size_str(sync_stats['bytes_per_sec'])}/sec)"
+        )
         self.sync_results.append((sync_complete, SYNC_STATUS_TEXT_COLOR["sync_complete"]))
 
     def subscribe_to_events(self):
         self.s3_sync.events.error_occurred += self.error_occurred
-        self.s3_sync.events.get_s3_objects_start += self.get_s3_objects_start
-        self.s3_sync.events.get_s3_objects_complete += self.get_s3_objects_complete
         self.s3_sync.events.find_out_of_sync_files_start += self.find_out_of_sync_files_start
         self.s3_sync.events.find_out_of_sync_files_complete += self.find_out_of_sync_files_complete
         self.s3_sync.events.sync_files_start += self.sync_files_start
@@ -166,8 +157,6 @@ class SyncDataNoPromptsTask(Task):
 
     def unsubscribe_from_events(self):
         self.s3_sync.events.error_occurred -= self.error_occurred
-        self.s3_sync.events.get_s3_objects_start -= self.get_s3_objects_start
-        self.s3_sync.events.get_s3_objects_complete -= self.get_s3_objects_complete
         self.s3_sync.events.find_out_of_sync_files_start -= self.find_out_of_sync_files_start
         self.s3_sync.events.find_out_of_sync_files_complete -= self.find_out_of_sync_files_complete
         self.s3_sync.events.sync_files_start -= self.sync_files_start
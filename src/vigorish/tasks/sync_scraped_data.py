@@ -1,33 +1,60 @@
+"""Sync the scraped data for a single year/file type/data set between the local folder and the S3 bucket."""
+import os
+import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from copy import deepcopy
+from datetime import timezone
 from functools import cached_property
 from pathlib import Path
 
+from boto3.s3.transfer import TransferConfig
 from events import Events
 from halo import Halo
 
 from vigorish.cli.components import get_random_cli_color, get_random_dots_spinner
+from vigorish.data.sync_manifest import SyncManifest
 from vigorish.enums import SyncDirection, VigFile
 from vigorish.tasks.base import Task
+from vigorish.util.datetime_util import dtaware_fromtimestamp
 from vigorish.util.regex import URL_ID_REGEX
 from vigorish.util.result import Result
-from vigorish.util.sys_helpers import get_last_mod_time_utc
+from vigorish.util.sys_helpers import calc_s3_etag, S3_MULTIPART_SIZE
 
 TIME_DIFFERENCE_SECONDS = 60
+DEFAULT_SYNC_WORKERS = 8
+S3_TRANSFER_CONFIG = TransferConfig(multipart_threshold=S3_MULTIPART_SIZE, multipart_chunksize=S3_MULTIPART_SIZE)
+
+
+def get_s3_sync_worker_count():
+    workers = os.environ.get("S3_SYNC_WORKERS", "")
+    return int(workers) if workers.isdigit() and int(workers) > 0 else DEFAULT_SYNC_WORKERS
 
 
 class SyncScrapedDataTask(Task):
+    """Find the files that are missing or outdated in the destination and transfer them with a pool of threads.
+
+    Only the S3 objects under the folder for the year/file type/data set are listed. A SyncManifest stored in the
+    local folder records every file that is known to be in sync, so files that have not changed since the last sync
+    are skipped (when uploading, the S3 bucket is not listed at all if no local files have been added or changed).
+
+    A file is only recorded in the manifest after it has been transferred, or when the ETag calculated from the
+    local file matches the ETag of the S3 object (i.e., the contents are identical). Files are uploaded with a fixed
+    multipart chunk size, so the ETag of each file that is uploaded can be calculated locally. When a file exists in
+    both places and the source is newer, it is outdated if the ETags differ (or if either ETag is unknown, if the
+    sizes differ).
+    """
+
     def __init__(self, app):
         super().__init__(app)
         self.sync_direction = None
         self.file_type = None
         self.data_set = None
         self.year = None
+        self.manifests = {}
         self.spinner = Halo(spinner=get_random_dots_spinner(), color=get_random_cli_color())
         self.events = Events(
             (
                 "error_occurred",
-                "get_s3_objects_start",
-                "get_s3_objects_complete",
                 "find_out_of_sync_files_start",
                 "find_out_of_sync_files_complete",
                 "sync_files_start",
@@ -41,11 +68,16 @@ class SyncScrapedDataTask(Task):
         return self.scraped_data.file_helper
 
     @cached_property
-    def all_s3_objects(self):  # pragma: no cover
-        return self.file_helper.get_all_object_keys_in_s3_bucket()
+    def s3_client(self):  # pragma: no cover
+        return self.file_helper.get_s3_bucket().meta.client
+
+    def get_sync_manifest(self, file_type, data_set, year):
+        folderpath = self.scraped_data.get_local_folderpath(file_type, data_set, year)
+        if folderpath not in self.manifests:
+            self.manifests[folderpath] = SyncManifest(folderpath)
+        return self.manifests[folderpath]
 
     def execute(self, sync_direction, file_type, data_set, year):
-        self.get_all_s3_objects()
         result = self.find_out_of_sync_files(sync_direction, file_type, data_set, year)
         if result.failure:
             self.events.error_occurred("Error occurred analyzing which files need to be synced.")
@@ -53,17 +85,20 @@ class SyncScrapedDataTask(Task):
         (out_of_sync, missing_files, outdated_files) = result.value
         if not out_of_sync:
             return Result.Ok()
-        self.sync_files(sync_direction, missing_files, outdated_files, file_type, data_set, year)
-        return Result.Ok()
-
-    def get_all_s3_objects(self):
-        self.events.get_s3_objects_start()
-        self.all_s3_objects
-        self.events.get_s3_objects_complete()
+        return self.sync_files(sync_direction, missing_files, outdated_files, file_type, data_set, year)
 
     def find_out_of_sync_files(self, sync_direction, file_type, data_set, year):
         self.events.find_out_of_sync_files_start()
-        (s3_objects, local_files) = self.get_all_files_in_src_and_dest(file_type, data_set, year)
+        manifest = self.get_sync_manifest(file_type, data_set, year)
+        (s3_objects, local_files) = self.get_all_files_in_src_and_dest(sync_direction, file_type, data_set, year)
+        add_in_sync_files_to_manifest(manifest, s3_objects, local_files)
+        if sync_direction == SyncDirection.UP_TO_S3:
+            local_files = [f for f in local_files if not manifest.file_is_unchanged(f)]
+        if sync_direction == SyncDirection.DOWN_TO_LOCAL:
+            local_file_map = {f["name"]: f for f in local_files}
+            s3_objects = [
+                obj for obj in s3_objects if not manifest.object_is_unchanged(obj, local_file_map.get(obj["name"]))
+            ]
         if (sync_direction == SyncDirection.UP_TO_S3 and not local_files) or (
             sync_direction == SyncDirection.DOWN_TO_LOCAL and not s3_objects
         ):
@@ -76,16 +111,23 @@ class SyncScrapedDataTask(Task):
         self.events.find_out_of_sync_files_complete(sync_results)
         return Result.Ok(sync_results)
 
-    def get_all_files_in_src_and_dest(self, file_type, data_set, year):
+    def get_all_files_in_src_and_dest(self, sync_direction, file_type, data_set, year):
         local_files = self.get_local_files(file_type, data_set, year)
+        manifest = self.get_sync_manifest(file_type, data_set, year)
+        if sync_direction == SyncDirection.UP_TO_S3 and all(map(manifest.file_is_unchanged, local_files)):
+            return ([], local_files)
         s3_objects = self.get_s3_objects(file_type, data_set, year)
         return (s3_objects, local_files)
 
     def get_local_files(self, file_type, data_set, year):
-        folderpath = self.scraped_data.get_local_folderpath(file_type, data_set, year)
+        folderpath = Path(self.scraped_data.get_local_folderpath(file_type, data_set, year))
         id_regex = URL_ID_REGEX[file_type][data_set]
-        local_files = filter(lambda x: id_regex.search(x.stem), Path(folderpath).glob("*.*"))
-        return sorted(map(get_local_file_data, local_files), key=lambda x: x["name"])
+        local_files = self.file_helper.get_file_index(folderpath).get_files()
+        return [
+            get_local_file_data(folderpath.joinpath(name), size, mtime)
+            for (name, (size, mtime)) in sorted(local_files.items())
+            if id_regex.search(Path(name).stem)
+        ]
 
     def get_s3_objects(self, file_type, data_set, year):
         folderpath = self.scraped_data.get_s3_folderpath(file_type, data_set, year)
@@ -93,21 +135,51 @@ class SyncScrapedDataTask(Task):
         file_suffix = ".html" if file_type == VigFile.SCRAPED_HTML else ".json"
         s3_objects = filter(
             lambda x: folderpath in x.key and id_regex.search(Path(x.key).stem) and Path(x.key).suffix == file_suffix,
-            self.all_s3_objects,
+            self.list_s3_objects(folderpath),
         )
         return sorted(map(get_s3_object_data, s3_objects), key=lambda x: x["name"])
 
+    def list_s3_objects(self, s3_folder):  # pragma: no cover
+        return self.file_helper.get_s3_objects_in_folder(s3_folder)
+
     def sync_files(self, sync_direction, missing_files, outdated_files, file_type, data_set, year):
         self.file_helper.create_all_folderpaths(year)
         self.bucket_name = self.config.get_current_setting("S3_BUCKET", data_set)
+        manifest = self.get_sync_manifest(file_type, data_set, year)
         sync_files = get_sync_files(missing_files, outdated_files)
         self.events.sync_files_start(sync_files[0]["name"], 0, len(sync_files))
-        for num, file in enumerate(sync_files, start=1):
-            self.events.sync_files_progress(file["name"], num - 1, len(sync_files))
-            (filepath, s3_key) = self.get_local_path_and_s3_key(file, file_type, data_set, year)
-            self.send_file(sync_direction, filepath, s3_key)
-            self.events.sync_files_progress(file["name"], num, len(sync_files))
-        self.events.sync_files_complete()
+        start = time.perf_counter()
+        total_bytes = 0
+        executor = ThreadPoolExecutor(max_workers=get_s3_sync_worker_count())
+        try:
+            futures = {
+                executor.submit(self.sync_file, sync_direction, file, file_type, data_set, year): file
+                for file in sync_files
+            }
+            for num, future in enumerate(as_completed(futures), start=1):
+                file = futures[future]
+                try:
+                    (local_path, etag) = future.result()
+                except Exception as ex:
+                    error = f"Error occurred syncing {file['name']}: {repr(ex)}"
+                    self.events.error_occurred(error)
+                    return Result.Fail(error)
+                manifest.update(local_path, etag)
+                total_bytes += file["size"]
+                self.events.sync_files_progress(file["name"], num, len(sync_files))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            manifest.save()
+        sync_stats = get_sync_stats(len(sync_files), total_bytes, time.perf_counter() - start)
+        self.events.sync_files_complete(sync_stats)
+        return Result.Ok(sync_stats)
+
+    def sync_file(self, sync_direction, file, file_type, data_set, year):
+        (local_path, s3_key) = self.get_local_path_and_s3_key(file, file_type, data_set, year)
+        self.send_file(sync_direction, local_path, s3_key)
+        if sync_direction == SyncDirection.UP_TO_S3:
+            return (local_path, calc_s3_etag(local_path))
+        return (local_path, file["etag"])
 
     def get_local_path_and_s3_key(self, file, file_type, data_set, year):
         local_folder = self.scraped_data.get_local_folderpath(file_type, data_set, year)
@@ -118,17 +190,18 @@ class SyncScrapedDataTask(Task):
 
     def send_file(self, sync_direction, local_path, s3_key):  # pragma: no cover
         if sync_direction == SyncDirection.UP_TO_S3:
-            self.file_helper.get_s3_bucket().upload_file(local_path, s3_key)
+            self.s3_client.upload_file(local_path, self.bucket_name, s3_key, Config=S3_TRANSFER_CONFIG)
         if sync_direction == SyncDirection.DOWN_TO_LOCAL:
-            self.file_helper.get_s3_bucket().download_file(s3_key, local_path)
+            self.s3_client.download_file(self.bucket_name, s3_key, local_path)
 
 
-def get_local_file_data(file):
+def get_local_file_data(file, size, mtime):
     return {
         "name": file.name,
         "path": file,
-        "size": file.stat().st_size,
-        "last_modified": get_last_mod_time_utc(file),
+        "size": size,
+        "mtime": mtime,
+        "last_modified": dtaware_fromtimestamp(mtime, use_tz=timezone.utc),
     }
 
 
@@ -138,9 +211,26 @@ def get_s3_object_data(obj):
         "path": Path(obj.key),
         "size": obj.size,
         "last_modified": obj.last_modified,
+        "etag": getattr(obj, "e_tag", "").strip('"'),
     }
 
 
+def add_in_sync_files_to_manifest(manifest, s3_objects, local_files):
+    """Set the ETag of each local file that has an S3 object, and record the files with identical contents."""
+    s3_object_map = {obj["name"]: obj for obj in s3_objects}
+    for local_file in local_files:
+        s3_object = s3_object_map.get(local_file["name"])
+        if not s3_object or not local_file["size"]:
+            continue
+        if manifest.file_is_unchanged(local_file):
+            local_file["etag"] = manifest.get_etag(local_file)
+            continue
+        local_file["etag"] = calc_s3_etag(local_file["path"])
+        if s3_object["etag"] and local_file["etag"] == s3_object["etag"]:
+            manifest.update(local_file["path"], s3_object["etag"])
+    manifest.save()
+
+
 def get_files_to_sync(src_files, dest_files):
     missing_files = find_missing_files(src_files, dest_files)
     outdated_files = find_outdated_files(src_files, dest_files)
@@ -176,7 +266,11 @@ def find_common_files(src_files, dest_files):
 def src_file_is_newer(file_pair):
     (src, dest) = file_pair
     diff = src["last_modified"] - dest["last_modified"]
-    return diff.total_seconds() > TIME_DIFFERENCE_SECONDS and src["size"] != dest["size"]
+    if diff.total_seconds() <= TIME_DIFFERENCE_SECONDS:
+        return False
+    if src.get("etag") and dest.get("etag"):
+        return src["etag"] != dest["etag"]
+    return src["size"] != dest["size"]
 
 
 def update_existing_file(file_pair):
@@ -192,3 +286,13 @@ def get_sync_files(missing_files, outdated_files):
     if outdated_files:
         sync_files.extend(deepcopy(outdated_files))
     return sync_files
+
+
+def get_sync_stats(total_files, total_bytes, seconds):
+    return {
+        "files": total_files,
+        "bytes": total_bytes,
+        "seconds": seconds,
+        "files_per_sec": total_files / seconds if seconds else 0.0,
+        "bytes_per_sec": total_bytes / seconds if seconds else 0.0,
+    }
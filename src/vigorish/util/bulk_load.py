@@ -0,0 +1,90 @@
+"""Helpers for loading a large number of rows into a table as quickly as possible."""
+import csv
+import io
+from contextlib import contextmanager
+from itertools import islice
+
+SQLITE_BULK_LOAD_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "cache_size": -262144}
+
+
+@contextmanager
+def sqlite_bulk_load_pragmas(conn, pragmas=None):
+    """Apply load-time pragmas to a SQLite connection and restore the previous values when the block exits.
+
+    With synchronous=OFF and the rollback journal kept in memory, a crash during the load can corrupt the database
+    file. This is only acceptable when the database is being rebuilt from scratch (e.g., restoring a backup), since
+    the load can simply be repeated. The pragmas only apply to conn, so the rows must be inserted with the same
+    connection. For any other database backend this does nothing.
+    """
+    if conn.dialect.name != "sqlite":
+        yield conn
+        return
+    pragmas = pragmas or SQLITE_BULK_LOAD_PRAGMAS
+    previous = {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in pragmas}
+    try:
+        for name, value in pragmas.items():
+            conn.exec_driver_sql(f"PRAGMA {name} = {value}")
+        yield conn
+    finally:
+        for name, value in previous.items():
+            conn.exec_driver_sql(f"PRAGMA {name} = {value}")
+
+
+@contextmanager
+def deferred_indexes(conn, table):
+    """Drop the secondary indexes of table and recreate them when the block exits (even if the load fails).
+
+    Building an index once over the complete table is much faster than updating it for every inserted row. Primary
+    keys and unique constraints are part of the table definition and are not affected.
+    """
+    indexes = list(table.indexes)
+    for index in indexes:
+        index.drop(conn)
+    try:
+        yield indexes
+    finally:
+        for index in indexes:
+            index.create(conn)
+
+
+def bulk_insert(conn, table, columns):
+    """Insert the rows in columns (a dict of column name -> list of values) into table with a single executemany.
+
+    For drivers that use positional parameters (e.g., sqlite3), each column is converted by the bind processor of
+    its type all at once and the rows are passed to the driver as tuples, skipping the per-row parameter handling
+    performed by SQLAlchemy. Keys in columns that are not columns of table are ignored, and missing columns with a
+    scalar default are filled with the default value.
+    """
+    names = [column.name for column in table.columns if column.name in columns]
+    insert = table.insert()
+    compiled = insert.compile(dialect=conn.dialect, column_keys=names)
+    defaults = {name: table.columns[name].default for name in compiled.positiontup or [] if name not in columns}
+    if not compiled.positional or any(not (default and default.is_scalar) for default in defaults.values()):
+        conn.execute(insert, [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))])
+        return
+    row_count = len(columns[names[0]])
+    values = {name: [default.arg] * row_count for name, default in defaults.items()}
+    for name in names:
+        process = table.columns[name].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+        values[name] = list(map(process, columns[name])) if process else columns[name]
+    conn.exec_driver_sql(str(compiled), list(zip(*(values[name] for name in compiled.positiontup))))
+
+
+def read_csv_column_batches(csv_file, column_parsers, batch_size):
+    """Read batches of rows from a binary CSV file object and yield each batch as a dict of column name -> list.
+
+    Each column listed in column_parsers is converted by passing the list of values for the whole batch to its
+    parser. Columns in column_parsers that are missing from the CSV file are treated as empty.
+    """
+    reader = csv.reader(io.TextIOWrapper(csv_file, encoding="utf-8", newline=""))
+    header = [name.strip() for name in next(reader, [])]
+    positions = {name: header.index(name) if name in header else None for name in column_parsers}
+    while True:
+        rows = list(islice(reader, batch_size))
+        if not rows:
+            break
+        columns = list(zip(*rows))
+        yield {
+            name: parse([""] * len(rows) if positions[name] is None else columns[positions[name]])
+            for name, parse in column_parsers.items()
+        }
@@ -1,5 +1,6 @@
-from dataclasses import asdict, fields
-from datetime import datetime
+from dataclasses import asdict, fields, MISSING
+from datetime import date, datetime
+from functools import partial
 from typing import get_type_hints
 
 from dacite import from_dict
@@ -55,6 +56,75 @@ def serialize_db_object_to_csv(db_obj, dataclass, date_format=DATE_ONLY):
     return dict_to_csv_row(csv_dict, date_format)
 
 
+def get_csv_value_serializers(dataclass, date_format=DATE_ONLY):
+    """Return a function for each field of dataclass that converts a column value to the same text as
+    serialize_db_object_to_csv, so rows selected as tuples can be written without creating ORM objects."""
+    return [get_csv_value_serializer(field.type, date_format) for field in dataclass.__dataclass_fields__.values()]
+
+
+def get_csv_value_serializer(field_type, date_format):
+    if field_type is bool:
+        return lambda value: "1" if value else "0"
+    convert = int if field_type is int else float if field_type is float else None
+
+    def serialize_value(value):
+        if not value:
+            return ""
+        if convert and not isinstance(value, convert):
+            value = convert(value)
+        return sanitize_value_for_csv(value, date_format)
+
+    return serialize_value
+
+
+def get_csv_column_parsers(dataclass):
+    """Return a function for each field of dataclass that converts a list of CSV values to the same values that
+    DataclassReader would assign to the field, so a batch of rows can be converted one column at a time."""
+    field_types = get_field_types(dataclass)
+    return {
+        field.name: get_csv_column_parser(dataclass, field, field_types[field.name])
+        for field in fields(dataclass)
+        if field.init
+    }
+
+
+def get_csv_column_parser(dataclass, field, field_type):
+    default = field.default_factory() if field.default_factory is not MISSING else field.default
+    date_format = field.metadata.get("dateformat", getattr(dataclass, "__dateformat__", None))
+    is_date = field_type in (date, datetime)
+    parse = (
+        partial(parse_csv_date, date_format=date_format, as_date=field_type is date)
+        if is_date
+        else parse_csv_bool
+        if field_type is bool
+        else field_type
+    )
+
+    def parse_column(values):
+        if default is MISSING and not all(values):
+            raise ValueError(f"The field `{field.name}` is required.")
+        if is_date:
+            parsed = {value: parse(value) if value else default for value in set(values)}
+            return list(map(parsed.__getitem__, values))
+        return [parse(value) if value else default for value in values]
+
+    return parse_column
+
+
+def parse_csv_date(value, date_format, as_date=False):
+    parsed = datetime.strptime(value, date_format)
+    return parsed.date() if as_date else parsed
+
+
+def parse_csv_bool(value):
+    value = value.strip().lower()
+    if value in ["true", "yes", "t", "y", "on", "1"]:
+        return True
+    if value in ["false", "no", "f", "n", "off", "0"]:
+        return False
+    raise ValueError(f"invalid boolean value {value}")
+
+
 def dict_to_csv_row(csv_dict, date_format):
     return ",".join(sanitize_value_for_csv(val, date_format) for val in csv_dict.values())
 
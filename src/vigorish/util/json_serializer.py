@@ -0,0 +1,86 @@
+"""Read and write parsed and combined game data as compact JSON, using orjson if it is installed."""
+import json
+import os
+from datetime import date, datetime
+
+from dateutil import parser
+
+from vigorish.util.dt_format_strings import DATE_ONLY, DATE_ONLY_2, DT_AWARE, DT_NAIVE, ISO_8601
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+KNOWN_DATE_FORMATS = [DATE_ONLY, DT_AWARE, ISO_8601, DT_NAIVE, DATE_ONLY_2]
+
+
+class StdlibJsonSerializer:
+    name = "json"
+
+    def dumps(self, obj, indent=False):
+        if indent:
+            return json.dumps(obj, indent=2, default=encode_date)
+        return json.dumps(obj, separators=(",", ":"), default=encode_date)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    name = "orjson"
+
+    def dumps(self, obj, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=encode_date, option=option).decode("utf-8")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+SERIALIZERS = {"json": StdlibJsonSerializer, "orjson": OrjsonSerializer}
+_serializers = {}
+
+
+def get_serializer(name=None):
+    """Return the serializer named by the JSON_SERIALIZER env var (default: orjson, or json if not installed)."""
+    name = name or os.environ.get("JSON_SERIALIZER") or "orjson"
+    if name not in SERIALIZERS or (name == "orjson" and not orjson):
+        name = "json"
+    if name not in _serializers:
+        _serializers[name] = SERIALIZERS[name]()
+    return _serializers[name]
+
+
+def dumps(obj, indent=False):
+    """Convert obj to a JSON string, without whitespace unless indent is True."""
+    return get_serializer().dumps(obj, indent)
+
+
+def loads(data):
+    """Convert a JSON string or bytes object to python objects."""
+    return get_serializer().loads(data)
+
+
+def encode_date(obj):
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def parse_date_str(date_str):
+    """Convert a date/time string to a datetime object.
+
+    The formats written to JSON files by vigorish are tried before falling back to the (much slower) generic
+    parser from dateutil.
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    for date_format in KNOWN_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return parser.parse(date_str)
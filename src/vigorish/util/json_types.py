@@ -7,9 +7,8 @@ from importlib import import_module
 from pathlib import PosixPath
 from uuid import UUID
 
-from dateutil.parser import parse
-
 from vigorish.util.dt_format_strings import DATE_ONLY, ISO_8601
+from vigorish.util.json_serializer import parse_date_str
 
 
 class CustomJsonEncoder(json.JSONEncoder):
@@ -76,13 +75,13 @@ def decode(obj_dict):
         return complex(obj_dict["real"], obj_dict["imag"])
 
     if class_name == datetime.__name__:
-        return parse(obj_dict["datetime_str"])
+        return parse_date_str(obj_dict["datetime_str"])
 
     if class_name == date.__name__:
-        return parse(obj_dict["date_str"]).date()
+        return parse_date_str(obj_dict["date_str"]).date()
 
     if class_name == time.struct_time.__name__:
-        return parse(obj_dict["time_str"]).timetuple()
+        return parse_date_str(obj_dict["time_str"]).timetuple()
 
     if class_name == UUID.__name__:
         return UUID(obj_dict["uuid_str"])
@@ -21,6 +21,7 @@ ONE_KB = 1000
 ONE_MB = ONE_KB * 1000
 ONE_GB = ONE_MB * 1000
 CHUNK_SIZE = 8192
+S3_MULTIPART_SIZE = 8 * 1024 * 1024
 
 
 def run_command(command, cwd=None, shell=True, text=True):  # pragma: no cover
@@ -233,3 +234,18 @@ def calc_file_hash(filepath: Path) -> str:
         while chunk := f.read(CHUNK_SIZE):
             md5.update(chunk)
     return md5.hexdigest()
+
+
+def calc_s3_etag(filepath: Path, multipart_size: int = S3_MULTIPART_SIZE) -> str:
+    """Return the ETag that S3 assigns to filepath when it is uploaded in parts of multipart_size bytes.
+
+    Files smaller than multipart_size are uploaded in a single request and the ETag is the MD5 hash of the file.
+    Otherwise the ETag is the MD5 hash of the concatenated MD5 digests of each part, followed by "-<part count>".
+    """
+    if Path(filepath).stat().st_size < multipart_size:
+        return calc_file_hash(filepath)
+    part_digests = []
+    with open(filepath, "rb") as f:
+        while part := f.read(multipart_size):
+            part_digests.append(hashlib.md5(part).digest())
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
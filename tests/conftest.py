@@ -12,6 +12,7 @@ CONFIG_FILE = TESTS_FOLDER.joinpath("vig.config.json")
 JSON_FOLDER = TESTS_FOLDER.joinpath("json")
 CSV_FOLDER = TESTS_FOLDER.joinpath("csv")
 BACKUP_FOLDER = TESTS_FOLDER.joinpath("backup")
+COMBINED_DATA_FOLDER = TESTS_FOLDER.joinpath("json_storage", "2019", "combined_data")
 
 
 @pytest.fixture(scope="package", autouse=True)
@@ -24,6 +25,15 @@ def env_vars(request):
     return True
 
 
+@pytest.fixture(scope="session", autouse=True)
+def combined_data_files():
+    """Restores the combined data fixtures, which are overwritten in compact form by the tests that combine data."""
+    fixture_files = {filepath: filepath.read_bytes() for filepath in COMBINED_DATA_FOLDER.glob("*.json")}
+    yield fixture_files
+    for filepath, contents in fixture_files.items():
+        filepath.write_bytes(contents)
+
+
 def get_db_filename():
     return f"vig_{str(uuid4())[-4:]}.db"
 
@@ -0,0 +1,49 @@
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+from tests.util import capture_queries
+from vigorish.enums import StatusReport
+from vigorish.status.report_status import report_season_status
+
+MLB_YEAR = 2019
+MAX_SECONDS = 2.0
+
+
+@pytest.mark.parametrize(
+    "report_type, max_queries",
+    [
+        (StatusReport.SEASON_SUMMARY, 1),
+        (StatusReport.DATE_SUMMARY_MISSING_DATA, 2),
+        (StatusReport.DATE_SUMMARY_ALL_DATES, 2),
+        (StatusReport.DATE_DETAIL_MISSING_DATA, 2),
+        (StatusReport.DATE_DETAIL_ALL_DATES, 2),
+        (StatusReport.DATE_DETAIL_MISSING_PITCHFX, 3),
+    ],
+)
+def test_season_status_report_query_count(vig_app, report_type, max_queries):
+    db_session = Session(bind=vig_app.db_engine)
+    with capture_queries(vig_app.db_engine) as queries:
+        start = time.perf_counter()
+        result = report_season_status(db_session, MLB_YEAR, report_type)
+        elapsed = time.perf_counter() - start
+    db_session.close()
+    assert result.success
+    assert len(queries) <= max_queries
+    assert elapsed < MAX_SECONDS
+
+
+def test_season_status_report_matches_date_status(vig_app):
+    db_session = Session(bind=vig_app.db_engine)
+    result = report_season_status(db_session, MLB_YEAR, StatusReport.DATE_DETAIL_ALL_DATES)
+    db_session.close()
+    assert result.success
+    report_pages = result.value.pages
+    season = db.Season.find_by_year(vig_app.db_session, MLB_YEAR)
+    date_range = season.get_date_range()
+    assert len(report_pages) == len(date_range)
+    for page, game_date in zip(report_pages, date_range):
+        date_status = db.DateScrapeStatus.find_by_date(vig_app.db_session, game_date)
+        assert page.text == date_status.status_report()
@@ -0,0 +1,81 @@
+from click.testing import CliRunner
+
+import vigorish.database as db
+from vigorish.cli.vig import cli
+from vigorish.models.status_rollup import (
+    DATE_STATUS_TOTALS,
+    GAME_STATUS_TOTALS,
+    PITCH_APP_STATUS_TOTALS,
+)
+from vigorish.status.update_status_rollups import rebuild_status_rollups
+
+MLB_YEAR = 2019
+
+
+def get_view_totals(db_session, view, view_id, rollup_cols):
+    view_row = db_session.query(view).get(view_id)
+    if not view_row:
+        return dict.fromkeys(rollup_cols, 0)
+    return {col: getattr(view_row, col.replace("_bbref_audited", "_bbref")) or 0 for col in rollup_cols}
+
+
+def get_rollup_totals(rollup, rollup_cols):
+    return {col: getattr(rollup, col) for col in rollup_cols}
+
+
+def verify_rollups_match_views(db_session):
+    season = db.Season.find_by_year(db_session, MLB_YEAR)
+    season_views = [
+        (db.Season_Date_View, DATE_STATUS_TOTALS),
+        (db.Season_Game_View, GAME_STATUS_TOTALS),
+        (db.Season_PitchApp_View, PITCH_APP_STATUS_TOTALS),
+    ]
+    for view, totals in season_views:
+        expected = get_view_totals(db_session, view, season.id, totals)
+        assert get_rollup_totals(season.status_rollup, totals) == expected
+    for date_status in season.dates:
+        expected = get_view_totals(db_session, db.Date_PitchApp_View, date_status.id, PITCH_APP_STATUS_TOTALS)
+        assert get_rollup_totals(date_status.status_rollup, PITCH_APP_STATUS_TOTALS) == expected
+        assert date_status.status_rollup.total_games == len(date_status.games)
+    for game_status in season.games:
+        expected = get_view_totals(db_session, db.Game_PitchApp_View, game_status.id, PITCH_APP_STATUS_TOTALS)
+        assert get_rollup_totals(game_status.status_rollup, PITCH_APP_STATUS_TOTALS) == expected
+
+
+def test_status_rollups_match_views(vig_app):
+    verify_rollups_match_views(vig_app.db_session)
+
+
+def test_rebuild_status_rollups(vig_app):
+    season = db.Season.find_by_year(vig_app.db_session, MLB_YEAR)
+    season.status_rollup.total_games = 0
+    vig_app.db_session.commit()
+    result = rebuild_status_rollups(vig_app.db_session)
+    assert result.success
+    rollup_counts = result.value
+    assert rollup_counts[db.SeasonStatusRollup] == vig_app.db_session.query(db.Season).count()
+    assert rollup_counts[db.DateStatusRollup] == vig_app.db_session.query(db.DateScrapeStatus).count()
+    assert rollup_counts[db.GameStatusRollup] == vig_app.db_session.query(db.GameScrapeStatus).count()
+    verify_rollups_match_views(vig_app.db_session)
+
+
+def test_status_rollups_updated_when_status_changes(vig_app):
+    game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, "TOR201906170")
+    season = game_status.season
+    total_pitch_count_pitchfx = season.total_pitch_count_pitchfx
+    pitch_app = game_status.pitch_apps[0]
+    pitch_app.pitch_count_pitchfx += 10
+    vig_app.db_session.flush()
+    assert season.total_pitch_count_pitchfx == total_pitch_count_pitchfx + 10
+    assert game_status.date.total_pitch_count_pitchfx == game_status.status_rollup.total_pitch_count_pitchfx
+    verify_rollups_match_views(vig_app.db_session)
+    vig_app.db_session.rollback()
+    assert season.total_pitch_count_pitchfx == total_pitch_count_pitchfx
+
+
+def test_status_rebuild_cli(vig_app):
+    runner = CliRunner()
+    result = runner.invoke(cli, "status rebuild")
+    assert result.exit_code == 0
+    assert "Rebuilt status totals" in result.output
+    verify_rollups_match_views(vig_app.db_session)
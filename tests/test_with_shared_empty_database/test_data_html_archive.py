@@ -0,0 +1,96 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import TESTS_FOLDER
+from vigorish.data.html_archive import HtmlArchive, INDEX_FILE_NAME, SEGMENT_FILE_PREFIX
+from vigorish.enums import DataSet, VigFile
+
+YEAR = 2019
+HTML_FOLDER = TESTS_FOLDER.joinpath("html_storage", str(YEAR), "brooks_pitch_logs")
+PITCH_APP_ID = "TOR201906170_429719"
+
+
+@pytest.fixture()
+def html_files():
+    return sorted(HTML_FOLDER.glob("*.html"))
+
+
+@pytest.fixture()
+def archive_storage(vig_app, monkeypatch):
+    """Stores the scraped HTML for all data sets in the local archive instead of one file per page."""
+    file_helper = vig_app.scraped_data.file_helper
+    monkeypatch.setattr(file_helper, "check_file_stored_local", lambda file_type, data_set: False)
+    monkeypatch.setattr(file_helper, "check_file_stored_archive", lambda file_type, data_set: True)
+    yield vig_app.scraped_data
+    vig_app.scraped_data.html_storage.archives.clear()
+    for archive_file in HTML_FOLDER.glob(f"{SEGMENT_FILE_PREFIX}*"):
+        archive_file.unlink()
+    HTML_FOLDER.joinpath(INDEX_FILE_NAME).unlink(missing_ok=True)
+
+
+def test_html_archive_read_write(tmp_path, html_files):
+    archive = HtmlArchive(tmp_path)
+    assert archive.import_html_files(html_files) == len(html_files)
+    assert archive.url_ids == sorted(f.stem for f in html_files)
+    for html_file in html_files:
+        assert archive.read(html_file.stem) == html_file.read_text()
+    assert archive.read("not_in_archive") is None
+    assert archive.disk_usage < sum(f.stat().st_size for f in html_files)
+    segment_file = archive.get_segment_filepath(1)
+    assert gzip.decompress(segment_file.read_bytes()).decode() == "".join(f.read_text() for f in html_files)
+
+
+def test_html_archive_overwrite_delete_compact(tmp_path, html_files):
+    archive = HtmlArchive(tmp_path)
+    archive.import_html_files(html_files)
+    (url_id, other_url_id) = (html_files[0].stem, html_files[1].stem)
+    archive.write(url_id, "<html>replaced</html>")
+    assert archive.delete(other_url_id)
+    assert not archive.delete(other_url_id)
+    assert archive.read(url_id) == "<html>replaced</html>"
+    assert other_url_id not in archive
+
+    reopened = HtmlArchive(tmp_path)
+    assert reopened.url_ids == archive.url_ids
+    assert reopened.read(url_id) == "<html>replaced</html>"
+
+    assert archive.compact() > 0
+    assert archive.segment_numbers == [2]
+    assert archive.read(url_id) == "<html>replaced</html>"
+    for html_file in html_files[2:]:
+        assert archive.read(html_file.stem) == html_file.read_text()
+
+
+def test_html_archive_segments_and_refresh(tmp_path, html_files):
+    writer = HtmlArchive(tmp_path, max_segment_size=20000)
+    reader = HtmlArchive(tmp_path)
+    writer.import_html_files(html_files)
+    assert len(writer.segment_numbers) > 1
+    assert all(writer.get_segment_filepath(s).stat().st_size <= 20000 for s in writer.segment_numbers[:-1])
+    assert len(reader) == 0
+    assert reader.read(html_files[-1].stem) == html_files[-1].read_text()
+    assert len(reader) == len(html_files)
+
+
+def test_html_storage_archive(vig_app, archive_storage, html_files):
+    data_set = DataSet.BROOKS_PITCH_LOGS
+    html = HTML_FOLDER.joinpath(f"{PITCH_APP_ID}.html").read_text()
+    result = archive_storage.save_html(data_set, PITCH_APP_ID, html)
+    assert result.success
+    assert Path(result.value["local_filepath"]).name == f"{SEGMENT_FILE_PREFIX}0001.gz"
+
+    archive = archive_storage.html_storage.get_html_archive(data_set, year=YEAR)
+    archive.import_html_files(html_files)
+    assert archive_storage.get_scraped_ids_from_local_folder(VigFile.SCRAPED_HTML, data_set, YEAR) == sorted(
+        f.stem for f in html_files
+    )
+
+    html_path = archive_storage.get_html(data_set, PITCH_APP_ID)
+    assert html_path.read_text() == html
+    assert html_path.parent == archive.extract_folderpath
+
+    result = archive_storage.html_storage.delete_html(data_set, PITCH_APP_ID)
+    assert result.success
+    assert not archive_storage.get_html(data_set, PITCH_APP_ID)
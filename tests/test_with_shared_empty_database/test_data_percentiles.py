@@ -0,0 +1,77 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import vigorish.database as db
+from vigorish.data.percentiles import PercentileArray, PercentileLookup, PITCH_TYPE_PERCENTILE_STATS
+
+PITCH_TYPES = ["CH", "CU", "FC", "FF", "FS", "FT", "KC", "SI", "SL", "CS"]
+
+
+def get_probe_values(db_session, stat_name, pitch_type):
+    stat_values = [
+        pt_perc.stat_value
+        for pt_perc in db_session.query(db.PitchTypePercentile).filter_by(stat_name=stat_name, pitch_type=pitch_type)
+    ]
+    if not stat_values:
+        return [0.0, 1.0]
+    probes = [min(stat_values) - 1.0, max(stat_values) + 1.0]
+    for stat_value in stat_values:
+        probes.extend([stat_value, stat_value - 0.0001, stat_value + 0.0001])
+    return probes
+
+
+@pytest.mark.parametrize("pitch_type", PITCH_TYPES)
+def test_pitch_type_percentiles_match_queries(vig_app, pitch_type):
+    rng = random.Random(pitch_type)
+    probe_values = {
+        stat_name: get_probe_values(vig_app.db_session, stat_name, pitch_type)
+        for (_, stat_name, _) in PITCH_TYPE_PERCENTILE_STATS
+    }
+    percentile_lookup = PercentileLookup(vig_app.db_session)
+    for _ in range(25):
+        pfx_metrics = SimpleNamespace(pitch_type=pitch_type)
+        for stat_name, probes in probe_values.items():
+            setattr(pfx_metrics, stat_name, rng.choice(probes))
+        for p_throws in ["R", "L"]:
+            expected = db.PitchTypePercentile.calculate_pitch_type_percentiles(
+                vig_app.db_session, p_throws, pfx_metrics
+            )
+            assert percentile_lookup.calculate_pitch_type_percentiles(p_throws, pfx_metrics) == expected
+    metrics_set = SimpleNamespace(metrics_by_pitch_type={pitch_type: pfx_metrics})
+    assert percentile_lookup.calculate_pitch_type_percentiles_for_metrics_set("R", metrics_set) == [
+        db.PitchTypePercentile.calculate_pitch_type_percentiles(vig_app.db_session, "R", pfx_metrics)
+    ]
+
+
+def test_batter_percentiles_without_data(vig_app):
+    pfx_metrics = SimpleNamespace(
+        bb_rate=0.1,
+        k_rate=0.2,
+        contact_rate=0.75,
+        o_swing_rate=0.3,
+        whiff_rate=0.1,
+        bad_whiff_rate=0.05,
+        line_drive_rate=0.2,
+        barrel_rate=0.06,
+        avg_launch_speed=88.1,
+        max_launch_speed=110.2,
+    )
+    expected = db.BatterPercentile.calculate_batter_percentiles(vig_app.db_session, pfx_metrics)
+    assert PercentileLookup(vig_app.db_session).calculate_batter_percentiles(pfx_metrics) == expected
+
+
+def test_percentile_array_matches_first_row_in_table_order():
+    rng = random.Random(0)
+    rows = [(float(rng.randint(0, 50)), float(percentile)) for percentile in range(1, 100)]
+    percentile_array = PercentileArray()
+    for stat_value, percentile in rows:
+        percentile_array.add(stat_value, percentile)
+    for probe in [x / 2 for x in range(-4, 110)]:
+        first_pos = next((perc for (val, perc) in rows if val >= probe), 100.0)
+        first_neg = next((perc for (val, perc) in rows if val <= probe), 100.0)
+        assert percentile_array.get_percentile(probe, pos_stat=True) == first_pos
+        assert percentile_array.get_percentile(probe, pos_stat=False) == first_neg
+    assert percentile_array.get_percentile(None, pos_stat=True) == 100.0
+    assert percentile_array.get_percentile(float("nan"), pos_stat=False) == 100.0
@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 
 from tests.util import (
@@ -5,6 +6,7 @@ from tests.util import (
     update_scraped_boxscore,
     update_scraped_brooks_games_for_date,
 )
+from vigorish.enums import DataSet, VigFile
 
 GAME_DATE = datetime(2019, 7, 11)
 BBREF_GAME_ID = "TEX201907110"
@@ -26,3 +28,33 @@ def test_get_all_brooks_pitch_logs_for_date(vig_app):
     assert "TEX201907110_606965" in pitch_app_ids
     assert "TEX201907110_657624" in pitch_app_ids
     assert "TEX201907110_664285" in pitch_app_ids
+
+
+def test_scraped_data_cache(vig_app):
+    scraped_data = vig_app.scraped_data
+    scraped_data.json_storage.cache.clear()
+    stats_before = scraped_data.get_json_cache_stats()
+    boxscore = scraped_data.get_bbref_boxscore(BBREF_GAME_ID)
+    boxscore.innings_list.clear()
+    cached_boxscore = scraped_data.get_bbref_boxscore(BBREF_GAME_ID)
+    assert cached_boxscore.innings_list
+    stats = scraped_data.get_json_cache_stats()
+    assert stats["hits"] - stats_before["hits"] == 1
+    assert stats["misses"] - stats_before["misses"] == 1
+
+    assert scraped_data.get_bbref_games_for_date(GAME_DATE)
+    filepath = scraped_data.json_storage.get_json_bbref_boxscore_local_file(BBREF_GAME_ID).value
+    original_json = filepath.read_bytes()
+    try:
+        result = scraped_data.save_json(DataSet.BBREF_BOXSCORES, cached_boxscore)
+        assert result.success
+        cached_keys = scraped_data.json_storage.cache.mtimes
+        assert (VigFile.PARSED_JSON, DataSet.BBREF_BOXSCORES, BBREF_GAME_ID) not in cached_keys
+        assert (VigFile.PARSED_JSON, DataSet.BBREF_GAMES_FOR_DATE, "2019-07-11") in cached_keys
+        assert scraped_data.get_bbref_boxscore(BBREF_GAME_ID).as_dict() == cached_boxscore.as_dict()
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        scraped_data.get_bbref_boxscore(BBREF_GAME_ID)
+        assert scraped_data.get_json_cache_stats()["misses"] - stats_before["misses"] == 4
+    finally:
+        filepath.write_bytes(original_json)
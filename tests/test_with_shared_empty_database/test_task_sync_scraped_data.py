@@ -1,17 +1,35 @@
 from collections import namedtuple
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import call, patch, PropertyMock
+from unittest.mock import call, patch
 
+import pytest
 from click.testing import CliRunner
 
-from tests.conftest import ROOT_FOLDER
+from tests.conftest import ROOT_FOLDER, TESTS_FOLDER
 from vigorish.cli.vig import cli
+from vigorish.data.sync_manifest import SYNC_MANIFEST_FILE_NAME
 from vigorish.enums import DataSet, SyncDirection, VigFile
+from vigorish.tasks.sync_scraped_data import SyncScrapedDataTask
 from vigorish.util.datetime_util import dtaware_fromtimestamp
+from vigorish.util.sys_helpers import calc_s3_etag
 
 MLB_SEASON = 2017
-S3ObjectMock = namedtuple("S3ObjectMock", ["key", "size", "last_modified"])
+S3ObjectMock = namedtuple("S3ObjectMock", ["key", "size", "last_modified", "e_tag"], defaults=[""])
+
+
+@pytest.fixture(autouse=True)
+def remove_sync_manifests():
+    yield
+    for manifest_file in TESTS_FOLDER.rglob(SYNC_MANIFEST_FILE_NAME):
+        manifest_file.unlink()
+
+
+def list_s3_objects_side_effect(s3_objects):
+    def list_s3_objects(s3_folder):
+        return [obj for obj in s3_objects if obj.key.startswith(f"{s3_folder.rstrip('/')}/")]
+
+    return list_s3_objects
 
 
 def get_s3_key(vig_app, file_id, file_type, data_set):
@@ -25,7 +43,7 @@ def get_local_filepath(vig_app, file_id, file_type, data_set):
     return Path(local_folder).joinpath(f"{file_id}.json")
 
 
-def create_s3_object_mock(vig_app, file_id, file_type, data_set, mod_size=0, mod_mtime=None):
+def create_s3_object_mock(vig_app, file_id, file_type, data_set, mod_size=0, mod_mtime=None, e_tag=None):
     s3_key = get_s3_key(vig_app, file_id, file_type, data_set)
     local_file = get_local_filepath(vig_app, file_id, file_type, data_set)
     size = local_file.stat().st_size
@@ -34,7 +52,9 @@ def create_s3_object_mock(vig_app, file_id, file_type, data_set, mod_size=0, mod
     last_modified = dtaware_fromtimestamp(local_file.stat().st_mtime, use_tz=timezone.utc)
     if mod_mtime:
         last_modified += mod_mtime
-    return S3ObjectMock(s3_key, size, last_modified)
+    if e_tag is None:
+        e_tag = f'"{calc_s3_etag(local_file)}"' if not mod_size else ""
+    return S3ObjectMock(s3_key, size, last_modified, e_tag)
 
 
 def create_call_result(vig_app, file_id, sync_direction, file_type, data_set):
@@ -159,9 +179,7 @@ def test_cli_sync_up_parsed_json(vig_app):
         + create_bb_pfx_objects_mock_data(vig_app)
     )
 
-    with patch(
-        "vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.all_s3_objects", new_callable=PropertyMock
-    ) as all_s3_objects_mock:
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
         with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
             SYNC_DIRECTION = SyncDirection.UP_TO_S3
             FILE_TYPE = VigFile.PARSED_JSON
@@ -170,7 +188,7 @@ def test_cli_sync_up_parsed_json(vig_app):
             FILE_2_ID = "CHA201705260"
             FILE_2_DATA_SET = DataSet.BBREF_BOXSCORES
 
-            all_s3_objects_mock.return_value = ALL_S3_OBJECTS_MOCK_DATA
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect(ALL_S3_OBJECTS_MOCK_DATA)
             send_file_mock.side_effect = send_file_side_effect
             runner = CliRunner()
             result = runner.invoke(cli, f"sync up 2017 --file-type={FILE_TYPE}")
@@ -180,7 +198,7 @@ def test_cli_sync_up_parsed_json(vig_app):
                 create_call_result(vig_app, FILE_1_ID, SYNC_DIRECTION, FILE_TYPE, FILE_1_DATA_SET),
                 create_call_result(vig_app, FILE_2_ID, SYNC_DIRECTION, FILE_TYPE, FILE_2_DATA_SET),
             ]
-            assert send_file_mock.call_args_list == expected_calls
+            assert sorted(send_file_mock.call_args_list, key=str) == sorted(expected_calls, key=str)
 
 
 def test_cli_sync_down_parsed_json(vig_app):
@@ -197,9 +215,7 @@ def test_cli_sync_down_parsed_json(vig_app):
         + create_bb_pfx_objects_mock_data(vig_app)
     )
 
-    with patch(
-        "vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.all_s3_objects", new_callable=PropertyMock
-    ) as all_s3_objects_mock:
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
         with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
             SYNC_DIRECTION = SyncDirection.DOWN_TO_LOCAL
             FILE_TYPE = VigFile.PARSED_JSON
@@ -214,7 +230,7 @@ def test_cli_sync_down_parsed_json(vig_app):
             FILE_5_ID = "HOU201705270_489119"
             FILE_5_DATA_SET = DataSet.BROOKS_PITCHFX
 
-            all_s3_objects_mock.return_value = ALL_S3_OBJECTS_MOCK_DATA
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect(ALL_S3_OBJECTS_MOCK_DATA)
             send_file_mock.side_effect = send_file_side_effect
             runner = CliRunner()
             result = runner.invoke(cli, f"sync down 2017 --file-type={FILE_TYPE}")
@@ -226,7 +242,7 @@ def test_cli_sync_down_parsed_json(vig_app):
                 create_call_result(vig_app, FILE_4_ID, SYNC_DIRECTION, FILE_TYPE, FILE_4_DATA_SET),
                 create_call_result(vig_app, FILE_5_ID, SYNC_DIRECTION, FILE_TYPE, FILE_5_DATA_SET),
             ]
-            assert send_file_mock.call_args_list == expected_calls
+            assert sorted(send_file_mock.call_args_list, key=str) == sorted(expected_calls, key=str)
 
 
 def test_cli_sync_up_patch_list(vig_app):
@@ -243,22 +259,20 @@ def test_cli_sync_up_patch_list(vig_app):
         + create_bb_pfx_objects_mock_data(vig_app)
     )
 
-    with patch(
-        "vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.all_s3_objects", new_callable=PropertyMock
-    ) as all_s3_objects_mock:
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
         with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
             SYNC_DIRECTION = SyncDirection.UP_TO_S3
             FILE_TYPE = VigFile.PATCH_LIST
             DATA_SET = DataSet.BBREF_GAMES_FOR_DATE
             FILE_ID = "bbref_games_for_date_2017-09-15_PATCH_LIST"
 
-            all_s3_objects_mock.return_value = ALL_S3_OBJECTS_MOCK_DATA
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect(ALL_S3_OBJECTS_MOCK_DATA)
             send_file_mock.side_effect = send_file_side_effect
             runner = CliRunner()
             result = runner.invoke(cli, f"sync up 2017 --file-type={FILE_TYPE}")
             assert result.exit_code == 0
             expected_calls = [create_call_result(vig_app, FILE_ID, SYNC_DIRECTION, FILE_TYPE, DATA_SET)]
-            assert send_file_mock.call_args_list == expected_calls
+            assert sorted(send_file_mock.call_args_list, key=str) == sorted(expected_calls, key=str)
 
 
 def test_cli_sync_down_patch_list(vig_app):
@@ -275,19 +289,119 @@ def test_cli_sync_down_patch_list(vig_app):
         + create_bb_pfx_objects_mock_data(vig_app)
     )
 
-    with patch(
-        "vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.all_s3_objects", new_callable=PropertyMock
-    ) as all_s3_objects_mock:
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
         with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
             SYNC_DIRECTION = SyncDirection.DOWN_TO_LOCAL
             FILE_TYPE = VigFile.PATCH_LIST
             DATA_SET = DataSet.BROOKS_GAMES_FOR_DATE
             FILE_ID = "brooks_games_for_date_2017-05-26_PATCH_LIST"
 
-            all_s3_objects_mock.return_value = ALL_S3_OBJECTS_MOCK_DATA
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect(ALL_S3_OBJECTS_MOCK_DATA)
             send_file_mock.side_effect = send_file_side_effect
             runner = CliRunner()
             result = runner.invoke(cli, f"sync down 2017 --file-type={FILE_TYPE}")
             assert result.exit_code == 0
             expected_calls = [create_call_result(vig_app, FILE_ID, SYNC_DIRECTION, FILE_TYPE, DATA_SET)]
+            assert sorted(send_file_mock.call_args_list, key=str) == sorted(expected_calls, key=str)
+
+
+def test_cli_sync_up_skips_unchanged_files(vig_app):
+    ALL_S3_OBJECTS_MOCK_DATA = create_br_box_objects_mock_data(vig_app) + create_bb_daily_objects_mock_data(vig_app)
+
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
+        with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
+            FILE_TYPE = VigFile.PARSED_JSON
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect(ALL_S3_OBJECTS_MOCK_DATA)
+            runner = CliRunner()
+            result = runner.invoke(cli, f"sync up 2017 --file-type={FILE_TYPE} --data-set=bbref_boxscores")
+            assert result.exit_code == 0
+            assert list_s3_objects_mock.call_count == 1
+            assert send_file_mock.call_count == 1
+
+            # CHA201705260 was uploaded and CHA201705272 is older than the S3 version, so only CHA201705272 is
+            # out of sync and the S3 folder must still be listed
+            list_s3_objects_mock.reset_mock()
+            send_file_mock.reset_mock()
+            result = runner.invoke(cli, f"sync up 2017 --file-type={FILE_TYPE} --data-set=bbref_boxscores")
+            assert result.exit_code == 0
+            assert list_s3_objects_mock.call_count == 1
+            assert send_file_mock.call_count == 0
+
+            # The ETag of the brooks_games_for_date S3 object matches the contents of the local file, after the
+            # first sync it is recorded in the manifest and the S3 folder is not listed again
+            list_s3_objects_mock.reset_mock()
+            result = runner.invoke(cli, f"sync up 2017 --file-type={FILE_TYPE} --data-set=brooks_games_for_date")
+            assert result.exit_code == 0
+            assert list_s3_objects_mock.call_count == 1
+            list_s3_objects_mock.reset_mock()
+            send_file_mock.reset_mock()
+            result = runner.invoke(cli, f"sync up 2017 --file-type={FILE_TYPE} --data-set=brooks_games_for_date")
+            assert result.exit_code == 0
+            assert list_s3_objects_mock.call_count == 0
+            assert send_file_mock.call_count == 0
+
+
+def test_cli_sync_up_same_size_file_with_different_etag(vig_app):
+    SYNC_DIRECTION = SyncDirection.UP_TO_S3
+    FILE_TYPE = VigFile.PARSED_JSON
+    DATA_SET = DataSet.BROOKS_GAMES_FOR_DATE
+    FILE_1_ID = "brooks_games_for_date_2017-05-26"
+    # Does not exist in S3
+    FILE_2_ID = "brooks_games_for_date_2017-05-27"
+    # The S3 object is the same size as the local file but the contents are different, and the local file is newer
+    s3_object = create_s3_object_mock(
+        vig_app, FILE_1_ID, FILE_TYPE, DATA_SET, mod_mtime=timedelta(hours=-2), e_tag='"0123456789abcdef"'
+    )
+
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
+        with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect([s3_object])
+            result = SyncScrapedDataTask(vig_app).execute(SYNC_DIRECTION, FILE_TYPE, DATA_SET, MLB_SEASON)
+            assert result.success
+            expected_calls = [
+                create_call_result(vig_app, FILE_1_ID, SYNC_DIRECTION, FILE_TYPE, DATA_SET),
+                create_call_result(vig_app, FILE_2_ID, SYNC_DIRECTION, FILE_TYPE, DATA_SET),
+            ]
+            assert sorted(send_file_mock.call_args_list, key=str) == sorted(expected_calls, key=str)
+
+            # After the upload the manifest holds the ETag of each local file, so the next sync skips it
+            send_file_mock.reset_mock()
+            list_s3_objects_mock.reset_mock()
+            result = SyncScrapedDataTask(vig_app).execute(SYNC_DIRECTION, FILE_TYPE, DATA_SET, MLB_SEASON)
+            assert result.success
+            assert list_s3_objects_mock.call_count == 0
+            assert send_file_mock.call_count == 0
+
+
+def test_cli_sync_down_resumes_after_error(vig_app):
+    FAILED_FILE_ID = "gid_2017_09_15_sdnmlb_colmlb_1"
+    downloaded_files = []
+
+    def send_file_side_effect(sync_direction, local_path, s3_key):
+        if FAILED_FILE_ID in s3_key:
+            raise ConnectionError("Connection was interrupted")
+        Path(local_path).write_text("{}")
+        downloaded_files.append(Path(local_path))
+
+    ALL_S3_OBJECTS_MOCK_DATA = create_bb_plog_objects_mock_data(vig_app)
+
+    with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.list_s3_objects") as list_s3_objects_mock:
+        with patch("vigorish.tasks.sync_scraped_data.SyncScrapedDataTask.send_file") as send_file_mock:
+            SYNC_DIRECTION = SyncDirection.DOWN_TO_LOCAL
+            FILE_TYPE = VigFile.PARSED_JSON
+            DATA_SET = DataSet.BROOKS_PITCH_LOGS
+            list_s3_objects_mock.side_effect = list_s3_objects_side_effect(ALL_S3_OBJECTS_MOCK_DATA)
+            send_file_mock.side_effect = send_file_side_effect
+            result = SyncScrapedDataTask(vig_app).execute(SYNC_DIRECTION, FILE_TYPE, DATA_SET, MLB_SEASON)
+            assert result.failure
+            assert FAILED_FILE_ID in result.error
+            assert len(downloaded_files) == 1
+
+            send_file_mock.reset_mock()
+            send_file_mock.side_effect = None
+            result = SyncScrapedDataTask(vig_app).execute(SYNC_DIRECTION, FILE_TYPE, DATA_SET, MLB_SEASON)
+            downloaded_files[0].unlink()
+            assert result.success
+            assert result.value["files"] == 1
+            expected_calls = [create_call_result(vig_app, FAILED_FILE_ID, SYNC_DIRECTION, FILE_TYPE, DATA_SET)]
             assert send_file_mock.call_args_list == expected_calls
@@ -0,0 +1,107 @@
+import vigorish.database as db
+from tests.util import capture_queries
+from vigorish.constants import TEAM_ID_MAP
+from vigorish.data.metrics.bat_stats import BatStatsMetricsFactory
+from vigorish.data.metrics.pitch_stats import PitchStatsMetricsFactory
+from vigorish.enums import DefensePosition
+
+from .conftest import GAME_DATE
+
+YEAR = 2019
+
+
+def get_stats_ids_by_team(db_session, stats_model, include=None):
+    team_id_map = db.Team.get_team_id_map_for_year(db_session, YEAR)
+    stats_ids_by_team = {}
+    for team_id_br in TEAM_ID_MAP:
+        team_stats = db_session.query(stats_model).filter(stats_model.player_team_id == team_id_map[team_id_br])
+        stats_ids_by_team[team_id_br] = [stats.id for stats in team_stats if not include or include(stats)]
+    return stats_ids_by_team
+
+
+def test_bat_stats_for_all_teams(vig_app):
+    bat_stats = BatStatsMetricsFactory(vig_app.db_session)
+    with capture_queries(vig_app.db_engine) as queries:
+        team_bat_stats = bat_stats.for_all_teams(YEAR)
+        team_bat_stats_for_starters = bat_stats.for_starters_for_all_teams(YEAR)
+        team_bat_stats_for_bench = bat_stats.for_bench_for_all_teams(YEAR)
+        team_bat_stats_for_leadoff = bat_stats.for_lineup_spots_for_all_teams([1], YEAR)
+        team_bat_stats_for_catchers = bat_stats.for_def_positions_for_all_teams([DefensePosition.CATCHER], YEAR)
+    assert len(queries) == 1
+
+    expected_splits = [
+        (team_bat_stats, None),
+        (team_bat_stats_for_starters, lambda bs: bs.is_starter == 1),
+        (team_bat_stats_for_bench, lambda bs: bs.is_starter == 0),
+        (team_bat_stats_for_leadoff, lambda bs: bs.bat_order == 1),
+        (team_bat_stats_for_catchers, lambda bs: bs.def_position == "2"),
+    ]
+    for team_metrics, include in expected_splits:
+        expected = get_stats_ids_by_team(vig_app.db_session, db.BatStats, include)
+        assert [metrics.team_id_bbref for metrics in team_metrics] == list(TEAM_ID_MAP)
+        assert {metrics.team_id_bbref: [bs.id for bs in metrics.bat_stats] for metrics in team_metrics} == expected
+    assert all(metrics.is_starter for metrics in team_bat_stats_for_starters)
+    assert sum(metrics.total_games for metrics in team_bat_stats) > 0
+
+
+def test_pitch_stats_for_all_teams(vig_app):
+    pitch_stats = PitchStatsMetricsFactory(vig_app.db_session)
+    with capture_queries(vig_app.db_engine) as queries:
+        team_pitch_stats = pitch_stats.for_all_teams(YEAR)
+        team_pitch_stats_for_sp = pitch_stats.for_sp_for_all_teams(YEAR)
+        team_pitch_stats_for_rp = pitch_stats.for_rp_for_all_teams(YEAR)
+    assert len(queries) == 1
+
+    expected_splits = [
+        (team_pitch_stats, None),
+        (team_pitch_stats_for_sp, lambda ps: ps.is_sp == 1),
+        (team_pitch_stats_for_rp, lambda ps: ps.is_rp == 1),
+    ]
+    for team_metrics, include in expected_splits:
+        expected = get_stats_ids_by_team(vig_app.db_session, db.PitchStats, include)
+        assert {metrics.team_id_bbref: [ps.id for ps in metrics.pitch_stats] for metrics in team_metrics} == expected
+    assert [metrics.role for metrics in team_pitch_stats_for_sp] == ["SP"] * len(TEAM_ID_MAP)
+    assert sum(metrics.total_games for metrics in team_pitch_stats) > 0
+
+
+def test_team_stats_for_season_are_ranked(vig_app):
+    team_bat_stats = vig_app.scraped_data.get_bat_stats_for_season_for_all_teams(YEAR)
+    assert sorted(metrics.rank for metrics in team_bat_stats.values()) == list(range(1, len(TEAM_ID_MAP) + 1))
+    ranked = sorted(team_bat_stats.values(), key=lambda metrics: metrics.rank)
+    assert [metrics.ops for metrics in ranked] == sorted((metrics.ops for metrics in ranked), reverse=True)
+    team_pitch_stats = vig_app.scraped_data.get_pitch_stats_for_season_for_all_teams(YEAR)
+    assert sorted(metrics.rank for metrics in team_pitch_stats.values()) == list(range(1, len(TEAM_ID_MAP) + 1))
+
+
+def test_season_standings(vig_app):
+    standings = vig_app.scraped_data.get_season_standings(YEAR, GAME_DATE)
+    for team_results in standings:
+        team_games = db.GameScrapeStatus.get_all_games_for_team(
+            vig_app.db_session, team_results["team_id_br"], YEAR, GAME_DATE
+        )
+        assert team_results["wins"] + team_results["losses"] == len(team_games)
+    standings_by_team = {team_results["team_id_br"]: team_results for team_results in standings}
+    assert len(standings_by_team) == len(db.Team.get_all_teams_for_season(vig_app.db_session, YEAR))
+    assert (standings_by_team["LAA"]["wins"], standings_by_team["LAA"]["losses"]) in [(1, 0), (0, 1)]
+    assert standings_by_team["LAA"]["runs"] == standings_by_team["TOR"]["runs_against"]
+    assert standings_by_team["LAA"]["runs_against"] == standings_by_team["TOR"]["runs"]
+
+
+def test_league_cache_is_not_refreshed_after_commit(vig_app):
+    bat_stats = BatStatsMetricsFactory(vig_app.db_session)
+    pitch_stats = PitchStatsMetricsFactory(vig_app.db_session)
+    bat_stats.for_all_teams(YEAR)
+    pitch_stats.for_all_teams(YEAR)
+    vig_app.db_session.commit()
+    with capture_queries(vig_app.db_engine) as queries:
+        team_stats = bat_stats.for_all_teams(YEAR) + pitch_stats.for_all_teams(YEAR)
+        team_stats_dicts = [metrics.as_dict() for metrics in team_stats]
+    assert len(queries) == 0
+    assert len(team_stats_dicts) == len(TEAM_ID_MAP) * 2
+
+    bat_stats.invalidate_league_cache(YEAR)
+    pitch_stats.invalidate_league_cache()
+    with capture_queries(vig_app.db_engine) as queries:
+        bat_stats.for_all_teams(YEAR)
+        pitch_stats.for_all_teams(YEAR)
+    assert len(queries) == 2
@@ -0,0 +1,32 @@
+import vigorish.database as db
+from tests.util import capture_queries
+from vigorish.data.name_search import PlayerNameSearch
+
+PITCHER_MLB_ID = 571882
+
+
+def get_player_id_name_map(db_session):
+    pitcher_ids = {ps.player_id_mlb for ps in db_session.query(db.PitchStats).all()}
+    batter_ids = {bs.player_id_mlb for bs in db_session.query(db.BatStats).all()}
+    return {mlb_id: db.PlayerId.find_by_mlb_id(db_session, mlb_id).mlb_name for mlb_id in pitcher_ids | batter_ids}
+
+
+def test_player_name_search(vig_app, tmp_path):
+    index_filepath = tmp_path.joinpath("player_names.json")
+    name_search = PlayerNameSearch(vig_app.db_session, index_filepath)
+    with capture_queries(vig_app.db_engine) as queries:
+        player_id_name_map = name_search.player_id_name_map
+    assert len(queries) == 2
+    assert player_id_name_map == get_player_id_name_map(vig_app.db_session)
+    assert index_filepath.exists()
+
+    pitcher_name = db.PlayerId.find_by_mlb_id(vig_app.db_session, PITCHER_MLB_ID).mlb_name
+    best_matches = name_search.fuzzy_match(pitcher_name.upper())
+    assert best_matches[0] == {"match": pitcher_name, "score": 100, "result": PITCHER_MLB_ID}
+    assert all(match["score"] >= 80 for match in best_matches)
+    assert name_search.fuzzy_match("zzzz qqqq", limit=3)
+
+    saved_name_search = PlayerNameSearch(vig_app.db_session, index_filepath)
+    with capture_queries(vig_app.db_engine) as queries:
+        assert saved_name_search.fuzzy_match(pitcher_name) == name_search.fuzzy_match(pitcher_name)
+    assert len(queries) == 2
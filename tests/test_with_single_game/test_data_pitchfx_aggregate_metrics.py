@@ -0,0 +1,72 @@
+import pytest
+
+import vigorish.database as db
+from vigorish.data.metrics.pitchfx import (
+    PitchFxAggregateGroups,
+    PitchFxAggregateMetrics,
+    PitchFxColumns,
+    PitchFxGroups,
+    PitchFxMetricsFactory,
+)
+
+from .conftest import BBREF_GAME_ID
+
+PITCHER_MLB_ID = 571882
+BATTER_MLB_ID = 519299
+
+
+def last_digit(value: float) -> float:
+    decimals = str(float(value)).split(".")[1].rstrip("0")
+    return 10 ** -len(decimals)
+
+
+def assert_metrics_dicts_match(aggregate_metrics, pfx_metrics):
+    # Averages are calculated from sums that SQLite and numpy accumulate in a different order, so a value that
+    # falls exactly on a rounding boundary can differ by one in its last rounded digit. Everything else must
+    # match exactly.
+    assert aggregate_metrics.keys() == pfx_metrics.keys()
+    for name, value in aggregate_metrics.items():
+        if isinstance(value, dict):
+            assert_metrics_dicts_match(value, pfx_metrics[name])
+        elif name.startswith("avg_"):
+            assert value == pytest.approx(pfx_metrics[name], abs=last_digit(pfx_metrics[name]) * 1.01)
+        else:
+            assert value == pfx_metrics[name]
+
+
+def test_aggregate_groups_match_column_groups(vig_app):
+    game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, BBREF_GAME_ID)
+    criteria = [db.PitchFx.game_status_id == game_status.id]
+    pfx_groups = PitchFxGroups(PitchFxColumns.from_db(vig_app.db_session, *criteria))
+    pfx_aggregate_groups = PitchFxAggregateGroups.from_db(vig_app.db_session, *criteria)
+    assert pfx_aggregate_groups.groups.keys() == pfx_groups.groups.keys()
+    assert pfx_aggregate_groups.total_pitches == pfx_groups.total_pitches
+    for key, positions in pfx_groups.groups.items():
+        assert len(pfx_aggregate_groups.groups[key]) == len(positions)
+
+
+def test_aggregate_metrics_match_array_metrics(vig_app):
+    pfx_metrics = PitchFxMetricsFactory(vig_app)
+    pfx_aggregate_metrics = PitchFxMetricsFactory(vig_app, aggregate_in_db=True)
+    career = pfx_aggregate_metrics.for_pitcher_career(PITCHER_MLB_ID, "R")
+    assert isinstance(career.all.metrics_combined, PitchFxAggregateMetrics)
+    assert_metrics_dicts_match(career.as_dict(), pfx_metrics.for_pitcher_career(PITCHER_MLB_ID, "R").as_dict())
+    team_pitching = pfx_aggregate_metrics.for_team_pitching("LAA", 2019)
+    assert_metrics_dicts_match(team_pitching.as_dict(), pfx_metrics.for_team_pitching("LAA", 2019).as_dict())
+    team_batting = pfx_aggregate_metrics.for_team_batting("LAA", 2019)
+    assert_metrics_dicts_match(team_batting.as_dict(), pfx_metrics.for_team_batting("LAA", 2019).as_dict())
+    batter = pfx_aggregate_metrics.for_batter_by_year(BATTER_MLB_ID)
+    assert_metrics_dicts_match(
+        {year: m.as_dict() for year, m in batter.items()},
+        {year: m.as_dict() for year, m in pfx_metrics.for_batter_by_year(BATTER_MLB_ID).items()},
+    )
+
+
+def test_aggregate_metrics_with_no_pitches(vig_app):
+    pfx = PitchFxAggregateGroups.from_db(vig_app.db_session, db.PitchFx.id == -1)
+    assert pfx.total_pitches == 0
+    pfx_metrics = PitchFxAggregateMetrics(pfx.valid_pitches())
+    assert pfx_metrics.total_pitches == 0
+    assert pfx_metrics.avg_speed == 0.0
+    assert pfx_metrics.max_launch_speed == 0.0
+    assert pfx_metrics.whiff_rate == 0.0
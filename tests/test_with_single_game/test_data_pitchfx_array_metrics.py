@@ -0,0 +1,88 @@
+import vigorish.database as db
+from vigorish.data.metrics.pitchfx import (
+    PitchFxArrayMetrics,
+    PitchFxColumns,
+    PitchFxGroups,
+    PitchFxMetrics,
+    PitchFxMetricsFactory,
+    PitchFxPitchingMetrics,
+)
+from vigorish.enums import PitchType
+
+from .conftest import BBREF_GAME_ID
+
+PITCHER_MLB_ID = 571882
+
+
+def assert_array_metrics_match(pfx):
+    pfx_metrics = PitchFxMetrics(pfx)
+    pfx_array_metrics = PitchFxArrayMetrics(PitchFxColumns.from_pfx(pfx))
+    assert pfx_array_metrics.as_dict() == pfx_metrics.as_dict()
+    for pitch_type in PitchType(pfx_metrics.pitch_type_int):
+        pfx_for_pitch_type = [p for p in pfx if p.mlbam_pitch_name == str(pitch_type)]
+        pfx_columns = PitchFxColumns.from_pfx(pfx_for_pitch_type)
+        assert PitchFxArrayMetrics(pfx_columns).as_dict() == PitchFxMetrics(pfx_for_pitch_type).as_dict()
+
+
+def test_array_metrics_match_pitcher_metrics(vig_app):
+    pitcher = db.PlayerId.find_by_mlb_id(vig_app.db_session, PITCHER_MLB_ID)
+    pfx = vig_app.db_session.query(db.PitchFx).filter_by(pitcher_id=pitcher.db_player_id).all()
+    assert pfx
+    assert_array_metrics_match(pfx)
+
+
+def test_array_metrics_match_team_metrics(vig_app):
+    team = db.Team.find_by_team_id_and_year(vig_app.db_session, "LAA", 2019)
+    pfx = vig_app.db_session.query(db.PitchFx).filter_by(team_batting_id=team.id).all()
+    assert pfx
+    assert_array_metrics_match(pfx)
+
+
+def test_columns_loaded_from_db_match_orm_rows(vig_app):
+    game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, BBREF_GAME_ID)
+    pfx = vig_app.db_session.query(db.PitchFx).filter_by(game_status_id=game_status.id).all()
+    pfx_columns = PitchFxColumns.from_db(vig_app.db_session, db.PitchFx.game_status_id == game_status.id)
+    assert len(pfx_columns) == len(pfx)
+    assert PitchFxArrayMetrics(pfx_columns).as_dict() == PitchFxMetrics(pfx).as_dict()
+
+
+def test_array_metrics_with_no_pitches():
+    pfx_metrics = PitchFxArrayMetrics(PitchFxColumns.from_pfx([]))
+    assert pfx_metrics.total_pitches == 0
+    assert pfx_metrics.avg_speed == 0.0
+    assert pfx_metrics.max_launch_speed == 0.0
+    assert pfx_metrics.whiff_rate == 0.0
+
+
+def test_split_views_share_column_store(vig_app):
+    pitcher = db.PlayerId.find_by_mlb_id(vig_app.db_session, PITCHER_MLB_ID)
+    pfx = PitchFxColumns.from_db(vig_app.db_session, db.PitchFx.pitcher_id == pitcher.db_player_id)
+    pfx_metrics = PitchFxPitchingMetrics(pfx, PITCHER_MLB_ID, "R")
+    for pfx_metrics_set in [pfx_metrics.all, pfx_metrics.rhb, pfx_metrics.lhb]:
+        assert pfx_metrics_set.metrics_combined.pfx.columns is pfx.columns
+        for metrics in pfx_metrics_set.metrics_by_pitch_type.values():
+            assert metrics.pfx.columns is pfx.columns
+    assert not pfx.columns["start_speed"].flags.writeable
+
+
+def test_pitchfx_groups_single_pass_partition(vig_app):
+    game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, BBREF_GAME_ID)
+    pfx = PitchFxColumns.from_db(vig_app.db_session, db.PitchFx.game_status_id == game_status.id)
+    pfx_groups = PitchFxGroups(pfx)
+    assert pfx_groups.total_pitches == len(pfx)
+    assert pfx_groups.filter(stand="R").total_pitches == int((pfx["stand"] == "R").sum())
+    assert pfx_groups.filter(p_throws="L", stand="L").total_pitches == int(
+        ((pfx["p_throws"] == "L") & (pfx["stand"] == "L")).sum()
+    )
+    for pitch_type_int, pfx_for_pitch_type in pfx_groups.valid_pitches_by_pitch_type().items():
+        assert set(pfx_for_pitch_type["pitch_type_int"]) == {pitch_type_int}
+        assert list(pfx_for_pitch_type.index) == sorted(pfx_for_pitch_type.index)
+
+
+def test_pitcher_career_and_by_year_from_one_partition(vig_app):
+    pfx_metrics = PitchFxMetricsFactory(vig_app)
+    (career, by_year) = pfx_metrics.for_pitcher_career_and_by_year(PITCHER_MLB_ID, "R")
+    assert career.as_dict() == pfx_metrics.for_pitcher_career(PITCHER_MLB_ID, "R").as_dict()
+    assert {year: m.as_dict() for year, m in by_year.items()} == {
+        year: m.as_dict() for year, m in pfx_metrics.for_pitcher_by_year(PITCHER_MLB_ID, "R").items()
+    }
@@ -0,0 +1,40 @@
+from vigorish.data.metrics.pitchfx import get_pfx_metrics_cache, PitchFxMetricsFactory
+from vigorish.tasks import AddToDatabaseTask
+
+from .conftest import BBREF_GAME_ID
+
+PITCHER_MLB_ID = 571882
+BATTER_MLB_ID = 519299
+YEAR = 2019
+
+
+def test_pitchfx_metrics_are_cached_across_factories(vig_app):
+    cache = get_pfx_metrics_cache()
+    pfx_metrics = PitchFxMetricsFactory(vig_app).for_pitcher_career(PITCHER_MLB_ID, "R")
+    hits = cache.stats["hits"]
+    assert PitchFxMetricsFactory(vig_app).for_pitcher_career(PITCHER_MLB_ID, "R") is pfx_metrics
+    assert PitchFxMetricsFactory(vig_app).for_pitcher_career(PITCHER_MLB_ID, "R", remove_outliers=True) is pfx_metrics
+    assert cache.stats["hits"] == hits + 2
+    assert PitchFxMetricsFactory(vig_app).for_pitcher_career(PITCHER_MLB_ID, "R", False) is not pfx_metrics
+    aggregate_factory = PitchFxMetricsFactory(vig_app, aggregate_in_db=True)
+    assert aggregate_factory.for_pitcher_career(PITCHER_MLB_ID, "R") is not pfx_metrics
+    assert PitchFxMetricsFactory(vig_app, use_cache=False).for_pitcher_career(PITCHER_MLB_ID, "R") is not pfx_metrics
+    assert vig_app.scraped_data.get_pfx_metrics_cache_stats()["hit_rate"] > 0
+
+
+def test_import_invalidates_pitchfx_metrics(vig_app):
+    factory = PitchFxMetricsFactory(vig_app)
+    pitcher_career = factory.for_pitcher_career(PITCHER_MLB_ID, "R")
+    batter_game = factory.for_batter_game(BATTER_MLB_ID, BBREF_GAME_ID)
+    batter_season = factory.for_batter_season(BATTER_MLB_ID, YEAR)
+    team_pitching = factory.for_team_pitching("TOR", YEAR)
+    assert factory.for_batter_game(BATTER_MLB_ID, BBREF_GAME_ID) is batter_game
+
+    add_to_db = AddToDatabaseTask(vig_app)
+    add_to_db.pfx_player_ids = {BATTER_MLB_ID}
+    add_to_db.pfx_years = {YEAR}
+    add_to_db.invalidate_pfx_metrics()
+    assert factory.for_pitcher_career(PITCHER_MLB_ID, "R") is pitcher_career
+    assert factory.for_batter_game(BATTER_MLB_ID, BBREF_GAME_ID) is not batter_game
+    assert factory.for_batter_season(BATTER_MLB_ID, YEAR) is not batter_season
+    assert factory.for_team_pitching("TOR", YEAR) is not team_pitching
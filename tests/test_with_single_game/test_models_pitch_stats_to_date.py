@@ -0,0 +1,56 @@
+import vigorish.database as db
+from vigorish.tasks import RebuildPitchStatsToDateTask
+
+from .conftest import GAME_DATE
+
+PITCHER_MLB_ID = 571882
+
+
+def get_all_rows(db_session):
+    rows = db_session.query(db.PitchStatsToDate).order_by(db.PitchStatsToDate.player_id).all()
+    return [(row.player_id, row.season_id, row.date_id, row.player_id_mlb, row.as_dict()) for row in rows]
+
+
+def test_pitch_stats_to_date_match_pitch_stats(vig_app):
+    pitch_stats = vig_app.db_session.query(db.PitchStats).all()
+    rows = get_all_rows(vig_app.db_session)
+    assert len(rows) == len(pitch_stats)
+    for stats_to_date in vig_app.db_session.query(db.PitchStatsToDate):
+        pitch_apps = [ps for ps in pitch_stats if ps.player_id == stats_to_date.player_id]
+        assert stats_to_date.total_games == len(pitch_apps)
+        assert stats_to_date.wins == sum(ps.is_wp for ps in pitch_apps)
+        assert stats_to_date.losses == sum(ps.is_lp for ps in pitch_apps)
+        assert stats_to_date.saves == sum(ps.is_sv for ps in pitch_apps)
+        assert stats_to_date.innings_pitched == sum(ps.innings_pitched for ps in pitch_apps)
+
+
+def get_pitch_apps_up_to_date(db_session, mlb_id, game_date):
+    player_id = db.PlayerId.find_by_mlb_id(db_session, mlb_id)
+    date_status = db.DateScrapeStatus.find_by_date(db_session, game_date)
+    return (
+        db_session.query(db.PitchStats)
+        .filter(db.PitchStats.player_id == player_id.db_player_id)
+        .filter(db.PitchStats.date_id <= date_status.id)
+        .filter(db.PitchStats.season_id == date_status.season_id)
+        .all()
+    )
+
+
+def test_pitcher_record_and_saves_on_date(vig_app):
+    pitch_apps = get_pitch_apps_up_to_date(vig_app.db_session, PITCHER_MLB_ID, GAME_DATE)
+    assert pitch_apps
+    expected_record = (sum(p.is_wp for p in pitch_apps), sum(p.is_lp for p in pitch_apps))
+    assert vig_app.scraped_data.get_pitcher_record_on_date(PITCHER_MLB_ID, GAME_DATE) == expected_record
+    expected_saves = sum(p.is_sv for p in pitch_apps)
+    assert vig_app.scraped_data.get_pitcher_total_saves_on_date(PITCHER_MLB_ID, GAME_DATE) == expected_saves
+    stats_to_date = vig_app.scraped_data.get_pitch_stats_to_date_for_player(PITCHER_MLB_ID, GAME_DATE)
+    assert stats_to_date.innings_pitched == sum(p.innings_pitched for p in pitch_apps)
+
+
+def test_rebuild_pitch_stats_to_date(vig_app):
+    rows = get_all_rows(vig_app.db_session)
+    result = RebuildPitchStatsToDateTask(vig_app).execute(2019)
+    assert result.success
+    assert result.value == len(rows)
+    vig_app.db_session.expire_all()
+    assert get_all_rows(vig_app.db_session) == rows
@@ -0,0 +1,67 @@
+import re
+
+import pytest
+
+from tests.util import capture_queries
+from vigorish.data.metrics.pitchfx import PitchFxMetricsFactory
+from vigorish.data.player_data import PlayerData
+
+from .conftest import BBREF_GAME_ID, GAME_DATE
+
+PITCHER_MLB_ID = 571882
+BATTER_MLB_ID = 519299
+TEAM_ID_BR = "TOR"
+YEAR = 2019
+
+FACT_TABLE_REGEX = re.compile(r"\bFROM (pitchfx|pitch_stats|bat_stats)\b")
+FULL_SCAN_REGEX = re.compile(r"^SCAN (TABLE )?(pitchfx|pitch_stats|bat_stats)\b")
+
+FACTORY_QUERIES = {
+    "for_pitch_app": lambda f: f.for_pitch_app(f"{BBREF_GAME_ID}_{PITCHER_MLB_ID}", "R"),
+    "for_pitcher_season": lambda f: f.for_pitcher_season(PITCHER_MLB_ID, YEAR, "R"),
+    "for_pitcher_career": lambda f: f.for_pitcher_career(PITCHER_MLB_ID, "R"),
+    "for_pitcher_by_year": lambda f: f.for_pitcher_by_year(PITCHER_MLB_ID, "R"),
+    "for_batter_game": lambda f: f.for_batter_game(BATTER_MLB_ID, BBREF_GAME_ID),
+    "for_batter_season": lambda f: f.for_batter_season(BATTER_MLB_ID, YEAR),
+    "for_batter_career": lambda f: f.for_batter_career(BATTER_MLB_ID),
+    "for_team_pitching": lambda f: f.for_team_pitching(TEAM_ID_BR, YEAR),
+    "for_team_batting": lambda f: f.for_team_batting(TEAM_ID_BR, YEAR),
+}
+
+
+def get_full_table_scans(db_engine, queries):
+    full_scans = []
+    with db_engine.connect() as conn:
+        for statement, parameters in queries:
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+                if FULL_SCAN_REGEX.match(row.detail):
+                    full_scans.append(f"{row.detail}: {statement}")
+    return full_scans
+
+
+def assert_no_full_table_scans(db_engine, queries):
+    assert any(FACT_TABLE_REGEX.search(statement) for statement, _ in queries)
+    assert not get_full_table_scans(db_engine, queries)
+
+
+@pytest.mark.parametrize("aggregate_in_db", [False, True])
+@pytest.mark.parametrize("query_name", FACTORY_QUERIES.keys())
+def test_pitchfx_metrics_factory_queries_use_indexes(vig_app, query_name, aggregate_in_db):
+    factory = PitchFxMetricsFactory(vig_app, aggregate_in_db=aggregate_in_db, use_cache=False)
+    with capture_queries(vig_app.db_engine, select_only=True) as queries:
+        pfx_metrics = FACTORY_QUERIES[query_name](factory)
+    assert pfx_metrics
+    assert_no_full_table_scans(vig_app.db_engine, queries)
+
+
+def test_barrels_for_game_date_query_uses_index(vig_app):
+    with capture_queries(vig_app.db_engine, select_only=True) as queries:
+        vig_app.scraped_data.get_all_barrels_for_game_date(GAME_DATE)
+    assert_no_full_table_scans(vig_app.db_engine, queries)
+
+
+def test_team_stint_details_queries_use_indexes(vig_app):
+    player_data = PlayerData(vig_app, PITCHER_MLB_ID)
+    with capture_queries(vig_app.db_engine, select_only=True) as queries:
+        player_data.get_team_stint_details_for_season(YEAR)
+    assert_no_full_table_scans(vig_app.db_engine, queries)
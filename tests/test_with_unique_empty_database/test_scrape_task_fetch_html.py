@@ -0,0 +1,158 @@
+import shutil
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+
+import pytest
+from requests import get as requests_get
+
+import vigorish.database as db
+from tests.conftest import CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
+from tests.util import GAME_DATE_PFX as GAME_DATE
+from tests.util import GAME_ID_PFX as BBREF_GAME_ID
+from tests.util import (
+    update_scraped_bbref_games_for_date,
+    update_scraped_boxscore,
+    update_scraped_brooks_games_for_date,
+    update_scraped_pitch_logs,
+)
+from vigorish.app import Vigorish
+from vigorish.config.types.batch_job_settings import BatchJobSettings
+from vigorish.config.types.batch_scrape_delay import BatchScrapeDelay
+from vigorish.config.types.url_scrape_delay import UrlScrapeDelay
+from vigorish.enums import DataSet, VigFile
+from vigorish.scrape.brooks_pitchfx.scrape_task import ScrapeBrooksPitchFx
+from vigorish.scrape.html_fetcher import AsyncHtmlFetcher, HostRateLimiter
+from vigorish.scrape.url_details import UrlDetails
+from vigorish.scrape.url_tracker import UrlTracker
+from vigorish.util.result import Result
+
+DATA_SET = DataSet.BROOKS_PITCHFX
+PITCH_APP_ID = "OAK201804010_660271"
+HTML_FOLDER = TESTS_FOLDER.joinpath("html_storage", "2018", "brooks_pitchfx")
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def vig_app(request):
+    """Returns an instance of the application with pitch logs for one game scraped, but no pitchfx data."""
+    app = Vigorish()
+    app.initialize_database(csv_folder=CSV_FOLDER, json_folder=JSON_FOLDER)
+    assert app.db_setup_complete
+    update_scraped_bbref_games_for_date(app, GAME_DATE)
+    update_scraped_brooks_games_for_date(app, GAME_DATE)
+    update_scraped_boxscore(app, BBREF_GAME_ID)
+    update_scraped_pitch_logs(app, GAME_DATE, BBREF_GAME_ID)
+    app.db_session.commit()
+
+    def fin():
+        app.db_session.close()
+        for file in TESTS_FOLDER.glob("vig_*.db"):
+            file.unlink()
+
+    request.addfinalizer(fin)
+    return app
+
+
+@pytest.fixture()
+def html_server():
+    """Serves the test HTML files from a local HTTP server in place of brooksbaseball.net."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietRequestHandler, directory=str(HTML_FOLDER)))
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_missing_html_parses_each_page_on_arrival(vig_app, html_server, tmp_path):
+    result = vig_app.create_scrape_job([DATA_SET], GAME_DATE, GAME_DATE)
+    assert result.success
+    db_job = result.value
+    url = UrlDetails(
+        url=f"{html_server}/{PITCH_APP_ID}.html",
+        url_id=PITCH_APP_ID,
+        fileName=f"{PITCH_APP_ID}.html",
+        cachedHtmlFolderPath=str(tmp_path.joinpath("cached")),
+        scrapedHtmlFolderpath=str(tmp_path),
+    )
+    scrape_task = ScrapeBrooksPitchFx(vig_app, db_job)
+    scrape_task.start_date = scrape_task.end_date = GAME_DATE
+    scrape_task.url_tracker = UrlTracker(db_job, DATA_SET, vig_app.scraped_data)
+    scrape_task.url_tracker.all_urls = {GAME_DATE: [url]}
+    scrape_task.url_tracker.missing_urls.append(url)
+    rate_limiter = HostRateLimiter(
+        UrlScrapeDelay(False, False, 0, 0, 0),
+        BatchJobSettings(False, False, 0, 0, 0),
+        BatchScrapeDelay(False, False, 0, 0, 0),
+    )
+    scrape_task.html_fetcher = AsyncHtmlFetcher(rate_limiter, max_concurrency=2)
+    try:
+        result = scrape_task.scrape_missing_html()
+        assert result.success
+        assert scrape_task.url_tracker.completed_urls == [url]
+        assert scrape_task.url_tracker.parsed_url_ids == {PITCH_APP_ID}
+        pitch_app_status = db.PitchAppScrapeStatus.find_by_pitch_app_id(vig_app.db_session, PITCH_APP_ID)
+        assert pitch_app_status.scraped_pitchfx == 1
+        assert pitch_app_status.pitch_count_pitchfx == 92
+        pitchfx_log = vig_app.scraped_data.get_brooks_pitchfx_log(PITCH_APP_ID)
+        assert pitchfx_log.total_pitch_count == 92
+
+        result = scrape_task.parse_scraped_html()
+        assert result.success
+        assert scrape_task.url_tracker.parsed_url_ids == {PITCH_APP_ID}
+    finally:
+        json_folder = Path(vig_app.scraped_data.get_local_folderpath(VigFile.PARSED_JSON, DATA_SET, GAME_DATE.year))
+        json_folder.joinpath(f"{PITCH_APP_ID}.json").unlink(missing_ok=True)
+        shutil.rmtree(db_job.scraped_html_root_folder, ignore_errors=True)
+
+
+def request_url_without_retries(url):
+    response = requests_get(url)
+    return Result.Ok(response) if response.ok else Result.Fail(f"{response.status_code} error: {url}")
+
+
+def test_fetch_missing_html_continues_after_failed_url(vig_app, html_server, tmp_path):
+    result = vig_app.create_scrape_job([DATA_SET], GAME_DATE, GAME_DATE)
+    assert result.success
+    db_job = result.value
+    urls = [
+        UrlDetails(
+            url=f"{html_server}/{url_id}.html",
+            url_id=url_id,
+            fileName=f"{url_id}.html",
+            cachedHtmlFolderPath=str(tmp_path.joinpath("cached")),
+            scrapedHtmlFolderpath=str(tmp_path),
+        )
+        for url_id in ["OAK201804010_000000", PITCH_APP_ID]
+    ]
+    scrape_task = ScrapeBrooksPitchFx(vig_app, db_job)
+    scrape_task.start_date = scrape_task.end_date = GAME_DATE
+    scrape_task.url_tracker = UrlTracker(db_job, DATA_SET, vig_app.scraped_data)
+    scrape_task.url_tracker.all_urls = {GAME_DATE: urls}
+    scrape_task.url_tracker.missing_urls.extend(urls)
+    rate_limiter = HostRateLimiter(
+        UrlScrapeDelay(False, False, 0, 0, 0),
+        BatchJobSettings(False, False, 0, 0, 0),
+        BatchScrapeDelay(False, False, 0, 0, 0),
+    )
+    scrape_task.html_fetcher = AsyncHtmlFetcher(rate_limiter, max_concurrency=1, request_url=request_url_without_retries)
+    try:
+        result = scrape_task.scrape_missing_html()
+        assert result.success
+        assert scrape_task.url_tracker.completed_urls == [urls[1]]
+        assert scrape_task.url_tracker.failed_urls == [urls[0]]
+        assert not scrape_task.url_tracker.missing_urls
+        assert scrape_task.url_tracker.parsed_url_ids == {PITCH_APP_ID}
+
+        result = scrape_task.check_failed_urls()
+        assert result.failure
+        assert "404 error" in result.error and urls[0].url in result.error
+    finally:
+        json_folder = Path(vig_app.scraped_data.get_local_folderpath(VigFile.PARSED_JSON, DATA_SET, GAME_DATE.year))
+        json_folder.joinpath(f"{PITCH_APP_ID}.json").unlink(missing_ok=True)
+        shutil.rmtree(db_job.scraped_html_root_folder, ignore_errors=True)
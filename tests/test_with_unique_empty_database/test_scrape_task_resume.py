@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+
+import vigorish.database as db
+from tests.conftest import CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
+from tests.util import (
+    GAME_ID_NO_ERRORS,
+    update_scraped_bbref_games_for_date,
+    update_scraped_boxscore,
+    update_scraped_brooks_games_for_date,
+    update_scraped_pitch_logs,
+)
+from vigorish.app import Vigorish
+from vigorish.enums import DataSet, ScrapeCondition
+from vigorish.scrape.brooks_pitchfx.scrape_task import ScrapeBrooksPitchFx
+from vigorish.scrape.url_details import UrlDetails
+from vigorish.scrape.url_tracker import UrlTracker
+from vigorish.status.status_batch import StatusUpdateBatch
+
+DATA_SET = DataSet.BROOKS_PITCHFX
+GAME_DATE = datetime(2019, 6, 17)
+HTML_FOLDER = TESTS_FOLDER.joinpath("html_storage", "2019", "brooks_pitchfx")
+NOT_SAVED_PITCH_APP_ID = f"{GAME_ID_NO_ERRORS}_999999"
+
+
+@pytest.fixture()
+def vig_app(request):
+    """Returns an instance of the application with pitch logs for one game scraped, but no pitchfx data."""
+    app = Vigorish()
+    app.initialize_database(csv_folder=CSV_FOLDER, json_folder=JSON_FOLDER)
+    assert app.db_setup_complete
+    update_scraped_bbref_games_for_date(app, GAME_DATE)
+    update_scraped_brooks_games_for_date(app, GAME_DATE)
+    update_scraped_boxscore(app, GAME_ID_NO_ERRORS)
+    update_scraped_pitch_logs(app, GAME_DATE, GAME_ID_NO_ERRORS)
+    app.db_session.commit()
+
+    def fin():
+        app.db_session.close()
+        for file in TESTS_FOLDER.glob("vig_*.db"):
+            file.unlink()
+
+    request.addfinalizer(fin)
+    return app
+
+
+def test_resume_from_saved_json(vig_app, tmp_path):
+    result = vig_app.create_scrape_job([DATA_SET], GAME_DATE, GAME_DATE)
+    assert result.success
+    db_job = result.value
+    pitch_app_ids = sorted(html_file.stem for html_file in HTML_FOLDER.glob(f"{GAME_ID_NO_ERRORS}_*.html"))
+    urls = [create_url_details(pitch_app_id, tmp_path) for pitch_app_id in pitch_app_ids + [NOT_SAVED_PITCH_APP_ID]]
+    scrape_task = ScrapeBrooksPitchFx(vig_app, db_job)
+    scrape_task.scrape_condition = ScrapeCondition.ONLY_MISSING_DATA
+    scrape_task.status_batch = StatusUpdateBatch(vig_app.db_session, batch_size=5, batch_seconds=0)
+    scrape_task.url_tracker = UrlTracker(db_job, DATA_SET, vig_app.scraped_data)
+    scrape_task.url_tracker.all_urls = {GAME_DATE: urls}
+    scrape_task.url_tracker.need_urls.extend(urls)
+
+    result = scrape_task.resume_from_saved_json()
+    assert result.success
+    assert [url.url_id for url in scrape_task.url_tracker.need_urls] == [NOT_SAVED_PITCH_APP_ID]
+    assert [url.url_id for url in scrape_task.url_tracker.skip_urls] == pitch_app_ids
+    assert scrape_task.status_batch.total_commits == 3
+    vig_app.db_session.expire_all()
+    for pitch_app_id in pitch_app_ids:
+        pitch_app_status = db.PitchAppScrapeStatus.find_by_pitch_app_id(vig_app.db_session, pitch_app_id)
+        assert pitch_app_status.scraped_pitchfx == 1
+        pitchfx_log = vig_app.scraped_data.get_brooks_pitchfx_log(pitch_app_id)
+        assert pitch_app_status.pitch_count_pitchfx == pitchfx_log.total_pitch_count
+
+
+def test_resume_skipped_when_always_scraping(vig_app, tmp_path):
+    result = vig_app.create_scrape_job([DATA_SET], GAME_DATE, GAME_DATE)
+    assert result.success
+    db_job = result.value
+    urls = [create_url_details(html_file.stem, tmp_path) for html_file in HTML_FOLDER.glob(f"{GAME_ID_NO_ERRORS}_*")]
+    scrape_task = ScrapeBrooksPitchFx(vig_app, db_job)
+    scrape_task.scrape_condition = ScrapeCondition.ALWAYS
+    scrape_task.url_tracker = UrlTracker(db_job, DATA_SET, vig_app.scraped_data)
+    scrape_task.url_tracker.all_urls = {GAME_DATE: urls}
+    scrape_task.url_tracker.need_urls.extend(urls)
+
+    result = scrape_task.resume_from_saved_json()
+    assert result.success
+    assert scrape_task.url_tracker.need_urls == urls
+    assert not scrape_task.url_tracker.skip_urls
+
+
+def create_url_details(pitch_app_id, folder):
+    return UrlDetails(
+        url=f"http://127.0.0.1/{pitch_app_id}.html",
+        url_id=pitch_app_id,
+        fileName=f"{pitch_app_id}.html",
+        cachedHtmlFolderPath=str(folder),
+        scrapedHtmlFolderpath=str(folder),
+    )
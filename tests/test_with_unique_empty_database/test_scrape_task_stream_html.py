@@ -0,0 +1,189 @@
+import shutil
+from datetime import datetime
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from queue import Queue
+from threading import current_thread, main_thread, Thread
+
+import pytest
+from sqlalchemy import event
+
+import vigorish.database as db
+from tests.conftest import CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
+from tests.util import (
+    GAME_ID_NO_ERRORS,
+    update_scraped_bbref_games_for_date,
+    update_scraped_boxscore,
+    update_scraped_brooks_games_for_date,
+    update_scraped_pitch_logs,
+)
+from vigorish.app import Vigorish
+from vigorish.config.types.batch_job_settings import BatchJobSettings
+from vigorish.config.types.batch_scrape_delay import BatchScrapeDelay
+from vigorish.config.types.url_scrape_delay import UrlScrapeDelay
+from vigorish.enums import DataSet, VigFile
+from vigorish.scrape.brooks_pitchfx.scrape_task import ScrapeBrooksPitchFx
+from vigorish.scrape.html_fetcher import AsyncHtmlFetcher, HostRateLimiter
+from vigorish.scrape.scrape_task import PARSE_COMPLETE
+from vigorish.scrape.url_details import UrlDetails
+from vigorish.scrape.url_tracker import UrlTracker
+from vigorish.status.status_batch import StatusUpdateBatch
+from vigorish.util.result import Result
+
+DATA_SET = DataSet.BROOKS_PITCHFX
+GAME_DATE = datetime(2019, 6, 17)
+HTML_FOLDER = TESTS_FOLDER.joinpath("html_storage", "2019", "brooks_pitchfx")
+BATCH_SIZE = 4
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def vig_app(request):
+    """Returns an instance of the application with pitch logs for one game scraped, but no pitchfx data."""
+    app = Vigorish()
+    app.initialize_database(csv_folder=CSV_FOLDER, json_folder=JSON_FOLDER)
+    assert app.db_setup_complete
+    update_scraped_bbref_games_for_date(app, GAME_DATE)
+    update_scraped_brooks_games_for_date(app, GAME_DATE)
+    update_scraped_boxscore(app, GAME_ID_NO_ERRORS)
+    update_scraped_pitch_logs(app, GAME_DATE, GAME_ID_NO_ERRORS)
+    app.db_session.commit()
+
+    def fin():
+        app.db_session.close()
+        for file in TESTS_FOLDER.glob("vig_*.db"):
+            file.unlink()
+
+    request.addfinalizer(fin)
+    return app
+
+
+@pytest.fixture()
+def html_server():
+    """Serves the test HTML files from a local HTTP server in place of brooksbaseball.net."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietRequestHandler, directory=str(HTML_FOLDER)))
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def pitchfx_json(vig_app):
+    """Restores the JSON files for the test game after the scrape task has overwritten them."""
+    json_folder = Path(vig_app.scraped_data.get_local_folderpath(VigFile.PARSED_JSON, DATA_SET, GAME_DATE.year))
+    json_files = {file: file.read_bytes() for file in json_folder.glob(f"{GAME_ID_NO_ERRORS}_*.json")}
+    yield json_files
+    for file, contents in json_files.items():
+        file.write_bytes(contents)
+
+
+def test_stream_scraped_html_commits_in_batches(vig_app, html_server, pitchfx_json, tmp_path):
+    html_files = sorted(HTML_FOLDER.glob(f"{GAME_ID_NO_ERRORS}_*.html"))
+    scrape_task = create_stream_scrape_task(vig_app, html_server, html_files, tmp_path)
+    db_job = scrape_task.db_job
+    missing_urls = scrape_task.url_tracker.missing_urls[:]
+    try:
+        result = scrape_task.stream_scraped_html()
+        assert result.success
+    finally:
+        shutil.rmtree(db_job.scraped_html_root_folder, ignore_errors=True)
+    assert not scrape_task.url_tracker.missing_urls
+    assert sorted(scrape_task.url_tracker.completed_urls, key=lambda url: url.url_id) == missing_urls
+    assert scrape_task.url_tracker.parsed_url_ids == {html_file.stem for html_file in html_files}
+    assert scrape_task.status_batch.total_commits == len(html_files) // BATCH_SIZE
+    assert not scrape_task.status_batch.pending_ids
+    for html_file in html_files:
+        pitch_app_status = db.PitchAppScrapeStatus.find_by_pitch_app_id(vig_app.db_session, html_file.stem)
+        assert pitch_app_status.scraped_pitchfx == 1
+        pitchfx_log = vig_app.scraped_data.get_brooks_pitchfx_log(html_file.stem)
+        assert pitch_app_status.pitch_count_pitchfx == pitchfx_log.total_pitch_count
+
+
+def test_stream_scraped_html_only_uses_db_session_on_main_thread(vig_app, html_server, pitchfx_json, tmp_path):
+    html_files = sorted(HTML_FOLDER.glob(f"{GAME_ID_NO_ERRORS}_*.html"))
+    scrape_task = create_stream_scrape_task(vig_app, html_server, html_files, tmp_path)
+    query_threads = set()
+
+    def record_query_thread(orm_execute_state):
+        query_threads.add(current_thread())
+
+    event.listen(vig_app.db_session, "do_orm_execute", record_query_thread)
+    try:
+        result = scrape_task.stream_scraped_html()
+        assert result.success
+    finally:
+        event.remove(vig_app.db_session, "do_orm_execute", record_query_thread)
+        shutil.rmtree(scrape_task.db_job.scraped_html_root_folder, ignore_errors=True)
+    assert scrape_task.url_tracker.parsed_url_ids == {html_file.stem for html_file in html_files}
+    assert query_threads == {main_thread()}
+
+
+def create_stream_scrape_task(vig_app, html_server, html_files, tmp_path):
+    result = vig_app.create_scrape_job([DATA_SET], GAME_DATE, GAME_DATE)
+    assert result.success
+    db_job = result.value
+    cached_urls = [create_url_details(html_server, html_file, HTML_FOLDER, tmp_path) for html_file in html_files[:5]]
+    missing_urls = [create_url_details(html_server, html_file, tmp_path, tmp_path) for html_file in html_files[5:]]
+    scrape_task = ScrapeBrooksPitchFx(vig_app, db_job)
+    scrape_task.start_date = scrape_task.end_date = GAME_DATE
+    scrape_task.stream_batch_size = BATCH_SIZE
+    scrape_task.status_batch = StatusUpdateBatch(vig_app.db_session, batch_size=BATCH_SIZE, batch_seconds=0)
+    scrape_task.url_tracker = UrlTracker(db_job, DATA_SET, vig_app.scraped_data)
+    scrape_task.url_tracker.all_urls = {GAME_DATE: cached_urls + missing_urls}
+    scrape_task.url_tracker.cached_urls.extend(cached_urls)
+    scrape_task.url_tracker.missing_urls.extend(missing_urls)
+    rate_limiter = HostRateLimiter(
+        UrlScrapeDelay(False, False, 0, 0, 0),
+        BatchJobSettings(False, False, 0, 0, 0),
+        BatchScrapeDelay(False, False, 0, 0, 0),
+    )
+    scrape_task.html_fetcher = AsyncHtmlFetcher(rate_limiter, max_concurrency=3)
+    return scrape_task
+
+
+@pytest.mark.parametrize("failed_step", ["parse_html", "save_scraped_html"])
+def test_write_parsed_results_commits_results_saved_before_failure(vig_app, tmp_path, failed_step):
+    result = vig_app.create_scrape_job([DATA_SET], GAME_DATE, GAME_DATE)
+    assert result.success
+    db_job = result.value
+    scrape_task = ScrapeBrooksPitchFx(vig_app, db_job)
+    scrape_task.status_batch = StatusUpdateBatch(vig_app.db_session, batch_size=BATCH_SIZE, batch_seconds=0)
+    scrape_task.url_tracker = UrlTracker(db_job, DATA_SET, vig_app.scraped_data)
+    urls = [create_url_details("http://127.0.0.1", Path(f"url_{num}.html"), tmp_path, tmp_path) for num in range(3)]
+
+    def save_parsed_data(url, parsed_data):
+        scrape_task.status_batch.add(url.url_id)
+        return Result.Ok()
+
+    scrape_task.save_parsed_data = save_parsed_data
+    scrape_task.save_scraped_html = lambda url: Result.Fail(f"Unable to save HTML for {url.url_id}")
+    parsed_data = {"pitchfx": []}
+    failed_result = Result.Fail("Unable to parse HTML") if failed_step == "parse_html" else Result.Ok(parsed_data)
+    if failed_step == "save_scraped_html":
+        scrape_task.url_tracker.missing_urls.append(urls[1])
+    parsed_results = Queue()
+    for parsed_result in [(urls[0], Result.Ok(parsed_data)), (urls[1], failed_result), (urls[2], Result.Ok(parsed_data))]:
+        parsed_results.put(parsed_result)
+    parsed_results.put(PARSE_COMPLETE)
+
+    result = scrape_task.write_parsed_results(parsed_results)
+    assert result.failure
+    assert scrape_task.status_batch.total_commits == 1
+    assert not scrape_task.status_batch.pending_ids
+    assert parsed_results.qsize() == 2
+
+
+def create_url_details(base_url, html_file, cached_folder, scraped_folder):
+    return UrlDetails(
+        url=f"{base_url}/{html_file.name}",
+        url_id=html_file.stem,
+        fileName=html_file.name,
+        cachedHtmlFolderPath=str(cached_folder),
+        scrapedHtmlFolderpath=str(scraped_folder),
+    )
@@ -0,0 +1,91 @@
+import pytest
+
+import vigorish.database as db
+from tests.conftest import CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
+from tests.util import (
+    COMBINED_DATA_GAME_DICT,
+    update_scraped_bbref_games_for_date,
+    update_scraped_boxscore,
+    update_scraped_brooks_games_for_date,
+    update_scraped_pitch_logs,
+    update_scraped_pitchfx_logs,
+)
+from vigorish.app import Vigorish
+from vigorish.tasks import AddToDatabaseTask
+from vigorish.tasks.combine_scraped_data import CombineScrapedDataTask
+
+TEST_ID = "NO_ERRORS"
+GAME_DATE = COMBINED_DATA_GAME_DICT[TEST_ID]["game_date"]
+BBREF_GAME_ID = COMBINED_DATA_GAME_DICT[TEST_ID]["bbref_game_id"]
+BB_GAME_ID = COMBINED_DATA_GAME_DICT[TEST_ID]["bb_game_id"]
+APPPLY_PATCH_LIST = COMBINED_DATA_GAME_DICT[TEST_ID]["apply_patch_list"]
+
+
+@pytest.fixture()
+def vig_app(request):
+    """Returns an instance of the application with combined data for one game that has not been imported."""
+    app = Vigorish()
+    app.initialize_database(csv_folder=CSV_FOLDER, json_folder=JSON_FOLDER)
+    assert app.db_setup_complete
+    update_scraped_bbref_games_for_date(app, GAME_DATE)
+    update_scraped_brooks_games_for_date(app, GAME_DATE)
+    update_scraped_boxscore(app, BBREF_GAME_ID)
+    update_scraped_pitch_logs(app, GAME_DATE, BBREF_GAME_ID)
+    update_scraped_pitchfx_logs(app, BB_GAME_ID)
+    combine_data_result_dict = CombineScrapedDataTask(app).execute(BBREF_GAME_ID, APPPLY_PATCH_LIST)
+    assert combine_data_result_dict["gather_scraped_data_success"]
+
+    def fin():
+        app.db_session.close()
+        for file in TESTS_FOLDER.glob("vig_*.db"):
+            file.unlink()
+
+    request.addfinalizer(fin)
+    return app
+
+
+def test_bulk_insert_matches_orm_insert(vig_app):
+    progress = []
+    add_to_db = AddToDatabaseTask(vig_app)
+    add_to_db.events.add_data_to_db_progress += lambda *args: progress.append(args)
+    result = add_to_db.execute(2019, bulk_insert=True, games_per_commit=1)
+    assert result.success
+    assert len(progress) == 1
+    (num_complete, year, game_id, pfx_per_sec) = progress[0]
+    assert (num_complete, year, game_id) == (1, 2019, BBREF_GAME_ID)
+    assert pfx_per_sec > 0
+
+    game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, BBREF_GAME_ID)
+    assert game_status.imported_bat_stats == 1
+    assert game_status.imported_pitch_stats == 1
+    assert all(pitch_app.imported_pitchfx == 1 for pitch_app in game_status.pitch_apps)
+    bulk_rows = get_imported_rows(vig_app)
+    assert len(bulk_rows[db.PitchFx]) == 298
+
+    remove_imported_rows(vig_app, game_status)
+    result = AddToDatabaseTask(vig_app).execute(2019)
+    assert result.success
+    assert get_imported_rows(vig_app) == bulk_rows
+
+    result = AddToDatabaseTask(vig_app).execute(2019, bulk_insert=True)
+    assert result.success
+    assert get_imported_rows(vig_app) == bulk_rows
+
+
+def get_imported_rows(vig_app):
+    imported_rows = {}
+    for model in [db.BatStats, db.PitchStats, db.PitchFx]:
+        columns = [col for col in model.__table__.columns if col.name != "id"]
+        rows = vig_app.db_session.query(*columns).all()
+        imported_rows[model] = sorted(tuple(row) for row in rows)
+    return imported_rows
+
+
+def remove_imported_rows(vig_app, game_status):
+    for model in [db.BatStats, db.PitchStats, db.PitchFx]:
+        vig_app.db_session.query(model).delete()
+    game_status.imported_bat_stats = 0
+    game_status.imported_pitch_stats = 0
+    for pitch_app in game_status.pitch_apps:
+        pitch_app.imported_pitchfx = 0
+    vig_app.db_session.commit()
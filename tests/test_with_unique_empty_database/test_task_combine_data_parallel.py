@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import vigorish.database as db
+from tests.conftest import CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
+from tests.util import (
+    COMBINED_DATA_GAME_DICT,
+    update_scraped_bbref_games_for_date,
+    update_scraped_boxscore,
+    update_scraped_brooks_games_for_date,
+    update_scraped_pitch_logs,
+    update_scraped_pitchfx_logs,
+)
+from vigorish.app import Vigorish
+from vigorish.tasks.combine_scraped_data import CombineScrapedDataTask
+from vigorish.tasks.combine_scraped_data_parallel import (
+    CombineDataWorkerApp,
+    CombineScrapedDataParallelTask,
+)
+from vigorish.util.result import Result
+
+BBREF_GAME_IDS = [game_id_dict["bbref_game_id"] for game_id_dict in COMBINED_DATA_GAME_DICT.values()]
+
+
+@pytest.fixture()
+def vig_app(request):
+    """Returns an instance of the application with scraped data for all test games that has not been combined."""
+    app = Vigorish()
+    app.initialize_database(csv_folder=CSV_FOLDER, json_folder=JSON_FOLDER)
+    assert app.db_setup_complete
+    for game_id_dict in COMBINED_DATA_GAME_DICT.values():
+        update_scraped_bbref_games_for_date(app, game_id_dict["game_date"])
+        update_scraped_brooks_games_for_date(app, game_id_dict["game_date"])
+        update_scraped_boxscore(app, game_id_dict["bbref_game_id"])
+        update_scraped_pitch_logs(app, game_id_dict["game_date"], game_id_dict["bbref_game_id"])
+        update_scraped_pitchfx_logs(app, game_id_dict["bb_game_id"])
+    app.db_session.commit()
+
+    def fin():
+        app.db_session.close()
+        for file in TESTS_FOLDER.glob("vig_*.db"):
+            file.unlink()
+
+    request.addfinalizer(fin)
+    return app
+
+
+def test_parallel_combine_matches_serial_combine(vig_app):
+    combine_data_parallel = CombineScrapedDataParallelTask(vig_app, max_workers=2)
+    parallel_results = combine_data_parallel.execute(BBREF_GAME_IDS)
+    combine_data_parallel.shutdown()
+    assert sorted(parallel_results.keys()) == sorted(BBREF_GAME_IDS)
+    assert all(results["update_pitch_apps_success"] for results in parallel_results.values())
+    parallel_status = get_scrape_status_rows(vig_app)
+    assert all(
+        game_status["combined_data_success"] == 1
+        for game_status in parallel_status[db.GameScrapeStatus]
+        if game_status["bbref_game_id"] in BBREF_GAME_IDS
+    )
+
+    combine_data = CombineScrapedDataTask(vig_app)
+    for bbref_game_id in BBREF_GAME_IDS:
+        serial_results = combine_data.execute(bbref_game_id)
+        assert serial_results["results"]["pfx_errors"] == parallel_results[bbref_game_id]["results"]["pfx_errors"]
+    assert get_scrape_status_rows(vig_app) == parallel_status
+
+
+def test_worker_app_cannot_write_to_database(vig_app):
+    worker_app = CombineDataWorkerApp(vig_app.dotenv_filepath, vig_app.db_url)
+    with pytest.raises(OperationalError, match="readonly"):
+        worker_app.db_session.execute(db.PlayerId.__table__.insert().values(mlb_id=1, bbref_id="test01"))
+    worker_app.db_session.close()
+
+
+def test_new_player_found_by_worker_is_added_by_parent(vig_app):
+    bbref_game_id = BBREF_GAME_IDS[0]
+    boxscore = vig_app.scraped_data.get_bbref_boxscore(bbref_game_id)
+    bbref_id = next(iter(boxscore.player_name_dict.values()))
+    player = db.Player.find_by_bbref_id(vig_app.db_session, bbref_id)
+    player_dict = {col.name: getattr(player, col.name) for col in db.Player.__table__.columns if col.name != "id"}
+    vig_app.db_session.delete(db.PlayerId.find_by_bbref_id(vig_app.db_session, bbref_id))
+    vig_app.db_session.delete(player)
+    vig_app.db_session.commit()
+
+    worker_app = CombineDataWorkerApp(vig_app.dotenv_filepath, vig_app.db_url)
+    combine_data = CombineScrapedDataTask(worker_app, add_new_players=False)
+    with patch("vigorish.tasks.combine_scraped_data.ScrapeMlbPlayerInfoTask.execute") as scrape_player_info_mock:
+        scrape_player_info_mock.return_value = Result.Ok(player_dict)
+        results = combine_data.execute(bbref_game_id, write_json=False, update_db=False)
+    worker_app.db_session.rollback()
+    assert not results["combined_data_success"]
+    assert any(bbref_id in error for error in results["error"])
+    assert scrape_player_info_mock.call_args.kwargs == {"add_to_db": False}
+    assert combine_data.new_players == {bbref_id: player_dict}
+    assert not db.PlayerId.find_by_bbref_id(vig_app.db_session, bbref_id)
+
+    result = CombineScrapedDataParallelTask(vig_app).add_new_players(list(combine_data.new_players.values()))
+    assert result.success
+    new_player = db.Player.find_by_bbref_id(vig_app.db_session, bbref_id)
+    assert new_player.mlb_id == player_dict["mlb_id"]
+    assert db.PlayerId.find_by_bbref_id(vig_app.db_session, bbref_id).db_player_id == new_player.id
+
+    results = combine_data.execute(bbref_game_id, write_json=False, update_db=False)
+    worker_app.db_session.close()
+    assert results["combined_data_success"]
+    assert not combine_data.new_players
+
+
+def get_scrape_status_rows(vig_app):
+    vig_app.db_session.expire_all()
+    status_rows = {}
+    for model in [db.GameScrapeStatus, db.PitchAppScrapeStatus]:
+        rows = vig_app.db_session.query(model.__table__).all()
+        status_rows[model] = sorted((dict(row._mapping) for row in rows), key=lambda row: row["id"])
+    return status_rows
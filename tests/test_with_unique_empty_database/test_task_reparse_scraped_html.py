@@ -0,0 +1,116 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+import vigorish.database as db
+from tests.conftest import CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
+from tests.util import (
+    COMBINED_DATA_GAME_DICT,
+    update_scraped_bbref_games_for_date,
+    update_scraped_brooks_games_for_date,
+    update_scraped_pitch_logs,
+)
+from vigorish.app import Vigorish
+from vigorish.cli.vig import cli
+from vigorish.enums import DataSet, VigFile
+from vigorish.tasks.reparse_scraped_html import ReparseScrapedHtmlTask
+
+YEAR = 2019
+BBREF_GAME_IDS = [game_id_dict["bbref_game_id"] for game_id_dict in COMBINED_DATA_GAME_DICT.values()]
+
+
+@pytest.fixture()
+def vig_app(request):
+    """Returns an instance of the application with pitch logs scraped for all test games, but no boxscores or
+    pitchfx data."""
+    app = Vigorish()
+    app.initialize_database(csv_folder=CSV_FOLDER, json_folder=JSON_FOLDER)
+    assert app.db_setup_complete
+    for game_id_dict in COMBINED_DATA_GAME_DICT.values():
+        update_scraped_bbref_games_for_date(app, game_id_dict["game_date"])
+        update_scraped_brooks_games_for_date(app, game_id_dict["game_date"])
+        update_scraped_pitch_logs(app, game_id_dict["game_date"], game_id_dict["bbref_game_id"])
+    app.db_session.commit()
+
+    def fin():
+        app.db_session.close()
+        for file in TESTS_FOLDER.glob("vig_*.db"):
+            file.unlink()
+
+    request.addfinalizer(fin)
+    return app
+
+
+@pytest.fixture()
+def parsed_json(vig_app):
+    """Restores the JSON files for the test season after the task has overwritten them."""
+    json_files = {}
+    for data_set in [DataSet.BBREF_BOXSCORES, DataSet.BROOKS_PITCHFX]:
+        json_folder = Path(vig_app.scraped_data.get_local_folderpath(VigFile.PARSED_JSON, data_set, YEAR))
+        json_files.update({file: file.read_bytes() for file in json_folder.glob("*.json")})
+    yield json_files
+    for file, contents in json_files.items():
+        file.write_bytes(contents)
+
+
+def test_reparse_scraped_html(vig_app, parsed_json):
+    result = ReparseScrapedHtmlTask(vig_app, max_workers=2).execute(YEAR)
+    assert result.success
+    reparse_results = result.value
+    boxscore_results = reparse_results[DataSet.BBREF_BOXSCORES]
+    pitchfx_results = reparse_results[DataSet.BROOKS_PITCHFX]
+    assert not boxscore_results["errors"] and not pitchfx_results["errors"]
+    assert boxscore_results["parsed"] >= len(BBREF_GAME_IDS)
+    assert pitchfx_results["parsed"] == pitchfx_results["total_pages"] > 0
+    assert boxscore_results["pages_per_sec"] > 0 and pitchfx_results["pages_per_sec"] > 0
+
+    vig_app.db_session.expire_all()
+    pitch_app_ids = []
+    for bbref_game_id in BBREF_GAME_IDS:
+        game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, bbref_game_id)
+        assert game_status.scraped_bbref_boxscore == 1
+        pitch_app_ids.extend(vig_app.scraped_data.get_all_pitch_app_ids_with_pfx_data_for_game(bbref_game_id))
+    assert len(pitch_app_ids) == pitchfx_results["parsed"]
+    for pitch_app_id in pitch_app_ids:
+        pitch_app_status = db.PitchAppScrapeStatus.find_by_pitch_app_id(vig_app.db_session, pitch_app_id)
+        pitchfx_log = vig_app.scraped_data.get_brooks_pitchfx_log(pitch_app_id)
+        assert pitch_app_status.pitch_count_pitchfx == pitchfx_log.total_pitch_count
+
+
+def test_reparse_reports_missing_html(vig_app, parsed_json):
+    get_html = vig_app.scraped_data.get_html
+    missing_ids = []
+
+    def get_html_missing_first_pitch_app(data_set, url_id):
+        if not missing_ids or missing_ids == [url_id]:
+            missing_ids[:] = [url_id]
+            return None
+        return get_html(data_set, url_id)
+
+    with patch.object(vig_app.scraped_data, "get_html", side_effect=get_html_missing_first_pitch_app):
+        result = ReparseScrapedHtmlTask(vig_app, max_workers=1).execute(YEAR, [DataSet.BROOKS_PITCHFX])
+    assert result.success
+    pitchfx_results = result.value[DataSet.BROOKS_PITCHFX]
+    assert pitchfx_results["missing_html"] == missing_ids
+    assert missing_ids[0] not in pitchfx_results["errors"]
+    assert not pitchfx_results["errors"]
+    assert pitchfx_results["parsed"] == pitchfx_results["total_pages"] > 0
+
+
+def test_reparse_unsupported_data_set(vig_app):
+    result = ReparseScrapedHtmlTask(vig_app, max_workers=1).execute(YEAR, [DataSet.BROOKS_PITCH_LOGS])
+    assert result.failure
+    assert "not supported" in result.error
+
+
+def test_reparse_cli_reports_pages_per_sec(vig_app, parsed_json):
+    runner = CliRunner()
+    result = runner.invoke(cli, f"reparse {YEAR} --data-set=bbref_boxscores --workers=1")
+    assert result.exit_code == 0
+    assert "pages/sec" in result.output
+    vig_app.db_session.expire_all()
+    for bbref_game_id in BBREF_GAME_IDS:
+        game_status = db.GameScrapeStatus.find_by_bbref_game_id(vig_app.db_session, bbref_game_id)
+        assert game_status.scraped_bbref_boxscore == 1
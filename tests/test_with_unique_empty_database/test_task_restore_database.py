@@ -1,6 +1,8 @@
 from datetime import datetime
+from zipfile import ZipFile
 
 import pytest
+from sqlalchemy import inspect
 
 import vigorish.database as db
 from tests.conftest import BACKUP_FOLDER, CSV_FOLDER, JSON_FOLDER, TESTS_FOLDER
@@ -16,7 +18,9 @@ from tests.util import (
 from vigorish.app import Vigorish
 from vigorish.cli.components.viewers.page_viewer import PageViewer
 from vigorish.tasks import AddToDatabaseTask, BackupDatabaseTask, RestoreDatabaseTask
+from vigorish.tasks.backup_database import DB_MODEL_TO_CSV_MAP
 from vigorish.tasks.combine_scraped_data import CombineScrapedDataTask
+from vigorish.util.dataclass_helpers import serialize_db_object_to_csv
 from vigorish.util.sys_helpers import zip_file_report
 
 TEST_ID = "NO_ERRORS"
@@ -51,7 +55,8 @@ def vig_app(request):
     return app
 
 
-def test_restore_database(vig_app):
+@pytest.mark.parametrize("bulk_load", [True, False])
+def test_restore_database(vig_app, bulk_load):
     total_rows_before = get_total_number_of_rows(vig_app, db.Player)
     create_recently_debuted_player_data(vig_app)
     total_rows_after = get_total_number_of_rows(vig_app, db.Player)
@@ -66,15 +71,22 @@ def test_restore_database(vig_app):
     assert total_rows == 298
 
     remove_everything_in_backup_folder()
-    result = BackupDatabaseTask(vig_app).execute()
+    backup_db = BackupDatabaseTask(vig_app)
+    result = backup_db.execute()
     assert result.success
+    assert backup_db.table_stats[db.PitchFx]["rows"] == 298
+    assert backup_db.table_stats[db.PitchFx]["rows_per_sec"] > 0
     zip_file = result.value
     assert zip_file.exists()
     report = zip_file_report(zip_file)
     assert isinstance(report, PageViewer)
+    check_backup_csv_matches_db_objects(vig_app, zip_file, db.PitchFx, "pitchfx.csv")
+    check_backup_csv_matches_db_objects(vig_app, zip_file, db.PitchAppScrapeStatus, "scrape_status_pitch_app.csv")
 
-    result = RestoreDatabaseTask(vig_app).execute(csv_folder=CSV_FOLDER)
+    result = RestoreDatabaseTask(vig_app).execute(csv_folder=CSV_FOLDER, bulk_load=bulk_load)
     assert result.success
+    pfx_indexes = {index["name"] for index in inspect(vig_app.db_engine).get_indexes("pitchfx")}
+    assert pfx_indexes == {index.name for index in db.PitchFx.__table__.indexes}
     check_player_1 = db.Player.find_by_mlb_id(vig_app.db_session, 660644)
     assert check_player_1 and check_player_1.add_to_db_backup and check_player_1.bbref_id == "brujavi01"
     check_player_2 = db.Player.find_by_mlb_id(vig_app.db_session, 669016)
@@ -102,6 +114,16 @@ def test_restore_database(vig_app):
     vig_app.db_session.close()
 
 
+def check_backup_csv_matches_db_objects(vig_app, zip_file, db_table, csv_file):
+    with ZipFile(zip_file) as zip:
+        csv_lines = zip.read(f"{zip_file.stem}/{csv_file}").decode("utf-8").splitlines()
+    csv_dataclass = DB_MODEL_TO_CSV_MAP[db_table]["dataclass"]
+    date_format = DB_MODEL_TO_CSV_MAP[db_table]["date_format"]
+    db_objects = vig_app.db_session.query(db_table).order_by(db_table.id).all()
+    assert csv_lines[0] == ",".join(csv_dataclass.__dataclass_fields__)
+    assert csv_lines[1:] == [serialize_db_object_to_csv(obj, csv_dataclass, date_format) for obj in db_objects]
+
+
 def create_recently_debuted_player_data(vig_app):
     players = [
         {
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from vigorish.data.decoded_data_cache import DecodedDataCache
+from vigorish.enums import DataSet, VigFile
+
+FILE_TYPE = VigFile.PARSED_JSON
+DATA_SET = DataSet.BBREF_BOXSCORES
+
+
+def test_cache_hit_returns_copy():
+    cache = DecodedDataCache()
+    data = {"bbref_game_id": "TEX201907110", "innings": [1, 2, 3]}
+    assert cache.put(FILE_TYPE, DATA_SET, "TEX201907110", 100, data)
+    cached = cache.get(FILE_TYPE, DATA_SET, "TEX201907110", 100)
+    assert cached == data
+    cached["innings"].append(4)
+    assert cache.get(FILE_TYPE, DATA_SET, "TEX201907110", 100) == data
+    assert cache.stats["hits"] == 2
+    assert cache.stats["misses"] == 0
+
+
+def test_cache_key_includes_mtime():
+    cache = DecodedDataCache()
+    cache.put(FILE_TYPE, DATA_SET, "TEX201907110", 100, {"version": 1})
+    assert cache.get(FILE_TYPE, DATA_SET, "TEX201907110", 200) is None
+    cache.put(FILE_TYPE, DATA_SET, "TEX201907110", 200, {"version": 2})
+    assert len(cache) == 1
+    assert cache.get(FILE_TYPE, DATA_SET, "TEX201907110", 100) is None
+    assert cache.get(FILE_TYPE, DATA_SET, "TEX201907110", 200) == {"version": 2}
+    assert cache.stats["misses"] == 2
+    assert cache.stats["hit_rate"] == 1 / 3
+
+
+def test_cache_evicts_least_recently_used():
+    item = {"data": "x" * 1000}
+    cache = DecodedDataCache(max_size=3500)
+    for url_id in ["A", "B", "C"]:
+        cache.put(FILE_TYPE, DATA_SET, url_id, 1, item)
+    assert cache.get(FILE_TYPE, DATA_SET, "A", 1) == item
+    cache.put(FILE_TYPE, DATA_SET, "D", 1, item)
+    assert cache.get(FILE_TYPE, DATA_SET, "B", 1) is None
+    assert cache.get(FILE_TYPE, DATA_SET, "A", 1) == item
+    assert cache.stats["evictions"] == 1
+    assert cache.size <= cache.max_size
+    assert not cache.put(FILE_TYPE, DATA_SET, "E", 1, {"data": "x" * 5000})
+
+
+def test_cache_invalidate():
+    cache = DecodedDataCache()
+    cache.put(FILE_TYPE, DATA_SET, "TEX201907110", 1, {})
+    cache.put(FILE_TYPE, DATA_SET, "TOR201906170", 1, {})
+    cache.put(FILE_TYPE, DataSet.BROOKS_PITCHFX, "TEX201907110_455119", 1, {})
+    cache.put(VigFile.PATCH_LIST, DATA_SET, "TEX201907110", 1, {})
+    cache.invalidate(FILE_TYPE, DATA_SET, "TEX201907110")
+    assert len(cache) == 3
+    assert cache.get(FILE_TYPE, DATA_SET, "TOR201906170", 1) == {}
+    assert cache.get(VigFile.PATCH_LIST, DATA_SET, "TEX201907110", 1) == {}
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_cache_invalidate_date_url_id():
+    cache = DecodedDataCache()
+    cache.put(VigFile.PATCH_LIST, DataSet.BBREF_GAMES_FOR_DATE, datetime(2019, 7, 11), 1, {"patch_list": []})
+    assert cache.get(VigFile.PATCH_LIST, DataSet.BBREF_GAMES_FOR_DATE, "2019-07-11", 1) == {"patch_list": []}
+    cache.invalidate(VigFile.PATCH_LIST, DataSet.BBREF_GAMES_FOR_DATE, "2019-07-11")
+    assert len(cache) == 0
@@ -0,0 +1,56 @@
+import os
+
+from vigorish.data.file_index import FILE_INDEX_NAME, FileIndex
+
+
+def write_file(file_index, filepath, text):
+    file_index.refresh()
+    filepath.write_text(text)
+    file_index.add(filepath)
+
+
+def delete_file(file_index, filepath):
+    file_index.refresh()
+    filepath.unlink()
+    file_index.remove(filepath)
+
+
+def test_file_index_tracks_writes_and_deletes(tmp_path):
+    file_index = FileIndex(tmp_path)
+    assert file_index.names == []
+    for num in range(5):
+        write_file(file_index, tmp_path.joinpath(f"file_{num}.json"), "x" * (num * 1000))
+    delete_file(file_index, tmp_path.joinpath("file_0.json"))
+    files = file_index.get_files()
+    assert sorted(files) == ["file_1.json", "file_2.json", "file_3.json", "file_4.json"]
+    assert files["file_3.json"] == (3000, tmp_path.joinpath("file_3.json").stat().st_mtime)
+    assert file_index.get_names(min_size=2000) == {"file_3.json", "file_4.json"}
+    assert tmp_path.joinpath(FILE_INDEX_NAME).exists()
+    assert FILE_INDEX_NAME not in file_index
+
+    reopened = FileIndex(tmp_path)
+    assert reopened.get_files() == files
+    write_file(file_index, tmp_path.joinpath("file_5.json"), "x")
+    assert "file_5.json" in reopened
+
+
+def test_file_index_rebuilt_when_folder_changed_externally(tmp_path):
+    file_index = FileIndex(tmp_path)
+    write_file(file_index, tmp_path.joinpath("file_1.json"), "x")
+    tmp_path.joinpath("file_2.json").write_text("x")
+    assert file_index.names == ["file_1.json", "file_2.json"]
+    tmp_path.joinpath("file_1.json").unlink()
+    assert file_index.names == ["file_2.json"]
+    os.remove(tmp_path.joinpath(FILE_INDEX_NAME))
+    assert FileIndex(tmp_path).names == ["file_2.json"]
+    assert file_index.names == ["file_2.json"]
+
+
+def test_file_index_compacted(tmp_path):
+    file_index = FileIndex(tmp_path)
+    filepath = tmp_path.joinpath("file_1.json")
+    for num in range(600):
+        write_file(file_index, filepath, str(num))
+    assert file_index.line_count < 1000
+    assert file_index.get_files()["file_1.json"][0] == 3
+    assert FileIndex(tmp_path).get_files() == file_index.get_files()
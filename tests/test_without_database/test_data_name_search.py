@@ -0,0 +1,58 @@
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+from vigorish.data.name_search import (
+    normalize_player_name,
+    PLAYER_NAME_INDEX_VERSION,
+    PlayerNameSearch,
+)
+
+PLAYER_NAMES = {1: "José Ramírez", 2: "Travis d'Arnaud", 3: "J.D. Martinez", 4: "Mike Trout", 5: "Jose Ramirez"}
+
+
+def create_db_session(tmp_path):
+    db_engine = create_engine(f"sqlite:///{tmp_path.joinpath('name_search.db')}")
+    tables = [db.PlayerId.__table__, db.PitchStats.__table__, db.BatStats.__table__]
+    db.Base.metadata.create_all(db_engine, tables=tables)
+    db_session = Session(bind=db_engine)
+    db_session.add_all(db.PlayerId(mlb_id=mlb_id, mlb_name=name) for (mlb_id, name) in PLAYER_NAMES.items())
+    db_session.commit()
+    return db_session
+
+
+def test_normalize_player_name():
+    assert normalize_player_name("José Ramírez") == "jose ramirez"
+    assert normalize_player_name("Travis d'Arnaud") == "travis d arnaud"
+    assert normalize_player_name(" J.D.  Martinez ") == "j d martinez"
+
+
+def test_player_name_search_is_updated_incrementally(tmp_path):
+    db_session = create_db_session(tmp_path)
+    index_filepath = tmp_path.joinpath("name_search.player_names.json")
+    name_search = PlayerNameSearch(db_session, index_filepath)
+    name_search.update()
+    assert not index_filepath.exists()
+
+    db_session.add_all([db.PitchStats(player_id_mlb=1), db.BatStats(player_id_mlb=1), db.BatStats(player_id_mlb=4)])
+    db_session.commit()
+    assert name_search.player_id_name_map == {1: "José Ramírez", 4: "Mike Trout"}
+    assert [match["result"] for match in name_search.fuzzy_match("jose ramirez")] == [1]
+
+    db_session.add_all([db.PitchStats(player_id_mlb=5), db.BatStats(player_id_mlb=2)])
+    db_session.commit()
+    name_search.update()
+    index = json.loads(index_filepath.read_text())
+    assert index["version"] == PLAYER_NAME_INDEX_VERSION
+    assert index["max_stats_ids"] == [2, 3]
+    assert [mlb_id for (mlb_id, *_) in index["players"]] == [1, 2, 4, 5]
+    assert [match["result"] for match in name_search.fuzzy_match("Jose Ramirez")] == [1, 5]
+    assert name_search.fuzzy_match("travis darnaud")[0]["match"] == "Travis d'Arnaud"
+
+    db_session.query(db.PitchStats).delete()
+    db_session.commit()
+    saved_name_search = PlayerNameSearch(db_session, index_filepath)
+    assert saved_name_search.player_id_name_map == {2: "Travis d'Arnaud", 1: "José Ramírez", 4: "Mike Trout"}
+    db_session.close()
@@ -0,0 +1,96 @@
+import numpy as np
+
+from vigorish.data.metrics.pitchfx import PitchFxColumns, PitchFxMetricsCache
+from vigorish.data.metrics.pitchfx.pitchfx_columns import PFX_COLUMN_NAMES
+from vigorish.data.metrics.pitchfx.pitchfx_metrics_cache import get_item_size
+
+DB_URL = "sqlite:///vig_test.db"
+OTHER_DB_URL = "sqlite:///vig_other.db"
+
+
+def get_key(name, db_url=DB_URL):
+    return (db_url, "for_pitcher_career", (("mlb_id", name),), False)
+
+
+def get_or_create(cache, key, metrics, mlb_id=None, years=None, data_version=1):
+    return cache.get_or_create(key, lambda: metrics, mlb_id, years, lambda: data_version)
+
+
+def test_cache_hits_and_misses():
+    cache = PitchFxMetricsCache()
+    metrics = {"pitch_count": 100}
+    assert get_or_create(cache, get_key(1), metrics) is metrics
+    assert get_or_create(cache, get_key(1), {"pitch_count": 0}) is metrics
+    assert get_or_create(cache, get_key(2), None) is None
+    assert len(cache) == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+    assert cache.stats["hit_rate"] == 1 / 3
+
+
+def test_cache_evicts_least_recently_used():
+    metrics = {"data": np.zeros(1000, dtype=np.int8)}
+    cache = PitchFxMetricsCache(max_size=3500)
+    for name in ["A", "B", "C"]:
+        get_or_create(cache, get_key(name), metrics)
+    get_or_create(cache, get_key("A"), None)
+    get_or_create(cache, get_key("D"), metrics)
+    assert cache.stats["evictions"] == 1
+    assert get_or_create(cache, get_key("B"), "rebuilt") == "rebuilt"
+    assert get_or_create(cache, get_key("A"), "rebuilt") == metrics
+    assert cache.size <= cache.max_size
+
+
+def test_invalidate_by_player_and_season():
+    cache = PitchFxMetricsCache()
+    get_or_create(cache, get_key("career"), "career", mlb_id=1, years=None)
+    get_or_create(cache, get_key("2019"), "2019", mlb_id=1, years=frozenset([2019]))
+    get_or_create(cache, get_key("2018"), "2018", mlb_id=1, years=frozenset([2018]))
+    get_or_create(cache, get_key("other_player"), "other_player", mlb_id=2, years=None)
+    get_or_create(cache, get_key("team_2019"), "team_2019", mlb_id=None, years=frozenset([2019]))
+    get_or_create(cache, get_key("team_2018"), "team_2018", mlb_id=None, years=frozenset([2018]))
+    get_or_create(cache, get_key("other_db", OTHER_DB_URL), "other_db", mlb_id=1, years=None)
+
+    assert cache.invalidate(DB_URL, mlb_ids={1}, years={2019}) == 3
+    assert cache.stats["invalidations"] == 3
+    remaining = {key[2][0][1] for key in cache.items}
+    assert remaining == {"2018", "other_player", "team_2018", "other_db"}
+    assert cache.invalidate(DB_URL) == 3
+    assert len(cache) == 1
+
+
+def test_disk_tier(tmp_path):
+    cache = PitchFxMetricsCache(disk_folder=tmp_path)
+    get_or_create(cache, get_key(1), {"pitch_count": 100}, data_version=10)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    new_cache = PitchFxMetricsCache(disk_folder=tmp_path)
+    assert get_or_create(new_cache, get_key(1), None, data_version=10) == {"pitch_count": 100}
+    assert new_cache.stats["disk_hits"] == 1
+    assert get_or_create(new_cache, get_key(1), None, data_version=10) == {"pitch_count": 100}
+    assert new_cache.stats["hits"] == 1
+
+    stale_cache = PitchFxMetricsCache(disk_folder=tmp_path)
+    assert get_or_create(stale_cache, get_key(1), {"pitch_count": 120}, data_version=11) == {"pitch_count": 120}
+    assert stale_cache.stats["misses"] == 1
+
+
+def test_cache_ignores_items_created_from_older_data():
+    cache = PitchFxMetricsCache()
+    assert get_or_create(cache, get_key(1), {"pitch_count": 100}, data_version=10) == {"pitch_count": 100}
+    assert get_or_create(cache, get_key(1), {"pitch_count": 120}, data_version=11) == {"pitch_count": 120}
+    assert get_or_create(cache, get_key(1), None, data_version=11) == {"pitch_count": 120}
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+    assert len(cache) == 1
+
+
+def test_item_size_excludes_shared_columns():
+    pfx = PitchFxColumns.from_rows([tuple(0 for _ in PFX_COLUMN_NAMES)] * 10000)
+    subset = pfx.take(np.arange(100))
+    speed = subset["start_speed"]
+    assert get_item_size(pfx) == 0
+    assert get_item_size(subset) == subset.index.nbytes
+    assert get_item_size({"pfx": subset, "speed": speed, "copy": speed}) == (
+        get_item_size("pfx") + get_item_size("speed") + get_item_size("copy") + subset.index.nbytes + speed.nbytes
+    )
@@ -0,0 +1,55 @@
+import random
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import vigorish.database as db
+
+DATE_IDS = [20190401, 20190402, 20190405, 20190410, 20190415]
+
+
+def create_pitch_stats(rng, game_num, player_id, date_id):
+    return db.PitchStats(
+        bbref_game_id=f"GAME{game_num:03d}",
+        player_id=player_id,
+        player_id_mlb=player_id + 100000,
+        season_id=1 if date_id < 20190410 else 2,
+        date_id=str(date_id),
+        is_sp=int(rng.random() < 0.3),
+        is_rp=int(rng.random() < 0.7),
+        is_wp=int(rng.random() < 0.2),
+        is_lp=int(rng.random() < 0.2),
+        is_sv=int(rng.random() < 0.1),
+        total_outs=rng.randint(0, 21),
+    )
+
+
+def get_all_rows(db_session):
+    return [
+        (row.player_id, row.season_id, row.date_id, row.player_id_mlb, row.as_dict())
+        for row in db_session.query(db.PitchStatsToDate).order_by("player_id", "season_id", "date_id")
+    ]
+
+
+def test_add_pitch_stats_out_of_order_matches_rebuild(tmp_path):
+    db_engine = create_engine(f"sqlite:///{tmp_path.joinpath('pitch_stats_to_date.db')}")
+    db.Base.metadata.create_all(db_engine, tables=[db.PitchStats.__table__, db.PitchStatsToDate.__table__])
+    db_session = Session(bind=db_engine)
+    rng = random.Random(7)
+    games = [
+        [create_pitch_stats(rng, game_num, player_id, date_id) for player_id in rng.sample(range(1, 6), 3)]
+        for game_num, date_id in enumerate(rng.choices(DATE_IDS, k=20))
+    ]
+    for pitch_stats in games:
+        db_session.add_all(pitch_stats)
+        db.PitchStatsToDate.add_pitch_stats(db_session, pitch_stats)
+        db_session.commit()
+    incremental_rows = get_all_rows(db_session)
+
+    result = db.PitchStatsToDate.rebuild(db_session)
+    assert result.success
+    assert result.value == len(incremental_rows)
+    db_session.expire_all()
+    assert get_all_rows(db_session) == incremental_rows
+    assert all(totals["total_games"] > 0 for (*_, totals) in incremental_rows)
+    db_session.close()
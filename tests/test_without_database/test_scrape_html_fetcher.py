@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+from requests import get as requests_get
+
+import vigorish.database  # noqa: F401 (import the models before datetime_util to avoid a circular import)
+from tests.conftest import TESTS_FOLDER
+from vigorish.config.types.batch_job_settings import BatchJobSettings
+from vigorish.config.types.batch_scrape_delay import BatchScrapeDelay
+from vigorish.config.types.url_scrape_delay import UrlScrapeDelay
+from vigorish.scrape.html_fetcher import AsyncHtmlFetcher, HostRateLimiter
+from vigorish.scrape.url_details import UrlDetails
+from vigorish.util.result import Result
+
+HTML_FOLDER = TESTS_FOLDER.joinpath("html_storage", "2019", "brooks_pitch_logs")
+NO_DELAY = HostRateLimiter(
+    UrlScrapeDelay(False, False, 0, 0, 0),
+    BatchJobSettings(False, False, 0, 0, 0),
+    BatchScrapeDelay(False, False, 0, 0, 0),
+)
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_html_folder():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietRequestHandler, directory=str(HTML_FOLDER)))
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def html_server():
+    """Serves the test HTML files from a local HTTP server in place of brooksbaseball.net."""
+    with serve_html_folder() as base_url:
+        yield base_url
+
+
+def request_url_without_retries(url):
+    response = requests_get(url)
+    return Result.Ok(response) if response.ok else Result.Fail(f"{response.status_code} error: {url}")
+
+
+def create_url_details(base_url, html_file, tmp_path):
+    return UrlDetails(
+        url=f"{base_url}/{html_file.name}",
+        url_id=html_file.stem,
+        fileName=html_file.name,
+        cachedHtmlFolderPath=str(tmp_path.joinpath("cached")),
+        scrapedHtmlFolderpath=str(tmp_path),
+    )
+
+
+def test_fetch_all_pages_from_local_server(html_server, tmp_path):
+    html_files = sorted(HTML_FOLDER.glob("*.html"))[:8]
+    urls = [create_url_details(html_server, html_file, tmp_path) for html_file in html_files]
+    fetched = list(AsyncHtmlFetcher(NO_DELAY, max_concurrency=3).fetch_all(urls))
+    assert len(fetched) == len(urls)
+    assert all(result.success for _, result in fetched)
+    for url, _ in fetched:
+        assert url.html_was_scraped
+        assert url.html == HTML_FOLDER.joinpath(url.fileName).read_text()
+
+
+def test_fetch_page_not_found(html_server, tmp_path):
+    url = create_url_details(html_server, HTML_FOLDER.joinpath("does_not_exist.html"), tmp_path)
+    fetcher = AsyncHtmlFetcher(NO_DELAY, request_url=request_url_without_retries)
+    [(fetched_url, result)] = list(fetcher.fetch_all([url]))
+    assert fetched_url is url
+    assert result.failure
+    assert not url.html_was_scraped
+
+
+def test_fetch_slot_is_not_held_while_waiting_for_rate_limiter(html_server, tmp_path):
+    rate_limiter = HostRateLimiter(
+        UrlScrapeDelay(True, False, 1, 0, 0),
+        BatchJobSettings(False, False, 0, 0, 0),
+        BatchScrapeDelay(False, False, 0, 0, 0),
+    )
+    html_files = sorted(HTML_FOLDER.glob("*.html"))[:3]
+    with serve_html_folder() as other_server:
+        urls = [
+            create_url_details(html_server, html_files[0], tmp_path),
+            create_url_details(html_server, html_files[1], tmp_path),
+            create_url_details(other_server, html_files[2], tmp_path),
+        ]
+        fetcher = AsyncHtmlFetcher(rate_limiter, max_concurrency=1, request_url=request_url_without_retries)
+        fetched = list(fetcher.fetch_all(urls))
+    assert all(result.success for _, result in fetched)
+    # The second request to html_server must wait one second, the request to other_server does not wait for it
+    assert [url for url, _ in fetched] == [urls[0], urls[2], urls[1]]
+
+
+def test_rate_limiter_spaces_requests_to_same_host():
+    rate_limiter = HostRateLimiter(
+        UrlScrapeDelay(True, False, 3, 0, 0),
+        BatchJobSettings(True, False, 2, 0, 0),
+        BatchScrapeDelay(True, False, 1, 0, 0),
+    )
+    assert rate_limiter.reserve("www.brooksbaseball.net") == pytest.approx(0, abs=0.1)
+    assert rate_limiter.reserve("www.brooksbaseball.net") == pytest.approx(3, abs=0.1)
+    assert rate_limiter.reserve("www.baseball-reference.com") == pytest.approx(0, abs=0.1)
+    assert rate_limiter.reserve("www.brooksbaseball.net") == pytest.approx(66, abs=0.1)
+    assert rate_limiter.reserve("www.brooksbaseball.net") == pytest.approx(69, abs=0.1)
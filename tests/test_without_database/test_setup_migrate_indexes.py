@@ -0,0 +1,39 @@
+from sqlalchemy import create_engine, inspect
+
+import vigorish.database as db
+from vigorish.setup.migrate_indexes import migrate_indexes
+
+NEW_INDEXES = [
+    ("pitchfx", "ix_pitchfx_pitcher_id_season_id"),
+    ("pitchfx", "ix_pitchfx_batter_id_season_id"),
+    ("pitchfx", "ix_pitchfx_game_status_id_batter_id"),
+    ("pitchfx", "ix_pitchfx_date_id_is_barreled"),
+    ("pitchfx", "ix_pitchfx_team_pitching_id"),
+    ("pitchfx", "ix_pitchfx_team_batting_id"),
+    ("pitch_stats", "ix_pitch_stats_player_id_mlb"),
+    ("bat_stats", "ix_bat_stats_player_id_mlb"),
+]
+
+
+def get_index_names(db_engine, table_name):
+    return {index["name"] for index in inspect(db_engine).get_indexes(table_name)}
+
+
+def test_migrate_indexes(tmp_path):
+    db_engine = create_engine(f"sqlite:///{tmp_path.joinpath('migrate_indexes.db')}")
+    db.Base.metadata.create_all(db_engine)
+    for _, index_name in NEW_INDEXES:
+        db_engine.execute(f"DROP INDEX {index_name}")
+    db_engine.execute("CREATE INDEX ix_pitchfx_pitcher_id ON pitchfx (pitcher_id)")
+    db_engine.execute("CREATE INDEX ix_pitchfx_batter_id ON pitchfx (batter_id)")
+
+    result = migrate_indexes(db_engine)
+    assert result.success
+    assert sorted(result.value["created"]) == sorted(index_name for _, index_name in NEW_INDEXES)
+    assert sorted(result.value["dropped"]) == ["ix_pitchfx_batter_id", "ix_pitchfx_pitcher_id"]
+    for table_name in ["pitchfx", "pitch_stats", "bat_stats"]:
+        model_indexes = {index.name for index in db.Base.metadata.tables[table_name].indexes}
+        assert get_index_names(db_engine, table_name) == model_indexes
+
+    result = migrate_indexes(db_engine)
+    assert result.value == {"created": [], "dropped": []}
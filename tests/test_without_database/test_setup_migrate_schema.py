@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session
+
+import vigorish.app
+import vigorish.database as db
+from vigorish.app import Vigorish
+from vigorish.setup.migrate_schema import get_schema_version, migrate_schema, SCHEMA_VERSION
+from vigorish.util.result import Result
+
+NEW_TABLES = ["status_rollup_season", "status_rollup_date", "status_rollup_game", "pitch_stats_to_date"]
+
+
+def drop_tables(db_engine, table_names):
+    for table_name in table_names:
+        db_engine.execute(f"DROP TABLE {table_name}")
+
+
+def test_migrate_schema_runs_once(tmp_path):
+    db_engine = create_engine(f"sqlite:///{tmp_path.joinpath('migrate_schema.db')}")
+    db.Base.metadata.create_all(db_engine)
+    drop_tables(db_engine, NEW_TABLES)
+    db_session = Session(bind=db_engine)
+    assert get_schema_version(db_engine) == 0
+
+    result = migrate_schema(db_session)
+    assert result.success
+    assert get_schema_version(db_engine) == SCHEMA_VERSION
+    assert set(NEW_TABLES) <= set(inspect(db_engine).get_table_names())
+
+    drop_tables(db_engine, NEW_TABLES)
+    result = migrate_schema(db_session)
+    assert result.success
+    assert not set(NEW_TABLES) & set(inspect(db_engine).get_table_names())
+    db_session.close()
+
+
+def test_app_raises_if_migrate_schema_fails(tmp_path, monkeypatch):
+    db_engine = create_engine(f"sqlite:///{tmp_path.joinpath('migrate_schema.db')}")
+    db_session = Session(bind=db_engine)
+    monkeypatch.setattr(vigorish.app, "migrate_schema", lambda db_session: Result.Fail("table is locked"))
+    with pytest.raises(ValueError, match="table is locked"):
+        Vigorish(db_engine=db_engine, db_session=db_session)
+    db_session.close()
@@ -0,0 +1,35 @@
+from vigorish.status.status_batch import StatusUpdateBatch
+
+
+class CommitCounter:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_commit_when_batch_size_reached():
+    db_session = CommitCounter()
+    status_batch = StatusUpdateBatch(db_session, batch_size=3, batch_seconds=0)
+    for url_id in range(7):
+        status_batch.add(url_id)
+    assert db_session.commits == 2
+    assert status_batch.pending_ids == [6]
+    status_batch.commit()
+    assert db_session.commits == 3
+    assert not status_batch.pending_ids
+    status_batch.commit()
+    assert db_session.commits == 3
+
+
+def test_commit_when_batch_window_elapsed():
+    db_session = CommitCounter()
+    status_batch = StatusUpdateBatch(db_session, batch_size=100, batch_seconds=5)
+    status_batch.add(1)
+    assert db_session.commits == 0
+    status_batch.batch_started -= 5
+    status_batch.add(2)
+    assert db_session.commits == 1
+    assert status_batch.total_commits == 1
+    assert not status_batch.pending_ids
@@ -0,0 +1,88 @@
+import io
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from sqlalchemy import (
+    Column,
+    create_engine,
+    DateTime,
+    Index,
+    inspect,
+    Integer,
+    MetaData,
+    String,
+    Table,
+)
+
+from vigorish.util.bulk_load import (
+    bulk_insert,
+    deferred_indexes,
+    read_csv_column_batches,
+    sqlite_bulk_load_pragmas,
+)
+from vigorish.util.dataclass_helpers import get_csv_column_parsers
+
+
+@dataclass
+class ExampleCsvRow:
+    id: int
+    name: str = None
+    score: float = 0.0
+    active: bool = False
+    created: datetime = None
+
+
+ExampleCsvRow.__dateformat__ = "%Y-%m-%d %H:%M"
+
+
+@pytest.fixture
+def example_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path.joinpath('bulk_load.db')}")
+    metadata = MetaData()
+    table = Table(
+        "example",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("created", DateTime),
+        Column("status", Integer, default=7),
+        Index("ix_example_name", "name"),
+    )
+    metadata.create_all(engine)
+    return (engine, table)
+
+
+def test_read_csv_column_batches():
+    csv_file = io.BytesIO(b"id,name ,score,active,created\n1,a,1.5,1,2021-04-01 07:30\n2,,,0,\n3,c,2,true,\n")
+    batches = list(read_csv_column_batches(csv_file, get_csv_column_parsers(ExampleCsvRow), batch_size=2))
+    assert len(batches) == 2
+    assert batches[0] == {
+        "id": [1, 2],
+        "name": ["a", None],
+        "score": [1.5, 0.0],
+        "active": [True, False],
+        "created": [datetime(2021, 4, 1, 7, 30), None],
+    }
+    assert batches[1]["score"] == [2.0] and batches[1]["active"] == [True]
+
+
+def test_bulk_insert_and_deferred_indexes(example_table):
+    (engine, table) = example_table
+    with engine.connect() as conn:
+        with sqlite_bulk_load_pragmas(conn):
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+            with pytest.raises(ValueError):
+                with deferred_indexes(conn, table):
+                    assert not inspect(conn).get_indexes("example")
+                    raise ValueError()
+            assert [index["name"] for index in inspect(conn).get_indexes("example")] == ["ix_example_name"]
+            with deferred_indexes(conn, table), conn.begin():
+                columns = {"id": [1, 2], "name": ["a", None], "created": [datetime(2021, 4, 1, 7, 30), None]}
+                bulk_insert(conn, table, columns)
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 2
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+        assert conn.exec_driver_sql("SELECT * FROM example ORDER BY id").fetchall() == [
+            (1, "a", "2021-04-01 07:30:00.000000", 7),
+            (2, None, None, 7),
+        ]
@@ -0,0 +1,97 @@
+import json
+from datetime import date, datetime
+
+import pytest
+from dateutil import parser
+
+from tests.conftest import TESTS_FOLDER
+from vigorish.data.json_decoder import (
+    decode_bbref_boxscore,
+    decode_bbref_games_for_date,
+    decode_brooks_games_for_date,
+    decode_brooks_pitch_logs_for_game,
+    decode_brooks_pitchfx_log,
+)
+from vigorish.util import json_serializer
+from vigorish.util.json_serializer import get_serializer, parse_date_str
+
+JSON_FOLDER = TESTS_FOLDER.joinpath("json_storage", "2019")
+PARSED_JSON_FILES = [
+    (decode_bbref_games_for_date, "bbref_games_for_date/bbref_games_for_date_2019-06-17.json"),
+    (decode_brooks_games_for_date, "brooks_games_for_date/brooks_games_for_date_2019-06-17.json"),
+    (decode_bbref_boxscore, "bbref_boxscores/TOR201906170.json"),
+    (decode_brooks_pitch_logs_for_game, "brooks_pitch_logs/gid_2019_06_17_anamlb_tormlb_1.json"),
+    (decode_brooks_pitchfx_log, "brooks_pitchfx/TOR201906170_429719.json"),
+]
+COMBINED_DATA_FILE = JSON_FOLDER.joinpath("combined_data", "TOR201906170_COMBINED_DATA.json")
+
+
+@pytest.fixture(params=["json", "orjson"])
+def serializer(request):
+    return get_serializer(request.param)
+
+
+@pytest.mark.parametrize("decode_func, filename", PARSED_JSON_FILES)
+def test_roundtrip_parsed_json(serializer, decode_func, filename):
+    json_text = JSON_FOLDER.joinpath(filename).read_text()
+    result = decode_func(json.loads(json_text))
+    assert result.success
+    parsed_data = result.value
+    serialized = serializer.dumps(parsed_data.as_dict())
+    assert "\n" not in serialized
+    result = decode_func(serializer.loads(serialized.encode("utf-8")))
+    assert result.success
+    assert result.value.as_dict() == parsed_data.as_dict()
+    assert serializer.loads(serialized) == json.loads(json_text)
+
+
+def test_roundtrip_combined_data(serializer):
+    json_text = COMBINED_DATA_FILE.read_text()
+    combined_data = json.loads(json_text)
+    serialized = serializer.dumps(combined_data)
+    assert serializer.loads(serialized) == combined_data
+    assert len(serialized) < len(json.dumps(combined_data, indent=2))
+    assert serializer.dumps(combined_data, indent=True).count("\n") > 0
+
+
+def test_decode_indented_and_compact_combined_data(serializer, combined_data_files, tmp_path):
+    indented = combined_data_files[COMBINED_DATA_FILE]
+    assert indented.count(b"\n") > 1
+    compact_file = tmp_path.joinpath(COMBINED_DATA_FILE.name)
+    compact_file.write_text(serializer.dumps(json.loads(indented)))
+    assert b"\n" not in compact_file.read_bytes()
+    assert serializer.loads(compact_file.read_bytes()) == serializer.loads(indented)
+
+
+def test_serializers_write_dates_in_iso_format(serializer):
+    data = {"game_date": date(2019, 6, 17), "game_start": datetime(2019, 6, 17, 19, 7)}
+    assert serializer.loads(serializer.dumps(data)) == {
+        "game_date": "2019-06-17",
+        "game_start": "2019-06-17T19:07:00",
+    }
+    with pytest.raises(TypeError):
+        serializer.dumps({"value": object()})
+
+
+def test_get_serializer_fallback(monkeypatch):
+    assert get_serializer("json").name == "json"
+    assert get_serializer("unknown").name == "json"
+    monkeypatch.setattr(json_serializer, "orjson", None)
+    assert get_serializer("orjson").name == "json"
+    assert json_serializer.loads(json_serializer.dumps([1, "2", None])) == [1, "2", None]
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "2019-06-17",
+        "06/17/2019 07:07:00 PM -0400",
+        "2021-04-01T07:30:30-0700",
+        "2021-04-01T07:30:30",
+        "06/17/2019 07:07:00 PM",
+        "06/17/2019",
+        "June 17, 2019 7:07 PM",
+    ],
+)
+def test_parse_date_str(date_str):
+    assert parse_date_str(date_str) == parser.parse(date_str)
@@ -1,6 +1,12 @@
+import hashlib
 from pathlib import Path
 
-from vigorish.util.sys_helpers import validate_file_path, validate_folder_path
+from vigorish.util.sys_helpers import (
+    calc_file_hash,
+    calc_s3_etag,
+    validate_file_path,
+    validate_folder_path,
+)
 
 
 def test_validate_file_path():
@@ -39,3 +45,11 @@ def test_validate_folder_path():
     valid_folder_path_str = str(valid_folder_path)
     result = validate_folder_path(valid_folder_path_str)
     assert result.success
+
+
+def test_calc_s3_etag(tmp_path):
+    filepath = tmp_path.joinpath("data.json")
+    filepath.write_bytes(b"0123456789" * 3)
+    assert calc_s3_etag(filepath, multipart_size=100) == calc_file_hash(filepath)
+    part_digests = [hashlib.md5(part).digest() for part in [b"0123456789" * 2, b"0123456789"]]
+    assert calc_s3_etag(filepath, multipart_size=20) == f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-2"
@@ -1,5 +1,8 @@
+from contextlib import contextmanager
 from datetime import datetime
 
+from sqlalchemy import event
+
 import vigorish.database as db
 from vigorish.enums import DataSet
 from vigorish.scrape.bbref_boxscores.parse_html import parse_bbref_boxscore
@@ -258,3 +261,19 @@ def combine_scraped_data_for_game(vig_app, game_id, apply_patch_list=True):
     result_dict = CombineScrapedDataTask(vig_app).execute(game_id, apply_patch_list, update_db=False)
     assert result_dict["combined_data_success"] and "boxscore" in result_dict
     return result_dict["boxscore"]
+
+
+@contextmanager
+def capture_queries(db_engine, select_only=False):
+    """Yield a list of the (statement, parameters) executed by db_engine until the block exits."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not select_only or statement.lstrip().upper().startswith("SELECT"):
+            queries.append((statement, parameters))
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(db_engine, "before_cursor_execute", before_cursor_execute)